@@ -3,19 +3,22 @@ Firecrawl Python SDK
 
 """
 
+import importlib
 import logging
 import os
-
-from .client import Firecrawl, AsyncFirecrawl, FirecrawlApp, AsyncFirecrawlApp
-from .v2.watcher import Watcher
-from .v2.watcher_async import AsyncWatcher
-from .v1 import (
-    V1FirecrawlApp,
-    AsyncV1FirecrawlApp,
-    V1JsonConfig,
-    V1ScrapeOptions,
-    V1ChangeTrackingOptions,
-)
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .client import Firecrawl, AsyncFirecrawl, FirecrawlApp, AsyncFirecrawlApp
+    from .v2.watcher import Watcher
+    from .v2.watcher_async import AsyncWatcher
+    from .v1 import (
+        V1FirecrawlApp,
+        AsyncV1FirecrawlApp,
+        V1JsonConfig,
+        V1ScrapeOptions,
+        V1ChangeTrackingOptions,
+    )
 
 __version__ = "4.32.1"
 
@@ -85,3 +88,33 @@ __all__ = [
     'V1ScrapeOptions',
     'V1ChangeTrackingOptions',
 ]
+
+# Public names are resolved on first access (PEP 562) so that ``import firecrawl``
+# only loads the modules a program actually uses: the v1 client (aiohttp), the
+# async clients (httpx) and the watchers (websockets) are all optional paths.
+_LAZY_ATTRIBUTES = {
+    'Firecrawl': '.client',
+    'AsyncFirecrawl': '.client',
+    'FirecrawlApp': '.client',
+    'AsyncFirecrawlApp': '.client',
+    'Watcher': '.v2.watcher',
+    'AsyncWatcher': '.v2.watcher_async',
+    'V1FirecrawlApp': '.v1',
+    'AsyncV1FirecrawlApp': '.v1',
+    'V1JsonConfig': '.v1',
+    'V1ScrapeOptions': '.v1',
+    'V1ChangeTrackingOptions': '.v1',
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,89 @@
+"""
+Import-time checks for the top-level package.
+
+Each check runs in a fresh interpreter so that modules imported by other
+tests do not leak into ``sys.modules``.
+"""
+
+import json
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+# Optional dependencies that only the v1, async or watcher code paths need
+HEAVY_MODULES = [
+    "firecrawl.v1",
+    "firecrawl.v2.client_async",
+    "firecrawl.v2.watcher",
+    "firecrawl.v2.watcher_async",
+    "aiohttp",
+    "httpx",
+    "websockets",
+]
+
+
+def _run(code):
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def _loaded_after(code):
+    return _run(f"""
+        import json, sys
+        {code}
+        print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))
+    """)
+
+
+class TestLazyImports:
+    def test_bare_import_loads_no_clients(self):
+        loaded = _run("""
+            import json, sys
+            import firecrawl
+            print(json.dumps(sorted(m for m in sys.modules if m.startswith("firecrawl."))))
+        """)
+        assert loaded == []
+
+    def test_sync_client_skips_optional_stacks(self):
+        assert _loaded_after("from firecrawl import Firecrawl; Firecrawl(api_key='fc-test')") == []
+
+    def test_v1_loaded_on_first_access(self):
+        loaded = _loaded_after("from firecrawl import Firecrawl; Firecrawl(api_key='fc-test').v1")
+        assert "firecrawl.v1" in loaded
+        assert "firecrawl.v2.client_async" not in loaded
+
+    def test_lazy_names_resolve(self):
+        import firecrawl
+
+        for name in firecrawl.__all__:
+            assert getattr(firecrawl, name) is not None
+        assert set(firecrawl.__all__) <= set(dir(firecrawl))
+        with pytest.raises(AttributeError):
+            firecrawl.DoesNotExist
+
+    @pytest.mark.parametrize(
+        "access, expected",
+        [
+            ("firecrawl.AsyncFirecrawl(api_key='fc-test')", {"firecrawl.v2.client_async", "httpx"}),
+            ("firecrawl.Watcher", {"firecrawl.v2.watcher", "websockets"}),
+            ("firecrawl.AsyncWatcher", {"firecrawl.v2.watcher_async", "websockets"}),
+        ],
+    )
+    def test_heavy_modules_load_on_first_access(self, access, expected):
+        before, after = _run(f"""
+            import json, sys
+            import firecrawl
+            heavy = {HEAVY_MODULES!r}
+            before = [m for m in heavy if m in sys.modules]
+            {access}
+            print(json.dumps([before, [m for m in heavy if m in sys.modules]]))
+        """)
+        assert before == []
+        assert expected <= set(after)
@@ -6,7 +6,6 @@ import pytest
 from firecrawl.v2.client_async import AsyncFirecrawlClient
 from firecrawl.v2.utils.http_client_async import AsyncHttpClient
 from firecrawl.v2.utils.http_client import HttpClient
-from firecrawl.v2.methods.aio import batch as aio_batch
 
 
 @pytest.mark.asyncio
@@ -57,17 +56,13 @@ async def test_event_loop_not_blocked(monkeypatch):
 @pytest.mark.asyncio
 async def test_wait_batch_scrape_polling_interval(monkeypatch):
     # Simulate one scraping status then completed
-    class S:  # simple status holder
-        def __init__(self, status):
-            self.status = status
-
     states = ["scraping", "completed"]
 
-    async def fake_status(client, job_id):
+    async def fake_get(self, endpoint, headers=None, timeout=None):
         state = states.pop(0)
-        return S(state)
+        return httpx.Response(200, json={"success": True, "status": state, "completed": 0, "total": 1, "data": []})
 
-    monkeypatch.setattr(aio_batch, "get_batch_scrape_status", fake_status)
+    monkeypatch.setattr(AsyncHttpClient, "get", fake_get)
 
     client = AsyncFirecrawlClient(api_key="test", api_url="http://localhost")
 
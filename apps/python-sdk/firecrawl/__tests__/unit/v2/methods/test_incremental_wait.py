@@ -0,0 +1,231 @@
+"""
+Unit tests for incremental crawl/batch waiters and document iterators.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from firecrawl.v2.methods.crawl import wait_for_crawl_completion, iter_crawl_documents
+from firecrawl.v2.methods.batch import wait_for_batch_completion, iter_batch_documents
+from firecrawl.v2.methods.aio.crawl import (
+    wait_for_crawl_completion as wait_for_crawl_completion_async,
+    iter_crawl_documents as iter_crawl_documents_async,
+)
+from firecrawl.v2.methods.aio.batch import (
+    wait_for_batch_completion as wait_for_batch_completion_async,
+    iter_batch_documents as iter_batch_documents_async,
+)
+
+
+def _doc(n):
+    return {"markdown": f"doc {n}", "metadata": {"sourceURL": f"https://example.com/{n}"}}
+
+
+def _body(status, docs, next_url=None, completed=0, total=3):
+    return {
+        "success": True,
+        "status": status,
+        "completed": completed,
+        "total": total,
+        "creditsUsed": completed,
+        "expiresAt": "2024-01-01T00:00:00Z",
+        "next": next_url,
+        "data": docs,
+    }
+
+
+def _response(body, status_code=200):
+    response = Mock()
+    response.ok = status_code < 400
+    response.status_code = status_code
+    response.json.return_value = body
+    return response
+
+
+class _RoutedClient:
+    """Fake HttpClient that replays responses per URL and records calls."""
+
+    def __init__(self, routes):
+        self.routes = {url: list(bodies) for url, bodies in routes.items()}
+        self.calls = []
+
+    def _next(self, url):
+        self.calls.append(url)
+        return _response(self.routes[url].pop(0))
+
+    def get(self, url, timeout=None, **kwargs):
+        return self._next(url)
+
+    async def aget(self, url, timeout=None, **kwargs):
+        return self._next(url)
+
+
+def _incremental_routes(base):
+    skip2 = f"https://api.example.com{base}?skip=2"
+    return skip2, {
+        base: [_body("scraping", [_doc(1), _doc(2)], next_url=skip2, completed=2)],
+        skip2: [
+            _body("scraping", [], next_url=skip2, completed=2),
+            _body("completed", [_doc(3)], completed=3),
+        ],
+    }
+
+
+class TestIncrementalCrawlWait:
+    @patch("firecrawl.v2.methods.crawl.time.sleep")
+    def test_resumes_from_cursor_without_refetching(self, mock_sleep):
+        skip2, routes = _incremental_routes("/v2/crawl/job-1")
+        client = _RoutedClient(routes)
+
+        job = wait_for_crawl_completion(client, "job-1", poll_interval=1)
+
+        assert job.status == "completed"
+        assert [d.markdown for d in job.data] == ["doc 1", "doc 2", "doc 3"]
+        assert job.next is None
+        assert client.calls == ["/v2/crawl/job-1", skip2, skip2]
+        assert mock_sleep.call_count == 1
+
+    @patch("firecrawl.v2.methods.crawl.time.sleep")
+    def test_drains_ready_pages_without_sleeping(self, mock_sleep):
+        page2 = "https://api.example.com/v2/crawl/job-1?skip=1"
+        client = _RoutedClient({
+            "/v2/crawl/job-1": [_body("completed", [_doc(1)], next_url=page2, completed=2, total=2)],
+            page2: [_body("completed", [_doc(2)], completed=2, total=2)],
+        })
+
+        job = wait_for_crawl_completion(client, "job-1")
+
+        assert [d.markdown for d in job.data] == ["doc 1", "doc 2"]
+        mock_sleep.assert_not_called()
+
+    @patch("firecrawl.v2.methods.crawl.time.sleep")
+    def test_falls_back_to_single_full_fetch_without_cursor(self, mock_sleep):
+        client = _RoutedClient({
+            "/v2/crawl/job-1": [
+                _body("scraping", [_doc(1)], completed=1),
+                _body("scraping", [_doc(1)], completed=1),
+                _body("completed", [_doc(1), _doc(2)], completed=2, total=2),
+                _body("completed", [_doc(1), _doc(2)], completed=2, total=2),
+            ],
+        })
+
+        job = wait_for_crawl_completion(client, "job-1")
+
+        assert [d.markdown for d in job.data] == ["doc 1", "doc 2"]
+        assert len(client.calls) == 4
+
+    @patch("firecrawl.v2.methods.crawl.time.sleep")
+    @patch("firecrawl.v2.methods.crawl.time.monotonic")
+    def test_timeout(self, mock_monotonic, mock_sleep):
+        mock_monotonic.side_effect = [0, 10]
+        client = _RoutedClient({"/v2/crawl/job-1": [_body("scraping", [], completed=0)]})
+
+        with pytest.raises(TimeoutError):
+            wait_for_crawl_completion(client, "job-1", timeout=5)
+
+
+class TestIncrementalBatchWait:
+    @patch("firecrawl.v2.methods.batch.time.sleep")
+    def test_resumes_from_cursor_without_refetching(self, mock_sleep):
+        skip2, routes = _incremental_routes("/v2/batch/scrape/job-1")
+        client = _RoutedClient(routes)
+
+        job = wait_for_batch_completion(client, "job-1", poll_interval=1)
+
+        assert job.status == "completed"
+        assert [d.markdown for d in job.data] == ["doc 1", "doc 2", "doc 3"]
+        assert client.calls == ["/v2/batch/scrape/job-1", skip2, skip2]
+
+
+class TestIncrementalWaitAsync:
+    @pytest.mark.asyncio
+    async def test_crawl_resumes_from_cursor(self):
+        skip2, routes = _incremental_routes("/v2/crawl/job-1")
+        client = _RoutedClient(routes)
+        client.get = client.aget
+
+        job = await wait_for_crawl_completion_async(client, "job-1", poll_interval=0)
+
+        assert [d.markdown for d in job.data] == ["doc 1", "doc 2", "doc 3"]
+        assert client.calls == ["/v2/crawl/job-1", skip2, skip2]
+
+    @pytest.mark.asyncio
+    async def test_batch_resumes_from_cursor(self):
+        skip2, routes = _incremental_routes("/v2/batch/scrape/job-1")
+        client = _RoutedClient(routes)
+        client.get = client.aget
+
+        job = await wait_for_batch_completion_async(client, "job-1", poll_interval=0)
+
+        assert [d.markdown for d in job.data] == ["doc 1", "doc 2", "doc 3"]
+        assert client.calls == ["/v2/batch/scrape/job-1", skip2, skip2]
+
+
+class TestDocumentIterators:
+    def test_iter_crawl_documents_is_lazy(self):
+        page2 = "https://api.example.com/v2/crawl/job-1?skip=1"
+        client = _RoutedClient({
+            "/v2/crawl/job-1": [_body("completed", [_doc(1)], next_url=page2, completed=2, total=2)],
+            page2: [_body("completed", [_doc(2)], completed=2, total=2)],
+        })
+
+        iterator = iter_crawl_documents(client, "job-1")
+        assert client.calls == []
+        assert next(iterator).markdown == "doc 1"
+        assert client.calls == ["/v2/crawl/job-1"]
+        assert [d.markdown for d in iterator] == ["doc 2"]
+        assert client.calls == ["/v2/crawl/job-1", page2]
+
+    def test_iter_crawl_documents_stops_at_available_results_without_follow(self):
+        skip2, routes = _incremental_routes("/v2/crawl/job-1")
+        client = _RoutedClient(routes)
+
+        docs = [d.markdown for d in iter_crawl_documents(client, "job-1")]
+
+        assert docs == ["doc 1", "doc 2"]
+        assert client.calls == ["/v2/crawl/job-1", skip2]
+
+    @patch("firecrawl.v2.methods.batch.time.sleep")
+    def test_iter_batch_documents_follows_running_job(self, mock_sleep):
+        skip2, routes = _incremental_routes("/v2/batch/scrape/job-1")
+        client = _RoutedClient(routes)
+
+        docs = [d.markdown for d in iter_batch_documents(client, "job-1", follow=True)]
+
+        assert docs == ["doc 1", "doc 2", "doc 3"]
+        assert mock_sleep.call_count == 1
+
+    @patch("firecrawl.v2.methods.crawl.time.sleep")
+    def test_follow_without_cursor_does_not_repeat_documents(self, mock_sleep):
+        client = _RoutedClient({
+            "/v2/crawl/job-1": [
+                _body("scraping", [_doc(1)], completed=1),
+                _body("completed", [_doc(1), _doc(2)], completed=2, total=2),
+                _body("completed", [_doc(1), _doc(2)], completed=2, total=2),
+            ],
+        })
+
+        docs = [d.markdown for d in iter_crawl_documents(client, "job-1", follow=True)]
+
+        assert docs == ["doc 1", "doc 2"]
+
+    @pytest.mark.asyncio
+    async def test_async_iter_crawl_documents(self):
+        skip2, routes = _incremental_routes("/v2/crawl/job-1")
+        client = _RoutedClient(routes)
+        client.get = client.aget
+
+        docs = [d.markdown async for d in iter_crawl_documents_async(client, "job-1", follow=True, poll_interval=0)]
+
+        assert docs == ["doc 1", "doc 2", "doc 3"]
+
+    @pytest.mark.asyncio
+    async def test_async_iter_batch_documents(self):
+        skip2, routes = _incremental_routes("/v2/batch/scrape/job-1")
+        client = _RoutedClient(routes)
+        client.get = client.aget
+
+        docs = [d.markdown async for d in iter_batch_documents_async(client, "job-1")]
+
+        assert docs == ["doc 1", "doc 2"]
@@ -0,0 +1,145 @@
+"""
+Unit tests for concurrent large-batch processing.
+"""
+
+import json
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from firecrawl.v2.methods.batch import LargeBatchCheckpoint, process_large_batch, _plan_large_batch
+from firecrawl.v2.methods.aio.batch import process_large_batch as process_large_batch_async
+
+
+def _response(body, status_code=200):
+    response = Mock()
+    response.ok = status_code < 400
+    response.status_code = status_code
+    response.json.return_value = body
+    return response
+
+
+class _FakeBatchServer:
+    """Fake HttpClient that runs each batch job instantly, with per-URL delays."""
+
+    def __init__(self, max_concurrency=None, delays=None, fail_urls=()):
+        self.max_concurrency = max_concurrency
+        self.delays = delays or {}
+        self.fail_urls = set(fail_urls)
+        self.jobs = {}
+        self.started = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def _prepare_headers(self, idempotency_key=None):
+        return {}
+
+    def post(self, endpoint, data, headers=None, **kwargs):
+        with self._lock:
+            job_id = f"job-{len(self.jobs)}"
+            self.jobs[job_id] = list(data["urls"])
+            self.started.append((job_id, data.get("maxConcurrency")))
+        return _response({"success": True, "id": job_id, "url": f"https://api.example.com/v2/batch/scrape/{job_id}"})
+
+    def get(self, endpoint, timeout=None, **kwargs):
+        if endpoint == "/v2/concurrency-check":
+            if self.max_concurrency is None:
+                return _response({"success": False, "error": "not supported"}, status_code=404)
+            return _response({"success": True, "concurrency": 0, "maxConcurrency": self.max_concurrency})
+        job_id = endpoint.rsplit("/", 1)[1]
+        urls = self.jobs[job_id]
+        if self.fail_urls.intersection(urls):
+            raise ConnectionError("boom")
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(max(self.delays.get(u, 0) for u in urls))
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+        docs = [{"markdown": u, "metadata": {"sourceURL": u}} for u in urls]
+        return _response({"success": True, "status": "completed", "completed": len(urls), "total": len(urls), "data": docs})
+
+    async def aget(self, endpoint, timeout=None, **kwargs):
+        return self.get(endpoint, timeout=timeout)
+
+    async def apost(self, endpoint, data, headers=None, **kwargs):
+        return self.post(endpoint, data, headers=headers)
+
+
+URLS = [f"https://example.com/{i}" for i in range(6)]
+
+
+class TestPlanLargeBatch:
+    def test_defaults_without_server_limit(self):
+        assert _plan_large_batch(None, 10, None) == (4, None)
+
+    def test_server_limit_is_split_between_chunks(self):
+        assert _plan_large_batch(4, 10, 50) == (4, 12)
+
+    def test_workers_capped_by_server_limit_and_chunk_count(self):
+        assert _plan_large_batch(8, 10, 2) == (2, 1)
+        assert _plan_large_batch(8, 3, 100) == (3, 33)
+
+
+class TestProcessLargeBatch:
+    def test_results_merged_in_input_order(self):
+        # First chunk finishes last
+        server = _FakeBatchServer(delays={URLS[0]: 0.2})
+
+        docs = process_large_batch(server, URLS, chunk_size=2, max_workers=3)
+
+        assert [d.markdown for d in docs] == URLS
+        assert server.max_in_flight >= 2
+
+    def test_respects_server_concurrency(self):
+        server = _FakeBatchServer(max_concurrency=2, delays={u: 0.05 for u in URLS})
+
+        process_large_batch(server, URLS, chunk_size=1, max_workers=5)
+
+        assert server.max_in_flight <= 2
+        assert {c for _, c in server.started} == {1}
+
+    def test_resume_from_checkpoint(self, tmp_path):
+        checkpoint_path = tmp_path / "batch.json"
+        first = _FakeBatchServer(fail_urls={URLS[4]})
+
+        with pytest.raises(ConnectionError):
+            process_large_batch(first, URLS, chunk_size=2, max_workers=1, checkpoint_path=checkpoint_path)
+        saved = json.loads(checkpoint_path.read_text())
+        assert set(saved["jobs"]) == {"0", "1", "2"}
+
+        second = _FakeBatchServer()
+        second.jobs = {job_id: urls for job_id, urls in first.jobs.items()}
+        second.jobs["job-2"] = URLS[4:6]
+
+        docs = process_large_batch(second, URLS, chunk_size=2, max_workers=2, checkpoint_path=checkpoint_path)
+
+        assert [d.markdown for d in docs] == URLS
+        assert second.started == []
+        assert not checkpoint_path.exists()
+
+    def test_checkpoint_for_other_urls_is_rejected(self, tmp_path):
+        checkpoint_path = tmp_path / "batch.json"
+        LargeBatchCheckpoint(checkpoint_path, URLS, 2).record(0, "job-0")
+
+        with pytest.raises(ValueError):
+            process_large_batch(_FakeBatchServer(), URLS[:4], chunk_size=2, checkpoint_path=checkpoint_path)
+
+
+class TestProcessLargeBatchAsync:
+    @pytest.mark.asyncio
+    async def test_results_merged_in_input_order(self):
+        server = _FakeBatchServer(max_concurrency=10)
+        client = Mock()
+        client.get = server.aget
+        client.post = server.apost
+
+        docs = await process_large_batch_async(client, URLS, chunk_size=4, max_workers=2)
+
+        assert [d.markdown for d in docs] == URLS
+        assert [c for _, c in server.started] == [5, 5]
@@ -0,0 +1,155 @@
+"""
+Unit tests for unvalidated (fast-path) document building.
+
+The build-time comparison against validation is a micro-benchmark, skipped unless
+FIRECRAWL_BENCHMARKS is set.
+"""
+
+import os
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.methods.crawl import get_crawl_status
+from firecrawl.v2.methods.search import _transform_array
+from firecrawl.v2.types import (
+    BrandingProfile, Document, DocumentMetadata, SearchResultImages, SearchResultNews,
+)
+from firecrawl.v2.utils.normalize import build_document, construct_document, validates_documents
+
+
+def _raw_doc(i):
+    return {
+        "markdown": f"# Page {i}\n\nSome body text for page {i}.",
+        "rawHtml": f"<html><body>Page {i}</body></html>",
+        "links": [f"https://example.com/{i}/a", f"https://example.com/{i}/b"],
+        "changeTracking": {"changeStatus": "same"},
+        "metadata": {
+            "title": f"Page {i}",
+            "description": "A page",
+            "sourceURL": f"https://example.com/{i}",
+            "statusCode": 200,
+            "ogTitle": f"Page {i}",
+            "contentType": "text/html",
+            "customTag": "extra",
+        },
+    }
+
+
+FIXTURE = [_raw_doc(i) for i in range(20)]
+
+
+class TestConstructDocument:
+    def test_matches_validated_document(self):
+        raw = _raw_doc(1)
+
+        fast = construct_document(raw)
+        validated = build_document(raw)
+
+        assert isinstance(fast, Document)
+        assert isinstance(fast.metadata, DocumentMetadata)
+        assert fast.model_dump() == validated.model_dump()
+        assert fast.metadata_dict == validated.metadata_dict
+        assert fast.metadata.source_url == "https://example.com/1"
+        assert fast.metadata.extras == validated.metadata.extras == {"customTag": "extra"}
+
+    def test_does_not_mutate_input(self):
+        raw = _raw_doc(1)
+        construct_document(raw)
+        assert "rawHtml" in raw
+        assert "sourceURL" in raw["metadata"]
+
+    def test_nested_profiles_are_still_models(self):
+        doc = construct_document({"markdown": "x", "branding": {"colorScheme": "dark"}})
+        assert isinstance(doc.branding, BrandingProfile)
+        assert doc.branding.color_scheme == "dark"
+
+    def test_fixture_builds_equal_documents_either_way(self):
+        for raw in FIXTURE:
+            assert build_document(raw, False).model_dump() == build_document(raw, True).model_dump()
+
+    def test_fast_path_skips_validation(self, monkeypatch):
+        monkeypatch.setattr(Document, "__init__", Mock(side_effect=AssertionError("validated")))
+        monkeypatch.setattr(
+            "firecrawl.v2.utils.normalize.DocumentMetadata.model_validate",
+            Mock(side_effect=AssertionError("validated")),
+        )
+        assert [build_document(raw, False).metadata.title for raw in FIXTURE[:3]] == [
+            "Page 0", "Page 1", "Page 2",
+        ]
+
+    def test_can_be_validated_later(self):
+        doc = construct_document(_raw_doc(2))
+        assert Document.model_validate(doc.model_dump()).metadata.status_code == 200
+
+
+class TestValidationSetting:
+    def test_defaults_to_validation(self):
+        assert validates_documents(object()) is True
+        assert FirecrawlClient(api_key="fc-test").http_client.validate_documents is True
+
+    def test_client_option_reaches_transport(self):
+        client = FirecrawlClient(api_key="fc-test", validate_documents=False)
+        assert client.config.validate_documents is False
+        assert validates_documents(client.http_client) is False
+
+    def test_crawl_status_uses_fast_path(self, monkeypatch):
+        response = Mock()
+        response.ok = True
+        response.json.return_value = {
+            "success": True,
+            "status": "completed",
+            "completed": 2,
+            "total": 2,
+            "data": FIXTURE[:2],
+        }
+        http_client = Mock()
+        http_client.validate_documents = False
+        http_client.get.return_value = response
+        monkeypatch.setattr(
+            "firecrawl.v2.utils.normalize.DocumentMetadata.model_validate",
+            Mock(side_effect=AssertionError("validated")),
+        )
+
+        job = get_crawl_status(http_client, "job-1")
+
+        assert [d.metadata.title for d in job.data] == ["Page 0", "Page 1"]
+
+    def test_search_image_and_news_keys_survive_fast_path(self):
+        images = _transform_array(
+            [{"title": "Cat", "imageUrl": "https://img", "imageWidth": 640, "imageHeight": 480, "url": "https://p"}],
+            SearchResultImages,
+            False,
+        )
+        news = _transform_array(
+            [{"title": "Story", "url": "https://n", "imageUrl": "https://img"}],
+            SearchResultNews,
+            False,
+        )
+
+        assert (images[0].image_url, images[0].image_width, images[0].image_height) == ("https://img", 640, 480)
+        assert news[0].image_url == "https://img"
+
+
+@pytest.mark.skipif(
+    not os.getenv("FIRECRAWL_BENCHMARKS"),
+    reason="set FIRECRAWL_BENCHMARKS=1 to run micro-benchmarks",
+)
+class TestDocumentBuildBenchmark:
+    def test_fast_path_beats_validation_on_10k_documents(self):
+        fixture = [_raw_doc(i) for i in range(10_000)]
+
+        def best(validate):
+            runs = []
+            for _ in range(3):
+                start = time.perf_counter()
+                docs = [build_document(raw, validate) for raw in fixture]
+                runs.append(time.perf_counter() - start)
+            assert len(docs) == len(fixture)
+            return min(runs)
+
+        validated = best(True)
+        fast = best(False)
+        assert fast < validated
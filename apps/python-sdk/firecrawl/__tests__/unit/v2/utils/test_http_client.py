@@ -0,0 +1,96 @@
+"""
+Unit tests for the pooled sync HTTP transport.
+"""
+
+import threading
+from unittest.mock import Mock, patch
+
+import requests
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.utils.http_client import HttpClient
+
+
+class TestHttpClientSession:
+    """Tests for HttpClient session pooling and lifecycle."""
+
+    def test_session_is_reused_across_requests(self):
+        client = HttpClient("fc-key", "https://api.example.com")
+        response = Mock(status_code=200)
+        with patch.object(requests.Session, "get", return_value=response) as mock_get, \
+                patch.object(requests.Session, "post", return_value=response) as mock_post:
+            session = client.session
+            client.get("/v2/crawl/abc")
+            client.post("/v2/scrape", {"url": "https://example.com"})
+            client.get("/v2/crawl/abc")
+
+        assert client.session is session
+        assert mock_get.call_count == 2
+        assert mock_post.call_count == 1
+
+    def test_adapter_uses_pool_settings(self):
+        client = HttpClient("fc-key", "https://api.example.com", pool_connections=3, pool_maxsize=7, pool_block=True)
+        adapter = client.session.get_adapter("https://api.example.com/v2/scrape")
+        assert adapter._pool_connections == 3
+        assert adapter._pool_maxsize == 7
+        assert adapter._pool_block is True
+        assert adapter.max_retries.total == 0
+
+    def test_keep_alive_disabled_sends_connection_close(self):
+        client = HttpClient("fc-key", "https://api.example.com", keep_alive=False)
+        assert client.session.headers["Connection"] == "close"
+
+    def test_session_created_once_across_threads(self):
+        client = HttpClient("fc-key", "https://api.example.com")
+        seen = []
+
+        def grab():
+            seen.append(client.session)
+
+        threads = [threading.Thread(target=grab) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len({id(s) for s in seen}) == 1
+
+    def test_close_releases_session_and_allows_reuse(self):
+        client = HttpClient("fc-key", "https://api.example.com")
+        first = client.session
+        with patch.object(first, "close") as mock_close:
+            client.close()
+        mock_close.assert_called_once()
+        assert client.session is not first
+
+    def test_context_manager_closes(self):
+        with HttpClient("fc-key", "https://api.example.com") as client:
+            session = client.session
+        assert client._session is None
+        assert session is not client.session
+
+    def test_retries_on_502_through_session(self):
+        client = HttpClient("fc-key", "https://api.example.com", max_retries=2, backoff_factor=0)
+        bad = Mock(status_code=502)
+        good = Mock(status_code=200)
+        with patch.object(requests.Session, "get", side_effect=[bad, good]) as mock_get:
+            response = client.get("/v2/crawl/abc")
+        assert response is good
+        assert mock_get.call_count == 2
+
+
+class TestFirecrawlClientPoolOptions:
+    """Tests for pool options exposed on FirecrawlClient."""
+
+    def test_pool_options_are_forwarded(self):
+        client = FirecrawlClient(api_key="fc-key", pool_maxsize=32, keep_alive=False)
+        assert client.http_client.pool_maxsize == 32
+        assert client.http_client.keep_alive is False
+        assert client.config.pool_maxsize == 32
+
+    def test_client_context_manager_closes_http_client(self):
+        client = FirecrawlClient(api_key="fc-key")
+        with patch.object(client.http_client, "close") as mock_close:
+            with client:
+                pass
+        mock_close.assert_called_once()
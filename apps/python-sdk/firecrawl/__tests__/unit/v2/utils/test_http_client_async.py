@@ -0,0 +1,98 @@
+"""
+Unit tests for the async HTTP transport connection pool.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from firecrawl.v2.client_async import AsyncFirecrawlClient
+from firecrawl.v2.utils import http_client_async
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"success": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_api():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class TestAsyncHttpClientPool:
+    def test_keepalive_enabled_by_default(self):
+        client = AsyncHttpClient("fc-key", "http://localhost")
+        assert client.limits.max_keepalive_connections == 20
+        assert client.limits.max_connections == 100
+
+    def test_custom_limits(self):
+        client = AsyncHttpClient(
+            "fc-key",
+            "http://localhost",
+            max_connections=8,
+            max_keepalive_connections=4,
+            keepalive_expiry=30.0,
+        )
+        stats = client.pool_stats()
+        assert stats["max_connections"] == 8
+        assert stats["max_keepalive_connections"] == 4
+        assert stats["keepalive_expiry"] == 30.0
+        assert stats["connections"] == 0
+
+    def test_http2_falls_back_without_h2(self, monkeypatch):
+        monkeypatch.setattr(http_client_async, "_http2_available", lambda: False)
+        client = AsyncHttpClient("fc-key", "http://localhost", http2=True)
+        assert client.http2 is False
+        assert client.pool_stats()["http2"] is False
+
+    @pytest.mark.asyncio
+    async def test_sequential_requests_reuse_connection(self, local_api):
+        async with AsyncHttpClient("fc-key", local_api) as client:
+            for _ in range(3):
+                response = await client.get("/v2/team/credit-usage")
+                assert response.status_code == 200
+            stats = client.pool_stats()
+        assert stats["connections"] == 1
+        assert stats["idle"] == 1
+        assert stats["active"] == 0
+
+    @pytest.mark.asyncio
+    async def test_keepalive_disabled_does_not_pool(self, local_api):
+        async with AsyncHttpClient("fc-key", local_api, max_keepalive_connections=0) as client:
+            await client.get("/v2/team/credit-usage")
+            await client.get("/v2/team/credit-usage")
+            stats = client.pool_stats()
+        assert stats["connections"] == 0
+
+
+class TestAsyncFirecrawlClientPoolOptions:
+    def test_options_forwarded(self):
+        client = AsyncFirecrawlClient(api_key="fc-key", api_url="http://localhost", max_connections=50)
+        assert client.async_http_client.limits.max_connections == 50
+        assert client.pool_stats()["max_connections"] == 50
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager_closes(self):
+        async with AsyncFirecrawlClient(api_key="fc-key", api_url="http://localhost") as client:
+            pass
+        assert client.async_http_client._client.is_closed
@@ -0,0 +1,131 @@
+"""
+Unit tests for the prefetching result paginator.
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from firecrawl.v2.types import PaginationConfig
+from firecrawl.v2.utils.pagination import iter_result_pages, aiter_result_pages
+
+
+def _page(i, last):
+    response = Mock()
+    response.ok = True
+    response.status_code = 200
+    response.json.return_value = {
+        "success": True,
+        "data": [{"markdown": f"doc {i}"}],
+        "next": None if i == last else f"https://api.example.com/v2/crawl/job?skip={i + 1}",
+    }
+    return response
+
+
+def _url_index(url):
+    return int(url.rsplit("=", 1)[1])
+
+
+class TestIterResultPages:
+    def test_default_prefetch_depth(self):
+        assert PaginationConfig().prefetch_pages == 1
+
+    def test_yields_pages_in_order(self):
+        get_page = Mock(side_effect=lambda url: _page(_url_index(url), 4))
+
+        bodies = list(iter_result_pages(get_page, "https://api.example.com/v2/crawl/job?skip=1"))
+
+        assert [b["data"][0]["markdown"] for b in bodies] == ["doc 1", "doc 2", "doc 3", "doc 4"]
+        assert get_page.call_count == 4
+
+    def test_next_request_overlaps_consumer_work(self):
+        fetched = []
+        second_fetched = threading.Event()
+
+        def get_page(url):
+            i = _url_index(url)
+            fetched.append(i)
+            if i == 2:
+                second_fetched.set()
+            return _page(i, 3)
+
+        pages = iter_result_pages(get_page, "https://api.example.com/v2/crawl/job?skip=1")
+        next(pages)
+        # While the caller is still "parsing" page 1, page 2 is requested in the background
+        assert second_fetched.wait(timeout=2)
+        time.sleep(0.05)
+        assert fetched == [1, 2]
+        assert len(list(pages)) == 2
+
+    def test_look_ahead_is_bounded(self):
+        fetched = []
+
+        def get_page(url):
+            fetched.append(_url_index(url))
+            return _page(_url_index(url), 10)
+
+        config = PaginationConfig(prefetch_pages=2)
+        pages = iter_result_pages(get_page, "https://api.example.com/v2/crawl/job?skip=1", pagination_config=config)
+        next(pages)
+        time.sleep(0.2)
+        assert fetched == [1, 2, 3]
+        pages.close()
+
+    def test_prefetch_disabled_is_sequential(self):
+        fetched = []
+
+        def get_page(url):
+            fetched.append(_url_index(url))
+            return _page(_url_index(url), 3)
+
+        config = PaginationConfig(prefetch_pages=0)
+        pages = iter_result_pages(get_page, "https://api.example.com/v2/crawl/job?skip=1", pagination_config=config)
+        next(pages)
+        time.sleep(0.05)
+        assert fetched == [1]
+
+    def test_transport_errors_propagate(self):
+        get_page = Mock(side_effect=ConnectionError("boom"))
+
+        with pytest.raises(ConnectionError):
+            list(iter_result_pages(get_page, "https://api.example.com/v2/crawl/job?skip=1"))
+
+    def test_max_results_stops_producer(self):
+        get_page = Mock(side_effect=lambda url: _page(_url_index(url), 10))
+        config = PaginationConfig(max_results=3, prefetch_pages=4)
+
+        bodies = list(iter_result_pages(get_page, "https://api.example.com/v2/crawl/job?skip=1", initial_count=1, pagination_config=config))
+
+        assert len(bodies) == 2
+        assert get_page.call_count == 2
+
+
+class TestAiterResultPages:
+    @pytest.mark.asyncio
+    async def test_yields_pages_in_order_with_overlap(self):
+        fetched = []
+
+        async def get_page(url):
+            fetched.append(_url_index(url))
+            await asyncio.sleep(0)
+            return _page(_url_index(url), 3)
+
+        pages = aiter_result_pages(get_page, "https://api.example.com/v2/crawl/job?skip=1")
+        first = await pages.__anext__()
+        await asyncio.sleep(0.01)
+        assert first["data"][0]["markdown"] == "doc 1"
+        assert fetched == [1, 2]
+        rest = [body async for body in pages]
+        assert len(rest) == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate(self):
+        async def get_page(url):
+            raise ConnectionError("boom")
+
+        with pytest.raises(ConnectionError):
+            async for _ in aiter_result_pages(get_page, "https://api.example.com/v2/crawl/job?skip=1"):
+                pass
@@ -19,22 +19,25 @@ Check example.py for other usage examples.
 """
 
 from pathlib import Path
-from typing import Any, Dict, Optional, List, Union, BinaryIO
+from typing import TYPE_CHECKING, Any, Dict, Optional, List, Union, BinaryIO
 import logging
 
 
-from .v1 import V1FirecrawlApp, AsyncV1FirecrawlApp
-from .v2 import FirecrawlClient as V2FirecrawlClient
-from .v2.client_async import AsyncFirecrawlClient
+from .v2.client import FirecrawlClient as V2FirecrawlClient
 from .v2.types import Document, ParseOptions, ScrapeOptions
 
+if TYPE_CHECKING:
+    # The v1 and async clients pull in aiohttp/httpx; they are imported on first use
+    from .v1 import V1FirecrawlApp, AsyncV1FirecrawlApp
+    from .v2.client_async import AsyncFirecrawlClient
+
 logger = logging.getLogger("firecrawl")
 
 class V1Proxy:
     """Type-annotated proxy for v1 client methods."""
-    _client: Optional[V1FirecrawlApp]
+    _client: Optional["V1FirecrawlApp"]
     
-    def __init__(self, client_instance: Optional[V1FirecrawlApp]):
+    def __init__(self, client_instance: Optional["V1FirecrawlApp"]):
         self._client = client_instance
 
         if client_instance:
@@ -69,6 +72,7 @@ class V2Proxy:
             self.start_crawl = client_instance.start_crawl
             self.get_crawl_status = client_instance.get_crawl_status
             self.get_crawl_status_page = client_instance.get_crawl_status_page
+            self.iter_crawl_documents = client_instance.iter_crawl_documents
             self.cancel_crawl = client_instance.cancel_crawl
             self.get_crawl_errors = client_instance.get_crawl_errors
             self.get_active_crawls = client_instance.get_active_crawls
@@ -87,8 +91,10 @@ class V2Proxy:
             self.start_batch_scrape = client_instance.start_batch_scrape
             self.get_batch_scrape_status = client_instance.get_batch_scrape_status
             self.get_batch_scrape_status_page = client_instance.get_batch_scrape_status_page
+            self.iter_batch_documents = client_instance.iter_batch_documents
             self.cancel_batch_scrape = client_instance.cancel_batch_scrape
             self.batch_scrape = client_instance.batch_scrape
+            self.process_large_batch = client_instance.process_large_batch
             self.get_batch_scrape_errors = client_instance.get_batch_scrape_errors
 
             self.map = client_instance.map
@@ -118,9 +124,9 @@ class V2Proxy:
 
 class AsyncV1Proxy:
     """Type-annotated proxy for v1 client methods."""
-    _client: Optional[AsyncV1FirecrawlApp]
+    _client: Optional["AsyncV1FirecrawlApp"]
     
-    def __init__(self, client_instance: Optional[AsyncV1FirecrawlApp]):
+    def __init__(self, client_instance: Optional["AsyncV1FirecrawlApp"]):
         self._client = client_instance
 
         if client_instance:
@@ -137,9 +143,9 @@ class AsyncV1Proxy:
 
 class AsyncV2Proxy:
     """Proxy class that forwards method calls to the appropriate version client."""
-    _client: Optional[AsyncFirecrawlClient] = None
+    _client: Optional["AsyncFirecrawlClient"] = None
 
-    def __init__(self, client_instance: Optional[AsyncFirecrawlClient] = None):
+    def __init__(self, client_instance: Optional["AsyncFirecrawlClient"] = None):
         self._client = client_instance
 
         if client_instance:
@@ -156,6 +162,7 @@ class AsyncV2Proxy:
             self.wait_crawl = client_instance.wait_crawl
             self.get_crawl_status = client_instance.get_crawl_status
             self.get_crawl_status_page = client_instance.get_crawl_status_page
+            self.iter_crawl_documents = client_instance.iter_crawl_documents
             self.cancel_crawl = client_instance.cancel_crawl
             self.get_crawl_errors = client_instance.get_crawl_errors
             self.get_active_crawls = client_instance.get_active_crawls
@@ -174,9 +181,11 @@ class AsyncV2Proxy:
             self.start_batch_scrape = client_instance.start_batch_scrape
             self.get_batch_scrape_status = client_instance.get_batch_scrape_status
             self.get_batch_scrape_status_page = client_instance.get_batch_scrape_status_page
+            self.iter_batch_documents = client_instance.iter_batch_documents
             self.cancel_batch_scrape = client_instance.cancel_batch_scrape
             self.wait_batch_scrape = client_instance.wait_batch_scrape
             self.batch_scrape = client_instance.batch_scrape
+            self.process_large_batch = client_instance.process_large_batch
             self.get_batch_scrape_errors = client_instance.get_batch_scrape_errors
 
             self.map = client_instance.map
@@ -222,6 +231,11 @@ class Firecrawl:
         timeout: float = None,
         max_retries: int = 3,
         backoff_factor: float = 0.5,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        validate_documents: bool = True,
     ):
         """Initialize the unified client.
 
@@ -231,22 +245,32 @@ class Firecrawl:
             timeout: Default request timeout in seconds for all HTTP requests
             max_retries: Maximum number of retries for failed requests (default: 3)
             backoff_factor: Exponential backoff factor for retries (default: 0.5)
+            pool_connections: Number of per-host connection pools to keep (default: 10)
+            pool_maxsize: Maximum number of pooled connections per host (default: 10)
+            pool_block: Block instead of opening extra connections when the pool is full (default: False)
+            keep_alive: Reuse connections between requests (default: True)
+            validate_documents: Validate crawl, batch and search documents field by field (default: True);
+                set to False for faster, unvalidated documents built by ``_construct_model``
         """
         self.api_key = api_key
         self.api_url = api_url
 
         # Initialize version-specific clients
-        self._v1_client = V1FirecrawlApp(api_key=api_key, api_url=api_url) if V1FirecrawlApp else None
+        self._v1_client = None
+        self._v1_proxy: Optional[V1Proxy] = None
         self._v2_client = V2FirecrawlClient(
             api_key=api_key,
             api_url=api_url,
             timeout=timeout,
             max_retries=max_retries,
             backoff_factor=backoff_factor,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            validate_documents=validate_documents,
         ) if V2FirecrawlClient else None
-        
-        # Create version-specific proxies
-        self.v1 = V1Proxy(self._v1_client) if self._v1_client else None
+
         self.v2 = V2Proxy(self._v2_client)
         
         self.scrape = self._v2_client.scrape
@@ -272,6 +296,7 @@ class Firecrawl:
         self.crawl_params_preview = self._v2_client.crawl_params_preview
         self.get_crawl_status = self._v2_client.get_crawl_status
         self.get_crawl_status_page = self._v2_client.get_crawl_status_page
+        self.iter_crawl_documents = self._v2_client.iter_crawl_documents
         self.cancel_crawl = self._v2_client.cancel_crawl
         self.get_crawl_errors = self._v2_client.get_crawl_errors
         self.get_active_crawls = self._v2_client.get_active_crawls
@@ -280,8 +305,10 @@ class Firecrawl:
         self.start_batch_scrape = self._v2_client.start_batch_scrape
         self.get_batch_scrape_status = self._v2_client.get_batch_scrape_status
         self.get_batch_scrape_status_page = self._v2_client.get_batch_scrape_status_page
+        self.iter_batch_documents = self._v2_client.iter_batch_documents
         self.cancel_batch_scrape = self._v2_client.cancel_batch_scrape
         self.batch_scrape = self._v2_client.batch_scrape
+        self.process_large_batch = self._v2_client.process_large_batch
         self.get_batch_scrape_errors = self._v2_client.get_batch_scrape_errors
 
         self.start_extract = self._v2_client.start_extract
@@ -316,6 +343,27 @@ class Firecrawl:
         self.check_batch_scrape_status = self._v2_client.check_batch_scrape_status
         self.check_batch_scrape_errors = self._v2_client.check_batch_scrape_errors
 
+    @property
+    def v1(self) -> V1Proxy:
+        """Feature-frozen v1 client, created on first access."""
+        if self._v1_proxy is None:
+            from .v1 import V1FirecrawlApp
+
+            self._v1_client = V1FirecrawlApp(api_key=self.api_key, api_url=self.api_url)
+            self._v1_proxy = V1Proxy(self._v1_client)
+        return self._v1_proxy
+
+    def close(self) -> None:
+        """Release pooled HTTP connections held by the v2 client."""
+        if self._v2_client:
+            self._v2_client.close()
+
+    def __enter__(self) -> "Firecrawl":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
     def parse(
         self,
         file: Union[str, Path, bytes, bytearray, BinaryIO],
@@ -342,22 +390,33 @@ class AsyncFirecrawl:
         timeout: float = None,
         max_retries: int = 3,
         backoff_factor: float = 0.5,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        validate_documents: bool = True,
     ):
         self.api_key = api_key
         self.api_url = api_url
 
         # Initialize version-specific clients
-        self._v1_client = AsyncV1FirecrawlApp(api_key=api_key, api_url=api_url) if AsyncV1FirecrawlApp else None
+        from .v2.client_async import AsyncFirecrawlClient
+
+        self._v1_client = None
+        self._v1_proxy: Optional[AsyncV1Proxy] = None
         self._v2_client = AsyncFirecrawlClient(
             api_key=api_key,
             api_url=api_url,
             timeout=timeout,
             max_retries=max_retries,
             backoff_factor=backoff_factor,
-        ) if AsyncFirecrawlClient else None
-        
-        # Create version-specific proxies
-        self.v1 = AsyncV1Proxy(self._v1_client) if self._v1_client else None
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            validate_documents=validate_documents,
+        )
+
         self.v2 = AsyncV2Proxy(self._v2_client)
 
         # Expose v2 async surface directly on the top-level client for ergonomic access
@@ -383,6 +442,7 @@ class AsyncFirecrawl:
         self.start_crawl = self._v2_client.start_crawl
         self.get_crawl_status = self._v2_client.get_crawl_status
         self.get_crawl_status_page = self._v2_client.get_crawl_status_page
+        self.iter_crawl_documents = self._v2_client.iter_crawl_documents
         self.cancel_crawl = self._v2_client.cancel_crawl
         self.crawl = self._v2_client.crawl
         self.get_crawl_errors = self._v2_client.get_crawl_errors
@@ -392,8 +452,10 @@ class AsyncFirecrawl:
         self.start_batch_scrape = self._v2_client.start_batch_scrape
         self.get_batch_scrape_status = self._v2_client.get_batch_scrape_status
         self.get_batch_scrape_status_page = self._v2_client.get_batch_scrape_status_page
+        self.iter_batch_documents = self._v2_client.iter_batch_documents
         self.cancel_batch_scrape = self._v2_client.cancel_batch_scrape
         self.batch_scrape = self._v2_client.batch_scrape
+        self.process_large_batch = self._v2_client.process_large_batch
         self.get_batch_scrape_errors = self._v2_client.get_batch_scrape_errors
 
         self.start_extract = self._v2_client.start_extract
@@ -428,6 +490,31 @@ class AsyncFirecrawl:
         self.check_batch_scrape_status = self._v2_client.check_batch_scrape_status
         self.check_batch_scrape_errors = self._v2_client.check_batch_scrape_errors
 
+    @property
+    def v1(self) -> AsyncV1Proxy:
+        """Feature-frozen async v1 client, created on first access."""
+        if self._v1_proxy is None:
+            from .v1 import AsyncV1FirecrawlApp
+
+            self._v1_client = AsyncV1FirecrawlApp(api_key=self.api_key, api_url=self.api_url)
+            self._v1_proxy = AsyncV1Proxy(self._v1_client)
+        return self._v1_proxy
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Return connection-pool occupancy for the async v2 transport."""
+        return self._v2_client.pool_stats()
+
+    async def close(self) -> None:
+        """Close pooled connections held by the v2 client."""
+        if self._v2_client:
+            await self._v2_client.close()
+
+    async def __aenter__(self) -> "AsyncFirecrawl":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
     async def parse(
         self,
         file: Union[str, Path, bytes, bytearray, BinaryIO],
@@ -1,4 +1,17 @@
+from typing import TYPE_CHECKING, Any
+
 from .client import FirecrawlClient
-from .client_async import AsyncFirecrawlClient
 
-__all__ = ["FirecrawlClient", "AsyncFirecrawlClient"]
\ No newline at end of file
+if TYPE_CHECKING:
+    from .client_async import AsyncFirecrawlClient
+
+__all__ = ["FirecrawlClient", "AsyncFirecrawlClient"]
+
+
+def __getattr__(name: str) -> Any:
+    # Defer the httpx-based async client until it is actually used
+    if name == "AsyncFirecrawlClient":
+        from .client_async import AsyncFirecrawlClient
+
+        return AsyncFirecrawlClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
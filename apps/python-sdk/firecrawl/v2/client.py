@@ -6,7 +6,7 @@ This module provides the main client class that orchestrates all v2 functionalit
 
 import os
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Callable, Union, Literal, BinaryIO
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Callable, Union, Literal, BinaryIO, Iterator
 from .types import (
     ClientConfig,
     ParseOptions,
@@ -67,7 +67,10 @@ from .methods import agent as agent_module
 from .methods import browser as browser_module
 from .methods import monitor as monitor_module
 from .methods import research as research_module
-from .watcher import Watcher
+
+if TYPE_CHECKING:
+    # watcher pulls in websockets; imported when a watcher is created
+    from .watcher import Watcher
 
 # Kwargs that map to ScrapeOptions fields. Used by async crawl normalization
 # to extract scrape kwargs from **kwargs before building CrawlRequest.
@@ -99,7 +102,12 @@ class FirecrawlClient:
         api_url: str = "https://api.firecrawl.dev",
         timeout: Optional[float] = None,
         max_retries: int = 3,
-        backoff_factor: float = 0.5
+        backoff_factor: float = 0.5,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        validate_documents: bool = True,
     ):
         """
         Initialize the Firecrawl client.
@@ -110,6 +118,12 @@ class FirecrawlClient:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
             backoff_factor: Exponential backoff factor for retries (e.g. 0.5 means wait 0.5s, then 1s, then 2s between retries)
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Maximum number of connections kept open per host
+            pool_block: Whether to block when the pool is exhausted instead of opening extra connections
+            keep_alive: Whether to reuse connections between requests
+            validate_documents: Whether to validate crawl, batch and search documents field by field;
+                set to False to build them with ``_construct_model`` (no field validation), which is much faster for large results
         """
         if api_key is None:
             api_key = os.getenv("FIRECRAWL_API_KEY")
@@ -124,7 +138,12 @@ class FirecrawlClient:
             api_url=api_url,
             timeout=timeout,
             max_retries=max_retries,
-            backoff_factor=backoff_factor
+            backoff_factor=backoff_factor,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            validate_documents=validate_documents,
         )
 
         self.http_client = HttpClient(
@@ -133,7 +152,22 @@ class FirecrawlClient:
             timeout=timeout,
             max_retries=max_retries,
             backoff_factor=backoff_factor,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            validate_documents=validate_documents,
         )
+
+    def close(self) -> None:
+        """Release pooled HTTP connections held by the client."""
+        self.http_client.close()
+
+    def __enter__(self) -> "FirecrawlClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
     
     def scrape(
         self,
@@ -799,6 +833,37 @@ class FirecrawlClient:
             next_url,
             request_timeout=request_timeout,
         )
+
+    def iter_crawl_documents(
+        self,
+        job_id: str,
+        *,
+        follow: bool = False,
+        poll_interval: float = 2,
+        timeout: Optional[float] = None,
+        request_timeout: Optional[float] = None,
+    ) -> Iterator[Document]:
+        """
+        Lazily iterate over crawl results page by page with bounded memory.
+
+        Args:
+            job_id: ID of the crawl job
+            follow: Keep polling a running crawl until it reaches a terminal state
+            poll_interval: Seconds between status checks when following
+            timeout: Maximum seconds to follow the crawl (None for no timeout)
+            request_timeout: Timeout (in seconds) for each HTTP request
+
+        Returns:
+            Iterator of Document objects in result order
+        """
+        return crawl_module.iter_crawl_documents(
+            self.http_client,
+            job_id,
+            follow=follow,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            request_timeout=request_timeout,
+        )
     
     def get_crawl_errors(self, crawl_id: str) -> CrawlErrorsResponse:
         """
@@ -1280,6 +1345,36 @@ class FirecrawlClient:
             request_timeout=request_timeout,
         )
 
+    def iter_batch_documents(
+        self,
+        job_id: str,
+        *,
+        follow: bool = False,
+        poll_interval: float = 2,
+        timeout: Optional[float] = None,
+        request_timeout: Optional[float] = None,
+    ) -> Iterator[Document]:
+        """Lazily iterate over batch scrape results page by page with bounded memory.
+
+        Args:
+            job_id: ID of the batch scrape job
+            follow: Keep polling a running job until it reaches a terminal state
+            poll_interval: Seconds between status checks when following
+            timeout: Maximum seconds to follow the job (None for no timeout)
+            request_timeout: Timeout (in seconds) for each HTTP request
+
+        Returns:
+            Iterator of Document objects in result order
+        """
+        return batch_module.iter_batch_documents(
+            self.http_client,
+            job_id,
+            follow=follow,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            request_timeout=request_timeout,
+        )
+
     def cancel_batch_scrape(self, job_id: str) -> bool:
         """Cancel a running batch scrape job.
 
@@ -1544,7 +1639,7 @@ class FirecrawlClient:
         kind: Literal["crawl", "batch"] = "crawl",
         poll_interval: int = 2,
         timeout: Optional[int] = None,
-    ) -> Watcher:
+    ) -> "Watcher":
         """Create a watcher for crawl or batch jobs.
 
         Args:
@@ -1556,6 +1651,8 @@ class FirecrawlClient:
         Returns:
             Watcher instance
         """
+        from .watcher import Watcher
+
         return Watcher(self, job_id, kind=kind, poll_interval=poll_interval, timeout=timeout)
 
     def batch_scrape(
@@ -1637,3 +1734,40 @@ class FirecrawlClient:
             timeout=wait_timeout,
         )
     
+
+    def process_large_batch(
+        self,
+        urls: List[str],
+        *,
+        options: Optional[ScrapeOptions] = None,
+        chunk_size: int = 100,
+        max_workers: Optional[int] = None,
+        checkpoint_path: Optional[Union[str, Path]] = None,
+        poll_interval: int = 2,
+        wait_timeout: Optional[int] = None,
+    ) -> List[Document]:
+        """
+        Scrape a large URL list as several concurrent batch jobs.
+
+        Args:
+            urls: URLs to scrape
+            options: Scrape options applied to every chunk
+            chunk_size: Number of URLs per batch job
+            max_workers: Maximum chunk jobs in flight (capped by the team's concurrency limit)
+            checkpoint_path: Optional file recording started jobs so an interrupted run can resume
+            poll_interval: Seconds between status checks
+            wait_timeout: Maximum seconds to wait per chunk
+
+        Returns:
+            Scraped documents in input order
+        """
+        return batch_module.process_large_batch(
+            self.http_client,
+            urls,
+            options=options,
+            chunk_size=chunk_size,
+            poll_interval=poll_interval,
+            timeout=wait_timeout,
+            max_workers=max_workers,
+            checkpoint_path=checkpoint_path,
+        )
@@ -3,11 +3,10 @@ Async v2 client mirroring the regular client surface using true async HTTP trans
 """
 
 import os
-import asyncio
-import time
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union, Callable, Literal, BinaryIO
+from typing import Optional, List, Dict, Any, Union, Callable, Literal, BinaryIO, AsyncIterator
 from .types import (
+    Document,
     ParseOptions,
     ScrapeOptions,
     CrawlRequest,
@@ -78,7 +77,28 @@ class AsyncFirecrawlClient:
         timeout: Optional[float] = None,
         max_retries: int = 3,
         backoff_factor: float = 0.5,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        validate_documents: bool = True,
     ):
+        """
+        Initialize the async Firecrawl client.
+
+        Args:
+            api_key: Firecrawl API key (or set FIRECRAWL_API_KEY env var)
+            api_url: Base URL for the Firecrawl API
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retries for failed requests
+            backoff_factor: Exponential backoff factor for retries
+            max_connections: Maximum number of concurrent connections (None for no limit)
+            max_keepalive_connections: Maximum number of idle connections kept for reuse (0 disables keep-alive)
+            keepalive_expiry: Seconds an idle connection is kept before being closed
+            http2: Use HTTP/2 when the optional ``h2`` package is installed
+            validate_documents: Whether to validate crawl, batch and search documents field by field;
+                set to False to build them with ``_construct_model`` (no field validation), which is much faster for large results
+        """
         if api_key is None:
             api_key = os.getenv("FIRECRAWL_API_KEY")
         if self._is_cloud_service(api_url) and not api_key:
@@ -89,6 +109,7 @@ class AsyncFirecrawlClient:
             timeout=timeout,
             max_retries=max_retries,
             backoff_factor=backoff_factor,
+            validate_documents=validate_documents,
         )
         self.async_http_client = AsyncHttpClient(
             api_key,
@@ -96,8 +117,28 @@ class AsyncFirecrawlClient:
             timeout=timeout,
             max_retries=max_retries,
             backoff_factor=backoff_factor,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            validate_documents=validate_documents,
         )
 
+    async def close(self) -> None:
+        """Close pooled connections held by the client."""
+        await self.async_http_client.close()
+        self.http_client.close()
+
+    async def __aenter__(self) -> "AsyncFirecrawlClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Return connection-pool occupancy for the async transport."""
+        return self.async_http_client.pool_stats()
+
     # Scrape
     async def scrape(
         self,
@@ -290,18 +331,13 @@ class AsyncFirecrawlClient:
             - "failed": The crawl finished with an error.
             - "cancelled": The crawl was cancelled.
         """
-        start = time.monotonic()
-        while True:
-            status = await async_crawl.get_crawl_status(
-                self.async_http_client,
-                job_id,
-                request_timeout=request_timeout,
-            )
-            if status.status in ["completed", "failed", "cancelled"]:
-                return status
-            if timeout and (time.monotonic() - start) > timeout:
-                raise TimeoutError("Crawl wait timed out")
-            await asyncio.sleep(poll_interval)
+        return await async_crawl.wait_for_crawl_completion(
+            self.async_http_client,
+            job_id,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            request_timeout=request_timeout,
+        )
 
     async def crawl(self, **kwargs) -> CrawlJob:
         # wrapper combining start and wait
@@ -371,6 +407,39 @@ class AsyncFirecrawlClient:
             request_timeout=request_timeout,
         )
 
+    def iter_crawl_documents(
+        self,
+        job_id: str,
+        *,
+        follow: bool = False,
+        poll_interval: float = 2,
+        timeout: Optional[float] = None,
+        request_timeout: Optional[float] = None,
+    ) -> AsyncIterator[Document]:
+        """
+        Lazily iterate over crawl results page by page with bounded memory.
+
+        Usage: ``async for doc in client.iter_crawl_documents(job_id): ...``
+
+        Args:
+            job_id: ID of the crawl job
+            follow: Keep polling a running crawl until it reaches a terminal state
+            poll_interval: Seconds between status checks when following
+            timeout: Maximum seconds to follow the crawl (None for no timeout)
+            request_timeout: Timeout (in seconds) for each HTTP request
+
+        Returns:
+            Async iterator of Document objects in result order
+        """
+        return async_crawl.iter_crawl_documents(
+            self.async_http_client,
+            job_id,
+            follow=follow,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            request_timeout=request_timeout,
+        )
+
     async def cancel_crawl(self, job_id: str) -> bool:
         return await async_crawl.cancel_crawl(self.async_http_client, job_id)
 
@@ -529,14 +598,12 @@ class AsyncFirecrawlClient:
         return await async_batch.start_batch_scrape(self.async_http_client, urls, **kwargs)
 
     async def wait_batch_scrape(self, job_id: str, poll_interval: int = 2, timeout: Optional[int] = None) -> Any:
-        start = asyncio.get_event_loop().time()
-        while True:
-            status = await async_batch.get_batch_scrape_status(self.async_http_client, job_id)
-            if status.status in ["completed", "failed", "cancelled"]:
-                return status
-            if timeout and (asyncio.get_event_loop().time() - start) > timeout:
-                raise TimeoutError("Batch wait timed out")
-            await asyncio.sleep(poll_interval)
+        return await async_batch.wait_for_batch_completion(
+            self.async_http_client,
+            job_id,
+            poll_interval=poll_interval,
+            timeout=timeout,
+        )
 
     async def batch_scrape(self, urls: List[str], **kwargs) -> Any:
         # waiter wrapper
@@ -546,6 +613,29 @@ class AsyncFirecrawlClient:
         timeout = kwargs.get("timeout")
         return await self.wait_batch_scrape(job_id, poll_interval=poll_interval, timeout=timeout)
 
+    async def process_large_batch(
+        self,
+        urls: List[str],
+        *,
+        options: Optional[ScrapeOptions] = None,
+        chunk_size: int = 100,
+        max_workers: Optional[int] = None,
+        checkpoint_path: Optional[Union[str, Path]] = None,
+        poll_interval: float = 2,
+        wait_timeout: Optional[float] = None,
+    ) -> List[Document]:
+        """Scrape a large URL list as several concurrent batch jobs, returning documents in input order."""
+        return await async_batch.process_large_batch(
+            self.async_http_client,
+            urls,
+            options=options,
+            chunk_size=chunk_size,
+            poll_interval=poll_interval,
+            timeout=wait_timeout,
+            max_workers=max_workers,
+            checkpoint_path=checkpoint_path,
+        )
+
     async def get_batch_scrape_status(
         self, 
         job_id: str,
@@ -569,6 +659,28 @@ class AsyncFirecrawlClient:
             request_timeout=request_timeout,
         )
 
+    def iter_batch_documents(
+        self,
+        job_id: str,
+        *,
+        follow: bool = False,
+        poll_interval: float = 2,
+        timeout: Optional[float] = None,
+        request_timeout: Optional[float] = None,
+    ) -> AsyncIterator[Document]:
+        """Lazily iterate over batch scrape results page by page with bounded memory.
+
+        Usage: ``async for doc in client.iter_batch_documents(job_id): ...``
+        """
+        return async_batch.iter_batch_documents(
+            self.async_http_client,
+            job_id,
+            follow=follow,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            request_timeout=request_timeout,
+        )
+
     async def cancel_batch_scrape(self, job_id: str) -> bool:
         return await async_batch.cancel_batch_scrape(self.async_http_client, job_id)
 
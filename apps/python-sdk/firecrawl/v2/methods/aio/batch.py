@@ -1,22 +1,28 @@
-from typing import Optional, List, Dict, Any
+import os
+from typing import Optional, List, Dict, Any, AsyncIterator, Union
 from ...types import ScrapeOptions, WebhookConfig, Document, BatchScrapeResponse, BatchScrapeJob, PaginationConfig
 from ...utils.http_client_async import AsyncHttpClient
 from ...utils.validation import prepare_scrape_options
 from ...utils.error_handler import handle_response_error
-from ...utils.normalize import normalize_document_input
-from ...methods.batch import validate_batch_urls
+from ...utils.normalize import build_document, validates_documents
+from ...utils.pagination import aiter_result_pages
+from ...methods.batch import validate_batch_urls, chunk_urls, LargeBatchCheckpoint, _plan_large_batch
+from .usage import get_concurrency
+import asyncio
+import logging
 import time
 
-def _parse_batch_scrape_documents(data_list: Optional[List[Any]]) -> List[Document]:
+logger = logging.getLogger("firecrawl")
+
+def _parse_batch_scrape_documents(data_list: Optional[List[Any]], validate: bool = True) -> List[Document]:
     documents: List[Document] = []
     for doc in data_list or []:
         if isinstance(doc, dict):
-            normalized = normalize_document_input(doc)
-            documents.append(Document(**normalized))
+            documents.append(build_document(doc, validate))
     return documents
 
 
-def _parse_batch_scrape_status_response(body: Dict[str, Any]) -> Dict[str, Any]:
+def _parse_batch_scrape_status_response(body: Dict[str, Any], parse_documents: bool = True, validate: bool = True) -> Dict[str, Any]:
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
 
@@ -27,7 +33,7 @@ def _parse_batch_scrape_status_response(body: Dict[str, Any]) -> Dict[str, Any]:
         "credits_used": body.get("creditsUsed"),
         "expires_at": body.get("expiresAt"),
         "next": body.get("next"),
-        "data": _parse_batch_scrape_documents(body.get("data", []) or []),
+        "data": _parse_batch_scrape_documents(body.get("data", []) or [], validate) if parse_documents else [],
     }
 
 def _prepare(urls: List[str], *, options: Optional[ScrapeOptions] = None, **kwargs) -> Dict[str, Any]:
@@ -91,7 +97,7 @@ async def get_batch_scrape_status(
     if response.status_code >= 400:
         handle_response_error(response, "get batch scrape status")
     body = response.json()
-    payload = _parse_batch_scrape_status_response(body)
+    payload = _parse_batch_scrape_status_response(body, validate=validates_documents(client))
     docs = payload["data"]
     
     # Handle pagination if requested
@@ -139,7 +145,7 @@ async def get_batch_scrape_status_page(
     if response.status_code >= 400:
         handle_response_error(response, "get batch scrape status page")
     body = response.json()
-    payload = _parse_batch_scrape_status_response(body)
+    payload = _parse_batch_scrape_status_response(body, validate=validates_documents(client))
     return BatchScrapeJob(
         status=payload["status"],
         completed=payload["completed"],
@@ -160,6 +166,9 @@ async def _fetch_all_batch_pages_async(
     """
     Fetch all pages of batch scrape results asynchronously.
     
+    The next page is requested while the current one is being parsed, up to
+    ``pagination_config.prefetch_pages`` pages ahead.
+    
     Args:
         client: Async HTTP client instance
         next_url: URL for the next page
@@ -170,58 +179,272 @@ async def _fetch_all_batch_pages_async(
         List of all documents from all pages
     """
     documents = initial_documents.copy()
-    current_url = next_url
-    page_count = 0
-    
-    # Apply pagination limits
-    max_pages = pagination_config.max_pages if pagination_config else None
     max_results = pagination_config.max_results if pagination_config else None
-    max_wait_time = pagination_config.max_wait_time if pagination_config else None
-    
-    start_time = time.monotonic()
-    
-    while current_url:
-        # Check pagination limits
-        if (max_pages is not None) and (page_count >= max_pages):
-            break
-            
-        if (max_wait_time is not None) and (time.monotonic() - start_time) > max_wait_time:
-            break
-        
-        # Fetch next page
-        response = await client.get(current_url)
-        
-        if response.status_code >= 400:
-            # Log error but continue with what we have
-            import logging
-            logger = logging.getLogger("firecrawl")
-            logger.warning(f"Failed to fetch next page: {response.status_code}")
-            break
-        
-        page_data = response.json()
+
+    async def get_page(url: str):
+        return await client.get(url)
+
+    async for page_data in aiter_result_pages(
+        get_page,
+        next_url,
+        initial_count=len(documents),
+        pagination_config=pagination_config,
+    ):
         try:
-            page_payload = _parse_batch_scrape_status_response(page_data)
+            page_documents = _parse_batch_scrape_documents(page_data.get("data", []) or [], validates_documents(client))
         except Exception:
             break
-        
+
         # Add documents from this page
-        for document in page_payload["data"]:
+        for document in page_documents:
             # Check max_results limit
             if (max_results is not None) and (len(documents) >= max_results):
                 break
             documents.append(document)
-        
+
         # Check if we hit max_results limit
         if (max_results is not None) and (len(documents) >= max_results):
             break
-        
-        # Get next URL
-        current_url = page_payload["next"]
-        page_count += 1
-    
+
     return documents
 
 
+async def _iter_batch_pages_async(
+    client: AsyncHttpClient,
+    job_id: str,
+    *,
+    follow: bool = True,
+    poll_interval: float = 2,
+    timeout: Optional[float] = None,
+    request_timeout: Optional[float] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Walk batch scrape result pages lazily, yielding one parsed status payload per page.
+
+    Pages are read by following the ``next`` cursor, so each document is
+    downloaded and parsed once. With ``follow`` set, a running job is polled
+    from the last cursor until it reaches a terminal state. If the server does
+    not return a resume cursor while the job runs, only the status counters
+    are polled and the remaining documents are read once the job finishes.
+    """
+    start_time = time.monotonic()
+    status_url = f"/v2/batch/scrape/{job_id}"
+    cursor: Optional[str] = status_url
+    consumed = 0
+    skip = 0
+
+    while True:
+        response = await client.get(cursor or status_url, timeout=request_timeout)
+        if response.status_code >= 400:
+            handle_response_error(response, "get batch scrape status")
+        payload = _parse_batch_scrape_status_response(
+            response.json(),
+            parse_documents=cursor is not None,
+            validate=validates_documents(client),
+        )
+        terminal = payload["status"] in ["completed", "failed", "cancelled"]
+
+        if cursor is None:
+            if terminal:
+                # Re-read from the start, dropping documents that were already yielded
+                cursor = status_url
+                skip = consumed
+                continue
+        else:
+            page_documents = payload["data"]
+            if skip:
+                dropped = min(skip, len(page_documents))
+                payload["data"] = page_documents[dropped:]
+                skip -= dropped
+            consumed += len(payload["data"])
+            yield payload
+
+            next_url = payload["next"]
+
+            # More results are ready; drain them before sleeping
+            if page_documents and next_url and next_url != cursor:
+                cursor = next_url
+                continue
+
+            if terminal or not follow:
+                return
+
+            if next_url:
+                cursor = next_url
+            elif page_documents or cursor != status_url:
+                cursor = None
+
+        if timeout and (time.monotonic() - start_time) > timeout:
+            raise TimeoutError("Batch wait timed out")
+        await asyncio.sleep(poll_interval)
+
+
+async def iter_batch_documents(
+    client: AsyncHttpClient,
+    job_id: str,
+    *,
+    follow: bool = False,
+    poll_interval: float = 2,
+    timeout: Optional[float] = None,
+    request_timeout: Optional[float] = None,
+) -> AsyncIterator[Document]:
+    """
+    Lazily iterate over the documents of a batch scrape job, one page at a time.
+
+    Only the current page is held in memory, so arbitrarily large jobs can
+    be streamed.
+
+    Args:
+        client: Async HTTP client instance
+        job_id: ID of the batch scrape job
+        follow: Keep polling a running job until it reaches a terminal state
+            instead of stopping at the documents available right now
+        poll_interval: Seconds between status checks when following
+        timeout: Maximum seconds to follow the job (None for no timeout)
+        request_timeout: Optional timeout (in seconds) for each HTTP request
+
+    Yields:
+        Document objects in result order
+
+    Raises:
+        TimeoutError: If following and the timeout is reached
+    """
+    async for page in _iter_batch_pages_async(
+        client,
+        job_id,
+        follow=follow,
+        poll_interval=poll_interval,
+        timeout=timeout,
+        request_timeout=request_timeout,
+    ):
+        for document in page["data"]:
+            yield document
+
+
+async def wait_for_batch_completion(
+    client: AsyncHttpClient,
+    job_id: str,
+    poll_interval: float = 2,
+    timeout: Optional[float] = None,
+) -> BatchScrapeJob:
+    """
+    Wait for a batch scrape job to complete, consuming results incrementally.
+
+    Each poll resumes from the ``next`` cursor of the previous one so that
+    pages are downloaded and parsed once. Without a resume cursor, only the
+    status counters are read while the job runs and the remaining documents
+    are read once at the end.
+
+    Args:
+        client: Async HTTP client instance
+        job_id: ID of the batch scrape job
+        poll_interval: Seconds between status checks
+        timeout: Maximum seconds to wait (None for no timeout)
+
+    Returns:
+        BatchScrapeJob when job reaches a terminal state
+
+    Raises:
+        TimeoutError: If timeout is reached
+    """
+    documents: List[Document] = []
+    payload: Dict[str, Any] = {}
+    async for payload in _iter_batch_pages_async(
+        client,
+        job_id,
+        follow=True,
+        poll_interval=poll_interval,
+        timeout=timeout,
+    ):
+        documents.extend(payload["data"])
+
+    return BatchScrapeJob(
+        status=payload["status"],
+        completed=payload["completed"],
+        total=payload["total"],
+        credits_used=payload["credits_used"],
+        expires_at=payload["expires_at"],
+        next=None,
+        data=documents,
+    )
+
+
+async def process_large_batch(
+    client: AsyncHttpClient,
+    urls: List[str],
+    options: Optional[ScrapeOptions] = None,
+    chunk_size: int = 100,
+    poll_interval: float = 2,
+    timeout: Optional[float] = None,
+    *,
+    max_workers: Optional[int] = None,
+    checkpoint_path: Optional[Union[str, os.PathLike]] = None,
+) -> List[Document]:
+    """
+    Process a large batch of URLs by running chunk jobs concurrently.
+
+    Async counterpart of :func:`firecrawl.v2.methods.batch.process_large_batch`:
+    up to ``max_workers`` chunk jobs are in flight, bounded by the team's
+    ``maxConcurrency``, results are merged in input order, and an optional
+    checkpoint file allows resuming a partially completed run.
+
+    Args:
+        client: Async HTTP client instance
+        urls: List of URLs to scrape
+        options: Scraping options
+        chunk_size: Size of each batch chunk
+        poll_interval: Seconds between status checks
+        timeout: Maximum seconds to wait per chunk
+        max_workers: Maximum number of chunk jobs in flight (default 4)
+        checkpoint_path: Optional file used to resume a partially completed run
+
+    Returns:
+        List of all scraped documents
+    """
+    url_chunks = chunk_urls(urls, chunk_size)
+    if not url_chunks:
+        return []
+
+    checkpoint = LargeBatchCheckpoint(checkpoint_path, urls, chunk_size) if checkpoint_path else None
+
+    try:
+        server_max_concurrency = (await get_concurrency(client)).max_concurrency
+    except Exception as e:
+        logger.debug("Concurrency check unavailable, not splitting server concurrency: %s", e)
+        server_max_concurrency = None
+    workers, per_job_concurrency = _plan_large_batch(max_workers, len(url_chunks), server_max_concurrency)
+    semaphore = asyncio.Semaphore(workers)
+
+    async def run_chunk(index: int) -> List[Document]:
+        async with semaphore:
+            job_id = checkpoint.job_id(index) if checkpoint else None
+            if job_id is None:
+                started = await start_batch_scrape(
+                    client,
+                    url_chunks[index],
+                    options=options,
+                    max_concurrency=per_job_concurrency,
+                )
+                job_id = started.id
+                if checkpoint:
+                    checkpoint.record(index, job_id)
+            result = await wait_for_batch_completion(client, job_id, poll_interval, timeout)
+            return result.data or []
+
+    tasks = [asyncio.ensure_future(run_chunk(index)) for index in range(len(url_chunks))]
+    try:
+        chunk_results = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+    if checkpoint:
+        checkpoint.clear()
+
+    return [document for documents in chunk_results for document in documents]
+
+
 async def cancel_batch_scrape(client: AsyncHttpClient, job_id: str) -> bool:
     response = await client.delete(f"/v2/batch/scrape/{job_id}")
     if response.status_code >= 400:
@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterator
 from ...types import (
     CrawlRequest,
     CrawlJob,
@@ -15,7 +15,9 @@ from ...types import (
 from ...utils.error_handler import handle_response_error
 from ...utils.validation import prepare_scrape_options
 from ...utils.http_client_async import AsyncHttpClient
-from ...utils.normalize import normalize_document_input
+from ...utils.normalize import build_document, validates_documents
+from ...utils.pagination import aiter_result_pages
+import asyncio
 import time
 
 
@@ -67,16 +69,15 @@ def _prepare_crawl_request(request: CrawlRequest) -> dict:
     return data
 
 
-def _parse_crawl_documents(data_list: Optional[List[Any]]) -> List[Document]:
+def _parse_crawl_documents(data_list: Optional[List[Any]], validate: bool = True) -> List[Document]:
     documents: List[Document] = []
     for doc_data in data_list or []:
         if isinstance(doc_data, dict):
-            normalized = normalize_document_input(doc_data)
-            documents.append(Document(**normalized))
+            documents.append(build_document(doc_data, validate))
     return documents
 
 
-def _parse_crawl_status_response(body: Dict[str, Any]) -> Dict[str, Any]:
+def _parse_crawl_status_response(body: Dict[str, Any], parse_documents: bool = True, validate: bool = True) -> Dict[str, Any]:
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
 
@@ -87,7 +88,7 @@ def _parse_crawl_status_response(body: Dict[str, Any]) -> Dict[str, Any]:
         "credits_used": body.get("creditsUsed", 0),
         "expires_at": body.get("expiresAt"),
         "next": body.get("next"),
-        "data": _parse_crawl_documents(body.get("data", [])),
+        "data": _parse_crawl_documents(body.get("data", []), validate) if parse_documents else [],
     }
 
 
@@ -144,7 +145,7 @@ async def get_crawl_status(
     if response.status_code >= 400:
         handle_response_error(response, "get crawl status")
     body = response.json()
-    payload = _parse_crawl_status_response(body)
+    payload = _parse_crawl_status_response(body, validate=validates_documents(client))
 
     documents = payload["data"]
 
@@ -194,7 +195,7 @@ async def get_crawl_status_page(
     if response.status_code >= 400:
         handle_response_error(response, "get crawl status page")
     body = response.json()
-    payload = _parse_crawl_status_response(body)
+    payload = _parse_crawl_status_response(body, validate=validates_documents(client))
     return CrawlJob(
         status=payload["status"],
         completed=payload["completed"],
@@ -217,6 +218,9 @@ async def _fetch_all_pages_async(
     """
     Fetch all pages of crawl results asynchronously.
     
+    The next page is requested while the current one is being parsed, up to
+    ``pagination_config.prefetch_pages`` pages ahead.
+    
     Args:
         client: Async HTTP client instance
         next_url: URL for the next page
@@ -228,58 +232,200 @@ async def _fetch_all_pages_async(
         List of all documents from all pages
     """
     documents = initial_documents.copy()
-    current_url = next_url
-    page_count = 0
-    
-    # Apply pagination limits
-    max_pages = pagination_config.max_pages if pagination_config else None
     max_results = pagination_config.max_results if pagination_config else None
-    max_wait_time = pagination_config.max_wait_time if pagination_config else None
-    
-    start_time = time.monotonic()
-    
-    while current_url:
-        # Check pagination limits (treat 0 as a valid limit)
-        if (max_pages is not None) and page_count >= max_pages:
-            break
 
-        if (max_wait_time is not None) and (time.monotonic() - start_time) > max_wait_time:
-            break
-        
-        # Fetch next page
-        response = await client.get(current_url, timeout=request_timeout)
-        
-        if response.status_code >= 400:
-            # Log error but continue with what we have
-            import logging
-            logger = logging.getLogger("firecrawl")
-            logger.warning("Failed to fetch next page", extra={"status_code": response.status_code})
-            break
-        
-        page_data = response.json()
+    async def get_page(url: str):
+        return await client.get(url, timeout=request_timeout)
+
+    async for page_data in aiter_result_pages(
+        get_page,
+        next_url,
+        initial_count=len(documents),
+        pagination_config=pagination_config,
+    ):
         try:
-            page_payload = _parse_crawl_status_response(page_data)
+            page_documents = _parse_crawl_documents(page_data.get("data", []) or [], validates_documents(client))
         except Exception:
             break
-        
+
         # Add documents from this page
-        for document in page_payload["data"]:
+        for document in page_documents:
             # Check max_results limit
             if (max_results is not None) and (len(documents) >= max_results):
                 break
             documents.append(document)
-        
+
         # Check if we hit max_results limit
         if (max_results is not None) and (len(documents) >= max_results):
             break
-        
-        # Get next URL
-        current_url = page_payload["next"]
-        page_count += 1
-    
+
     return documents
 
 
+async def _iter_crawl_pages_async(
+    client: AsyncHttpClient,
+    job_id: str,
+    *,
+    follow: bool = True,
+    poll_interval: float = 2,
+    timeout: Optional[float] = None,
+    request_timeout: Optional[float] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Walk crawl result pages lazily, yielding one parsed status payload per page.
+
+    Pages are read by following the ``next`` cursor, so each document is
+    downloaded and parsed once. With ``follow`` set, a running job is polled
+    from the last cursor until it reaches a terminal state. If the server does
+    not return a resume cursor while the job runs, only the status counters
+    are polled and the remaining documents are read once the job finishes.
+    """
+    start_time = time.monotonic()
+    status_url = f"/v2/crawl/{job_id}"
+    cursor: Optional[str] = status_url
+    consumed = 0
+    skip = 0
+
+    while True:
+        response = await client.get(cursor or status_url, timeout=request_timeout)
+        if response.status_code >= 400:
+            handle_response_error(response, "get crawl status")
+        payload = _parse_crawl_status_response(
+            response.json(),
+            parse_documents=cursor is not None,
+            validate=validates_documents(client),
+        )
+        terminal = payload["status"] in ["completed", "failed", "cancelled"]
+
+        if cursor is None:
+            if terminal:
+                # Re-read from the start, dropping documents that were already yielded
+                cursor = status_url
+                skip = consumed
+                continue
+        else:
+            page_documents = payload["data"]
+            if skip:
+                dropped = min(skip, len(page_documents))
+                payload["data"] = page_documents[dropped:]
+                skip -= dropped
+            consumed += len(payload["data"])
+            yield payload
+
+            next_url = payload["next"]
+
+            # More results are ready; drain them before sleeping
+            if page_documents and next_url and next_url != cursor:
+                cursor = next_url
+                continue
+
+            if terminal or not follow:
+                return
+
+            if next_url:
+                cursor = next_url
+            elif page_documents or cursor != status_url:
+                cursor = None
+
+        if timeout and (time.monotonic() - start_time) > timeout:
+            raise TimeoutError("Crawl wait timed out")
+        await asyncio.sleep(poll_interval)
+
+
+async def iter_crawl_documents(
+    client: AsyncHttpClient,
+    job_id: str,
+    *,
+    follow: bool = False,
+    poll_interval: float = 2,
+    timeout: Optional[float] = None,
+    request_timeout: Optional[float] = None,
+) -> AsyncIterator[Document]:
+    """
+    Lazily iterate over the documents of a crawl job, one page at a time.
+
+    Only the current page is held in memory, so arbitrarily large jobs can
+    be streamed.
+
+    Args:
+        client: Async HTTP client instance
+        job_id: ID of the crawl job
+        follow: Keep polling a running job until it reaches a terminal state
+            instead of stopping at the documents available right now
+        poll_interval: Seconds between status checks when following
+        timeout: Maximum seconds to follow the job (None for no timeout)
+        request_timeout: Optional timeout (in seconds) for each HTTP request
+
+    Yields:
+        Document objects in result order
+
+    Raises:
+        TimeoutError: If following and the timeout is reached
+    """
+    async for page in _iter_crawl_pages_async(
+        client,
+        job_id,
+        follow=follow,
+        poll_interval=poll_interval,
+        timeout=timeout,
+        request_timeout=request_timeout,
+    ):
+        for document in page["data"]:
+            yield document
+
+
+async def wait_for_crawl_completion(
+    client: AsyncHttpClient,
+    job_id: str,
+    poll_interval: float = 2,
+    timeout: Optional[float] = None,
+    *,
+    request_timeout: Optional[float] = None,
+) -> CrawlJob:
+    """
+    Wait for a crawl job to complete, consuming results incrementally.
+
+    Each poll resumes from the ``next`` cursor of the previous one so that
+    documents are downloaded and parsed once. Without a resume cursor, only
+    the status counters are read while the job runs and the remaining
+    documents are read once at the end.
+
+    Args:
+        client: Async HTTP client instance
+        job_id: ID of the crawl job
+        poll_interval: Seconds between status checks
+        timeout: Maximum seconds to wait (None for no timeout)
+        request_timeout: Optional timeout (in seconds) for each status request
+
+    Returns:
+        CrawlJob when job reaches a terminal state
+
+    Raises:
+        TimeoutError: If timeout is reached
+    """
+    documents: List[Document] = []
+    payload: Dict[str, Any] = {}
+    async for payload in _iter_crawl_pages_async(
+        client,
+        job_id,
+        follow=True,
+        poll_interval=poll_interval,
+        timeout=timeout,
+        request_timeout=request_timeout,
+    ):
+        documents.extend(payload["data"])
+
+    return CrawlJob(
+        status=payload["status"],
+        completed=payload["completed"],
+        total=payload["total"],
+        credits_used=payload["credits_used"],
+        expires_at=payload["expires_at"],
+        next=None,
+        data=documents,
+    )
+
+
 async def cancel_crawl(client: AsyncHttpClient, job_id: str) -> bool:
     """
     Cancel a crawl job.
@@ -9,7 +9,7 @@ from ...types import (
 )
 from ...utils.http_client_async import AsyncHttpClient
 from ...utils.error_handler import handle_response_error
-from ...utils.normalize import normalize_document_input
+from ...utils.normalize import build_document, validates_documents
 from ...utils.validation import validate_scrape_options, prepare_scrape_options
 
 T = TypeVar("T")
@@ -41,19 +41,20 @@ async def search(
             handle_response_error(response, "search")
         data = response_data.get("data", {}) or {}
         out = SearchData()
+        validate = validates_documents(client)
         if "web" in data:
-            out.web = _transform_array(data["web"], SearchResultWeb)
+            out.web = _transform_array(data["web"], SearchResultWeb, validate)
         if "news" in data:
-            out.news = _transform_array(data["news"], SearchResultNews)
+            out.news = _transform_array(data["news"], SearchResultNews, validate)
         if "images" in data:
-            out.images = _transform_array(data["images"], SearchResultImages)
+            out.images = _transform_array(data["images"], SearchResultImages, validate)
         return out
     except Exception as err:
         if hasattr(err, "response"):
             handle_response_error(getattr(err, "response"), "search")
         raise err
 
-def _transform_array(arr: List[Any], result_type: Type[T]) -> List[Union[T, Document]]:
+def _transform_array(arr: List[Any], result_type: Type[T], validate: bool = True) -> List[Union[T, Document]]:
     """
     Transforms an array of items into a list of result_type or Document.
     If the item dict contains any of the special keys, it is treated as a Document.
@@ -73,7 +74,7 @@ def _transform_array(arr: List[Any], result_type: Type[T]) -> List[Union[T, Docu
                 "summary" in item or
                 "json" in item
             ):
-                results.append(Document(**normalize_document_input(item)))
+                results.append(build_document(item, validate))
             else:
                 results.append(result_type(**item))
         else:
@@ -2,8 +2,14 @@
 Batch scraping functionality for Firecrawl v2 API.
 """
 
+import hashlib
+import json
+import logging
+import os
+import threading
 import time
-from typing import Optional, List, Callable, Dict, Any, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Callable, Dict, Any, Union, Iterator, Tuple
 from ..types import (
     BatchScrapeRequest,
     BatchScrapeResponse,
@@ -14,20 +20,27 @@ from ..types import (
     PaginationConfig,
 )
 from ..utils import HttpClient, handle_response_error, validate_scrape_options, prepare_scrape_options
-from ..utils.normalize import normalize_document_input
+from ..utils.normalize import build_document, validates_documents
+from ..utils.pagination import iter_result_pages
 from ..types import CrawlErrorsResponse
+from .usage import get_concurrency
 
+logger = logging.getLogger("firecrawl")
 
-def _parse_batch_scrape_documents(data_list: Optional[List[Any]]) -> List[Document]:
+
+def _parse_batch_scrape_documents(data_list: Optional[List[Any]], validate: bool = True) -> List[Document]:
     documents: List[Document] = []
     for doc in data_list or []:
         if isinstance(doc, dict):
-            normalized = normalize_document_input(doc)
-            documents.append(Document(**normalized))
+            documents.append(build_document(doc, validate))
     return documents
 
 
-def _parse_batch_scrape_status_response(body: Dict[str, Any]) -> Dict[str, Any]:
+def _parse_batch_scrape_status_response(
+    body: Dict[str, Any],
+    parse_documents: bool = True,
+    validate: bool = True,
+) -> Dict[str, Any]:
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
 
@@ -38,7 +51,7 @@ def _parse_batch_scrape_status_response(body: Dict[str, Any]) -> Dict[str, Any]:
         "credits_used": body.get("creditsUsed"),
         "expires_at": body.get("expiresAt"),
         "next": body.get("next"),
-        "data": _parse_batch_scrape_documents(body.get("data", []) or []),
+        "data": _parse_batch_scrape_documents(body.get("data", []) or [], validate) if parse_documents else [],
     }
 
 
@@ -128,7 +141,7 @@ def get_batch_scrape_status(
     
     # Parse response
     body = response.json()
-    payload = _parse_batch_scrape_status_response(body)
+    payload = _parse_batch_scrape_status_response(body, validate=validates_documents(client))
     documents = payload["data"]
 
     # Handle pagination if requested
@@ -178,7 +191,7 @@ def get_batch_scrape_status_page(
         handle_response_error(response, "get batch scrape status page")
 
     body = response.json()
-    payload = _parse_batch_scrape_status_response(body)
+    payload = _parse_batch_scrape_status_response(body, validate=validates_documents(client))
 
     return BatchScrapeJob(
         status=payload["status"],
@@ -200,6 +213,9 @@ def _fetch_all_batch_pages(
     """
     Fetch all pages of batch scrape results.
     
+    The next page is requested while the current one is being parsed, up to
+    ``pagination_config.prefetch_pages`` pages ahead.
+    
     Args:
         client: HTTP client instance
         next_url: URL for the next page
@@ -210,55 +226,33 @@ def _fetch_all_batch_pages(
         List of all documents from all pages
     """
     documents = initial_documents.copy()
-    current_url = next_url
-    page_count = 0
-    
-    # Apply pagination limits
-    max_pages = pagination_config.max_pages if pagination_config else None
     max_results = pagination_config.max_results if pagination_config else None
-    max_wait_time = pagination_config.max_wait_time if pagination_config else None
-    
-    start_time = time.monotonic()
-    
-    while current_url:
-        # Check pagination limits (treat 0 as a valid limit)
-        if (max_pages is not None) and page_count >= max_pages:
-            break
-        
-        if (max_wait_time is not None) and (time.monotonic() - start_time) > max_wait_time:
-            break
-        
-        # Fetch next page
-        response = client.get(current_url)
-        
-        if not response.ok:
-            # Log error but continue with what we have
-            import logging
-            logger = logging.getLogger("firecrawl")
-            logger.warning("Failed to fetch next page", extra={"status_code": response.status_code})
-            break
-        
-        page_data = response.json()
+
+    def get_page(url: str):
+        return client.get(url)
+
+    for page_data in iter_result_pages(
+        get_page,
+        next_url,
+        initial_count=len(documents),
+        pagination_config=pagination_config,
+    ):
         try:
-            page_payload = _parse_batch_scrape_status_response(page_data)
+            page_documents = _parse_batch_scrape_documents(page_data.get("data", []) or [], validates_documents(client))
         except Exception:
             break
-        
+
         # Add documents from this page
-        for document in page_payload["data"]:
-            # Check max_results limit
+        for document in page_documents:
+            # Check max_results limit BEFORE adding each document
             if max_results is not None and len(documents) >= max_results:
                 break
             documents.append(document)
-        
-        # Check if we hit max_results limit after adding all docs from this page
+
+        # Check if we hit max_results limit
         if max_results is not None and len(documents) >= max_results:
             break
-        
-        # Get next URL
-        current_url = page_payload["next"]
-        page_count += 1
-    
+
     return documents
 
 
@@ -291,6 +285,118 @@ def cancel_batch_scrape(
     return body.get("status") == "cancelled"
 
 
+def _iter_batch_pages(
+    client: HttpClient,
+    job_id: str,
+    *,
+    follow: bool = True,
+    poll_interval: float = 2,
+    timeout: Optional[float] = None,
+    request_timeout: Optional[float] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Walk batch scrape result pages lazily, yielding one parsed status payload per page.
+
+    Pages are read by following the ``next`` cursor, so each document is
+    downloaded and parsed once. With ``follow`` set, a running job is polled
+    from the last cursor until it reaches a terminal state. If the server does
+    not return a resume cursor while the job runs, only the status counters
+    are polled and the remaining documents are read once the job finishes.
+    """
+    start_time = time.monotonic()
+    status_url = f"/v2/batch/scrape/{job_id}"
+    cursor: Optional[str] = status_url
+    consumed = 0
+    skip = 0
+
+    while True:
+        response = client.get(cursor or status_url, timeout=request_timeout)
+        if not response.ok:
+            handle_response_error(response, "get batch scrape status")
+        payload = _parse_batch_scrape_status_response(
+            response.json(),
+            parse_documents=cursor is not None,
+            validate=validates_documents(client),
+        )
+        terminal = payload["status"] in ["completed", "failed", "cancelled"]
+
+        if cursor is None:
+            if terminal:
+                # Re-read from the start, dropping documents that were already yielded
+                cursor = status_url
+                skip = consumed
+                continue
+        else:
+            page_documents = payload["data"]
+            if skip:
+                dropped = min(skip, len(page_documents))
+                payload["data"] = page_documents[dropped:]
+                skip -= dropped
+            consumed += len(payload["data"])
+            yield payload
+
+            next_url = payload["next"]
+
+            # More results are ready; drain them before sleeping
+            if page_documents and next_url and next_url != cursor:
+                cursor = next_url
+                continue
+
+            if terminal or not follow:
+                return
+
+            if next_url:
+                cursor = next_url
+            elif page_documents or cursor != status_url:
+                cursor = None
+
+        if timeout and (time.monotonic() - start_time) > timeout:
+            raise TimeoutError(f"Batch scrape job {job_id} did not complete within {timeout} seconds")
+        time.sleep(poll_interval)
+
+
+def iter_batch_documents(
+    client: HttpClient,
+    job_id: str,
+    *,
+    follow: bool = False,
+    poll_interval: float = 2,
+    timeout: Optional[float] = None,
+    request_timeout: Optional[float] = None,
+) -> Iterator[Document]:
+    """
+    Lazily iterate over the documents of a batch scrape job, one page at a time.
+
+    Only the current page is held in memory, so arbitrarily large jobs can
+    be streamed.
+
+    Args:
+        client: HTTP client instance
+        job_id: ID of the batch scrape job
+        follow: Keep polling a running job until it reaches a terminal state
+            instead of stopping at the documents available right now
+        poll_interval: Seconds between status checks when following
+        timeout: Maximum seconds to follow the job (None for no timeout)
+        request_timeout: Optional timeout (in seconds) for each HTTP request
+
+    Yields:
+        Document objects in result order
+
+    Raises:
+        TimeoutError: If following and the timeout is reached
+    """
+    for page in _iter_batch_pages(
+        client,
+        job_id,
+        follow=follow,
+        poll_interval=poll_interval,
+        timeout=timeout,
+        request_timeout=request_timeout,
+    ):
+        for document in page["data"]:
+            yield document
+
+
 def wait_for_batch_completion(
     client: HttpClient,
     job_id: str,
@@ -299,6 +405,11 @@ def wait_for_batch_completion(
 ) -> BatchScrapeJob:
     """
     Wait for a batch scrape job to complete, polling for status updates.
+
+    Results are consumed incrementally by following the ``next`` cursor from
+    the previous poll, so pages that were already received are not fetched
+    again. Without a resume cursor, only the status counters are read while
+    the job runs and the remaining documents are read once at the end.
     
     Args:
         client: HTTP client instance
@@ -313,21 +424,26 @@ def wait_for_batch_completion(
         FirecrawlError: If the job fails or timeout is reached
         TimeoutError: If timeout is reached
     """
-    start_time = time.monotonic()
-    
-    while True:
-        status_job = get_batch_scrape_status(client, job_id)
-        
-        # Check if job is complete
-        if status_job.status in ["completed", "failed", "cancelled"]:
-            return status_job
-        
-        # Check timeout
-        if timeout and (time.monotonic() - start_time) > timeout:
-            raise TimeoutError(f"Batch scrape job {job_id} did not complete within {timeout} seconds")
-        
-        # Wait before next poll
-        time.sleep(poll_interval)
+    documents: List[Document] = []
+    payload: Dict[str, Any] = {}
+    for payload in _iter_batch_pages(
+        client,
+        job_id,
+        follow=True,
+        poll_interval=poll_interval,
+        timeout=timeout,
+    ):
+        documents.extend(payload["data"])
+
+    return BatchScrapeJob(
+        status=payload["status"],
+        completed=payload["completed"],
+        total=payload["total"],
+        credits_used=payload["credits_used"],
+        expires_at=payload["expires_at"],
+        next=None,
+        data=documents,
+    )
 
 
 def batch_scrape(
@@ -481,16 +597,93 @@ def chunk_urls(urls: List[str], chunk_size: int = 100) -> List[List[str]]:
     return chunks
 
 
+class LargeBatchCheckpoint:
+    """
+    Small on-disk record of the batch job started for each chunk.
+
+    Only job IDs are stored; documents stay on the server and are fetched
+    again when a run is resumed. The file is tied to the exact URL list and
+    chunk size it was created for.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], urls: List[str], chunk_size: int):
+        self.path = os.fspath(path)
+        self.fingerprint = hashlib.sha256(
+            json.dumps([chunk_size, urls], separators=(",", ":")).encode("utf-8")
+        ).hexdigest()
+        self.jobs: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as fh:
+            state = json.load(fh)
+        if state.get("fingerprint") != self.fingerprint:
+            raise ValueError(
+                f"Checkpoint {self.path} belongs to a different URL list or chunk size"
+            )
+        self.jobs = {int(index): job_id for index, job_id in state.get("jobs", {}).items()}
+
+    def job_id(self, index: int) -> Optional[str]:
+        with self._lock:
+            return self.jobs.get(index)
+
+    def record(self, index: int, job_id: str) -> None:
+        with self._lock:
+            self.jobs[index] = job_id
+            state = {
+                "fingerprint": self.fingerprint,
+                "jobs": {str(i): j for i, j in sorted(self.jobs.items())},
+            }
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as fh:
+                json.dump(state, fh)
+            os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        with self._lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+
+def _plan_large_batch(
+    max_workers: Optional[int],
+    num_chunks: int,
+    server_max_concurrency: Optional[int],
+) -> Tuple[int, Optional[int]]:
+    """Return (chunk jobs in flight, per-job maxConcurrency) for a large batch."""
+    workers = max_workers if max_workers is not None else 4
+    if server_max_concurrency:
+        workers = min(workers, server_max_concurrency)
+    workers = max(1, min(workers, num_chunks))
+    per_job = max(1, server_max_concurrency // workers) if server_max_concurrency else None
+    return workers, per_job
+
+
 def process_large_batch(
     client: HttpClient,
     urls: List[str],
     options: Optional[ScrapeOptions] = None,
     chunk_size: int = 100,
     poll_interval: int = 2,
-    timeout: Optional[int] = None
+    timeout: Optional[int] = None,
+    *,
+    max_workers: Optional[int] = None,
+    checkpoint_path: Optional[Union[str, os.PathLike]] = None,
 ) -> List[Document]:
     """
     Process a large batch of URLs by splitting into smaller chunks.
+
+    Up to ``max_workers`` chunk jobs are kept in flight on a thread pool. The
+    team's ``maxConcurrency`` from ``get_concurrency()`` caps the number of
+    chunks in flight and is split evenly between them, so together they never
+    exceed the server limit. Documents are returned in chunk (input) order.
+
+    With ``checkpoint_path`` the job ID of every started chunk is persisted;
+    re-running with the same URLs resumes those jobs instead of starting new
+    ones. The checkpoint is removed once every chunk has finished.
     
     Args:
         client: HTTP client instance
@@ -499,33 +692,58 @@ def process_large_batch(
         chunk_size: Size of each batch chunk
         poll_interval: Seconds between status checks
         timeout: Maximum seconds to wait per chunk
+        max_workers: Maximum number of chunk jobs in flight (default 4)
+        checkpoint_path: Optional file used to resume a partially completed run
         
     Returns:
         List of all scraped documents
         
     Raises:
         FirecrawlError: If any chunk fails
+        ValueError: If the checkpoint belongs to a different URL list
     """
     url_chunks = chunk_urls(urls, chunk_size)
-    all_documents = []
-    completed_chunks = 0
-    
-    for chunk in url_chunks:
-        # Process this chunk
-        result = batch_scrape(
-            client,
-            chunk,
-            options=options,
-            poll_interval=poll_interval,
-            timeout=timeout,
-        )
+    if not url_chunks:
+        return []
+
+    checkpoint = LargeBatchCheckpoint(checkpoint_path, urls, chunk_size) if checkpoint_path else None
+
+    try:
+        server_max_concurrency = get_concurrency(client).max_concurrency
+    except Exception as e:
+        logger.debug("Concurrency check unavailable, not splitting server concurrency: %s", e)
+        server_max_concurrency = None
+    workers, per_job_concurrency = _plan_large_batch(max_workers, len(url_chunks), server_max_concurrency)
+
+    def run_chunk(index: int) -> List[Document]:
+        job_id = checkpoint.job_id(index) if checkpoint else None
+        if job_id is None:
+            job_id = start_batch_scrape(
+                client,
+                url_chunks[index],
+                options=options,
+                max_concurrency=per_job_concurrency,
+            ).id
+            if checkpoint:
+                checkpoint.record(index, job_id)
+        result = wait_for_batch_completion(client, job_id, poll_interval, timeout)
+        return result.data or []
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="firecrawl-large-batch") as executor:
+        futures = [executor.submit(run_chunk, index) for index in range(len(url_chunks))]
+        all_documents: List[Document] = []
+        try:
+            for future in futures:
+                all_documents.extend(future.result())
+        except BaseException:
+            # Chunks already started stay recorded in the checkpoint for a later resume
+            for future in futures:
+                future.cancel()
+            raise
+
+    if checkpoint:
+        checkpoint.clear()
 
-        # Add documents from this chunk
-        if result.data:
-            all_documents.extend(result.data)
-        
-        completed_chunks += 1
-    
     return all_documents
 
 
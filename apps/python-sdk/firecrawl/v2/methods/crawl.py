@@ -3,7 +3,7 @@ Crawling functionality for Firecrawl v2 API.
 """
 
 import time
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterator
 from ..types import (
     CrawlRequest,
     CrawlJob,
@@ -11,7 +11,8 @@ from ..types import (
     WebhookConfig, CrawlErrorsResponse, ActiveCrawlsResponse, ActiveCrawl, PaginationConfig
 )
 from ..utils import HttpClient, handle_response_error, validate_scrape_options, prepare_scrape_options
-from ..utils.normalize import normalize_document_input
+from ..utils.normalize import build_document, validates_documents
+from ..utils.pagination import iter_result_pages
 
 
 def _validate_crawl_request(request: CrawlRequest) -> None:
@@ -110,15 +111,19 @@ def _prepare_crawl_request(request: CrawlRequest) -> dict:
     return data
 
 
-def _parse_crawl_documents(data_list: Optional[List[Any]]) -> List[Document]:
+def _parse_crawl_documents(data_list: Optional[List[Any]], validate: bool = True) -> List[Document]:
     documents: List[Document] = []
     for doc_data in data_list or []:
         if isinstance(doc_data, dict):
-            documents.append(Document(**normalize_document_input(doc_data)))
+            documents.append(build_document(doc_data, validate))
     return documents
 
 
-def _parse_crawl_status_response(response_data: Dict[str, Any]) -> Dict[str, Any]:
+def _parse_crawl_status_response(
+    response_data: Dict[str, Any],
+    parse_documents: bool = True,
+    validate: bool = True,
+) -> Dict[str, Any]:
     if not response_data.get("success"):
         raise Exception(response_data.get("error", "Unknown error occurred"))
 
@@ -129,7 +134,7 @@ def _parse_crawl_status_response(response_data: Dict[str, Any]) -> Dict[str, Any
         "credits_used": response_data.get("creditsUsed", 0),
         "expires_at": response_data.get("expiresAt"),
         "next": response_data.get("next"),
-        "data": _parse_crawl_documents(response_data.get("data", [])),
+        "data": _parse_crawl_documents(response_data.get("data", []), validate) if parse_documents else [],
     }
 
 
@@ -202,7 +207,7 @@ def get_crawl_status(
     # Parse response
     response_data = response.json()
 
-    payload = _parse_crawl_status_response(response_data)
+    payload = _parse_crawl_status_response(response_data, validate=validates_documents(client))
 
     documents = payload["data"]
 
@@ -259,7 +264,7 @@ def get_crawl_status_page(
         handle_response_error(response, "get crawl status page")
 
     response_data = response.json()
-    payload = _parse_crawl_status_response(response_data)
+    payload = _parse_crawl_status_response(response_data, validate=validates_documents(client))
 
     return CrawlJob(
         status=payload["status"],
@@ -282,7 +287,10 @@ def _fetch_all_pages(
 ) -> List[Document]:
     """
     Fetch all pages of crawl results.
-
+    
+    The next page is requested while the current one is being parsed, up to
+    ``pagination_config.prefetch_pages`` pages ahead.
+    
     Args:
         client: HTTP client instance
         next_url: URL for the next page
@@ -294,43 +302,24 @@ def _fetch_all_pages(
         List of all documents from all pages
     """
     documents = initial_documents.copy()
-    current_url = next_url
-    page_count = 0
-
-    # Apply pagination limits
-    max_pages = pagination_config.max_pages if pagination_config else None
     max_results = pagination_config.max_results if pagination_config else None
-    max_wait_time = pagination_config.max_wait_time if pagination_config else None
-
-    start_time = time.monotonic()
-
-    while current_url:
-        # Check pagination limits (treat 0 as a valid limit)
-        if (max_pages is not None) and page_count >= max_pages:
-            break
-
-        if (max_wait_time is not None) and (time.monotonic() - start_time) > max_wait_time:
-            break
 
-        # Fetch next page
-        response = client.get(current_url, timeout=request_timeout)
-
-        if not response.ok:
-            # Log error but continue with what we have
-            import logging
-            logger = logging.getLogger("firecrawl")
-            logger.warning("Failed to fetch next page", extra={"status_code": response.status_code})
-            break
-
-        page_data = response.json()
+    def get_page(url: str):
+        return client.get(url, timeout=request_timeout)
 
+    for page_data in iter_result_pages(
+        get_page,
+        next_url,
+        initial_count=len(documents),
+        pagination_config=pagination_config,
+    ):
         try:
-            page_payload = _parse_crawl_status_response(page_data)
+            page_documents = _parse_crawl_documents(page_data.get("data", []) or [], validates_documents(client))
         except Exception:
             break
 
         # Add documents from this page
-        for document in page_payload["data"]:
+        for document in page_documents:
             # Check max_results limit BEFORE adding each document
             if max_results is not None and len(documents) >= max_results:
                 break
@@ -340,10 +329,6 @@ def _fetch_all_pages(
         if max_results is not None and len(documents) >= max_results:
             break
 
-        # Get next URL
-        current_url = page_payload["next"]
-        page_count += 1
-
     return documents
 
 
@@ -370,6 +355,119 @@ def cancel_crawl(client: HttpClient, job_id: str) -> bool:
     
     return response_data.get("status") == "cancelled"
 
+
+def _iter_crawl_pages(
+    client: HttpClient,
+    job_id: str,
+    *,
+    follow: bool = True,
+    poll_interval: float = 2,
+    timeout: Optional[float] = None,
+    request_timeout: Optional[float] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Walk crawl result pages lazily, yielding one parsed status payload per page.
+
+    Pages are read by following the ``next`` cursor, so each document is
+    downloaded and parsed once. With ``follow`` set, a running job is polled
+    from the last cursor until it reaches a terminal state. If the server does
+    not return a resume cursor while the job runs, only the status counters
+    are polled and the remaining documents are read once the job finishes.
+    """
+    start_time = time.monotonic()
+    status_url = f"/v2/crawl/{job_id}"
+    cursor: Optional[str] = status_url
+    consumed = 0
+    skip = 0
+
+    while True:
+        response = client.get(cursor or status_url, timeout=request_timeout)
+        if not response.ok:
+            handle_response_error(response, "get crawl status")
+        payload = _parse_crawl_status_response(
+            response.json(),
+            parse_documents=cursor is not None,
+            validate=validates_documents(client),
+        )
+        terminal = payload["status"] in ["completed", "failed", "cancelled"]
+
+        if cursor is None:
+            if terminal:
+                # Re-read from the start, dropping documents that were already yielded
+                cursor = status_url
+                skip = consumed
+                continue
+        else:
+            page_documents = payload["data"]
+            if skip:
+                dropped = min(skip, len(page_documents))
+                payload["data"] = page_documents[dropped:]
+                skip -= dropped
+            consumed += len(payload["data"])
+            yield payload
+
+            next_url = payload["next"]
+
+            # More results are ready; drain them before sleeping
+            if page_documents and next_url and next_url != cursor:
+                cursor = next_url
+                continue
+
+            if terminal or not follow:
+                return
+
+            if next_url:
+                cursor = next_url
+            elif page_documents or cursor != status_url:
+                cursor = None
+
+        if timeout and (time.monotonic() - start_time) > timeout:
+            raise TimeoutError(f"Crawl job {job_id} did not complete within {timeout} seconds")
+        time.sleep(poll_interval)
+
+
+def iter_crawl_documents(
+    client: HttpClient,
+    job_id: str,
+    *,
+    follow: bool = False,
+    poll_interval: float = 2,
+    timeout: Optional[float] = None,
+    request_timeout: Optional[float] = None,
+) -> Iterator[Document]:
+    """
+    Lazily iterate over the documents of a crawl job, one page at a time.
+
+    Only the current page is held in memory, so arbitrarily large jobs can
+    be streamed.
+
+    Args:
+        client: HTTP client instance
+        job_id: ID of the crawl job
+        follow: Keep polling a running job until it reaches a terminal state
+            instead of stopping at the documents available right now
+        poll_interval: Seconds between status checks when following
+        timeout: Maximum seconds to follow the job (None for no timeout)
+        request_timeout: Optional timeout (in seconds) for each HTTP request
+
+    Yields:
+        Document objects in result order
+
+    Raises:
+        TimeoutError: If following and the timeout is reached
+    """
+    for page in _iter_crawl_pages(
+        client,
+        job_id,
+        follow=follow,
+        poll_interval=poll_interval,
+        timeout=timeout,
+        request_timeout=request_timeout,
+    ):
+        for document in page["data"]:
+            yield document
+
+
 def wait_for_crawl_completion(
     client: HttpClient,
     job_id: str,
@@ -380,6 +478,12 @@ def wait_for_crawl_completion(
 ) -> CrawlJob:
     """
     Wait for a crawl job to complete, polling for status updates.
+
+    Results are consumed incrementally: each poll resumes from the ``next``
+    cursor returned by the previous one, so documents that were already
+    received are never downloaded or parsed again. If the server does not
+    return a resume cursor while the job is running, only the status counters
+    are read on each poll and the remaining documents are read once at the end.
     
     Args:
         client: HTTP client instance
@@ -395,25 +499,27 @@ def wait_for_crawl_completion(
         Exception: If the job fails
         TimeoutError: If timeout is reached
     """
-    start_time = time.monotonic()
-    
-    while True:
-        crawl_job = get_crawl_status(
-            client,
-            job_id,
-            request_timeout=request_timeout,
-        )
-        
-        # Check if job is complete
-        if crawl_job.status in ["completed", "failed", "cancelled"]:
-            return crawl_job
-        
-        # Check timeout
-        if timeout is not None and (time.monotonic() - start_time) > timeout:
-            raise TimeoutError(f"Crawl job {job_id} did not complete within {timeout} seconds")
-        
-        # Wait before next poll
-        time.sleep(poll_interval)
+    documents: List[Document] = []
+    payload: Dict[str, Any] = {}
+    for payload in _iter_crawl_pages(
+        client,
+        job_id,
+        follow=True,
+        poll_interval=poll_interval,
+        timeout=timeout,
+        request_timeout=request_timeout,
+    ):
+        documents.extend(payload["data"])
+
+    return CrawlJob(
+        status=payload["status"],
+        completed=payload["completed"],
+        total=payload["total"],
+        credits_used=payload["credits_used"],
+        expires_at=payload["expires_at"],
+        next=None,
+        data=documents,
+    )
 
 
 def crawl(
@@ -4,7 +4,7 @@ Search functionality for Firecrawl v2 API.
 
 from typing import Dict, Any, Union, List, TypeVar, Type
 from ..types import SearchRequest, SearchData, Document, SearchResultWeb, SearchResultNews, SearchResultImages
-from ..utils.normalize import normalize_document_input, _map_search_result_keys
+from ..utils.normalize import build_document, validates_documents, _map_search_result_keys
 from ..utils import HttpClient, handle_response_error, validate_scrape_options, prepare_scrape_options
 
 T = TypeVar("T")
@@ -36,12 +36,13 @@ def search(
             handle_response_error(response, "search")
         data = response_data.get("data", {}) or {}
         out = SearchData()
+        validate = validates_documents(client)
         if "web" in data:
-            out.web = _transform_array(data["web"], SearchResultWeb)
+            out.web = _transform_array(data["web"], SearchResultWeb, validate)
         if "news" in data:
-            out.news = _transform_array(data["news"], SearchResultNews)
+            out.news = _transform_array(data["news"], SearchResultNews, validate)
         if "images" in data:
-            out.images = _transform_array(data["images"], SearchResultImages)
+            out.images = _transform_array(data["images"], SearchResultImages, validate)
         return out
     except Exception as err:
         # If the error is an HTTP error from requests, handle it
@@ -50,7 +51,7 @@ def search(
             handle_response_error(getattr(err, "response"), "search")
         raise err
 
-def _transform_array(arr: List[Any], result_type: Type[T]) -> List[Union[T, 'Document']]:
+def _transform_array(arr: List[Any], result_type: Type[T], validate: bool = True) -> List[Union[T, 'Document']]:
     """
     Transforms an array of items into a list of result_type or Document.
     If the item dict contains any of the special keys, it is treated as a Document.
@@ -70,7 +71,7 @@ def _transform_array(arr: List[Any], result_type: Type[T]) -> List[Union[T, 'Doc
                 "summary" in item or
                 "json" in item
             ):
-                results.append(Document(**normalize_document_input(item)))
+                results.append(build_document(item, validate))
             else:
                 result_type_name = None
                 if result_type == SearchResultImages:
@@ -1786,6 +1786,11 @@ class ClientConfig(BaseModel):
     timeout: Optional[float] = None
     max_retries: int = 3
     backoff_factor: float = 0.5
+    pool_connections: int = Field(default=10, ge=1)
+    pool_maxsize: int = Field(default=10, ge=1)
+    pool_block: bool = False
+    keep_alive: bool = True
+    validate_documents: bool = True
 
 
 class PaginationConfig(BaseModel):
@@ -1795,6 +1800,7 @@ class PaginationConfig(BaseModel):
     max_pages: Optional[int] = Field(default=None, ge=0)
     max_results: Optional[int] = Field(default=None, ge=0)
     max_wait_time: Optional[int] = Field(default=None, ge=0)  # seconds
+    prefetch_pages: int = Field(default=1, ge=0)  # pages fetched ahead while parsing; 0 disables
 
 
 # Response union types
@@ -2,16 +2,25 @@
 HTTP client utilities for v2 API.
 """
 
+import threading
 import time
 from typing import Dict, Any, Optional
 from urllib.parse import urlparse, urlunparse, urljoin
 import requests
+from requests.adapters import HTTPAdapter
 from .get_version import get_version
 
 version = get_version()
 
 class HttpClient:
-    """HTTP client with retry logic and error handling."""
+    """HTTP client with retry logic and error handling.
+
+    Requests go through a pooled ``requests.Session`` so that TCP/TLS
+    connections to the API are reused across calls (status polls, pagination,
+    etc.). The session is created lazily, is safe to share between threads,
+    and is released with :meth:`close` or by using the client as a context
+    manager.
+    """
 
     def __init__(
         self,
@@ -20,12 +29,64 @@ class HttpClient:
         timeout: Optional[float] = None,
         max_retries: int = 3,
         backoff_factor: float = 0.5,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        validate_documents: bool = True,
     ):
         self.api_key = api_key
         self.api_url = api_url
         self.timeout = timeout
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        # Read by the v2 methods when turning result pages into Document models
+        self.validate_documents = validate_documents
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        # Retries are handled by this client, so the adapter must not retry on its own.
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=0,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """Return the shared session, creating it on first use."""
+        session = self._session
+        if session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+                session = self._session
+        return session
+
+    def close(self) -> None:
+        """Close pooled connections. The client may still be used afterwards."""
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+    def __enter__(self) -> "HttpClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
     def _build_url(self, endpoint: str) -> str:
         base = urlparse(self.api_url)
@@ -97,7 +158,7 @@ class HttpClient:
 
         for attempt in range(num_attempts):
             try:
-                response = requests.post(
+                response = self.session.post(
                     url,
                     headers=headers,
                     json=payload,
@@ -149,7 +210,7 @@ class HttpClient:
 
         for attempt in range(num_attempts):
             try:
-                response = requests.post(
+                response = self.session.post(
                     url,
                     headers=multipart_headers,
                     data=data,
@@ -196,7 +257,7 @@ class HttpClient:
 
         for attempt in range(num_attempts):
             try:
-                response = requests.get(
+                response = self.session.get(
                     url,
                     headers=headers,
                     timeout=timeout
@@ -243,7 +304,7 @@ class HttpClient:
 
         for attempt in range(num_attempts):
             try:
-                response = requests.delete(
+                response = self.session.delete(
                     url,
                     headers=headers,
                     timeout=timeout
@@ -293,7 +354,7 @@ class HttpClient:
 
         for attempt in range(num_attempts):
             try:
-                response = requests.patch(
+                response = self.session.patch(
                     url,
                     json=payload,
                     headers=headers,
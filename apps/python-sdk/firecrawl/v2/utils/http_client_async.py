@@ -1,12 +1,27 @@
 import asyncio
+import importlib.util
+import logging
 import httpx
 from typing import Optional, Dict, Any
 from .get_version import get_version
 
 version = get_version()
 
+logger = logging.getLogger("firecrawl")
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
 
 class AsyncHttpClient:
+    """Async HTTP client with a keep-alive connection pool and retry logic.
+
+    Pool sizing follows ``httpx.Limits``. Set ``max_keepalive_connections=0``
+    to restore the previous one-connection-per-request behaviour, e.g. when
+    the client is shared across several short-lived event loops.
+    """
+
     def __init__(
         self,
         api_key: Optional[str],
@@ -14,12 +29,28 @@ class AsyncHttpClient:
         timeout: Optional[float] = None,
         max_retries: int = 3,
         backoff_factor: float = 0.5,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        validate_documents: bool = True,
     ):
         self.api_key = api_key
         self.api_url = api_url
         self.timeout = timeout
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
+        self.validate_documents = validate_documents
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+
+        if http2 and not _http2_available():
+            logger.warning("HTTP/2 requested but the 'h2' package is not installed; falling back to HTTP/1.1")
+            http2 = False
+        self.http2 = http2
 
         headers = {}
 
@@ -29,12 +60,50 @@ class AsyncHttpClient:
         self._client = httpx.AsyncClient(
             base_url=api_url,
             headers=headers,
-            limits=httpx.Limits(max_keepalive_connections=0),
+            limits=self.limits,
+            http2=self.http2,
         )
 
     async def close(self) -> None:
         await self._client.aclose()
 
+    async def __aenter__(self) -> "AsyncHttpClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Return a snapshot of connection-pool occupancy.
+
+        ``active`` counts connections currently serving a request, ``idle``
+        counts kept-alive connections available for reuse and ``queued`` counts
+        requests waiting for a free connection.
+        """
+        stats: Dict[str, Any] = {
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "keepalive_expiry": self.limits.keepalive_expiry,
+            "http2": self.http2,
+            "connections": 0,
+            "active": 0,
+            "idle": 0,
+            "queued": 0,
+        }
+        # httpx does not expose pool state publicly; read it from the httpcore pool when present.
+        pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+        if pool is None:
+            return stats
+        connections = list(getattr(pool, "connections", []) or [])
+        idle = sum(1 for conn in connections if conn.is_idle())
+        stats["connections"] = len(connections)
+        stats["idle"] = idle
+        stats["active"] = len(connections) - idle
+        stats["queued"] = sum(
+            1 for req in getattr(pool, "_requests", []) or [] if getattr(req, "connection", None) is None
+        )
+        return stats
+
     def _headers(self, idempotency_key: Optional[str] = None) -> Dict[str, str]:
         headers: Dict[str, str] = {}
         if idempotency_key:
@@ -2,8 +2,57 @@
 Normalization helpers for v2 API payloads to avoid relying on Pydantic aliases.
 """
 
-from typing import Any, Dict, List
-from ..types import DocumentMetadata
+from typing import Any, Dict, List, Type, TypeVar
+
+from pydantic import BaseModel
+
+from ..types import BrandingProfile, Document, DocumentMetadata, MenuProfile, ProductProfile
+
+M = TypeVar("M", bound=BaseModel)
+
+
+# API v2 camelCase metadata keys and their snake_case DocumentMetadata fields
+_METADATA_KEY_MAP = {
+    # OpenGraph
+    "ogTitle": "og_title",
+    "ogDescription": "og_description",
+    "ogUrl": "og_url",
+    "ogImage": "og_image",
+    "ogAudio": "og_audio",
+    "ogDeterminer": "og_determiner",
+    "ogLocale": "og_locale",
+    "ogLocaleAlternate": "og_locale_alternate",
+    "ogSiteName": "og_site_name",
+    "ogVideo": "og_video",
+    # Dublin Core and misc
+    "dcTermsCreated": "dc_terms_created",
+    "dcDateCreated": "dc_date_created",
+    "dcDate": "dc_date",
+    "dcTermsType": "dc_terms_type",
+    "dcType": "dc_type",
+    "dcTermsAudience": "dc_terms_audience",
+    "dcTermsSubject": "dc_terms_subject",
+    "dcSubject": "dc_subject",
+    "dcDescription": "dc_description",
+    "dcTermsKeywords": "dc_terms_keywords",
+    "modifiedTime": "modified_time",
+    "publishedTime": "published_time",
+    "articleTag": "article_tag",
+    "articleSection": "article_section",
+    # Response-level
+    "sourceURL": "source_url",
+    "statusCode": "status_code",
+    "scrapeId": "scrape_id",
+    "numPages": "num_pages",
+    "totalPages": "total_pages",
+    "contentType": "content_type",
+    "proxyUsed": "proxy_used",
+    "cacheState": "cache_state",
+    "cachedAt": "cached_at",
+    "creditsUsed": "credits_used",
+    "concurrencyLimited": "concurrency_limited",
+    "concurrencyQueueDurationMs": "concurrency_queue_duration_ms",
+}
 
 
 def _map_metadata_keys(md: Dict[str, Any]) -> Dict[str, Any]:
@@ -11,51 +60,9 @@ def _map_metadata_keys(md: Dict[str, Any]) -> Dict[str, Any]:
     Convert API v2 camelCase metadata keys to snake_case expected by DocumentMetadata.
     Leaves unknown keys as-is.
     """
-    mapping = {
-        # OpenGraph
-        "ogTitle": "og_title",
-        "ogDescription": "og_description",
-        "ogUrl": "og_url",
-        "ogImage": "og_image",
-        "ogAudio": "og_audio",
-        "ogDeterminer": "og_determiner",
-        "ogLocale": "og_locale",
-        "ogLocaleAlternate": "og_locale_alternate",
-        "ogSiteName": "og_site_name",
-        "ogVideo": "og_video",
-        # Dublin Core and misc
-        "dcTermsCreated": "dc_terms_created",
-        "dcDateCreated": "dc_date_created",
-        "dcDate": "dc_date",
-        "dcTermsType": "dc_terms_type",
-        "dcType": "dc_type",
-        "dcTermsAudience": "dc_terms_audience",
-        "dcTermsSubject": "dc_terms_subject",
-        "dcSubject": "dc_subject",
-        "dcDescription": "dc_description",
-        "dcTermsKeywords": "dc_terms_keywords",
-        "modifiedTime": "modified_time",
-        "publishedTime": "published_time",
-        "articleTag": "article_tag",
-        "articleSection": "article_section",
-        # Response-level
-        "sourceURL": "source_url",
-        "statusCode": "status_code",
-        "scrapeId": "scrape_id",
-        "numPages": "num_pages",
-        "totalPages": "total_pages",
-        "contentType": "content_type",
-        "proxyUsed": "proxy_used",
-        "cacheState": "cache_state",
-        "cachedAt": "cached_at",
-        "creditsUsed": "credits_used",
-        "concurrencyLimited": "concurrency_limited",
-        "concurrencyQueueDurationMs": "concurrency_queue_duration_ms",
-    }
-
     out: Dict[str, Any] = {}
     for k, v in md.items():
-        snake = mapping.get(k, k)
+        snake = _METADATA_KEY_MAP.get(k, k)
         out[snake] = v
 
     # Light coercions where server may send strings/lists
@@ -69,13 +76,7 @@ def _map_metadata_keys(md: Dict[str, Any]) -> Dict[str, Any]:
     return out
 
 
-def normalize_document_input(doc: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Normalize a raw Document dict from the API into the Python SDK's expected shape:
-    - Convert top-level keys rawHtml->raw_html, changeTracking->change_tracking
-    - Convert metadata keys from camelCase to snake_case
-    - Convert branding.colorScheme to branding.color_scheme
-    """
+def _normalize_document_keys(doc: Dict[str, Any]) -> Dict[str, Any]:
     normalized = dict(doc)
 
     if "rawHtml" in normalized and "raw_html" not in normalized:
@@ -84,6 +85,24 @@ def normalize_document_input(doc: Dict[str, Any]) -> Dict[str, Any]:
     if "changeTracking" in normalized and "change_tracking" not in normalized:
         normalized["change_tracking"] = normalized.pop("changeTracking")
 
+    # Normalize branding top-level camelCase keys
+    branding = normalized.get("branding")
+    if isinstance(branding, dict):
+        if "colorScheme" in branding and "color_scheme" not in branding:
+            branding["color_scheme"] = branding.pop("colorScheme")
+
+    return normalized
+
+
+def normalize_document_input(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize a raw Document dict from the API into the Python SDK's expected shape:
+    - Convert top-level keys rawHtml->raw_html, changeTracking->change_tracking
+    - Convert metadata keys from camelCase to snake_case
+    - Convert branding.colorScheme to branding.color_scheme
+    """
+    normalized = _normalize_document_keys(doc)
+
     md = normalized.get("metadata")
     if isinstance(md, dict):
         mapped = _map_metadata_keys(md)
@@ -93,15 +112,87 @@ def normalize_document_input(doc: Dict[str, Any]) -> Dict[str, Any]:
         except Exception:
             normalized["metadata"] = mapped
 
-    # Normalize branding top-level camelCase keys
-    branding = normalized.get("branding")
-    if isinstance(branding, dict):
-        if "colorScheme" in branding and "color_scheme" not in branding:
-            branding["color_scheme"] = branding.pop("colorScheme")
-
     return normalized
 
 
+# Nested profile models are only present for specific formats; they are still
+# validated in fast mode so attribute access on them keeps working.
+_NESTED_DOCUMENT_MODELS = {
+    "branding": BrandingProfile,
+    "product": ProductProfile,
+    "menu": MenuProfile,
+}
+
+_MODEL_DEFAULTS: Dict[type, Dict[str, Any]] = {}
+
+
+def _construct_model(model: Type[M], values: Dict[str, Any]) -> M:
+    """
+    Equivalent of ``model.model_construct(**values)`` for flat models whose
+    fields all have plain defaults.
+
+    ``model_construct`` walks every field in Python on each call, which is
+    slower than validating for wide models such as ``DocumentMetadata``; the
+    defaults are resolved once per class here instead.
+    """
+    defaults = _MODEL_DEFAULTS.get(model)
+    if defaults is None:
+        defaults = {name: field.get_default() for name, field in model.model_fields.items()}
+        _MODEL_DEFAULTS[model] = defaults
+
+    fields = dict(defaults)
+    fields_set = set()
+    extra: Dict[str, Any] = {}
+    for key, value in values.items():
+        if key in defaults:
+            fields[key] = value
+            fields_set.add(key)
+        else:
+            extra[key] = value
+
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", fields)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", extra if model.model_config.get("extra") == "allow" else None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+def construct_document(doc: Dict[str, Any]) -> Document:
+    """
+    Build a Document from a raw API dict without per-field validation.
+
+    Keys are normalized exactly as in :func:`normalize_document_input`, but the
+    document and its metadata are assembled without running Pydantic
+    validators, so values are kept as sent by the API. Use
+    ``Document.model_validate(doc.model_dump())`` to validate such a document later.
+    """
+    normalized = _normalize_document_keys(doc)
+
+    md = normalized.get("metadata")
+    if isinstance(md, dict):
+        normalized["metadata"] = _construct_model(DocumentMetadata, _map_metadata_keys(md))
+
+    for key, model in _NESTED_DOCUMENT_MODELS.items():
+        value = normalized.get(key)
+        if isinstance(value, dict):
+            normalized[key] = model.model_validate(value)
+
+    return _construct_model(Document, normalized)
+
+
+def build_document(doc: Dict[str, Any], validate: bool = True) -> Document:
+    """Build a Document from a raw API dict, validating fields unless ``validate`` is False."""
+    if validate:
+        return Document(**normalize_document_input(doc))
+    return construct_document(doc)
+
+
+def validates_documents(client: Any) -> bool:
+    """Whether documents fetched through ``client`` should be fully validated."""
+    return getattr(client, "validate_documents", True) is not False
+
+
 def _map_search_result_keys(result: Dict[str, Any], result_type: str) -> Dict[str, Any]:
     if result_type == "images":
         mapping = {
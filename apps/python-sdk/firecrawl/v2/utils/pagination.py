@@ -0,0 +1,247 @@
+"""
+Prefetching paginator for cursor-based crawl and batch scrape results.
+
+Result pages are chained through the ``next`` URL of the previous page, so
+the paginator walks the chain on its own (a background thread for sync
+callers, an asyncio task for async callers) and hands decoded page bodies to
+the caller. While the caller normalizes one page into ``Document`` models,
+up to ``prefetch_pages`` further pages are already being downloaded.
+
+Pagination limits (``max_pages``, ``max_results``, ``max_wait_time``) are
+enforced by the producer, so the set of requests issued is the same as with
+a plain sequential loop.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional
+
+from ..types import PaginationConfig
+
+logger = logging.getLogger("firecrawl")
+
+_PAGE = "page"
+_DONE = "done"
+_ERROR = "error"
+
+
+def _count_documents(body: Dict[str, Any]) -> int:
+    return sum(1 for doc in body.get("data") or [] if isinstance(doc, dict))
+
+
+def _iter_page_bodies(
+    get_page: Callable[[str], Any],
+    next_url: str,
+    initial_count: int,
+    pagination_config: Optional[PaginationConfig],
+) -> Iterator[Dict[str, Any]]:
+    max_pages = pagination_config.max_pages if pagination_config else None
+    max_results = pagination_config.max_results if pagination_config else None
+    max_wait_time = pagination_config.max_wait_time if pagination_config else None
+
+    current_url: Optional[str] = next_url
+    document_count = initial_count
+    page_count = 0
+    start_time = time.monotonic()
+
+    while current_url:
+        # Check pagination limits (treat 0 as a valid limit)
+        if (max_pages is not None) and page_count >= max_pages:
+            break
+
+        if (max_wait_time is not None) and (time.monotonic() - start_time) > max_wait_time:
+            break
+
+        response = get_page(current_url)
+
+        if not response.ok:
+            # Log error but continue with what we have
+            logger.warning("Failed to fetch next page", extra={"status_code": response.status_code})
+            break
+
+        body = response.json()
+        if not body.get("success"):
+            break
+
+        yield body
+
+        document_count += _count_documents(body)
+        if (max_results is not None) and document_count >= max_results:
+            break
+
+        current_url = body.get("next")
+        page_count += 1
+
+
+async def _aiter_page_bodies(
+    get_page: Callable[[str], Awaitable[Any]],
+    next_url: str,
+    initial_count: int,
+    pagination_config: Optional[PaginationConfig],
+) -> AsyncIterator[Dict[str, Any]]:
+    max_pages = pagination_config.max_pages if pagination_config else None
+    max_results = pagination_config.max_results if pagination_config else None
+    max_wait_time = pagination_config.max_wait_time if pagination_config else None
+
+    current_url: Optional[str] = next_url
+    document_count = initial_count
+    page_count = 0
+    start_time = time.monotonic()
+
+    while current_url:
+        if (max_pages is not None) and page_count >= max_pages:
+            break
+
+        if (max_wait_time is not None) and (time.monotonic() - start_time) > max_wait_time:
+            break
+
+        response = await get_page(current_url)
+
+        if response.status_code >= 400:
+            logger.warning("Failed to fetch next page", extra={"status_code": response.status_code})
+            break
+
+        body = response.json()
+        if not body.get("success"):
+            break
+
+        yield body
+
+        document_count += _count_documents(body)
+        if (max_results is not None) and document_count >= max_results:
+            break
+
+        current_url = body.get("next")
+        page_count += 1
+
+
+def _prefetch_depth(pagination_config: Optional[PaginationConfig]) -> int:
+    return pagination_config.prefetch_pages if pagination_config else PaginationConfig().prefetch_pages
+
+
+def iter_result_pages(
+    get_page: Callable[[str], Any],
+    next_url: str,
+    *,
+    initial_count: int = 0,
+    pagination_config: Optional[PaginationConfig] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield decoded JSON bodies of successive result pages, prefetching ahead.
+
+    Args:
+        get_page: Callable issuing the GET request for a page URL
+        next_url: URL of the first page to fetch
+        initial_count: Number of documents the caller already holds
+        pagination_config: Limits and look-ahead depth (``prefetch_pages``)
+
+    Yields:
+        Successful page bodies in order; iteration stops at the first failed page
+    """
+    pages = _iter_page_bodies(get_page, next_url, initial_count, pagination_config)
+    depth = _prefetch_depth(pagination_config)
+    if depth <= 0:
+        yield from pages
+        return
+
+    results: "queue.Queue[tuple]" = queue.Queue()
+    slots = threading.Semaphore(depth)
+    stopped = threading.Event()
+
+    def produce() -> None:
+        try:
+            while True:
+                while not slots.acquire(timeout=0.1):
+                    if stopped.is_set():
+                        return
+                if stopped.is_set():
+                    return
+                try:
+                    body = next(pages)
+                except StopIteration:
+                    break
+                results.put((_PAGE, body))
+            results.put((_DONE, None))
+        except BaseException as exc:  # surface transport errors to the consumer
+            results.put((_ERROR, exc))
+
+    worker = threading.Thread(target=produce, name="firecrawl-page-prefetch", daemon=True)
+    worker.start()
+    try:
+        while True:
+            kind, item = results.get()
+            if kind == _ERROR:
+                raise item
+            if kind == _DONE:
+                return
+            slots.release()
+            yield item
+    finally:
+        stopped.set()
+
+
+async def aiter_result_pages(
+    get_page: Callable[[str], Awaitable[Any]],
+    next_url: str,
+    *,
+    initial_count: int = 0,
+    pagination_config: Optional[PaginationConfig] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Async variant of :func:`iter_result_pages` backed by an asyncio task.
+
+    Args:
+        get_page: Coroutine function issuing the GET request for a page URL
+        next_url: URL of the first page to fetch
+        initial_count: Number of documents the caller already holds
+        pagination_config: Limits and look-ahead depth (``prefetch_pages``)
+
+    Yields:
+        Successful page bodies in order; iteration stops at the first failed page
+    """
+    pages = _aiter_page_bodies(get_page, next_url, initial_count, pagination_config)
+    depth = _prefetch_depth(pagination_config)
+    if depth <= 0:
+        async for body in pages:
+            yield body
+        return
+
+    results: "asyncio.Queue[tuple]" = asyncio.Queue()
+    slots = asyncio.Semaphore(depth)
+
+    async def produce() -> None:
+        try:
+            while True:
+                await slots.acquire()
+                try:
+                    body = await pages.__anext__()
+                except StopAsyncIteration:
+                    break
+                results.put_nowait((_PAGE, body))
+            results.put_nowait((_DONE, None))
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            results.put_nowait((_ERROR, exc))
+
+    worker = asyncio.ensure_future(produce())
+    try:
+        while True:
+            kind, item = await results.get()
+            if kind == _ERROR:
+                raise item
+            if kind == _DONE:
+                return
+            slots.release()
+            yield item
+    finally:
+        if not worker.done():
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+        await pages.aclose()
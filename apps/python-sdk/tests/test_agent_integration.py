@@ -23,8 +23,8 @@ class FoundersSchema(BaseModel):
 class TestAgent(unittest.TestCase):
     """Integration tests for agent method."""
 
-    @patch('firecrawl.v2.utils.http_client.requests.post')
-    @patch('firecrawl.v2.utils.http_client.requests.get')
+    @patch('firecrawl.v2.utils.http_client.requests.Session.post')
+    @patch('firecrawl.v2.utils.http_client.requests.Session.get')
     def test_agent_basic(self, mock_get, mock_post):
         """Test basic agent call."""
         # Mock start agent response
@@ -83,7 +83,7 @@ class TestAgent(unittest.TestCase):
         assert result.status == "completed"
         assert result.data is not None
 
-    @patch('firecrawl.v2.utils.http_client.requests.post')
+    @patch('firecrawl.v2.utils.http_client.requests.Session.post')
     def test_agent_with_urls(self, mock_post):
         """Test agent call with URLs."""
         mock_response = MagicMock()
@@ -109,7 +109,7 @@ class TestAgent(unittest.TestCase):
         assert request_body["urls"] == ["https://example.com", "https://test.com"]
         assert request_body["prompt"] == "Extract information"
 
-    @patch('firecrawl.v2.utils.http_client.requests.post')
+    @patch('firecrawl.v2.utils.http_client.requests.Session.post')
     def test_agent_with_dict_schema(self, mock_post):
         """Test agent call with dict schema."""
         mock_response = MagicMock()
@@ -141,7 +141,7 @@ class TestAgent(unittest.TestCase):
         request_body = post_call_args[1]["json"]
         assert request_body["schema"] == schema
 
-    @patch('firecrawl.v2.utils.http_client.requests.post')
+    @patch('firecrawl.v2.utils.http_client.requests.Session.post')
     def test_agent_with_all_params(self, mock_post):
         """Test agent call with all parameters."""
         mock_response = MagicMock()
@@ -179,7 +179,7 @@ class TestAgent(unittest.TestCase):
         assert request_body["maxCredits"] == 50
         assert request_body["strictConstrainToURLs"] is True
 
-    @patch('firecrawl.v2.utils.http_client.requests.post')
+    @patch('firecrawl.v2.utils.http_client.requests.Session.post')
     def test_agent_pydantic_schema_normalization(self, mock_post):
         """Test that Pydantic schemas are properly normalized."""
         mock_response = MagicMock()
@@ -208,8 +208,8 @@ class TestAgent(unittest.TestCase):
         assert "founders" in schema["properties"]
         assert schema["properties"]["founders"]["type"] == "array"
 
-    @patch('firecrawl.v2.utils.http_client.requests.post')
-    @patch('firecrawl.v2.utils.http_client.requests.get')
+    @patch('firecrawl.v2.utils.http_client.requests.Session.post')
+    @patch('firecrawl.v2.utils.http_client.requests.Session.get')
     def test_agent_url_construction(self, mock_get, mock_post):
         """Test that agent requests are sent to correct URL."""
         # Mock start agent response
@@ -248,7 +248,7 @@ class TestAgent(unittest.TestCase):
         get_url = get_call_args[1].get("url") if "url" in get_call_args[1] else get_call_args[0][0]
         assert "/v2/agent/test-agent-123" in str(get_url)
 
-    @patch('firecrawl.v2.utils.http_client.requests.post')
+    @patch('firecrawl.v2.utils.http_client.requests.Session.post')
     def test_agent_headers(self, mock_post):
         """Test that agent requests include correct headers."""
         mock_response = MagicMock()
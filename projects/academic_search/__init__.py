@@ -42,7 +42,7 @@ from .analyzers import TopicExtractor, LLMAnalyzer, CompositeAnalyzer
 from .providers import (
     ScienceDirectSearcher, ScopusSearcher, OpenAlexSearcher, SemanticScholarSearcher, ArXivSearcher,
     GoogleScholarSearcher, ClarivateSearcher, FirecrawlResearchSearcher,
-    CrossRefEnricher, SemanticScholarEnricher, ScopusEnricher
+    OpenAlexEnricher, CrossRefEnricher, SemanticScholarEnricher, ScopusEnricher
 )
 from .base import BaseSearcher, BaseAbstractEnricher, BaseAnalyzer, BaseExporter
 
@@ -74,6 +74,7 @@ __all__ = [
     "FirecrawlResearchSearcher",
     
     # Enrichers
+    "OpenAlexEnricher",
     "CrossRefEnricher",
     "SemanticScholarEnricher",
     "ScopusEnricher",
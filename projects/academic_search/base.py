@@ -6,11 +6,17 @@ This allows for easy extension with new sources.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Dict, Any, Tuple
 import logging
 
+import requests
+
 from .models import Article, SearchResult
 from .config import Config
+from .response_cache import ResponseCache, get_response_cache
+from .rate_limit import RateLimitExceeded, TokenBucket, get_rate_limiter
+from .transport import provider_get
 
 
 class BaseSearcher(ABC):
@@ -43,6 +49,8 @@ class BaseSearcher(ABC):
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
         self.last_failure: Optional[Dict[str, str]] = None
+        # None uses the process-wide cache; assign a ResponseCache to isolate one.
+        self.response_cache: Optional[ResponseCache] = None
 
     def clear_last_failure(self) -> None:
         self.last_failure = None
@@ -77,7 +85,87 @@ class BaseSearcher(ABC):
         Override this method if your searcher requires specific setup.
         """
         return True
+
+    @property
+    def rate_limiter(self) -> Optional[TokenBucket]:
+        """Shared limiter for this provider, if ``Config.rate_limits`` names it."""
+        return get_rate_limiter(self.source_name, self.config.rate_limits.get(self.source_name))
     
+    def _get(self, url: str, params: Optional[Dict[str, Any]] = None,
+             headers: Optional[Dict[str, str]] = None,
+             timeout: Optional[float] = None):
+        """
+        HTTP GET through the provider response cache.
+
+        Returns a ``requests.Response`` or, for a cache hit, a ``CachedResponse``
+        with the same ``status_code``/``content``/``text``/``json()`` surface.
+        Request exceptions propagate as with ``requests.get``.
+        """
+        timeout = timeout or self.config.timeout
+
+        def fetch(conditional: Dict[str, str]):
+            request_headers = {**(headers or {}), **conditional} if conditional else headers
+            return provider_get(
+                self.source_name, url, params, request_headers, timeout,
+                rate=self.config.rate_limits.get(self.source_name),
+                pool_size=self.config.http_pool_size,
+            )
+
+        if not self.config.enable_response_cache:
+            return fetch({})
+        cache = self.response_cache or get_response_cache()
+        return cache.get(
+            self.source_name, url, params, fetch, ttl=self.config.cache_ttl_for(self.source_name)
+        )
+
+    def _paginate(
+        self,
+        fetch_page: Callable[[int, int], Optional[Tuple[List[Any], int]]],
+        max_results: int,
+        page_size: int,
+        max_offset: Optional[int] = None,
+    ) -> Tuple[List[Any], int]:
+        """
+        Collect up to ``max_results`` records from an offset-paged API.
+
+        ``fetch_page(start, count)`` returns ``(entries, total_found)``, or None when
+        the page failed. The first page tells how many records exist, so every
+        remaining offset is known up front and fetched concurrently
+        (``Config.page_concurrency``); request pacing is left to the rate limiter.
+        Entries come back in offset order and stop at the first failed or empty page,
+        so a partial sweep is still a prefix of the provider's ranking.
+
+        Returns:
+            (entries, total_found)
+        """
+        first = fetch_page(0, min(page_size, max_results))
+        if first is None:
+            return [], 0
+        entries, total_found = first
+        entries = list(entries)
+        target = min(max_results, total_found)
+        if max_offset is not None:
+            target = min(target, max_offset)
+        offsets = list(range(page_size, target, page_size))
+        if not offsets or len(entries) < page_size:
+            return entries, total_found
+
+        workers = max(1, min(self.config.page_concurrency, len(offsets)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pages = [
+                executor.submit(fetch_page, start, min(page_size, target - start))
+                for start in offsets
+            ]
+            for start, future in zip(offsets, pages):
+                page = future.result()
+                if not page or not page[0]:
+                    self.logger.warning(f"{self.source_name}: stopped paging at offset {start}")
+                    for pending in pages:
+                        pending.cancel()
+                    break
+                entries.extend(page[0])
+        return entries, total_found
+
     def _make_request(self, url: str, params: Dict[str, Any], 
                       headers: Optional[Dict[str, str]] = None) -> Optional[Dict]:
         """
@@ -91,15 +179,8 @@ class BaseSearcher(ABC):
         Returns:
             JSON response data or None if request failed.
         """
-        import requests
-        
         try:
-            response = requests.get(
-                url, 
-                params=params, 
-                headers=headers,
-                timeout=self.config.timeout
-            )
+            response = self._get(url, params, headers)
             
             if response.status_code == 200:
                 return response.json()
@@ -118,6 +199,9 @@ class BaseSearcher(ABC):
         except requests.exceptions.Timeout:
             self.logger.warning(f"{self.source_name}: Request timeout")
             self.last_failure = {"code": "timeout", "message": "provider request timed out"}
+        except RateLimitExceeded:
+            self.logger.warning(f"{self.source_name}: Rate limit budget exhausted")
+            self.last_failure = {"code": "rate_limited", "message": "provider rate limit reached"}
         except requests.exceptions.RequestException as e:
             self.logger.warning(f"{self.source_name}: Request error - {e}")
             self.last_failure = {"code": "request_error", "message": "provider request failed"}
@@ -129,12 +213,25 @@ class BaseAbstractEnricher(ABC):
     """
     Abstract base class for abstract enrichment providers.
     
-    Enrichers fetch abstracts for articles that don't have them.
+    Enrichers fetch abstracts for articles that don't have them. Providers with a
+    bulk lookup set ``batch_size`` above 1 and override ``get_abstracts``.
     """
+
+    batch_size: int = 1
     
     def __init__(self, config: Config):
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
+
+    def _get(self, url: str, params: Optional[Dict[str, Any]] = None,
+             headers: Optional[Dict[str, str]] = None,
+             timeout: Optional[float] = None) -> requests.Response:
+        """HTTP GET over the provider's pooled session, within its rate limit."""
+        return provider_get(
+            self.source_name, url, params, headers, timeout or self.config.timeout,
+            rate=self.config.rate_limits.get(self.source_name),
+            pool_size=self.config.http_pool_size,
+        )
     
     @abstractmethod
     def get_abstract(self, article: Article) -> Optional[str]:
@@ -145,10 +242,33 @@ class BaseAbstractEnricher(ABC):
             article: Article object to enrich.
             
         Returns:
-            Abstract text if found, None otherwise.
+            Abstract text if found, None if the provider has none.
+        
+        Raises:
+            requests.exceptions.RequestException: The provider could not answer
+            (outage, throttling, unexpected status), so the gap is not definite.
         """
         pass
     
+    def get_abstracts(self, articles: List[Article]) -> List[Optional[str]]:
+        """
+        Fetch abstracts for up to ``batch_size`` articles.
+        
+        Returns:
+            One abstract (or None) per article, in order.
+        """
+        return [self.get_abstract(article) for article in articles]
+
+    def _has_record(self, response) -> bool:
+        """True for 200, False for 404 (no such record); raise for any other status."""
+        if response.status_code == 200:
+            return True
+        if response.status_code == 404:
+            return False
+        raise requests.exceptions.HTTPError(
+            f"{self.source_name}: status {response.status_code}", response=response
+        )
+    
     @property
     @abstractmethod
     def source_name(self) -> str:
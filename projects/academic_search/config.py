@@ -41,6 +41,30 @@ class APIConfig:
             self.clarivate_api_key = os.getenv("CLARIVATE_API_KEY")
 
 
+# Indexes that change slowly keep responses for a day; arXiv lists new preprints daily.
+DEFAULT_RESPONSE_CACHE_TTLS: Dict[str, float] = {
+    "OpenAlex": 6 * 3600.0,
+    "Semantic Scholar": 6 * 3600.0,
+    "arXiv": 3600.0,
+    "Scopus API": 24 * 3600.0,
+    "ScienceDirect": 24 * 3600.0,
+    "Web of Science": 24 * 3600.0,
+}
+
+
+# Requests per second allowed by the providers' published throttling limits
+# (OpenAlex and Crossref: polite pool; arXiv: one request every three seconds).
+DEFAULT_RATE_LIMITS: Dict[str, float] = {
+    "Scopus API": 9.0,
+    "ScienceDirect": 2.0,
+    "OpenAlex": 10.0,
+    "CrossRef": 10.0,
+    "Semantic Scholar": 1.0,
+    "arXiv": 1 / 3,
+    "Web of Science": 5.0,
+}
+
+
 @dataclass
 class Config:
     """
@@ -63,6 +87,30 @@ class Config:
     # Search Settings
     max_results: int = 25
     timeout: int = 30
+    # Multi-provider searches query every provider at once. A provider that has not
+    # answered after its deadline is reported as "timeout" and its late results are
+    # dropped; no search waits longer than the overall budget.
+    provider_deadline: float = 20.0
+    provider_deadlines: Dict[str, float] = field(default_factory=dict)  # by source_name
+    search_budget: float = 30.0
+    # Successful provider responses are cached in memory and in a SQLite file next to
+    # the project store, and reused while younger than the provider's TTL (seconds).
+    enable_response_cache: bool = True
+    response_cache_ttl: float = 3600.0
+    response_cache_ttls: Dict[str, float] = field(
+        default_factory=lambda: dict(DEFAULT_RESPONSE_CACHE_TTLS)
+    )  # by source_name
+    # Provider requests share one keep-alive connection pool per host and a token
+    # bucket per provider (requests per second, by source_name). Paged providers fetch
+    # the pages after the first one concurrently, within that limit.
+    page_concurrency: int = 4
+    rate_limits: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_RATE_LIMITS))
+    http_pool_size: int = 16
+    # Abstract enrichment batches DOI lookups and remembers abstracts by DOI (with the
+    # response cache); per-article enrichers run on up to this many workers.
+    enrichment_max_workers: int = 8
+    abstract_cache_ttl: float = 30 * 86400.0
+    abstract_miss_ttl: float = 86400.0
     enable_abstract_enrichment: bool = True
     deduplicate_results: bool = True
     enable_firecrawl_research: bool = False
@@ -117,6 +165,23 @@ class Config:
         self.enable_elsevier = self.enable_elsevier or os.getenv("ACADEMIC_ENABLE_ELSEVIER", "").lower() in ("true", "1", "yes")
         self.enable_clarivate = self.enable_clarivate or os.getenv("ACADEMIC_ENABLE_CLARIVATE", "").lower() in ("true", "1", "yes")
         self.enable_serper = self.enable_serper or os.getenv("ACADEMIC_ENABLE_SERPER", "").lower() in ("true", "1", "yes")
+
+        if os.getenv("ACADEMIC_PROVIDER_DEADLINE"):
+            self.provider_deadline = float(os.getenv("ACADEMIC_PROVIDER_DEADLINE"))
+        if os.getenv("ACADEMIC_SEARCH_BUDGET"):
+            self.search_budget = float(os.getenv("ACADEMIC_SEARCH_BUDGET"))
+        if os.getenv("ACADEMIC_RESPONSE_CACHE", "").lower() in ("false", "0", "no"):
+            self.enable_response_cache = False
+        if os.getenv("ACADEMIC_RESPONSE_CACHE_TTL"):
+            self.response_cache_ttl = float(os.getenv("ACADEMIC_RESPONSE_CACHE_TTL"))
+
+    def deadline_for(self, source_name: str) -> float:
+        """Seconds a multi-provider search waits for ``source_name``."""
+        return min(self.provider_deadlines.get(source_name, self.provider_deadline), self.search_budget)
+
+    def cache_ttl_for(self, source_name: str) -> float:
+        """Seconds a cached ``source_name`` response is reused without asking the provider."""
+        return self.response_cache_ttls.get(source_name, self.response_cache_ttl)
     
     @classmethod
     def from_env(cls) -> "Config":
@@ -160,6 +225,18 @@ class Config:
             },
             "max_results": self.max_results,
             "timeout": self.timeout,
+            "provider_deadline": self.provider_deadline,
+            "provider_deadlines": dict(self.provider_deadlines),
+            "search_budget": self.search_budget,
+            "enable_response_cache": self.enable_response_cache,
+            "response_cache_ttl": self.response_cache_ttl,
+            "response_cache_ttls": dict(self.response_cache_ttls),
+            "page_concurrency": self.page_concurrency,
+            "rate_limits": dict(self.rate_limits),
+            "http_pool_size": self.http_pool_size,
+            "enrichment_max_workers": self.enrichment_max_workers,
+            "abstract_cache_ttl": self.abstract_cache_ttl,
+            "abstract_miss_ttl": self.abstract_miss_ttl,
             "enable_abstract_enrichment": self.enable_abstract_enrichment,
             "enable_firecrawl_research": self.enable_firecrawl_research,
             "enable_elsevier": self.enable_elsevier,
@@ -175,6 +252,18 @@ class Config:
         data = {
             "max_results": self.max_results,
             "timeout": self.timeout,
+            "provider_deadline": self.provider_deadline,
+            "provider_deadlines": dict(self.provider_deadlines),
+            "search_budget": self.search_budget,
+            "enable_response_cache": self.enable_response_cache,
+            "response_cache_ttl": self.response_cache_ttl,
+            "response_cache_ttls": dict(self.response_cache_ttls),
+            "page_concurrency": self.page_concurrency,
+            "rate_limits": dict(self.rate_limits),
+            "http_pool_size": self.http_pool_size,
+            "enrichment_max_workers": self.enrichment_max_workers,
+            "abstract_cache_ttl": self.abstract_cache_ttl,
+            "abstract_miss_ttl": self.abstract_miss_ttl,
             "enable_abstract_enrichment": self.enable_abstract_enrichment,
             "deduplicate_results": self.deduplicate_results,
             "enable_firecrawl_research": self.enable_firecrawl_research,
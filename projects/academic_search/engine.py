@@ -6,9 +6,11 @@ all search providers, enrichers, analyzers, and exporters.
 """
 
 import logging
+import math
 import re
-from typing import List, Dict, Any, Optional, Type
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from typing import Callable, List, Dict, Any, Optional, Tuple, Type
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 
 from .base import BaseSearcher, BaseAbstractEnricher, BaseAnalyzer, BaseExporter
 from .models import Article, ProviderOutcome, SearchResult
@@ -16,12 +18,45 @@ from .config import Config
 from .providers import (
     ScienceDirectSearcher, ScopusSearcher, OpenAlexSearcher, SemanticScholarSearcher, ArXivSearcher,
     GoogleScholarSearcher, ClarivateSearcher, FirecrawlResearchSearcher,
-    CrossRefEnricher, SemanticScholarEnricher, ScopusEnricher
+    OpenAlexEnricher, CrossRefEnricher, SemanticScholarEnricher, ScopusEnricher
 )
+from .response_cache import AbstractCache, get_abstract_cache
 from .exporters import JSONExporter, MarkdownExporter, CSVExporter, BibTeXExporter, RISExporter
 from .analyzers import TopicExtractor, LLMAnalyzer
 
 
+class _IncrementalDeduplicator:
+    """
+    Groups provider results by deduplication key as they arrive, in any order.
+
+    ``rank`` is the provider's position in the searcher list. The merged output
+    matches a sequential merge in rank order: the primary record of each group is the
+    one from the lowest-ranked provider, duplicates are attached in rank order, and
+    groups are ordered by where their primary record would have appeared.
+    """
+
+    def __init__(self, key_fn: Callable[[Article], str]):
+        self._key_fn = key_fn
+        self._groups: Dict[str, List[Tuple[int, int, Article]]] = {}
+
+    def add(self, rank: int, articles: List[Article]) -> None:
+        for position, article in enumerate(articles):
+            members = self._groups.setdefault(self._key_fn(article), [])
+            members.append((rank, position, article))
+            if len(members) > 1 and members[-2][:2] > members[-1][:2]:
+                members.sort(key=lambda member: member[:2])
+
+    def articles(self) -> List[Article]:
+        groups = sorted(self._groups.values(), key=lambda members: members[0][:2])
+        merged = []
+        for members in groups:
+            primary = members[0][2]
+            for _, _, duplicate in members[1:]:
+                primary.add_provider_record(duplicate)
+            merged.append(primary)
+        return merged
+
+
 class AcademicSearchEngine:
     """
     Main search engine that orchestrates all components.
@@ -73,6 +108,8 @@ class AcademicSearchEngine:
         self._enrichers: List[BaseAbstractEnricher] = []
         self._analyzers: List[BaseAnalyzer] = []
         self._exporters: Dict[str, BaseExporter] = {}
+        # None uses the process-wide DOI abstract cache; assign one to isolate an engine.
+        self.abstract_cache: Optional[AbstractCache] = None
         
         # Set up default components
         self._setup_default_components()
@@ -102,8 +139,9 @@ class AcademicSearchEngine:
         if self.config.enable_serper and self.config.api.serper_api_key:
             self._searchers.append(GoogleScholarSearcher(self.config))
         
-        # Enrichers for adding abstracts
+        # Enrichers for adding abstracts (bulk DOI lookup first)
         self._enrichers.extend([
+            OpenAlexEnricher(self.config),
             SemanticScholarEnricher(self.config),
             CrossRefEnricher(self.config)
         ])
@@ -250,45 +288,80 @@ class AcademicSearchEngine:
     def _search_all_sources(self, query: str, max_results: int, year_min: Optional[int] = None,
                             year_max: Optional[int] = None, searchers: List[BaseSearcher] = None,
                             requested_names: Optional[List[str]] = None) -> SearchResult:
-        """Search all sources and merge results."""
+        """
+        Search all sources concurrently and merge results.
+
+        Every available provider is queried at once, so latency is that of the
+        slowest provider still within its deadline rather than the sum of all of them.
+        ``config.deadline_for(source_name)`` bounds each provider (never beyond
+        ``config.search_budget``); one that has not answered by then is reported as
+        ``timeout`` and its late results are discarded. Results are deduplicated as
+        each provider answers. Merged records are identical to a sequential run in
+        provider order, whichever provider happens to respond first.
+        """
         searchers = searchers or self._searchers
-        all_articles = []
+        started = time.monotonic()
+        outcomes: Dict[int, ProviderOutcome] = {}
+        dedup = _IncrementalDeduplicator(self._deduplication_key)
         total = 0
         raw_article_count = 0
-        sources = []
-        seen_keys: Dict[str, Article] = {}
-        outcomes: List[ProviderOutcome] = []
-        
-        for searcher in searchers:
+        responded: Dict[int, str] = {}
+
+        pending: Dict[Future, int] = {}
+        deadlines: Dict[int, float] = {}
+        available = [(rank, s) for rank, s in enumerate(searchers) if s.is_available]
+        for rank, searcher in enumerate(searchers):
             if not searcher.is_available:
-                outcomes.append(ProviderOutcome(searcher.source_name, "unavailable", error_code="not_configured",
-                                                message="provider is not configured"))
-                continue
-            try:
-                searcher.clear_last_failure()
+                outcomes[rank] = ProviderOutcome(searcher.source_name, "unavailable", error_code="not_configured",
+                                                 message="provider is not configured")
+
+        # Not a context manager: leaving it would wait for providers past their deadline.
+        executor = ThreadPoolExecutor(max_workers=max(1, len(available)),
+                                      thread_name_prefix="academic-search")
+        try:
+            for rank, searcher in available:
                 self.logger.info(f"Searching {searcher.source_name}...")
-                result = searcher.search(query, max_results, year_min, year_max)
-                total += result.total_found
-                raw_article_count += len(result.articles)
-                if result.articles:
-                    sources.append(searcher.source_name)
-                    outcomes.append(ProviderOutcome(searcher.source_name, "responded", len(result.articles) > 0,
-                                                    len(result.articles), result.total_found))
-                else:
-                    outcomes.append(self._outcome_from_failure(searcher.source_name, searcher.last_failure))
+                pending[executor.submit(self._run_searcher, searcher, query, max_results,
+                                        year_min, year_max)] = rank
+                deadlines[rank] = started + self.config.deadline_for(searcher.source_name)
 
-                for article in result.articles:
-                    key = self._deduplication_key(article)
-                    if key in seen_keys:
-                        seen_keys[key].add_provider_record(article)
+            while pending:
+                now = time.monotonic()
+                for future, rank in list(pending.items()):
+                    if now >= deadlines[rank] and not future.done():
+                        name = searchers[rank].source_name
+                        self.logger.warning(f"{name} missed its {deadlines[rank] - started:.1f}s deadline")
+                        outcomes[rank] = ProviderOutcome(name, "timeout", error_code="deadline_exceeded",
+                                                         message="provider did not respond before the deadline")
+                        future.cancel()
+                        del pending[future]
+                if not pending:
+                    break
+                next_deadline = min(deadlines[rank] for rank in pending.values())
+                done, _ = wait(list(pending), timeout=max(0.0, next_deadline - time.monotonic()),
+                               return_when=FIRST_COMPLETED)
+                for future in done:
+                    rank = pending.pop(future)
+                    name = searchers[rank].source_name
+                    try:
+                        result, failure = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Error with {name}: {e}")
+                        outcomes[rank] = self._outcome_from_exception(name, e)
                         continue
-                    seen_keys[key] = article
-                    all_articles.append(article)
-                    
-            except Exception as e:
-                self.logger.error(f"Error with {searcher.source_name}: {e}")
-                outcomes.append(self._outcome_from_exception(searcher.source_name, e))
-        
+                    total += result.total_found
+                    raw_article_count += len(result.articles)
+                    if result.articles:
+                        responded[rank] = name
+                        outcomes[rank] = ProviderOutcome(name, "responded", len(result.articles) > 0,
+                                                         len(result.articles), result.total_found)
+                    else:
+                        outcomes[rank] = self._outcome_from_failure(name, failure)
+                    dedup.add(rank, result.articles)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        all_articles = dedup.articles()
         # Sort by year (newest first)
         all_articles.sort(key=lambda a: int(a.year) if a.year and str(a.year).isdigit() else 0, reverse=True)
         deduplicated_article_count = len(all_articles)
@@ -298,9 +371,10 @@ class AcademicSearchEngine:
             query=query,
             articles=all_articles,
             total_found=total,
-            sources=sources,
+            sources=[responded[rank] for rank in sorted(responded)],
             requested_providers=requested_names or [s.source_name for s in searchers],
-            provider_outcomes=outcomes,
+            provider_outcomes=[outcomes[rank] for rank in sorted(outcomes)],
+            search_time=round(time.monotonic() - started, 3),
             year_min=year_min,
             year_max=year_max,
             limit=max_results,
@@ -308,6 +382,14 @@ class AcademicSearchEngine:
             deduplicated_article_count=deduplicated_article_count,
         )
 
+    @staticmethod
+    def _run_searcher(searcher: BaseSearcher, query: str, max_results: int,
+                      year_min: Optional[int], year_max: Optional[int]):
+        """Run one provider search; returns the result and the failure it recorded."""
+        searcher.clear_last_failure()
+        result = searcher.search(query, max_results, year_min, year_max)
+        return result, searcher.last_failure
+
     @staticmethod
     def _deduplication_key(article: Article) -> str:
         """Prefer DOI; otherwise only merge strong title/year/first-author matches."""
@@ -357,10 +439,7 @@ class AcademicSearchEngine:
             f"Enriching {len(articles_without_abstract)} articles without abstracts..."
         )
         
-        if parallel:
-            self._enrich_parallel(articles_without_abstract)
-        else:
-            self._enrich_sequential(articles_without_abstract)
+        self._enrich_batched(articles_without_abstract, parallel)
         
         # Log results
         with_abstract = sum(1 for a in result.articles if a.abstract)
@@ -368,53 +447,92 @@ class AcademicSearchEngine:
         
         return result
     
-    def _enrich_sequential(self, articles: List[Article]):
-        """Enrich articles sequentially."""
+    def _enrich_batched(self, articles: List[Article], parallel: bool = True):
+        """
+        Fill missing abstracts, trying each enricher on whatever is still missing.
+        
+        DOIs seen in earlier searches are answered from the abstract cache. Bulk
+        enrichers receive the remaining articles ``batch_size`` at a time; the rest
+        are called per article on a pool sized by ``_enrichment_workers``.
+        """
+        cache = self.abstract_cache
+        if cache is None and self.config.enable_response_cache:
+            cache = get_abstract_cache()
+        
+        pending = []
         for article in articles:
-            if article.abstract:
-                continue
-            
-            for enricher in self._enrichers:
-                try:
-                    abstract = enricher.get_abstract(article)
-                    if abstract:
-                        article.set_enriched_abstract(abstract, enricher.source_name)
-                        self.logger.debug(
-                            f"Got abstract from {enricher.source_name}"
-                        )
-                        break
-                except Exception as e:
-                    self.logger.error(
-                        f"Enrichment error ({enricher.source_name}): {e}"
-                    )
-    
-    def _enrich_parallel(self, articles: List[Article]):
-        """Enrich articles in parallel."""
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = {
-                executor.submit(self._enrich_single, article): article
-                for article in articles
-            }
-            
-            for future in as_completed(futures):
-                try:
-                    future.result()
-                except Exception as e:
-                    self.logger.error(f"Parallel enrichment error: {e}")
-    
-    def _enrich_single(self, article: Article):
-        """Enrich a single article (for parallel processing)."""
-        if article.abstract:
-            return
+            known = None
+            if cache is not None and article.doi_normalized:
+                known = cache.get(
+                    article.doi_normalized, self.config.abstract_cache_ttl, self.config.abstract_miss_ttl
+                )
+            if known is None:
+                pending.append(article)
+            elif known[0]:
+                article.set_enriched_abstract(known[0], known[1])
         
+        supplied: Dict[int, str] = {}
+        unanswered: set = set()
         for enricher in self._enrichers:
-            try:
-                abstract = enricher.get_abstract(article)
-                if abstract:
+            missing = [a for a in pending if not a.abstract]
+            if not missing:
+                break
+            abstracts, failed = self._run_enricher(enricher, missing, parallel)
+            for article, abstract, error in zip(missing, abstracts, failed):
+                if error:
+                    unanswered.add(id(article))
+                elif abstract:
                     article.set_enriched_abstract(abstract, enricher.source_name)
-                    return
-            except Exception:
+                    supplied[id(article)] = enricher.source_name
+        
+        if cache is None:
+            return
+        for article in pending:
+            if not article.doi_normalized:
                 continue
+            if id(article) in supplied:
+                cache.put(article.doi_normalized, article.abstract, supplied[id(article)])
+            elif id(article) not in unanswered:
+                # Only remember a gap when every enricher answered "no abstract".
+                cache.put(article.doi_normalized, "", "")
+    
+    def _run_enricher(self, enricher: BaseAbstractEnricher, articles: List[Article],
+                      parallel: bool) -> Tuple[List[Optional[str]], List[bool]]:
+        """
+        Abstracts from one enricher, in article order, and per article whether the
+        enricher failed to answer (raised) rather than reported no abstract.
+        """
+        size = max(1, enricher.batch_size)
+        chunks = [articles[i:i + size] for i in range(0, len(articles), size)]
+        
+        def run(chunk: List[Article]) -> List[Tuple[Optional[str], bool]]:
+            try:
+                return [(abstract, False) for abstract in enricher.get_abstracts(chunk)]
+            except Exception as e:
+                self.logger.error(f"Enrichment error ({enricher.source_name}): {e}")
+                return [(None, True)] * len(chunk)
+        
+        workers = self._enrichment_workers(enricher, len(chunks)) if parallel else 1
+        if workers == 1:
+            results = [run(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(run, chunks))
+        answers = [answer for chunk in results for answer in chunk]
+        return [abstract for abstract, _ in answers], [failed for _, failed in answers]
+    
+    def _enrichment_workers(self, enricher: BaseAbstractEnricher, jobs: int) -> int:
+        """
+        Concurrent requests for ``jobs`` enricher calls.
+        
+        A provider with a rate limit gets about one worker per permitted request per
+        second; more would only queue on its token bucket.
+        """
+        workers = self.config.enrichment_max_workers
+        rate = self.config.rate_limits.get(enricher.source_name)
+        if rate:
+            workers = min(workers, math.ceil(rate))
+        return max(1, min(workers, jobs))
     
     # ========== Analysis Methods ==========
     
@@ -25,7 +25,7 @@ class ArticleSource(Enum):
 
 
 PROVIDER_OUTCOME_STATUSES = {
-    "requested", "responded", "empty", "unavailable", "rate_limited", "failed",
+    "requested", "responded", "empty", "unavailable", "rate_limited", "failed", "timeout",
 }
 
 
@@ -7,8 +7,7 @@ for various academic databases.
 
 import re
 import time
-import requests
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 from .base import BaseSearcher, BaseAbstractEnricher
 from .models import Article, SearchResult
@@ -271,6 +270,8 @@ class ScienceDirectSearcher(BaseSearcher):
     """
     
     SEARCH_URL = "https://api.elsevier.com/content/search/sciencedirect"
+    PAGE_SIZE = 100  # ScienceDirect allows up to 100 per request
+    MAX_OFFSET = 6000  # the search API refuses deeper offsets
     
     def __init__(self, config: Config):
         super().__init__(config)
@@ -300,48 +301,55 @@ class ScienceDirectSearcher(BaseSearcher):
                 sources=[self.source_name]
             )
         
+        # Build query with year filter using pub-date field
+        # ScienceDirect uses different syntax: pub-date AFT YYYYMMDD
+        # Update: Don't wrap query in quotes to allow boolean operators/keywords
+        search_query = f'title-abs-key({query})'
+        
+        if year_min:
+            year_min_date = f"{year_min}0101"
+            search_query += f" AND pub-date AFT {year_min_date}"
+        
+        if year_max:
+            year_max_date = f"{year_max}1231"
+            search_query += f" AND pub-date BEF {year_max_date}"
+        
+        entries, total_found = self._paginate(
+            lambda start, count: self._fetch_page(search_query, start, count),
+            max_results,
+            self.PAGE_SIZE,
+            self.MAX_OFFSET,
+        )
+        self.logger.info(f"ScienceDirect: {total_found} total results, fetched {len(entries)}")
+        
         articles = []
-        total_found = 0
+        for entry in entries:
+            article = self._parse_entry(entry)
+            if article:
+                articles.append(article)
         
+        return SearchResult(
+            query=query,
+            articles=articles,
+            total_found=total_found,
+            sources=[self.source_name]
+        )
+    
+    def _fetch_page(self, search_query: str, start: int, count: int) -> Optional[Tuple[List[Dict[str, Any]], int]]:
+        """Fetch one page of search results; None if the request failed."""
+        params = {
+            'query': search_query,
+            'start': start,
+            'count': count,
+            'sort': 'relevance'
+        }
         try:
-            # Build query with year filter using pub-date field
-            # ScienceDirect uses different syntax: pub-date AFT YYYYMMDD
-            # Update: Don't wrap query in quotes to allow boolean operators/keywords
-            search_query = f'title-abs-key({query})'
-            
-            if year_min:
-                year_min_date = f"{year_min}0101"
-                search_query += f" AND pub-date AFT {year_min_date}"
-            
-            if year_max:
-                year_max_date = f"{year_max}1231"
-                search_query += f" AND pub-date BEF {year_max_date}"
-            
-            params = {
-                'query': search_query,
-                'count': min(max_results, 100),  # ScienceDirect allows up to 100
-                'sort': 'relevance'
-            }
-            
-            response = requests.get(
-                self.SEARCH_URL,
-                headers=self.headers,
-                params=params,
-                timeout=15
-            )
+            response = self._get(self.SEARCH_URL, params, self.headers, timeout=15)
             
             if response.status_code == 200:
-                data = response.json()
-                results = data.get('search-results', {}).get('entry', [])
-                total_found = int(data.get('search-results', {}).get('opensearch:totalResults', 0))
-                
-                self.logger.info(f"ScienceDirect: {total_found} total results, fetched {len(results)}")
-                
-                for entry in results:
-                    article = self._parse_entry(entry)
-                    if article:
-                        articles.append(article)
-                        
+                data = response.json().get('search-results', {})
+                total_found = int(data.get('opensearch:totalResults', 0) or 0)
+                return data.get('entry', []), total_found
             elif response.status_code == 401:
                 self.logger.error("ScienceDirect: Authentication failed")
             else:
@@ -349,13 +357,7 @@ class ScienceDirectSearcher(BaseSearcher):
                 
         except Exception as e:
             self.logger.error(f"ScienceDirect search error: {e}")
-        
-        return SearchResult(
-            query=query,
-            articles=articles,
-            total_found=total_found,
-            sources=[self.source_name]
-        )
+        return None
     
     def _parse_entry(self, entry: Dict[str, Any]) -> Optional[Article]:
         """Parse ScienceDirect API entry into Article."""
@@ -412,6 +414,8 @@ class ScopusSearcher(BaseSearcher):
     
     SEARCH_URL = "https://api.elsevier.com/content/search/scopus"
     ABSTRACT_URL = "https://api.elsevier.com/content/abstract"
+    PAGE_SIZE = 25  # Scopus limit per request
+    MAX_OFFSET = 5000  # deeper results need cursor paging
     
     def __init__(self, config: Config):
         super().__init__(config)
@@ -441,9 +445,6 @@ class ScopusSearcher(BaseSearcher):
                 sources=[self.source_name]
             )
         
-        articles = []
-        total_found = 0
-        
         # Build query with year filter
         search_query = query
         if year_min or year_max:
@@ -451,67 +452,19 @@ class ScopusSearcher(BaseSearcher):
             year_filter += f" AND PUBYEAR < {year_max+1}" if year_max else ""
             search_query = query + year_filter
         
-        start = 0
-        batch_size = 25  # Scopus limit per request
+        entries, total_found = self._paginate(
+            lambda start, count: self._fetch_page(search_query, start, count),
+            max_results,
+            self.PAGE_SIZE,
+            self.MAX_OFFSET,
+        )
+        self.logger.info(f"Scopus: {total_found} total results")
         
-        while len(articles) < max_results:
-            try:
-                # Calculate how many more we need
-                remaining = max_results - len(articles)
-                count = min(remaining, batch_size)
-                
-                params = {
-                    'query': search_query,
-                    'start': start,
-                    'count': count,
-                    'sort': 'relevance'
-                }
-                
-                response = requests.get(
-                    self.SEARCH_URL,
-                    headers=self.headers,
-                    params=params,
-                    timeout=15
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    results = data.get('search-results', {}).get('entry', [])
-                    total_str = data.get('search-results', {}).get('opensearch:totalResults', '0')
-                    total_found = int(total_str)
-                    
-                    if not results:
-                        break
-                        
-                    for entry in results:
-                        article = self._parse_entry(entry)
-                        if article:
-                            articles.append(article)
-                    
-                    # Log first batch
-                    if start == 0:
-                        self.logger.info(f"Scopus: {total_found} total results")
-                    
-                    # Prepare next batch
-                    start += len(results)
-                    
-                    # Check if we've exhausted results
-                    if start >= total_found:
-                        break
-                        
-                    # Rate limit kindness
-                    time.sleep(0.2)
-                            
-                elif response.status_code == 401:
-                    self.logger.error("Scopus: Authentication failed")
-                    break
-                else:
-                    self.logger.warning(f"Scopus: Status {response.status_code}")
-                    break
-                    
-            except Exception as e:
-                self.logger.error(f"Scopus search error: {e}")
-                break
+        articles = []
+        for entry in entries:
+            article = self._parse_entry(entry)
+            if article:
+                articles.append(article)
         
         self.logger.info(f"Scopus: Fetched {len(articles)} articles")
         
@@ -522,6 +475,34 @@ class ScopusSearcher(BaseSearcher):
             sources=[self.source_name]
         )
     
+    def _fetch_page(self, search_query: str, start: int, count: int) -> Optional[Tuple[List[Dict[str, Any]], int]]:
+        """Fetch one page of search results; None if the request failed."""
+        params = {
+            'query': search_query,
+            'start': start,
+            'count': count,
+            'sort': 'relevance'
+        }
+        try:
+            response = self._get(self.SEARCH_URL, params, self.headers, timeout=15)
+            
+            if response.status_code == 200:
+                data = response.json().get('search-results', {})
+                total_found = int(data.get('opensearch:totalResults', 0) or 0)
+                entries = data.get('entry', [])
+                # An empty result set comes back as a single entry carrying an error.
+                if len(entries) == 1 and 'error' in entries[0]:
+                    entries = []
+                return entries, total_found
+            elif response.status_code == 401:
+                self.logger.error("Scopus: Authentication failed")
+            else:
+                self.logger.warning(f"Scopus: Status {response.status_code}")
+                
+        except Exception as e:
+            self.logger.error(f"Scopus search error: {e}")
+        return None
+    
     def _parse_entry(self, entry: Dict[str, Any]) -> Optional[Article]:
         """Parse Scopus API entry into Article."""
         try:
@@ -559,15 +540,18 @@ class ScopusSearcher(BaseSearcher):
         """Fetch abstract using DOI."""
         try:
             url = f"{self.ABSTRACT_URL}/doi/{doi}"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self._get(url, headers=self.headers, timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
-                coredata = data.get('abstracts-retrieval-response', {}).get('coredata', {})
-                return coredata.get('dc:description', '')
+                return self._abstract_from(response)
         except Exception:
             pass
         return None
+    
+    @staticmethod
+    def _abstract_from(response) -> str:
+        coredata = response.json().get('abstracts-retrieval-response', {}).get('coredata', {})
+        return coredata.get('dc:description', '')
 
 
 class OpenAlexSearcher(BaseSearcher):
@@ -615,11 +599,7 @@ class OpenAlexSearcher(BaseSearcher):
                 'mailto': self.email
             }
             
-            response = requests.get(
-                f"{self.BASE_URL}/works",
-                params=params,
-                timeout=15
-            )
+            response = self._get(f"{self.BASE_URL}/works", params, timeout=15)
             
             if response.status_code == 200:
                 data = response.json()
@@ -702,6 +682,54 @@ class OpenAlexSearcher(BaseSearcher):
         return ' '.join([w for _, w in word_positions])
 
 
+class OpenAlexEnricher(BaseAbstractEnricher):
+    """
+    Abstract enricher using OpenAlex bulk DOI lookups.
+    
+    One request resolves up to ``batch_size`` DOIs via ``filter=doi:a|b|c``.
+    """
+    
+    batch_size = 50
+    
+    def __init__(self, config: Config):
+        super().__init__(config)
+        self.searcher = OpenAlexSearcher(config)
+    
+    @property
+    def source_name(self) -> str:
+        return "OpenAlex"
+    
+    def get_abstract(self, article: Article) -> Optional[str]:
+        """Fetch abstract from OpenAlex by DOI."""
+        return self.get_abstracts([article])[0]
+    
+    def get_abstracts(self, articles: List[Article]) -> List[Optional[str]]:
+        """Fetch abstracts for several DOIs in one request."""
+        # '|' and ',' separate filter values, so such DOIs cannot be looked up in bulk.
+        dois = sorted({
+            a.doi_normalized for a in articles
+            if a.doi_normalized and not re.search(r"[|,]", a.doi_normalized)
+        })
+        found: Dict[str, str] = {}
+        if dois:
+            params = {
+                'filter': f"doi:{'|'.join(dois)}",
+                'per_page': len(dois),
+                'select': 'doi,abstract_inverted_index',
+                'mailto': self.config.contact_email
+            }
+            response = self._get(f"{OpenAlexSearcher.BASE_URL}/works", params, timeout=15)
+            
+            if self._has_record(response):
+                for work in response.json().get('results', []):
+                    doi = (work.get('doi') or '').lower().replace('https://doi.org/', '').strip()
+                    abstract = self.searcher._reconstruct_abstract(work.get('abstract_inverted_index'))
+                    if doi and abstract:
+                        found[doi] = abstract
+        
+        return [found.get(a.doi_normalized) for a in articles]
+
+
 class CrossRefEnricher(BaseAbstractEnricher):
     """
     Abstract enricher using CrossRef API.
@@ -720,24 +748,20 @@ class CrossRefEnricher(BaseAbstractEnricher):
         if not article.doi:
             return None
         
-        try:
-            url = f"{self.BASE_URL}/works/{article.doi}"
-            headers = {
-                'User-Agent': f'AcademicSearch/1.0 (mailto:{self.config.contact_email})'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                abstract = data.get('message', {}).get('abstract', '')
-                if abstract:
-                    # Clean HTML tags
-                    abstract = re.sub(r'<[^>]+>', '', abstract)
-                    return abstract.strip()
-                    
-        except Exception as e:
-            self.logger.debug(f"CrossRef error: {e}")
+        url = f"{self.BASE_URL}/works/{article.doi}"
+        headers = {
+            'User-Agent': f'AcademicSearch/1.0 (mailto:{self.config.contact_email})'
+        }
+        
+        response = self._get(url, headers=headers, timeout=10)
+        
+        if self._has_record(response):
+            data = response.json()
+            abstract = data.get('message', {}).get('abstract', '')
+            if abstract:
+                # Clean HTML tags
+                abstract = re.sub(r'<[^>]+>', '', abstract)
+                return abstract.strip()
         
         return None
 
@@ -771,7 +795,7 @@ class SemanticScholarSearcher(BaseSearcher):
             if year_min:
                 params['year'] = f"{year_min}-{year_max or 2030}"
             
-            response = requests.get(url, params=params, timeout=15)
+            response = self._get(url, params, timeout=15)
             
             if response.status_code == 200:
                 data = response.json()
@@ -853,7 +877,7 @@ class ArXivSearcher(BaseSearcher):
                 'sortBy': 'relevance'
             }
             
-            response = requests.get(self.BASE_URL, params=params, timeout=15)
+            response = self._get(self.BASE_URL, params, timeout=15)
             
             if response.status_code == 200:
                 import xml.etree.ElementTree as ET
@@ -942,24 +966,19 @@ class SemanticScholarEnricher(BaseAbstractEnricher):
         if not article.title or len(article.title) < 10:
             return None
         
-        try:
-            url = f"{self.BASE_URL}/paper/search"
-            params = {
-                'query': article.title[:200],
-                'limit': 1,
-                'fields': 'title,abstract'
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                papers = data.get('data', [])
-                if papers:
-                    return papers[0].get('abstract', '')
-                    
-        except Exception as e:
-            self.logger.debug(f"Semantic Scholar error: {e}")
+        url = f"{self.BASE_URL}/paper/search"
+        params = {
+            'query': article.title[:200],
+            'limit': 1,
+            'fields': 'title,abstract'
+        }
+        
+        response = self._get(url, params, timeout=10)
+        
+        if self._has_record(response):
+            papers = response.json().get('data', [])
+            if papers:
+                return papers[0].get('abstract', '')
         
         return None
 
@@ -979,7 +998,11 @@ class ScopusEnricher(BaseAbstractEnricher):
         """Fetch abstract from Scopus by DOI."""
         if not article.doi:
             return None
-        return self.searcher.get_abstract_by_doi(article.doi)
+        url = f"{self.searcher.ABSTRACT_URL}/doi/{article.doi}"
+        response = self.searcher._get(url, headers=self.searcher.headers, timeout=10)
+        if self._has_record(response):
+            return self.searcher._abstract_from(response) or None
+        return None
 
 
 
@@ -1208,12 +1231,7 @@ class ClarivateSearcher(BaseSearcher):
                     'X-ApiKey': self.api_key
                 }
                 
-                response = requests.get(
-                    self.SEARCH_URL,
-                    headers=headers,
-                    params=params,
-                    timeout=30
-                )
+                response = self._get(self.SEARCH_URL, params, headers, timeout=30)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -1329,7 +1347,7 @@ class ClarivateSearcher(BaseSearcher):
             params = {'detail': detail}
             headers = {'X-ApiKey': self.api_key}
             
-            response = requests.get(url, headers=headers, params=params, timeout=15)
+            response = self._get(url, params, headers, timeout=15)
             
             if response.status_code == 200:
                 data = response.json()
@@ -0,0 +1,107 @@
+"""Token-bucket rate limiting for provider requests.
+
+Paged providers (Scopus, ScienceDirect) fetch their pages concurrently, so the
+request rate is bounded here rather than with sleeps between pages. Each provider has
+one process-wide bucket (``get_rate_limiter``) sized from ``Config.rate_limits``;
+every request that actually goes to the network takes a token first, so cache hits
+are free.
+
+Buckets also follow the provider's own accounting: ``X-RateLimit-Remaining`` caps the
+tokens on hand, and once it reaches zero the bucket pauses until
+``X-RateLimit-Reset``. A caller that would have to wait longer than it is prepared to
+gets :class:`RateLimitExceeded` instead of blocking.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+
+import requests
+
+
+class RateLimitExceeded(requests.exceptions.RequestException):
+    """No request slot became available within the caller's wait budget."""
+
+
+def _header_number(headers: Optional[Mapping[str, Any]], name: str) -> Optional[float]:
+    try:
+        value = headers.get(name) if headers is not None else None
+    except AttributeError:
+        return None
+    if not isinstance(value, (str, int, float)):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` requests per second, bursts up to ``burst``."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(burst) if burst else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, max_wait: Optional[float] = None) -> float:
+        """Take one token, sleeping as needed; returns the seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return waited
+                    wait = (1 - self._tokens) / self.rate
+            if max_wait is not None and waited + wait > max_wait:
+                raise RateLimitExceeded(f"no request slot within {max_wait:.1f}s")
+            time.sleep(wait)
+            waited += wait
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller back for ``seconds`` (e.g. after the provider said so)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + max(0.0, seconds))
+            self._tokens = 0.0
+
+    def observe(self, headers: Optional[Mapping[str, Any]]) -> None:
+        """Apply ``X-RateLimit-Remaining`` / ``X-RateLimit-Reset`` from a response."""
+        remaining = _header_number(headers, "X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        if remaining <= 0:
+            reset = _header_number(headers, "X-RateLimit-Reset")
+            self.pause(reset - time.time() if reset else 1.0)
+            return
+        with self._lock:
+            self._tokens = min(self._tokens, remaining)
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+_registry_lock = threading.Lock()
+_limiters: Dict[str, TokenBucket] = {}
+
+
+def get_rate_limiter(name: str, rate: Optional[float]) -> Optional[TokenBucket]:
+    """Process-wide bucket for ``name``; None when no rate is configured."""
+    if not rate:
+        return None
+    with _registry_lock:
+        limiter = _limiters.get(name)
+        if limiter is None or limiter.rate != rate:
+            limiter = _limiters[name] = TokenBucket(rate)
+        return limiter
@@ -0,0 +1,401 @@
+"""Cache of raw provider responses shared by every search in the process.
+
+The UI and the batch scripts repeat the same provider queries many times (re-running
+a saved project search, paging through a sweep, adding a provider to an earlier run).
+Searchers route their HTTP GETs through :class:`ResponseCache`, which keeps successful
+responses in a small in-memory LRU backed by a SQLite file next to the project store.
+
+Entries are keyed by provider, endpoint and the request parameters — which carry the
+query, year range and page — with whitespace in parameter values collapsed and
+credentials kept out of the key. Each provider has its own freshness TTL
+(``Config.response_cache_ttls``). A stale entry that carried an ``ETag`` or
+``Last-Modified`` header is revalidated with a conditional GET instead of being
+refetched, and identical requests that arrive while one is already in flight wait for
+that request instead of issuing their own.
+
+Only ``200`` responses are stored. Cache errors are logged and treated as misses; the
+cache never fails a search.
+
+:class:`AbstractCache` keeps enriched abstracts by normalized DOI in the same SQLite
+file, so an article that appears in many searches is enriched once.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MEMORY_ENTRIES = 256
+DEFAULT_TTL_SECONDS = 3600.0
+
+
+@dataclass
+class CachedResponse:
+    """The parts of a ``requests.Response`` that searchers read."""
+
+    content: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+    stored_at: float = field(default_factory=time.time)
+    status_code: int = 200
+    from_cache: bool = True
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """Conditional-request headers that revalidate this entry."""
+        conditional = {}
+        if self.headers.get("ETag"):
+            conditional["If-None-Match"] = self.headers["ETag"]
+        if self.headers.get("Last-Modified"):
+            conditional["If-Modified-Since"] = self.headers["Last-Modified"]
+        return conditional
+
+
+def _normalize(value: Any) -> str:
+    return " ".join(str(value).split())
+
+
+class ResponseCache:
+    """Two-tier (memory LRU + SQLite) cache of provider GET responses."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+    ) -> None:
+        self.path = path
+        self.memory_entries = max(0, int(memory_entries))
+        self._memory: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.RLock()
+        self._connection: Optional[sqlite3.Connection] = None
+        if path:
+            if path != ":memory:":
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(path, check_same_thread=False, timeout=5)
+            with self._connection:
+                self._connection.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS provider_responses (
+                      key TEXT PRIMARY KEY,
+                      provider TEXT NOT NULL,
+                      content BLOB NOT NULL,
+                      headers_json TEXT NOT NULL,
+                      stored_at REAL NOT NULL
+                    )
+                    """
+                )
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "revalidated": 0,
+            "coalesced": 0,
+            "stores": 0,
+            "errors": 0,
+        }
+
+    @staticmethod
+    def key(provider: str, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Stable key for one provider request; parameter order and spacing do not matter."""
+        canonical = sorted((str(name), _normalize(value)) for name, value in (params or {}).items())
+        payload = json.dumps([provider, url, canonical], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(
+        self,
+        provider: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        fetch: Callable[[Dict[str, str]], Any],
+        ttl: float = DEFAULT_TTL_SECONDS,
+    ) -> Any:
+        """
+        Return a fresh cached response, or call ``fetch`` and cache a ``200`` result.
+
+        ``fetch`` receives the conditional headers to add to the request (empty for a
+        plain GET) and returns a ``requests.Response``-like object. Its exceptions
+        propagate to every caller waiting on the same key.
+        """
+        key = self.key(provider, url, params)
+        entry = self._lookup(key)
+        if entry is not None and time.time() - entry.stored_at < ttl:
+            self._count("hits")
+            return entry
+
+        with self._lock:
+            pending = self._inflight.get(key)
+            if pending is None:
+                pending = Future()
+                self._inflight[key] = pending
+                leader = True
+            else:
+                leader = False
+        if not leader:
+            self._count("coalesced")
+            return pending.result()
+
+        self._count("misses")
+        try:
+            response = self._fetch(key, provider, entry, fetch)
+        except BaseException as exc:
+            pending.set_exception(exc)
+            raise
+        else:
+            pending.set_result(response)
+            return response
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        stats["persistent"] = self._connection is not None
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._connection is not None:
+                with self._connection:
+                    self._connection.execute("DELETE FROM provider_responses")
+
+    def _fetch(
+        self,
+        key: str,
+        provider: str,
+        stale: Optional[CachedResponse],
+        fetch: Callable[[Dict[str, str]], Any],
+    ) -> Any:
+        response = fetch(stale.validators if stale is not None else {})
+        status = getattr(response, "status_code", None)
+        if status == 304 and stale is not None:
+            self._count("revalidated")
+            refreshed = CachedResponse(stale.content, stale.headers)
+            self._store(key, provider, refreshed)
+            return refreshed
+        content = getattr(response, "content", None)
+        if status == 200 and isinstance(content, bytes):
+            raw_headers = getattr(response, "headers", None) or {}
+            headers = {}
+            for name in ("ETag", "Last-Modified", "Content-Type"):
+                value = raw_headers.get(name)
+                if isinstance(value, str):
+                    headers[name] = value
+            self._store(key, provider, CachedResponse(content, headers))
+        return response
+
+    def _lookup(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+            if self._connection is None:
+                return None
+            try:
+                row = self._connection.execute(
+                    "SELECT content, headers_json, stored_at FROM provider_responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+            except sqlite3.Error as exc:
+                logger.warning(f"Provider response cache read failed: {exc}")
+                self._stats["errors"] += 1
+                return None
+            if row is None:
+                return None
+            entry = CachedResponse(bytes(row[0]), json.loads(row[1]), stored_at=row[2])
+            self._remember(key, entry)
+            return entry
+
+    def _store(self, key: str, provider: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._remember(key, entry)
+            self._stats["stores"] += 1
+            if self._connection is None:
+                return
+            try:
+                with self._connection:
+                    self._connection.execute(
+                        """
+                        INSERT OR REPLACE INTO provider_responses
+                          (key, provider, content, headers_json, stored_at)
+                        VALUES (?, ?, ?, ?, ?)
+                        """,
+                        (key, provider, entry.content, json.dumps(entry.headers), entry.stored_at),
+                    )
+            except sqlite3.Error as exc:
+                logger.warning(f"Provider response cache write failed: {exc}")
+                self._stats["errors"] += 1
+
+    def _remember(self, key: str, entry: CachedResponse) -> None:
+        if not self.memory_entries:
+            return
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+
+class AbstractCache:
+    """Enriched abstracts by normalized DOI, with the enricher that supplied each.
+
+    An empty abstract records that no enricher had one, so known gaps are not
+    re-queried on every search until ``miss_ttl`` passes.
+    """
+
+    def __init__(self, path: Optional[str] = None, memory_entries: int = 4096) -> None:
+        self.path = path
+        self.memory_entries = max(0, int(memory_entries))
+        self._memory: "OrderedDict[str, Tuple[str, str, float]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._connection: Optional[sqlite3.Connection] = None
+        if path:
+            if path != ":memory:":
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(path, check_same_thread=False, timeout=5)
+            with self._connection:
+                self._connection.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS doi_abstracts (
+                      doi TEXT PRIMARY KEY,
+                      abstract TEXT NOT NULL,
+                      source TEXT NOT NULL,
+                      stored_at REAL NOT NULL
+                    )
+                    """
+                )
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, doi: str, ttl: float, miss_ttl: float) -> Optional[Tuple[str, str]]:
+        """``(abstract, source)`` if known and fresh; ``abstract`` is "" for a known gap."""
+        with self._lock:
+            entry = self._memory.get(doi)
+            if entry is None and self._connection is not None:
+                try:
+                    row = self._connection.execute(
+                        "SELECT abstract, source, stored_at FROM doi_abstracts WHERE doi = ?", (doi,)
+                    ).fetchone()
+                except sqlite3.Error as exc:
+                    logger.warning(f"Abstract cache read failed: {exc}")
+                    row = None
+                if row is not None:
+                    entry = (row[0], row[1], row[2])
+                    self._remember(doi, entry)
+            if entry is not None:
+                abstract, source, stored_at = entry
+                if time.time() - stored_at < (ttl if abstract else miss_ttl):
+                    self.hits += 1
+                    return abstract, source
+            self.misses += 1
+            return None
+
+    def put(self, doi: str, abstract: str, source: str) -> None:
+        entry = (abstract or "", source or "", time.time())
+        with self._lock:
+            self._remember(doi, entry)
+            if self._connection is None:
+                return
+            try:
+                with self._connection:
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO doi_abstracts (doi, abstract, source, stored_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        (doi, *entry),
+                    )
+            except sqlite3.Error as exc:
+                logger.warning(f"Abstract cache write failed: {exc}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "memory_entries": len(self._memory)}
+
+    def _remember(self, doi: str, entry: Tuple[str, str, float]) -> None:
+        if not self.memory_entries:
+            return
+        self._memory[doi] = entry
+        self._memory.move_to_end(doi)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+
+def response_cache_path() -> str:
+    """SQLite file for cached responses, next to the project store by default."""
+    if os.getenv("ACADEMIC_RESPONSE_CACHE_PATH"):
+        return os.environ["ACADEMIC_RESPONSE_CACHE_PATH"]
+    project_db = os.getenv("ACADEMIC_PROJECT_DB_PATH", "/tmp/academic-search-projects.db")
+    return str(Path(project_db).with_name("academic-search-responses.db"))
+
+
+_cache_lock = threading.Lock()
+_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Process-wide cache; falls back to memory only when the SQLite file cannot be opened."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                path = response_cache_path()
+                try:
+                    _cache = ResponseCache(path)
+                except (OSError, sqlite3.Error) as exc:
+                    logger.warning(f"Provider response cache is memory-only ({path}): {exc}")
+                    _cache = ResponseCache(None)
+    return _cache
+
+
+_abstract_cache: Optional[AbstractCache] = None
+
+
+def get_abstract_cache() -> AbstractCache:
+    """Process-wide DOI abstract cache, stored with the response cache."""
+    global _abstract_cache
+    if _abstract_cache is None:
+        with _cache_lock:
+            if _abstract_cache is None:
+                path = response_cache_path()
+                try:
+                    _abstract_cache = AbstractCache(path)
+                except (OSError, sqlite3.Error) as exc:
+                    logger.warning(f"Abstract cache is memory-only ({path}): {exc}")
+                    _abstract_cache = AbstractCache(None)
+    return _abstract_cache
+
+
+def response_cache_stats() -> Optional[Dict[str, Any]]:
+    """Stats of the process-wide caches, or None if no search has used them yet."""
+    if _cache is None and _abstract_cache is None:
+        return None
+    stats = _cache.stats() if _cache is not None else {}
+    if _abstract_cache is not None:
+        stats["abstracts"] = _abstract_cache.stats()
+    return stats
+
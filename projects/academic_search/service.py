@@ -18,6 +18,8 @@ from pydantic import BaseModel, Field
 from .engine import AcademicSearchEngine
 from .models import Article
 from .project_store import ProjectStore
+from .response_cache import response_cache_stats
+from .transport import provider_stats
 
 
 SERVICE_VERSION = "1.0"
@@ -321,6 +323,8 @@ def create_app(project_store: Optional[ProjectStore] = None) -> FastAPI:
             "service": "academic-search",
             "version": SERVICE_VERSION,
             "providers": _provider_availability(engine),
+            "response_cache": response_cache_stats(),
+            "provider_http": provider_stats(),
         }
 
     @app.get("/api/v1/categories")
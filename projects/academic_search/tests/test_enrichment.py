@@ -0,0 +1,133 @@
+"""Offline tests for batched abstract enrichment."""
+
+from unittest.mock import Mock, patch
+
+import requests
+
+from academic_search import Article, Config, CrossRefEnricher, OpenAlexEnricher, SearchResult
+from academic_search.base import BaseAbstractEnricher
+from academic_search.engine import AcademicSearchEngine
+from academic_search.response_cache import AbstractCache
+
+
+class CountingEnricher(BaseAbstractEnricher):
+    """Per-article enricher that knows abstracts for DOIs ending in an even digit."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.calls = []
+
+    @property
+    def source_name(self):
+        return "Counting"
+
+    def get_abstract(self, article):
+        self.calls.append(article.doi)
+        return f"Abstract of {article.doi}" if int(article.doi[-1]) % 2 == 0 else None
+
+
+def openalex_response(dois):
+    response = Mock(status_code=200, headers={})
+    response.json.return_value = {
+        "results": [
+            {"doi": f"https://doi.org/{doi.upper()}", "abstract_inverted_index": {"Bulk": [0], doi: [1]}}
+            for doi in dois
+        ]
+    }
+    return response
+
+
+def engine_with(*enrichers, cache=None):
+    engine = AcademicSearchEngine(Config())
+    engine._enrichers = list(enrichers)
+    engine.abstract_cache = cache or AbstractCache()
+    return engine
+
+
+def articles(count):
+    return [Article(f"Paper {i}", f"https://p/{i}", doi=f"10.1/p{i}") for i in range(count)]
+
+
+def test_openalex_resolves_many_dois_in_one_request():
+    config = Config()
+    batch = articles(3)
+    with patch("requests.Session.get", return_value=openalex_response(["10.1/p0", "10.1/p2"])) as get:
+        abstracts = OpenAlexEnricher(config).get_abstracts(batch)
+
+    assert get.call_count == 1
+    assert get.call_args.kwargs["params"]["filter"] == "doi:10.1/p0|10.1/p1|10.1/p2"
+    assert abstracts == ["Bulk 10.1/p0", None, "Bulk 10.1/p2"]
+
+
+def test_hundred_articles_take_a_handful_of_bulk_requests():
+    config = Config()
+    batch = articles(100)
+    fallback = CountingEnricher(config)
+    engine = engine_with(OpenAlexEnricher(config), fallback)
+
+    def bulk(url, params=None, headers=None, timeout=None):
+        found = [doi for doi in params["filter"][4:].split("|") if int(doi[-1]) % 5 != 1]
+        return openalex_response(found)
+
+    with patch("requests.Session.get", side_effect=bulk) as get:
+        engine.enrich_abstracts(SearchResult(query="q", articles=batch))
+
+    assert get.call_count == 2
+    assert len(fallback.calls) == 20
+    assert batch[0].field_provenance["abstract"][-1]["source"] == "OpenAlex"
+    assert batch[12].abstract == "Bulk 10.1/p12"
+    assert batch[16].abstract == "Abstract of 10.1/p16"
+    assert batch[11].abstract is None
+    assert sum(1 for a in batch if a.abstract) == 90
+
+
+def test_abstracts_and_gaps_are_cached_by_doi_across_searches():
+    cache = AbstractCache()
+    config = Config()
+    first = CountingEnricher(config)
+    engine_with(first, cache=cache).enrich_abstracts(SearchResult(query="q", articles=articles(4)))
+    assert len(first.calls) == 4
+
+    again = CountingEnricher(config)
+    rerun = articles(4)
+    rerun[0].doi = "HTTPS://DOI.ORG/10.1/P0"
+    engine_with(again, cache=cache).enrich_abstracts(SearchResult(query="other", articles=rerun))
+
+    assert again.calls == []
+    assert rerun[0].abstract == "Abstract of 10.1/p0"
+    assert rerun[0].field_provenance["abstract"][-1]["source"] == "Counting"
+    assert not rerun[1].abstract
+
+
+def test_provider_outage_is_not_cached_as_a_missing_abstract():
+    cache = AbstractCache()
+    config = Config(rate_limits={})
+    outage = requests.exceptions.ConnectionError("provider unreachable")
+
+    with patch("requests.Session.get", side_effect=outage):
+        engine_with(OpenAlexEnricher(config), CrossRefEnricher(config), cache=cache).enrich_abstracts(
+            SearchResult(query="q", articles=articles(2))
+        )
+    assert cache.get("10.1/p0", ttl=3600, miss_ttl=3600) is None
+
+    throttled = Mock(status_code=429, headers={})
+    with patch("requests.Session.get", return_value=throttled):
+        engine_with(OpenAlexEnricher(config), cache=cache).enrich_abstracts(
+            SearchResult(query="q", articles=articles(2))
+        )
+    assert cache.get("10.1/p0", ttl=3600, miss_ttl=3600) is None
+
+    with patch("requests.Session.get", return_value=openalex_response(["10.1/p0"])) as get:
+        recovered = articles(2)
+        engine_with(OpenAlexEnricher(config), cache=cache).enrich_abstracts(
+            SearchResult(query="q", articles=recovered)
+        )
+    assert get.call_count == 1
+    assert recovered[0].abstract == "Bulk 10.1/p0"
+    assert cache.get("10.1/p1", ttl=3600, miss_ttl=3600) == ("", "")
+
+
+def test_enrichment_workers_follow_provider_rate_limits():
+    engine = AcademicSearchEngine(Config(enrichment_max_workers=8, rate_limits={"Counting": 3.0}))
+    assert engine._enrichment_workers(CountingEnricher(engine.config), jobs=50) == 3
+    assert engine._enrichment_workers(CountingEnricher(Config()), jobs=2) == 2
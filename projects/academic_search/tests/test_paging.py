@@ -0,0 +1,151 @@
+"""Offline tests for concurrent paging and provider rate limiting."""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from academic_search import APIConfig, Config, ScienceDirectSearcher, ScopusSearcher, rate_limit
+from academic_search.rate_limit import RateLimitExceeded, TokenBucket
+
+
+def elsevier_config(**overrides):
+    overrides.setdefault("rate_limits", {})
+    return Config(api=APIConfig(elsevier_api_key="key"), enable_response_cache=False, **overrides)
+
+
+def fake_elsevier(total, fail_at=None, overlap=0):
+    """
+    requests.get stand-in serving numbered entries for any start/count.
+
+    With ``overlap`` set, a call for a later page holds until that many such calls
+    are in flight (or half a second passes), so concurrent paging shows up in
+    ``stats["peak"]`` without relying on sleeps lining up.
+    """
+    calls = []
+    stats = {"in_flight": 0, "peak": 0}
+    cond = threading.Condition()
+
+    def get(url, params=None, headers=None, timeout=None):
+        with cond:
+            calls.append(params["start"])
+            stats["in_flight"] += 1
+            stats["peak"] = max(stats["peak"], stats["in_flight"])
+            cond.notify_all()
+            if overlap and params["start"]:
+                cond.wait_for(lambda: stats["in_flight"] >= overlap, timeout=0.5)
+            stats["in_flight"] -= 1
+        if params["start"] == fail_at:
+            return Mock(status_code=500, headers={})
+        start, count = params["start"], params["count"]
+        entries = [
+            {"dc:title": f"Paper {i}", "prism:doi": f"10.1/{i}"}
+            for i in range(start, min(start + count, total))
+        ]
+        response = Mock(status_code=200, headers={})
+        response.json.return_value = {
+            "search-results": {"opensearch:totalResults": str(total), "entry": entries}
+        }
+        return response
+
+    get.stats = stats
+    return get, calls
+
+
+def test_scopus_fetches_remaining_pages_concurrently_in_rank_order():
+    get, calls = fake_elsevier(total=1000, overlap=3)
+    searcher = ScopusSearcher(elsevier_config(page_concurrency=4))
+
+    with patch("requests.Session.get", side_effect=get):
+        result = searcher.search("monetary policy", max_results=100)
+
+    assert calls[0] == 0
+    assert sorted(calls) == [0, 25, 50, 75]
+    # the three pages after the first were all in flight at once
+    assert get.stats["peak"] == 3
+    assert [a.title for a in result.articles] == [f"Paper {i}" for i in range(100)]
+    assert result.total_found == 1000
+
+
+def test_page_concurrency_bounds_in_flight_requests():
+    get, calls = fake_elsevier(total=1000, overlap=2)
+    searcher = ScopusSearcher(elsevier_config(page_concurrency=2))
+
+    with patch("requests.Session.get", side_effect=get):
+        result = searcher.search("q", max_results=100)
+
+    assert sorted(calls) == [0, 25, 50, 75]
+    assert get.stats["peak"] == 2
+    assert len(result.articles) == 100
+
+
+def test_paging_stops_at_total_results_and_first_failed_page():
+    get, calls = fake_elsevier(total=40)
+    with patch("requests.Session.get", side_effect=get):
+        result = ScopusSearcher(elsevier_config()).search("q", max_results=500)
+    assert sorted(calls) == [0, 25]
+    assert len(result.articles) == 40
+
+    get, calls = fake_elsevier(total=1000, fail_at=200)
+    with patch("requests.Session.get", side_effect=get):
+        result = ScienceDirectSearcher(elsevier_config()).search("q", max_results=500)
+    # pages already in flight when 200 fails may still be requested; none past the target
+    assert {0, 100, 200} <= set(calls) <= {0, 100, 200, 300, 400}
+    assert [a.title for a in result.articles] == [f"Paper {i}" for i in range(200)]
+
+
+class FakeClock:
+    """Stand-in for the ``time`` module in rate_limit: sleeping advances the clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return 1_700_000_000.0 + self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_paces_requests_and_honours_exhausted_quota(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit, "time", clock)
+    # 1/4 s steps are exact in binary, so the fake clock lands on whole tokens.
+    bucket = TokenBucket(rate=4, burst=1)
+
+    waits = [bucket.acquire() for _ in range(4)]
+
+    # the burst token is free, then one token every 1/4 s
+    assert waits == [0.0, 0.25, 0.25, 0.25]
+    assert clock.slept == [0.25, 0.25, 0.25]
+
+    bucket.observe({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(clock.time() + 30)})
+    slept = len(clock.slept)
+    with pytest.raises(RateLimitExceeded):
+        bucket.acquire(max_wait=0.1)
+    assert len(clock.slept) == slept  # gave up without sleeping
+    assert bucket.acquire() == pytest.approx(30.0)
+
+
+def test_exhausted_provider_quota_stops_further_pages(monkeypatch):
+    monkeypatch.setattr(rate_limit, "_limiters", {})
+    get, calls = fake_elsevier(total=1000)
+
+    def quota_spent(*args, **kwargs):
+        response = get(*args, **kwargs)
+        response.headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(time.time() + 60)}
+        return response
+
+    searcher = ScopusSearcher(elsevier_config(rate_limits={"Scopus API": 9.0}))
+    with patch("requests.Session.get", side_effect=quota_spent):
+        result = searcher.search("q", max_results=200)
+
+    assert calls == [0]
+    assert len(result.articles) == 25
+    assert searcher.rate_limiter is rate_limit._limiters["Scopus API"]
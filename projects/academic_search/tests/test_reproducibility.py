@@ -1,5 +1,7 @@
 """Offline conformance tests for search outcomes, evidence, and exports."""
 
+import threading
+import time
 from unittest.mock import Mock, patch
 
 import requests
@@ -21,6 +23,12 @@ class FixtureSearcher(BaseSearcher):
         return self._name
 
     def search(self, query, max_results=25, year_min=None, year_max=None):
+        # A provider with a gate blocks until the test releases it (or its delay passes).
+        gate = getattr(self, "gate", None)
+        if gate is not None:
+            gate.wait(self.delay)
+        else:
+            time.sleep(getattr(self, "delay", 0))
         if isinstance(self.behavior, Exception):
             raise self.behavior
         if isinstance(self.behavior, dict):
@@ -29,8 +37,8 @@ class FixtureSearcher(BaseSearcher):
         return SearchResult(query=query, articles=self.behavior, total_found=len(self.behavior), sources=[self.source_name])
 
 
-def fixture_engine(*searchers):
-    engine = AcademicSearchEngine(Config())
+def fixture_engine(*searchers, config=None):
+    engine = AcademicSearchEngine(config or Config())
     engine._searchers = list(searchers)
     return engine
 
@@ -55,6 +63,86 @@ def test_provider_conformance_outcomes_cover_success_empty_and_failures():
     assert result.manifest()["deduplication_version"] == "doi-or-title-author-year-v1"
 
 
+# Slack on top of a configured deadline before a timing bound counts as a failure;
+# generous so a loaded CI machine does not flake, yet far below a stuck provider.
+DEADLINE_MARGIN = 2.0
+STUCK = 60.0
+
+
+def _slow(config, name, articles, delay):
+    searcher = FixtureSearcher(config, name, articles)
+    searcher.delay = delay
+    return searcher
+
+
+def _stuck(config, name, articles):
+    """Provider that never answers on its own; release its gate when the test ends."""
+    searcher = _slow(config, name, articles, STUCK)
+    searcher.gate = threading.Event()
+    return searcher
+
+
+def test_providers_are_queried_concurrently_and_late_ones_report_timeout():
+    config = Config(provider_deadline=1.0, provider_deadlines={"Slow": 0.2})
+    slow = _stuck(config, "Slow", [Article("Paper that arrives too late", "https://slow")])
+    engine = fixture_engine(
+        _slow(config, "A", [Article("Paper from provider A", "https://a")], 0.1),
+        slow,
+        _slow(config, "B", [Article("Paper from provider B", "https://b")], 0.1),
+        config=config,
+    )
+
+    try:
+        started = time.monotonic()
+        result = engine.search("paper", max_results=10, use_all_sources=True)
+        elapsed = time.monotonic() - started
+    finally:
+        slow.gate.set()
+
+    assert [o.status for o in result.provider_outcomes] == ["responded", "timeout", "responded"]
+    assert result.provider_outcomes[1].error_code == "deadline_exceeded"
+    assert result.sources == ["A", "B"]
+    assert {a.url for a in result.articles} == {"https://a", "https://b"}
+    # The search ends at the slowest deadline, not when the stuck provider would.
+    assert elapsed < config.provider_deadline + DEADLINE_MARGIN
+    assert result.search_time is not None and result.search_time < config.provider_deadline + DEADLINE_MARGIN
+
+
+def test_search_budget_caps_every_provider_deadline():
+    config = Config(provider_deadline=30.0, search_budget=0.2)
+    slow = _stuck(config, "Slow", [])
+    engine = fixture_engine(slow, config=config)
+
+    try:
+        started = time.monotonic()
+        result = engine.search("paper", use_all_sources=True)
+        elapsed = time.monotonic() - started
+    finally:
+        slow.gate.set()
+
+    assert result.provider_outcomes[0].status == "timeout"
+    assert result.provider_outcomes[0].error_code == "deadline_exceeded"
+    assert elapsed < config.search_budget + DEADLINE_MARGIN
+
+
+def test_merge_does_not_depend_on_which_provider_answers_first():
+    config = Config()
+    shared = "A sufficiently long shared research title"
+    first = _slow(config, "First", [Article(shared, "https://first", doi="10.1/x", source="First")], 0.15)
+    second = _slow(config, "Second", [
+        Article(shared, "https://second", doi="10.1/X", source="Second"),
+        Article("Another distinct study title here", "https://other", source="Second"),
+    ], 0.0)
+
+    result = fixture_engine(first, second).search("research", max_results=10, use_all_sources=True)
+
+    assert [a.url for a in result.articles] == ["https://first", "https://other"]
+    merged = result.articles[0]
+    assert [record["source"] for record in merged.provider_records] == ["First", "Second"]
+    assert result.raw_article_count == 3
+    assert result.deduplicated_article_count == 2
+
+
 def test_global_limit_and_conservative_deduplication_preserve_distinct_short_titles():
     config = Config()
     first = FixtureSearcher(config, "First", [
@@ -88,7 +176,7 @@ def test_abstract_enrichment_preserves_original_record_and_provenance():
 def test_base_searcher_records_safe_http_failure_classifications():
     searcher = FixtureSearcher(Config(), "Fixture", [])
     response = Mock(status_code=429)
-    with patch("requests.get", return_value=response):
+    with patch("requests.Session.get", return_value=response):
         assert searcher._make_request("https://provider.test", {}) is None
     assert searcher.last_failure == {"code": "rate_limited", "message": "provider rate limit reached"}
 
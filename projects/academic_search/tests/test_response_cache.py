@@ -0,0 +1,109 @@
+"""Offline tests for the provider response cache."""
+
+import json
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from academic_search import Config, OpenAlexSearcher
+from academic_search.response_cache import ResponseCache
+
+
+def ok(body=b'{"meta": {"count": 1}, "results": []}', headers=None):
+    response = Mock(status_code=200, content=body, headers=headers or {})
+    response.json.return_value = json.loads(body)
+    return response
+
+
+def cached_openalex(cache, **config):
+    searcher = OpenAlexSearcher(Config(**config))
+    searcher.response_cache = cache
+    return searcher
+
+
+def test_repeated_search_is_served_from_cache():
+    cache = ResponseCache()
+    searcher = cached_openalex(cache)
+
+    with patch("requests.Session.get", return_value=ok()) as get:
+        searcher.search("labour  markets", year_min=2020, year_max=2024)
+        searcher.search("labour markets", year_min=2020, year_max=2024)
+        searcher.search("labour markets", year_min=2021, year_max=2024)
+
+    assert get.call_count == 2
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+def test_only_successful_responses_are_stored():
+    cache = ResponseCache()
+    searcher = cached_openalex(cache)
+
+    with patch("requests.Session.get", return_value=Mock(status_code=429, content=b"")) as get:
+        assert searcher._make_request("https://provider.test", {"q": "x"}) is None
+        assert searcher._make_request("https://provider.test", {"q": "x"}) is None
+
+    assert get.call_count == 2
+    assert searcher.last_failure["code"] == "rate_limited"
+
+
+def test_sqlite_tier_survives_a_new_cache_instance(tmp_path):
+    path = str(tmp_path / "responses.db")
+    with patch("requests.Session.get", return_value=ok()) as get:
+        cached_openalex(ResponseCache(path)).search("tax policy")
+        restarted = ResponseCache(path)
+        cached_openalex(restarted).search("tax policy")
+
+    assert get.call_count == 1
+    assert restarted.stats()["hits"] == 1
+
+
+def test_stale_entry_is_revalidated_with_its_etag():
+    cache = ResponseCache()
+    searcher = cached_openalex(cache, response_cache_ttls={"OpenAlex": 0.05})
+
+    with patch("requests.Session.get", return_value=ok(headers={"ETag": '"v1"'})):
+        first = searcher.search("inflation")
+    time.sleep(0.1)
+    with patch("requests.Session.get", return_value=Mock(status_code=304, content=b"")) as get:
+        again = searcher.search("inflation")
+
+    assert get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    assert again.total_found == first.total_found == 1
+    assert cache.stats()["revalidated"] == 1
+
+
+def test_identical_in_flight_requests_share_one_fetch():
+    cache = ResponseCache()
+    calls = []
+
+    def slow_fetch(conditional):
+        calls.append(conditional)
+        time.sleep(0.2)
+        return ok()
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(cache.get("OpenAlex", "https://w", {"search": "x"}, slow_fetch))
+        )
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(results) == 4
+    assert cache.stats()["coalesced"] == 3
+
+
+def test_disabled_cache_always_calls_the_provider():
+    searcher = cached_openalex(ResponseCache(), enable_response_cache=False)
+
+    with patch("requests.Session.get", return_value=ok()) as get:
+        searcher.search("trade")
+        searcher.search("trade")
+
+    assert get.call_count == 2
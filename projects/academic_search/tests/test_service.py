@@ -191,6 +191,8 @@ def test_health_reports_each_provider_availability():
     assert providers["semantic-scholar"] is True
     assert providers["arxiv"] is True
     assert all(isinstance(value, bool) for value in providers.values())
+    assert "response_cache" in response.json()
+    assert isinstance(response.json()["provider_http"], dict)
 
 
 def test_provider_availability_matches_web_of_science_to_clarivate():
@@ -0,0 +1,55 @@
+"""Offline tests for pooled provider HTTP access."""
+
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from academic_search import Config, CrossRefEnricher, Article, rate_limit, transport
+
+
+@pytest.fixture(autouse=True)
+def fresh_transport(monkeypatch):
+    monkeypatch.setattr(transport, "_sessions", {})
+    monkeypatch.setattr(transport, "_stats", {})
+    monkeypatch.setattr(rate_limit, "_limiters", {})
+
+
+def test_one_keep_alive_session_per_host():
+    first = transport.get_session("https://api.openalex.org/works")
+    assert transport.get_session("https://api.openalex.org/authors") is first
+    assert transport.get_session("https://api.crossref.org/works") is not first
+
+
+def test_retry_after_pauses_the_provider_and_retries_once():
+    throttled = Mock(status_code=429, headers={"Retry-After": "0.2"})
+    ok = Mock(status_code=200, headers={})
+    with patch("requests.Session.get", side_effect=[throttled, ok]) as get:
+        started = time.monotonic()
+        response = transport.provider_get("OpenAlex", "https://api.openalex.org/works", rate=50.0)
+
+    assert response is ok
+    assert get.call_count == 2
+    assert time.monotonic() - started >= 0.2
+    stats = transport.provider_stats()["OpenAlex"]
+    assert stats["requests"] == 2
+    assert stats["rate_limited"] == 1
+    assert stats["retries"] == 1
+
+
+def test_retry_after_longer_than_the_timeout_is_returned_to_the_caller():
+    throttled = Mock(status_code=503, headers={"Retry-After": "120"})
+    with patch("requests.Session.get", return_value=throttled) as get:
+        response = transport.provider_get("arXiv", "https://export.arxiv.org/api/query", timeout=5)
+    assert response is throttled
+    assert get.call_count == 1
+    assert transport.provider_stats()["arXiv"]["errors"] == 1
+
+
+def test_enrichers_share_the_pooled_transport():
+    response = Mock(status_code=200, headers={})
+    response.json.return_value = {"message": {"abstract": "<p>Pooled abstract.</p>"}}
+    enricher = CrossRefEnricher(Config())
+    with patch("requests.Session.get", return_value=response):
+        assert enricher.get_abstract(Article("T", "https://x", doi="10.1/x")) == "Pooled abstract."
+    assert transport.provider_stats()["CrossRef"]["requests"] == 1
@@ -0,0 +1,148 @@
+"""Pooled HTTP access to scholarly providers.
+
+Every searcher and enricher sends its GETs through :func:`provider_get`, which
+
+* reuses one keep-alive ``requests.Session`` per provider host, so a multi-provider
+  search or an enrichment pass does not pay a TCP/TLS handshake per request;
+* takes a token from the provider's bucket (``Config.rate_limits``) before the request
+  and feeds the provider's rate-limit headers back into it;
+* honours ``Retry-After`` on ``429``/``503``: the bucket is paused so concurrent callers
+  back off together, and the request is retried once if the delay fits in its timeout;
+* counts requests, errors, throttling and latency per provider (``provider_stats``),
+  reported by the service health endpoint.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .rate_limit import get_rate_limiter
+
+DEFAULT_POOL_SIZE = 16
+RETRY_STATUSES = (429, 503)
+
+_lock = threading.Lock()
+_sessions: Dict[str, requests.Session] = {}
+_stats: Dict[str, Dict[str, float]] = {}
+
+
+def get_session(url: str, pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """Process-wide keep-alive session for the host of ``url``."""
+    host = urlparse(url).netloc
+    with _lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size))
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[host] = session
+        return session
+
+
+def retry_after_seconds(headers: Optional[Mapping[str, Any]]) -> Optional[float]:
+    """Delay requested by a ``Retry-After`` header (seconds or HTTP date), if any."""
+    value = headers.get("Retry-After") if isinstance(headers, Mapping) else None
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _record(provider: str, **counts: float) -> None:
+    with _lock:
+        stats = _stats.setdefault(
+            provider,
+            {"requests": 0, "errors": 0, "rate_limited": 0, "retries": 0,
+             "latency_seconds": 0.0, "max_latency_seconds": 0.0},
+        )
+        for name, value in counts.items():
+            if name == "latency":
+                stats["latency_seconds"] += value
+                stats["max_latency_seconds"] = max(stats["max_latency_seconds"], value)
+            else:
+                stats[name] += value
+
+
+def provider_stats() -> Dict[str, Dict[str, Any]]:
+    """Request, error, throttling and latency counters keyed by provider."""
+    with _lock:
+        snapshot = {name: dict(stats) for name, stats in _stats.items()}
+    report = {}
+    for name, stats in sorted(snapshot.items()):
+        requests_made = stats["requests"]
+        report[name] = {
+            "requests": int(requests_made),
+            "errors": int(stats["errors"]),
+            "rate_limited": int(stats["rate_limited"]),
+            "retries": int(stats["retries"]),
+            "avg_latency_ms": round(stats["latency_seconds"] * 1000 / requests_made, 1) if requests_made else 0.0,
+            "max_latency_ms": round(stats["max_latency_seconds"] * 1000, 1),
+        }
+    return report
+
+
+def provider_get(
+    provider: str,
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 30,
+    rate: Optional[float] = None,
+    pool_size: int = DEFAULT_POOL_SIZE,
+) -> requests.Response:
+    """
+    GET ``url`` for ``provider`` over its pooled session, within its rate limit.
+
+    Request exceptions (including ``RateLimitExceeded`` when no slot frees up within
+    ``timeout``) propagate to the caller, as with ``requests.get``.
+    """
+    limiter = get_rate_limiter(provider, rate)
+    session = get_session(url, pool_size)
+    for attempt in (0, 1):
+        if limiter is not None:
+            limiter.acquire(max_wait=timeout)
+        started = time.perf_counter()
+        try:
+            response = session.get(url, params=params, headers=headers, timeout=timeout)
+        except requests.exceptions.RequestException:
+            _record(provider, requests=1, errors=1, latency=time.perf_counter() - started)
+            raise
+        status = getattr(response, "status_code", None)
+        response_headers = getattr(response, "headers", None)
+        _record(
+            provider,
+            requests=1,
+            latency=time.perf_counter() - started,
+            errors=1 if isinstance(status, int) and status >= 500 else 0,
+            rate_limited=1 if status == 429 else 0,
+        )
+        if limiter is not None:
+            limiter.observe(response_headers)
+        if status not in RETRY_STATUSES:
+            return response
+        delay = retry_after_seconds(response_headers)
+        if delay is None:
+            return response
+        if limiter is not None:
+            limiter.pause(delay)
+        if attempt or delay > timeout:
+            return response
+        _record(provider, retries=1)
+        if limiter is None:
+            time.sleep(delay)
+    return response
@@ -71,8 +71,10 @@ class ReportResponse(BaseModel):
 class ReportsListResponse(BaseModel):
     """List of reports response"""
     total: int
+    total_is_estimate: bool = False
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
     reports: List[ReportResponse]
 
 
@@ -88,6 +90,9 @@ class HealthResponse(BaseModel):
     """Health check response"""
     status: str
     database: str
+    latency_ms: Optional[float] = None
+    pool: Optional[Dict[str, Any]] = None
+    inference: Optional[Dict[str, Any]] = None
     timestamp: datetime = Field(default_factory=datetime.now)
 
 
@@ -16,6 +16,7 @@ honest error/unavailable envelope — we never fabricate data (§5).
 import logging
 import os
 import asyncio
+import contextlib
 from datetime import datetime, timezone
 from typing import List, Optional
 
@@ -44,6 +45,10 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["external-analysis"])
 
+# Database-only handlers are plain ``def`` so FastAPI runs them in its threadpool;
+# handlers that also await upstream fetches push their psycopg2 calls through
+# ``asyncio.to_thread``. Either way the event loop never blocks on the database.
+
 _fundamental_collection_task = None
 _fundamental_collection_state = {"status": "idle", "total": 0, "completed": 0, "fetched": 0, "cached": 0, "failed": 0, "started_at": None, "finished_at": None}
 
@@ -136,7 +141,7 @@ def _firecrawl_capabilities() -> dict:
 
 # ── instruments catalog — discovery endpoint for clients ─────────────────────
 @router.get("/instruments")
-async def instruments_catalog(
+def instruments_catalog(
     market: Market = Query(Market.BIST),
     db_manager: DatabaseManager = Depends(get_db_manager),
 ):
@@ -239,7 +244,7 @@ async def instruments_catalog(
 
 # ── health (§6.8) — declared first, no path params ───────────────────────────
 @router.get("/health")
-async def health(db_manager: DatabaseManager = Depends(get_db_manager)):
+def health(db_manager: DatabaseManager = Depends(get_db_manager)):
     db_ok = False
     try:
         conn = db_manager.get_connection()
@@ -261,7 +266,7 @@ async def health(db_manager: DatabaseManager = Depends(get_db_manager)):
 
 
 @router.get("/capabilities")
-async def capabilities():
+def capabilities():
     """Return only runtime-confirmed Firecrawl capabilities for external clients."""
     return {
         "contract_version": CONTRACT_VERSION,
@@ -273,7 +278,7 @@ async def capabilities():
 async def _collect_all_isyatirim_fundamentals(db_manager: DatabaseManager, force: bool) -> None:
     global _fundamental_collection_state
     try:
-        rows = db_manager.query("SELECT code FROM bist_companies WHERE is_active = TRUE ORDER BY code", ())
+        rows = await asyncio.to_thread(db_manager.query, "SELECT code FROM bist_companies WHERE is_active = TRUE ORDER BY code", ())
         tickers = [row["code"].strip().upper() for row in rows if row.get("code")]
     except Exception:
         tickers = []
@@ -283,12 +288,12 @@ async def _collect_all_isyatirim_fundamentals(db_manager: DatabaseManager, force
     delay = max(0.1, float(os.getenv("ISYATIRIM_FUNDAMENTALS_COLLECTION_DELAY_SECONDS", "0.5")))
     for ticker in tickers:
         try:
-            cached = db_manager.get_isyatirim_fundamentals(ticker, ttl)
+            cached = await asyncio.to_thread(db_manager.get_isyatirim_fundamentals, ticker, ttl)
             if cached["fresh"] and cached["payload"].get("one_year_statement_history") and not force:
                 _fundamental_collection_state["cached"] += 1
             else:
                 payload = await asyncio.to_thread(fetch_fundamentals, ticker)
-                db_manager.upsert_isyatirim_fundamentals(ticker, payload)
+                await asyncio.to_thread(db_manager.upsert_isyatirim_fundamentals, ticker, payload)
                 _fundamental_collection_state["fetched"] += 1
         except Exception as exc:  # noqa: BLE001 - one unavailable company must not stop the collection
             logger.warning("İş Yatırım bulk fundamentals failed for %s: %s", ticker, exc)
@@ -317,7 +322,7 @@ async def isyatirim_fundamentals_collection_status():
 
 
 @router.get("/isyatirim/fundamentals")
-async def search_isyatirim_fundamentals(
+def search_isyatirim_fundamentals(
     query_text: str = Query("", alias="query", max_length=20),
     limit: int = Query(50, ge=1, le=200),
     db_manager: DatabaseManager = Depends(get_db_manager),
@@ -356,7 +361,9 @@ async def isyatirim_market_history(
         })
     cache_ttl_seconds = max(60, int(os.getenv("ISYATIRIM_MARKET_CACHE_TTL_SECONDS", "900")))
     try:
-        cached = db_manager.get_isyatirim_market_history(ticker, days, cache_ttl_seconds)
+        cached = await asyncio.to_thread(
+            db_manager.get_isyatirim_market_history, ticker, days, cache_ttl_seconds
+        )
     except Exception:  # noqa: BLE001 - a cache outage must not prevent an on-demand fetch
         logger.exception("İş Yatırım database cache lookup failed for %s", ticker)
         cached = {"fresh": False, "series": [], "age_seconds": None}
@@ -381,7 +388,7 @@ async def isyatirim_market_history(
                 "detail": "İş Yatırım market data is temporarily unavailable.",
             })
         try:
-            db_manager.upsert_isyatirim_market_history(ticker, payload["series"])
+            await asyncio.to_thread(db_manager.upsert_isyatirim_market_history, ticker, payload["series"])
         except Exception:  # noqa: BLE001 - the visible fetched result remains valid
             logger.exception("İş Yatırım database cache write failed for %s", ticker)
         freshness_seconds = 0
@@ -417,7 +424,7 @@ async def isyatirim_fundamentals(
         })
     cache_ttl_seconds = max(300, int(os.getenv("ISYATIRIM_FUNDAMENTALS_CACHE_TTL_SECONDS", "21600")))
     try:
-        cached = db_manager.get_isyatirim_fundamentals(ticker, cache_ttl_seconds)
+        cached = await asyncio.to_thread(db_manager.get_isyatirim_fundamentals, ticker, cache_ttl_seconds)
     except Exception:  # noqa: BLE001 - cache failure must not hide source availability
         logger.exception("İş Yatırım fundamental cache lookup failed for %s", ticker)
         cached = {"fresh": False, "payload": None, "age_seconds": None}
@@ -442,7 +449,7 @@ async def isyatirim_fundamentals(
                 "detail": "İş Yatırım fundamentals are temporarily unavailable.",
             })
         try:
-            db_manager.upsert_isyatirim_fundamentals(ticker, payload)
+            await asyncio.to_thread(db_manager.upsert_isyatirim_fundamentals, ticker, payload)
         except Exception:  # noqa: BLE001 - fetched source result remains useful
             logger.exception("İş Yatırım fundamental cache write failed for %s", ticker)
         freshness_seconds = 0
@@ -464,17 +471,13 @@ async def isyatirim_fundamentals(
 
 # ── batch (§6.2) ──────────────────────────────────────────────────────────────
 @router.post("/sentiment/batch")
-async def sentiment_batch(
+def sentiment_batch(
     request: SentimentBatchRequest,
     db_manager: DatabaseManager = Depends(get_db_manager),
 ):
     repo = _repo(db_manager)
-    items = []
     try:
-        for instrument in request.instruments:
-            items.append(
-                repo.get_point(instrument, request.market.value, request.as_of)
-            )
+        items = repo.get_points(request.instruments, request.market.value, request.as_of)
     except DatabaseManager.PoolExhaustedError:
         return _db_error("database temporarily unavailable")
     except Exception as e:  # noqa: BLE001
@@ -486,7 +489,7 @@ async def sentiment_batch(
 
 # ── overview (§6.4) — static path before {instrument} ────────────────────────
 @router.get("/sentiment/overview")
-async def sentiment_overview(
+def sentiment_overview(
     market: Market = Query(...),
     date_from: Optional[str] = Query(None, alias="from"),
     date_to: Optional[str] = Query(None, alias="to"),
@@ -506,7 +509,7 @@ async def sentiment_overview(
 
 # ── history (§6.3) ────────────────────────────────────────────────────────────
 @router.get("/sentiment/{instrument}/history")
-async def sentiment_history(
+def sentiment_history(
     instrument: str,
     market: Market = Query(...),
     date_from: Optional[str] = Query(None, alias="from"),
@@ -538,7 +541,7 @@ async def sentiment_history(
 
 # ── point (§6.1) — most general route, declared last ──────────────────────────
 @router.get("/sentiment/{instrument}")
-async def sentiment_point(
+def sentiment_point(
     instrument: str,
     market: Market = Query(...),
     as_of: Optional[str] = Query(None),
@@ -564,6 +567,7 @@ async def _on_demand_fundamental_fetch(
     repo,
     market: str,
     as_of: Optional[str] = None,
+    oid_refresh: Optional[asyncio.Lock] = None,
 ) -> dict:
     """Trigger a live KAP scrape for *instrument* and re-query the repo.
 
@@ -572,6 +576,8 @@ async def _on_demand_fundamental_fetch(
 
     If the instrument's mkkMemberOid is not yet known, calls refresh_member_oids
     first to populate it from KAP's member API, then retries the scrape.
+    Concurrent fetches from one batch share *oid_refresh*, so the member list is
+    refreshed once and later waiters find their OID already populated.
     """
     from scrapers.kap_scraper import KAPScraper
     from infrastructure.contracts.instrument_identity_map import resolve_member_oid
@@ -584,28 +590,40 @@ async def _on_demand_fundamental_fetch(
         scraper = KAPScraper(db_manager=db_manager)
 
         # If OID is unknown, try to discover all OIDs before scraping.
-        if resolve_member_oid(instrument, db_manager=db_manager) is None:
-            logger.info(
-                "mkkMemberOid for %s unknown — running refresh_member_oids first",
-                instrument,
-            )
-            try:
-                await scraper.refresh_member_oids()
-            except Exception as exc:
-                logger.warning("refresh_member_oids failed: %s", exc)
-            # If POST-based refresh failed, try the GET-based fallback.
-            if resolve_member_oid(instrument, db_manager=db_manager) is None:
-                try:
-                    await scraper.refresh_member_oids_via_get(instruments=[instrument])
-                except Exception as exc:
-                    logger.warning("refresh_member_oids_via_get failed: %s", exc)
+        if await asyncio.to_thread(resolve_member_oid, instrument, db_manager=db_manager) is None:
+            async with oid_refresh or contextlib.nullcontext():
+                await _refresh_member_oid(scraper, instrument, db_manager, resolve_member_oid)
 
         await scraper.scrape_financial_statements(instruments=[instrument])
     except Exception as exc:
         logger.warning(
             "on-demand KAP fetch for %s failed: %s", instrument, exc
         )
-    return repo.get_point(instrument, market, as_of)
+    return await asyncio.to_thread(repo.get_point, instrument, market, as_of)
+
+
+async def _refresh_member_oid(scraper, instrument: str, db_manager, resolve_member_oid) -> None:
+    # Another fetch in the same batch may have refreshed the list while we waited.
+    if await asyncio.to_thread(resolve_member_oid, instrument, db_manager=db_manager) is not None:
+        return
+    logger.info(
+        "mkkMemberOid for %s unknown — running refresh_member_oids first",
+        instrument,
+    )
+    try:
+        await scraper.refresh_member_oids()
+    except Exception as exc:
+        logger.warning("refresh_member_oids failed: %s", exc)
+    # If POST-based refresh failed, try the GET-based fallback.
+    if await asyncio.to_thread(resolve_member_oid, instrument, db_manager=db_manager) is None:
+        try:
+            await scraper.refresh_member_oids_via_get(instruments=[instrument])
+        except Exception as exc:
+            logger.warning("refresh_member_oids_via_get failed: %s", exc)
+
+
+def _on_demand_concurrency() -> int:
+    return max(1, int(os.getenv("FUNDAMENTAL_ON_DEMAND_CONCURRENCY", "4")))
 
 
 # ── batch (§6.2) ──────────────────────────────────────────────────────────────
@@ -615,15 +633,30 @@ async def fundamental_batch(
     db_manager: DatabaseManager = Depends(get_db_manager),
 ):
     repo = _fund_repo(db_manager)
-    items = []
+    market = request.market.value
     try:
-        for instrument in request.instruments:
-            point = repo.get_point(instrument, request.market.value, request.as_of)
-            if point.get("status") == "unavailable" and request.as_of is None:
-                point = await _on_demand_fundamental_fetch(
-                    instrument, db_manager, repo, request.market.value
-                )
-            items.append(point)
+        items = await asyncio.to_thread(repo.get_points, request.instruments, market, request.as_of)
+        if request.as_of is None:
+            # Missing tickers are scraped concurrently, a few at a time, instead of
+            # one after another; duplicates in the request share one fetch.
+            missing = {}
+            for idx, point in enumerate(items):
+                if point.get("status") == "unavailable":
+                    missing.setdefault(request.instruments[idx], []).append(idx)
+            if missing:
+                gate = asyncio.Semaphore(_on_demand_concurrency())
+                oid_refresh = asyncio.Lock()
+
+                async def fetch(instrument: str) -> dict:
+                    async with gate:
+                        return await _on_demand_fundamental_fetch(
+                            instrument, db_manager, repo, market, oid_refresh=oid_refresh
+                        )
+
+                fetched = await asyncio.gather(*(fetch(instrument) for instrument in missing))
+                for positions, point in zip(missing.values(), fetched):
+                    for idx in positions:
+                        items[idx] = point
     except DatabaseManager.PoolExhaustedError:
         return _db_error("database temporarily unavailable")
     except Exception as e:  # noqa: BLE001
@@ -635,7 +668,7 @@ async def fundamental_batch(
 
 # ── history (§6.3) — static suffix before {instrument} point ──────────────────
 @router.get("/fundamental/{instrument}/history")
-async def fundamental_history(
+def fundamental_history(
     instrument: str,
     market: Market = Query(...),
     date_from: Optional[str] = Query(None, alias="from"),
@@ -675,7 +708,7 @@ async def fundamental_point(
 ):
     repo = _fund_repo(db_manager)
     try:
-        result = repo.get_point(instrument, market.value, as_of)
+        result = await asyncio.to_thread(repo.get_point, instrument, market.value, as_of)
         if result.get("status") == "unavailable" and as_of is None:
             result = await _on_demand_fundamental_fetch(instrument, db_manager, repo, market.value)
         return result
@@ -691,7 +724,7 @@ async def fundamental_point(
 # ════════════════════════════════════════════════════════════════════════════
 # ── list (newest-first, cursor-paginated) — declared before {news_id} ─────────
 @router.get("/news")
-async def news_list(
+def news_list(
     category: Optional[str] = Query(None, description="SPK | MKK | BIST | KAP …"),
     date_from: Optional[str] = Query(None, alias="from"),
     date_to: Optional[str] = Query(None, alias="to"),
@@ -718,7 +751,7 @@ async def news_list(
 
 # ── point (single item by KAP news_id) ────────────────────────────────────────
 @router.get("/news/{news_id}")
-async def news_point(
+def news_point(
     news_id: str,
     db_manager: DatabaseManager = Depends(get_db_manager),
 ):
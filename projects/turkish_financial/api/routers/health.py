@@ -1,11 +1,13 @@
 """
 Health check endpoints
 """
+import asyncio
 import logging
 from fastapi import APIRouter, Depends
 from api.models import HealthResponse
 from api.dependencies import get_db_manager
 from database.db_manager import DatabaseManager
+from utils.hf_inference import inference_stats
 
 logger = logging.getLogger(__name__)
 
@@ -21,19 +23,17 @@ async def health_check(
     
     Returns:
     - API status
-    - Database connection status
+    - Database connection status, round-trip latency and pool statistics
+    - Throughput of the local sentiment model queues, once a model has been used
     """
     db_status = "disconnected"
+    latency_ms = None
     
     try:
-        conn = db_manager.get_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute("SELECT 1")
-            cursor.fetchone()
-            db_status = "connected"
-        finally:
-            db_manager.return_connection(conn)
+        # Off the event loop: a busy pool must not stall every other request.
+        result = await asyncio.to_thread(db_manager.health_check)
+        db_status = result["status"]
+        latency_ms = result["latency_ms"]
     except DatabaseManager.PoolExhaustedError as e:
         logger.warning(f"Database connection pool exhausted during health check: {e}")
         db_status = "error: connection pool exhausted"
@@ -43,5 +43,8 @@ async def health_check(
     
     return HealthResponse(
         status="healthy" if db_status == "connected" else "degraded",
-        database=db_status
+        database=db_status,
+        latency_ms=latency_ms,
+        pool=db_manager.pool_stats(),
+        inference=inference_stats() or None,
     )
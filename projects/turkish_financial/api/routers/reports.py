@@ -1,10 +1,13 @@
 """
 Report query endpoints
 """
+import base64
 import logging
 import json
+import time
+from threading import Lock
 from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from datetime import date
 from psycopg2.extras import RealDictCursor
 
@@ -18,15 +21,138 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/reports", tags=["reports"])
 
+# Handlers are plain ``def`` on purpose: FastAPI runs them in its threadpool, so the
+# blocking psycopg2 work never stalls the event loop for other requests.
+
+
+# Keyset order for kap_disclosures listings. NULL dates/timestamps sort last via
+# -infinity; idx_kap_disclosures_keyset indexes exactly these expressions.
+_KEYSET_DATE = "COALESCE(disclosure_date, '-infinity'::date)"
+_KEYSET_TS = "COALESCE(scraped_at, '-infinity'::timestamp)"
+_KEYSET_ORDER = f"{_KEYSET_DATE} DESC, {_KEYSET_TS} DESC, id DESC"
+_KEYSET_SELECT = f"{_KEYSET_DATE}::text, {_KEYSET_TS}::text"
+
+_COUNT_CACHE_TTL_SECONDS = 60.0
+_COUNT_CACHE_MAX_ENTRIES = 256
+_count_cache: Dict[Tuple[str, tuple], Tuple[float, int]] = {}
+_count_cache_lock = Lock()
+
+
+def _encode_cursor(date_key: str, ts_key: str, row_id: int) -> str:
+    """Opaque ``next`` token for the row after which the next page starts."""
+    raw = json.dumps([date_key, ts_key, row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(token: str) -> Tuple[str, str, int]:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        date_key, ts_key, row_id = json.loads(raw)
+        if not isinstance(date_key, str) or not isinstance(ts_key, str) or not isinstance(row_id, int):
+            raise ValueError("unexpected cursor shape")
+        return date_key, ts_key, row_id
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor") from e
+
+
+def _disclosure_filters(
+    company: Optional[str],
+    start_date: Optional[date],
+    end_date: Optional[date],
+    report_type: Optional[str] = None,
+) -> Tuple[List[str], list]:
+    conditions: List[str] = []
+    params: list = []
+    if company:
+        # Served by the pg_trgm index idx_kap_disclosures_company_trgm.
+        conditions.append("company_name ILIKE %s")
+        params.append(f"%{company}%")
+    if start_date:
+        conditions.append("disclosure_date >= %s")
+        params.append(start_date)
+    if end_date:
+        conditions.append("disclosure_date <= %s")
+        params.append(end_date)
+    if report_type:
+        conditions.append("disclosure_type = %s")
+        params.append(report_type)
+    return conditions, params
+
+
+def _page_clause(
+    conditions: List[str],
+    params: list,
+    cursor_token: Optional[str],
+    limit: int,
+    offset: int,
+) -> Tuple[str, list]:
+    """WHERE/ORDER/LIMIT tail for one page; fetches one extra row to detect a next page."""
+    conditions = list(conditions)
+    params = list(params)
+    if cursor_token:
+        date_key, ts_key, row_id = _decode_cursor(cursor_token)
+        conditions.append(f"({_KEYSET_DATE}, {_KEYSET_TS}, id) < (%s::date, %s::timestamp, %s)")
+        params.extend([date_key, ts_key, row_id])
+    where_clause = " AND ".join(conditions) if conditions else "1=1"
+    tail = f"WHERE {where_clause} ORDER BY {_KEYSET_ORDER} LIMIT %s"
+    params.append(limit + 1)
+    if offset and not cursor_token:
+        # Legacy offset paging; cursors are the cheap way to reach deep pages.
+        tail += " OFFSET %s"
+        params.append(offset)
+    return tail, params
+
+
+def _next_cursor(rows: list, limit: int) -> Optional[str]:
+    """Drop the look-ahead row and return the token for the following page."""
+    if len(rows) <= limit:
+        return None
+    del rows[limit:]
+    last = rows[-1]
+    return _encode_cursor(last[-2], last[-1], last[0])
+
+
+def _disclosure_total(cursor, conditions: List[str], params: list) -> Tuple[int, bool]:
+    """Return ``(total, is_estimate)`` without a full COUNT(*) on every page.
+
+    The unfiltered total comes from the planner's row estimate; filtered totals are
+    counted once and cached for ``_COUNT_CACHE_TTL_SECONDS``.
+    """
+    if not conditions:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass('kap_disclosures')"
+        )
+        row = cursor.fetchone()
+        # reltuples is -1 (or 0) until the table has been analyzed once.
+        if row and row[0] and row[0] > 0:
+            return int(row[0]), True
+
+    where_clause = " AND ".join(conditions) if conditions else "1=1"
+    key = (where_clause, tuple(params))
+    now = time.monotonic()
+    with _count_cache_lock:
+        cached = _count_cache.get(key)
+        if cached and now - cached[0] < _COUNT_CACHE_TTL_SECONDS:
+            return cached[1], False
+
+    cursor.execute(f"SELECT COUNT(*) FROM kap_disclosures WHERE {where_clause}", params)
+    total = cursor.fetchone()[0]
+    with _count_cache_lock:
+        if len(_count_cache) >= _COUNT_CACHE_MAX_ENTRIES:
+            _count_cache.clear()
+        _count_cache[key] = (now, total)
+    return total, False
+
 
 @router.get("/kap", response_model=ReportsListResponse)
-async def get_kap_reports(
+def get_kap_reports(
     company_code: Optional[str] = Query(None, description="Filter by company code"),
     start_date: Optional[date] = Query(None, description="Start date filter"),
     end_date: Optional[date] = Query(None, description="End date filter"),
     report_type: Optional[str] = Query(None, description="Filter by report type"),
     limit: int = Query(100, ge=1, le=1000, description="Number of results"),
-    offset: int = Query(0, ge=0, description="Pagination offset"),
+    offset: int = Query(0, ge=0, description="Pagination offset (ignored when cursor is set)"),
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor from the previous page"),
     db_manager: DatabaseManager = Depends(get_db_manager)
 ):
     """
@@ -36,53 +162,35 @@ async def get_kap_reports(
     - Company code
     - Date range
     - Report type
+
+    Pages are ordered newest first; pass ``next_cursor`` back as ``cursor`` to fetch
+    the next page. ``total`` may be a planner estimate (``total_is_estimate``).
     """
     try:
-        # Build WHERE clause
-        conditions = []
-        params = []
-        
-        if company_code:
-            conditions.append("company_name ILIKE %s")
-            params.append(f"%{company_code}%")
-        
-        if start_date:
-            conditions.append("disclosure_date >= %s")
-            params.append(start_date)
-        
-        if end_date:
-            conditions.append("disclosure_date <= %s")
-            params.append(end_date)
-        
-        if report_type:
-            conditions.append("disclosure_type = %s")
-            params.append(report_type)
-        
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
-        
-        # Get total count
-        count_query = f"SELECT COUNT(*) FROM kap_disclosures WHERE {where_clause}"
+        conditions, filter_params = _disclosure_filters(
+            company_code, start_date, end_date, report_type
+        )
+        tail, params = _page_clause(conditions, filter_params, cursor, limit, offset)
+
         conn = db_manager.get_connection()
         try:
-            cursor = conn.cursor()
-            cursor.execute("SET search_path TO turkish_financial,public;")
-            cursor.execute(count_query, params)
-            total = cursor.fetchone()[0]
+            db_cursor = conn.cursor()
+            db_cursor.execute("SET search_path TO turkish_financial,public;")
+            total, total_is_estimate = _disclosure_total(db_cursor, conditions, filter_params)
             
             # Get reports
             query = f"""
                 SELECT id, company_name, disclosure_type, disclosure_date,
-                       content, data, scraped_at
+                       content, data, scraped_at, {_KEYSET_SELECT}
                 FROM kap_disclosures
-                WHERE {where_clause}
-                ORDER BY disclosure_date DESC, scraped_at DESC
-                LIMIT %s OFFSET %s
+                {tail}
             """
-            params.extend([limit, offset])
-            cursor.execute(query, params)
+            db_cursor.execute(query, params)
+            rows = db_cursor.fetchall()
+            next_cursor = _next_cursor(rows, limit)
             
             reports = []
-            for row in cursor.fetchall():
+            for row in rows:
                 reports.append(ReportResponse(
                     id=row[0],
                     company_code="",
@@ -97,13 +205,17 @@ async def get_kap_reports(
             
             return ReportsListResponse(
                 total=total,
+                total_is_estimate=total_is_estimate,
                 limit=limit,
-                offset=offset,
+                offset=0 if cursor else offset,
+                next_cursor=next_cursor,
                 reports=reports
             )
         finally:
             db_manager.return_connection(conn)
             
+    except HTTPException:
+        raise
     except DatabaseManager.PoolExhaustedError as e:
         logger.error(f"Database connection pool exhausted when querying reports: {e}")
         raise HTTPException(status_code=503, detail="Database temporarily unavailable, please try again later")
@@ -113,24 +225,27 @@ async def get_kap_reports(
 
 
 @router.get("/kap/pdf-urls")
-async def get_pdf_urls(
+def get_pdf_urls(
     company_name: Optional[str] = Query(None, description="Filter by company name"),
     start_date: Optional[date] = Query(None, description="Start date filter"),
     end_date: Optional[date] = Query(None, description="End date filter"),
     limit: int = Query(100, ge=1, le=1000, description="Number of results"),
-    offset: int = Query(0, ge=0, description="Pagination offset"),
+    offset: int = Query(0, ge=0, description="Pagination offset (ignored when cursor is set)"),
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor from the previous page"),
     db_manager: DatabaseManager = Depends(get_db_manager)
 ):
     """
     Get PDF URLs for KAP disclosures
     
     Returns PDF download links for financial disclosures.
-    Supports filtering by company name and date range.
+    Supports filtering by company name and date range. ``total`` is the size of
+    this page; pass ``next_cursor`` back as ``cursor`` for the next one.
     
     Example response:
     ```json
     {
         "total": 10,
+        "next_cursor": "WyIyMDI2LTAxLTI4Ii...",
         "results": [
             {
                 "report_id": 1,
@@ -146,28 +261,13 @@ async def get_pdf_urls(
     ```
     """
     try:
+        conditions, filter_params = _disclosure_filters(company_name, start_date, end_date)
+        tail, params = _page_clause(conditions, filter_params, cursor, limit, offset)
+
         conn = db_manager.get_connection()
         try:
-            cursor = conn.cursor()
-            cursor.execute("SET search_path TO turkish_financial,public;")
-            
-            # Build WHERE conditions
-            conditions = []
-            params = []
-            
-            if company_name:
-                conditions.append("company_name ILIKE %s")
-                params.append(f"%{company_name}%")
-            
-            if start_date:
-                conditions.append("disclosure_date >= %s")
-                params.append(start_date)
-            
-            if end_date:
-                conditions.append("disclosure_date <= %s")
-                params.append(end_date)
-            
-            where_clause = " AND ".join(conditions) if conditions else "1=1"
+            db_cursor = conn.cursor()
+            db_cursor.execute("SET search_path TO turkish_financial,public;")
             
             # Get PDF information
             query = f"""
@@ -181,16 +281,14 @@ async def get_pdf_urls(
                     CASE 
                         WHEN pdf_url IS NOT NULL AND pdf_url != '' THEN true 
                         ELSE false 
-                    END as has_pdf
+                    END as has_pdf,
+                    {_KEYSET_SELECT}
                 FROM kap_disclosures
-                WHERE {where_clause}
-                ORDER BY disclosure_date DESC, scraped_at DESC
-                LIMIT %s OFFSET %s
+                {tail}
             """
-            params.extend([limit, offset])
-            
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
+            db_cursor.execute(query, params)
+            rows = db_cursor.fetchall()
+            next_cursor = _next_cursor(rows, limit)
             
             results = []
             for row in rows:
@@ -206,10 +304,13 @@ async def get_pdf_urls(
             
             return {
                 "total": len(results),
+                "next_cursor": next_cursor,
                 "results": results
             }
         finally:
             db_manager.return_connection(conn)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to get PDF URLs: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -217,7 +318,7 @@ async def get_pdf_urls(
 
 @router.get("/kap/{report_id}", response_model=ReportResponse)
 
-async def get_kap_report(
+def get_kap_report(
     report_id: int,
     db_manager: DatabaseManager = Depends(get_db_manager)
 ):
@@ -265,7 +366,7 @@ async def get_kap_report(
 
 
 @router.get("/companies", response_model=List[dict])
-async def get_companies(
+def get_companies(
     sector: Optional[str] = Query(None, description="Filter by sector"),
     limit: int = Query(100, ge=1, le=1000),
     db_manager: DatabaseManager = Depends(get_db_manager)
@@ -318,7 +419,7 @@ async def get_companies(
 
 
 @router.get("/kap/{report_id}/sentiment")
-async def get_report_sentiment(
+def get_report_sentiment(
     report_id: int,
     db_manager: DatabaseManager = Depends(get_db_manager)
 ):
@@ -366,7 +467,7 @@ async def get_report_sentiment(
 
 
 @router.get("/kap/sentiment/query")
-async def query_sentiment(
+def query_sentiment(
     company_code: Optional[str] = None,
     sentiment: Optional[str] = None,
     start_date: Optional[date] = None,
@@ -22,72 +22,96 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["sentiment"])
 
+# Handlers are plain ``def`` on purpose: FastAPI runs them in its threadpool, so the
+# blocking psycopg2 work never stalls the event loop for other requests.
+
+
+def _refresh_rollups(db_manager: DatabaseManager) -> Dict[str, Any]:
+    """Fold pending sentiment writes into kap_sentiment_daily; never fails the request."""
+    try:
+        return db_manager.refresh_sentiment_rollups()
+    except Exception as e:
+        logger.warning(f"Sentiment rollup refresh failed, serving last rollup: {e}")
+        return {"refreshed_at": None, "days_refreshed": 0, "pending_days": None}
+
+
+def _rollup_freshness(refresh: Dict[str, Any]) -> Dict[str, Any]:
+    refreshed_at = refresh.get("refreshed_at")
+    return {
+        "refreshed_at": refreshed_at.isoformat() if isinstance(refreshed_at, datetime) else refreshed_at,
+        "pending_days": refresh.get("pending_days"),
+    }
+
 
 @router.get("/")
 @router.get("/overview")
-async def get_sentiment_overview(
+def get_sentiment_overview(
     db_manager: DatabaseManager = Depends(get_db_manager)
 ):
     """
     Get overview of sentiment analysis data
     
-    Returns statistics and summary of available sentiment analysis
+    Returns statistics and summary of available sentiment analysis,
+    read from the daily rollup (see ``rollup`` for its freshness)
     """
     try:
+        refresh = _refresh_rollups(db_manager)
         conn = db_manager.get_connection()
-        cursor = conn.cursor()
-        
-        # Set search path
-        cursor.execute("SET search_path TO turkish_financial,public;")
-        
-        # Get sentiment statistics
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total_analyses,
-                COUNT(DISTINCT disclosure_id) as unique_disclosures,
-                AVG(sentiment_score) as avg_sentiment_score,
-                COUNT(CASE WHEN overall_sentiment = 'positive' THEN 1 END) as positive_count,
-                COUNT(CASE WHEN overall_sentiment = 'neutral' THEN 1 END) as neutral_count,
-                COUNT(CASE WHEN overall_sentiment = 'negative' THEN 1 END) as negative_count,
-                MAX(created_at) as latest_analysis
-            FROM kap_disclosure_sentiment
-        """)
-        
-        stats = cursor.fetchone()
-        
-        # Get recent sentiment trends
-        cursor.execute("""
-            SELECT 
-                DATE(created_at) as analysis_date,
-                overall_sentiment,
-                COUNT(*) as count
-            FROM kap_disclosure_sentiment
-            WHERE created_at >= CURRENT_DATE - INTERVAL '30 days'
-            GROUP BY DATE(created_at), overall_sentiment
-            ORDER BY analysis_date DESC, overall_sentiment
-            LIMIT 90
-        """)
-        
-        trends = cursor.fetchall()
-        
-        # Get top companies by analysis volume
-        cursor.execute("""
-            SELECT 
-                d.company_name,
-                COUNT(*) as analysis_count,
-                AVG(s.sentiment_score) as avg_sentiment_score,
-                MAX(s.created_at) as latest_analysis
-            FROM kap_disclosure_sentiment s
-            JOIN kap_disclosures d ON s.disclosure_id = d.id
-            GROUP BY d.company_name
-            ORDER BY analysis_count DESC
-            LIMIT 10
-        """)
-        
-        top_companies = cursor.fetchall()
-        
-        cursor.close()
-        db_manager.return_connection(conn)
+        try:
+            cursor = conn.cursor()
+            
+            # Set search path
+            cursor.execute("SET search_path TO turkish_financial,public;")
+            
+            # Get sentiment statistics (one sentiment row per disclosure, so
+            # analyses == unique disclosures)
+            cursor.execute("""
+                SELECT 
+                    COALESCE(SUM(analyses), 0) as total_analyses,
+                    COALESCE(SUM(analyses), 0) as unique_disclosures,
+                    SUM(sentiment_score_sum) / NULLIF(SUM(sentiment_score_n), 0) as avg_sentiment_score,
+                    COALESCE(SUM(analyses) FILTER (WHERE overall_sentiment = 'positive'), 0) as positive_count,
+                    COALESCE(SUM(analyses) FILTER (WHERE overall_sentiment = 'neutral'), 0) as neutral_count,
+                    COALESCE(SUM(analyses) FILTER (WHERE overall_sentiment = 'negative'), 0) as negative_count,
+                    MAX(latest_at) as latest_analysis
+                FROM kap_sentiment_daily
+            """)
+            
+            stats = cursor.fetchone()
+            
+            # Get recent sentiment trends
+            cursor.execute("""
+                SELECT 
+                    day as analysis_date,
+                    NULLIF(overall_sentiment, '') as overall_sentiment,
+                    SUM(analyses) as count
+                FROM kap_sentiment_daily
+                WHERE day >= CURRENT_DATE - 30
+                GROUP BY day, overall_sentiment
+                ORDER BY analysis_date DESC, overall_sentiment
+                LIMIT 90
+            """)
+            
+            trends = cursor.fetchall()
+            
+            # Get top companies by analysis volume
+            cursor.execute("""
+                SELECT 
+                    company_name,
+                    SUM(analyses) as analysis_count,
+                    SUM(sentiment_score_sum) / NULLIF(SUM(sentiment_score_n), 0) as avg_sentiment_score,
+                    MAX(latest_at) as latest_analysis
+                FROM kap_sentiment_daily
+                WHERE company_name <> ''
+                GROUP BY company_name
+                ORDER BY analysis_count DESC
+                LIMIT 10
+            """)
+            
+            top_companies = cursor.fetchall()
+            cursor.close()
+        finally:
+            db_manager.return_connection(conn)
         
         return {
             "success": True,
@@ -114,11 +138,12 @@ async def get_sentiment_overview(
                     {
                         "company_name": company[0],
                         "analysis_count": company[1],
-                        "avg_sentiment_score": round(company[2], 3),
+                        "avg_sentiment_score": round(company[2] or 0, 3),
                         "latest_analysis": company[3]
                     } for company in top_companies
                 ]
             },
+            "rollup": _rollup_freshness(refresh),
             "timestamp": datetime.now().isoformat()
         }
         
@@ -131,7 +156,7 @@ async def get_sentiment_overview(
 
 
 @router.get("/query")
-async def query_sentiment(
+def query_sentiment(
     company_code: Optional[str] = None,
     sentiment: Optional[str] = None,
     start_date: Optional[date] = None,
@@ -237,7 +262,7 @@ async def query_sentiment(
 
 
 @router.get("/disclosures/{disclosure_id}")
-async def get_disclosure_sentiment(
+def get_disclosure_sentiment(
     disclosure_id: int,
     db_manager: DatabaseManager = Depends(get_db_manager)
 ):
@@ -313,7 +338,7 @@ async def get_disclosure_sentiment(
 
 
 @router.get("/company/{company_name}")
-async def get_company_sentiment_history(
+def get_company_sentiment_history(
     company_name: str,
     limit: int = Query(50, ge=1, le=200, description="Number of results"),
     days_back: int = Query(30, ge=1, le=365, description="Days to look back"),
@@ -413,7 +438,7 @@ async def get_company_sentiment_history(
 
 
 @router.post("/analyze", response_model=SentimentAnalysisResponse)
-async def analyze_sentiment_bulk(
+def analyze_sentiment_bulk(
     request: SentimentAnalysisRequest,
     db_manager: DatabaseManager = Depends(get_db_manager)
 ):
@@ -524,6 +549,7 @@ async def analyze_sentiment_bulk(
         conn.commit()
         cursor.close()
         db_manager.return_connection(conn)
+        _refresh_rollups(db_manager)
         
         return SentimentAnalysisResponse(
             total_analyzed=len(request.report_ids),
@@ -541,7 +567,7 @@ async def analyze_sentiment_bulk(
 
 
 @router.post("/analyze/auto", response_model=ScrapeResponse)
-async def analyze_recent_sentiment(
+def analyze_recent_sentiment(
     request: AutoSentimentRequest,
     db_manager: DatabaseManager = Depends(get_db_manager)
 ):
@@ -654,6 +680,7 @@ async def analyze_recent_sentiment(
         conn.commit()
         cursor.close()
         db_manager.return_connection(conn)
+        _refresh_rollups(db_manager)
         
         return ScrapeResponse(
             success=True,
@@ -675,7 +702,7 @@ async def analyze_recent_sentiment(
 
 
 @router.get("/trends")
-async def get_sentiment_trends(
+def get_sentiment_trends(
     days_back: int = Query(30, ge=1, le=365, description="Days to look back"),
     company_name: Optional[str] = Query(None, description="Filter by company"),
     db_manager: DatabaseManager = Depends(get_db_manager)
@@ -687,63 +714,50 @@ async def get_sentiment_trends(
     - **company_name**: Optional company filter
     """
     try:
+        refresh = _refresh_rollups(db_manager)
         conn = db_manager.get_connection()
-        cursor = conn.cursor()
-        
-        # Set search path
-        cursor.execute("SET search_path TO turkish_financial,public;")
-        
-        # Base query for trends
-        base_query = """
-            SELECT 
-                DATE(s.created_at) as trend_date,
-                s.overall_sentiment,
-                COUNT(*) as count,
-                AVG(s.sentiment_score) as avg_sentiment_score,
-                COUNT(DISTINCT d.company_name) as unique_companies
-            FROM kap_disclosure_sentiment s
-            JOIN kap_disclosures d ON s.disclosure_id = d.id
-            WHERE s.created_at >= CURRENT_DATE - INTERVAL %s
-        """
-        
-        params = [f"{days_back} days"]
-        
-        if company_name:
-            base_query += " AND d.company_name = %s"
-            params.append(company_name)
-        
-        base_query += """
-            GROUP BY DATE(s.created_at), s.overall_sentiment
-            ORDER BY trend_date DESC, s.overall_sentiment
-        """
-        
-        cursor.execute(base_query, params)
-        trends = cursor.fetchall()
-        
-        # Get summary statistics
-        summary_query = """
-            SELECT 
-                COUNT(*) as total_analyses,
-                COUNT(DISTINCT d.company_name) as total_companies,
-                AVG(s.sentiment_score) as overall_sentiment_score,
-                COUNT(CASE WHEN s.overall_sentiment = 'positive' THEN 1 END) as positive_total,
-                COUNT(CASE WHEN s.overall_sentiment = 'neutral' THEN 1 END) as neutral_total,
-                COUNT(CASE WHEN s.overall_sentiment = 'negative' THEN 1 END) as negative_total
-            FROM kap_disclosure_sentiment s
-            JOIN kap_disclosures d ON s.disclosure_id = d.id
-            WHERE s.created_at >= CURRENT_DATE - INTERVAL %s
-        """
-        
-        summary_params = [f"{days_back} days"]
-        if company_name:
-            summary_query += " AND d.company_name = %s"
-            summary_params.append(company_name)
-        
-        cursor.execute(summary_query, summary_params)
-        summary = cursor.fetchone()
-        
-        cursor.close()
-        conn.close()
+        try:
+            cursor = conn.cursor()
+            
+            # Set search path
+            cursor.execute("SET search_path TO turkish_financial,public;")
+            
+            where = " WHERE day >= CURRENT_DATE - %s AND company_name <> ''"
+            params = [days_back]
+            if company_name:
+                where += " AND company_name = %s"
+                params.append(company_name)
+            
+            # Daily trends straight off the rollup: O(days x sentiments x companies)
+            cursor.execute("""
+                SELECT 
+                    day as trend_date,
+                    NULLIF(overall_sentiment, '') as overall_sentiment,
+                    SUM(analyses) as count,
+                    SUM(sentiment_score_sum) / NULLIF(SUM(sentiment_score_n), 0) as avg_sentiment_score,
+                    COUNT(*) as unique_companies
+                FROM kap_sentiment_daily
+            """ + where + """
+                GROUP BY day, overall_sentiment
+                ORDER BY trend_date DESC, overall_sentiment
+            """, params)
+            trends = cursor.fetchall()
+            
+            # Get summary statistics
+            cursor.execute("""
+                SELECT 
+                    COALESCE(SUM(analyses), 0) as total_analyses,
+                    COUNT(DISTINCT company_name) as total_companies,
+                    SUM(sentiment_score_sum) / NULLIF(SUM(sentiment_score_n), 0) as overall_sentiment_score,
+                    COALESCE(SUM(analyses) FILTER (WHERE overall_sentiment = 'positive'), 0) as positive_total,
+                    COALESCE(SUM(analyses) FILTER (WHERE overall_sentiment = 'neutral'), 0) as neutral_total,
+                    COALESCE(SUM(analyses) FILTER (WHERE overall_sentiment = 'negative'), 0) as negative_total
+                FROM kap_sentiment_daily
+            """ + where, params)
+            summary = cursor.fetchone()
+            cursor.close()
+        finally:
+            db_manager.return_connection(conn)
         
         return {
             "success": True,
@@ -765,11 +779,12 @@ async def get_sentiment_trends(
                         "date": trend[0],
                         "sentiment": trend[1],
                         "count": trend[2],
-                        "avg_confidence": round(trend[3], 3),
+                        "avg_confidence": round(trend[3] or 0, 3),
                         "unique_companies": trend[4]
                     } for trend in trends
                 ]
             },
+            "rollup": _rollup_freshness(refresh),
             "timestamp": datetime.now().isoformat()
         }
         
@@ -3,9 +3,13 @@ Collect News Sentiment Use Case.
 
 Orchestrates the news-portal sentiment pipeline:
   1. scrape articles from Turkish financial portals (NewsPortalScraper)
-  2. analyse each article's sentiment (SentimentAnalyzerService — reused unchanged)
-  3. persist article + per-article sentiment (DatabaseManager helpers)
-  4. recompute the daily per-ticker rollup (aggregated_ticker_sentiment)
+  2. analyse the articles' sentiment concurrently (SentimentAnalyzerService — reused
+     unchanged), at most ``analysis_concurrency`` calls in flight
+  3. persist articles + per-article sentiment in batches (DatabaseManager *_many helpers)
+  4. recompute the daily per-ticker rollup (aggregated_ticker_sentiment) in one pass
+
+Steps 2 and 4 run on the engine shared with the social and YouTube use cases
+(application/use_cases/sentiment_pipeline.py).
 
 Sentiment is analysed with the same LLM pipeline used for KAP disclosures, so the
 contract `analyzer` provenance and Turkish-prompt behaviour stay consistent. Articles
@@ -17,11 +21,17 @@ from __future__ import annotations
 import logging
 from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from domain.entities.news_article import NewsArticle
 from domain.services.sentiment_analyzer_service import ISentimentAnalyzer
 from domain.value_objects.sentiment import SentimentAnalysis
+from application.use_cases.sentiment_pipeline import (
+    DEFAULT_ANALYSIS_CONCURRENCY,
+    analyze_concurrently,
+    recompute_aggregates,
+)
+from utils.bulk_upsert import upsert_many
 
 logger = logging.getLogger(__name__)
 
@@ -34,10 +44,12 @@ class CollectNewsSentimentUseCase:
         scraper,
         sentiment_analyzer: ISentimentAnalyzer,
         db_manager,
+        analysis_concurrency: int = DEFAULT_ANALYSIS_CONCURRENCY,
     ):
         self._scraper = scraper
         self._analyzer = sentiment_analyzer
         self._db = db_manager
+        self._concurrency = analysis_concurrency
 
     async def execute(
         self,
@@ -60,19 +72,15 @@ class CollectNewsSentimentUseCase:
         )
         articles: List[NewsArticle] = scrape_result.get("articles", [])
 
-        analyzed = 0
-        saved = 0
+        analyzed: List[Tuple[NewsArticle, SentimentAnalysis]] = []
         # Collect (score, confidence) per ticker per day for the rollup.
         buckets: Dict[tuple, List[float]] = defaultdict(list)
 
-        for article in articles:
-            sentiment = await self._analyze(article)
+        sentiments = await analyze_concurrently(articles, self._analyze, self._concurrency)
+        for article, sentiment in zip(articles, sentiments):
             if sentiment is None:
                 continue
-            analyzed += 1
-
-            if self._persist(article, sentiment):
-                saved += 1
+            analyzed.append((article, sentiment))
 
             if article.ticker:
                 day = (article.published_at or article.scraped_at).date()
@@ -80,15 +88,22 @@ class CollectNewsSentimentUseCase:
                     sentiment.to_score() * sentiment.confidence.value
                 )
 
+        saved = self._persist(analyzed)
         aggregated = self._aggregate(buckets)
+        # Unchanged RSS feeds are skipped next run only once every scraped article
+        # is stored; otherwise the next run re-reads them and retries the rest.
+        commit_feed_state = getattr(self._scraper, "commit_feed_state", None)
+        if commit_feed_state is not None and saved == len(articles):
+            commit_feed_state()
 
         return {
             "success": True,
             "scraped": scrape_result.get("total", len(articles)),
-            "analyzed": analyzed,
+            "analyzed": len(analyzed),
             "saved": saved,
             "aggregated_tickers": aggregated,
             "by_source": scrape_result.get("by_source", {}),
+            "by_source_timing": scrape_result.get("by_source_timing", {}),
         }
 
     # ── steps ─────────────────────────────────────────────────────────────────
@@ -99,58 +114,35 @@ class CollectNewsSentimentUseCase:
             logger.error(f"Sentiment analysis failed for {article.article_id}: {e}")
             return None
 
-    def _persist(self, article: NewsArticle, sentiment: SentimentAnalysis) -> bool:
-        """Save the article then its sentiment. Returns True when both succeed."""
-        if self._db is None:
-            return False
-        article_pk = self._db.upsert_news_article(article.to_db_row())
-        if not article_pk:
-            return False
-        return self._db.upsert_news_article_sentiment(
-            article_pk,
-            {
-                "overall_sentiment": sentiment.overall_sentiment.value,
-                "sentiment_score": sentiment.to_score(),
-                "confidence": sentiment.confidence.value,
-                "key_drivers": ", ".join(sentiment.key_drivers) or None,
-                "tone_descriptors": ", ".join(sentiment.tone_descriptors) or None,
-                "analyzer": "news-portal-scraper",
-            },
+    def _persist(self, analyzed: List[Tuple[NewsArticle, SentimentAnalysis]]) -> int:
+        """Save the articles then their sentiments, one batch each. Returns the saved count."""
+        if self._db is None or not analyzed:
+            return 0
+        article_pks = upsert_many(
+            self._db, "upsert_news_article", [article.to_db_row() for article, _ in analyzed]
         )
+        rows = [
+            (
+                article_pk,
+                {
+                    "overall_sentiment": sentiment.overall_sentiment.value,
+                    "sentiment_score": sentiment.to_score(),
+                    "confidence": sentiment.confidence.value,
+                    "key_drivers": ", ".join(sentiment.key_drivers) or None,
+                    "tone_descriptors": ", ".join(sentiment.tone_descriptors) or None,
+                    "analyzer": "news-portal-scraper",
+                },
+            )
+            for article_pk, (_, sentiment) in zip(article_pks, analyzed)
+            if article_pk
+        ]
+        return sum(1 for ok in upsert_many(self._db, "upsert_news_article_sentiment", rows) if ok)
 
     def _aggregate(self, buckets: Dict[tuple, List[float]]) -> int:
         """Recompute daily per-ticker news aggregates and upsert them. Returns row count.
 
-        combined_score blends with any existing social score so the result is
-        independent of whether news or social was collected first (see
-        collect_social_sentiment_use_case.blend_scores).
+        combined_score blends with any existing social/YouTube score so the result is
+        independent of which source was collected first (see
+        collect_social_sentiment_use_case.blend_sources).
         """
-        if self._db is None:
-            return 0
-        from application.use_cases.collect_social_sentiment_use_case import blend_sources
-
-        count = 0
-        for (ticker, day), scores in buckets.items():
-            if not scores:
-                continue
-            news_score = round(sum(scores) / len(scores), 4)
-
-            existing = self._db.get_aggregated_ticker_sentiment(ticker, day) or {}
-            combined = blend_sources({
-                "news": news_score,
-                "social": existing.get("social_score"),
-                "youtube": existing.get("youtube_score"),
-            })
-
-            ok = self._db.upsert_aggregated_ticker_sentiment(
-                {
-                    "ticker": ticker,
-                    "period_date": day,
-                    "news_score": news_score,
-                    "news_count": len(scores),
-                    "combined_score": combined,
-                }
-            )
-            if ok:
-                count += 1
-        return count
+        return recompute_aggregates(self._db, "news", buckets)
@@ -3,8 +3,9 @@ Collect Social Sentiment Use Case (Phase 2).
 
 Orchestrates the X/FinTwit sentiment pipeline:
   1. scrape posts per ticker (SocialMediaScraper — Firecrawl Playwright)
-  2. analyse each post's sentiment (SentimentAnalyzerService — reused unchanged)
-  3. persist post + per-post sentiment (DatabaseManager helpers)
+  2. analyse the posts' sentiment concurrently (SentimentAnalyzerService — reused
+     unchanged) through the shared engine in sentiment_pipeline.py
+  3. persist posts + per-post sentiment in batches (DatabaseManager *_many helpers)
   4. update the social_* columns of the daily per-ticker rollup and recompute
      combined_score by blending the existing news score with the new social score.
 
@@ -17,11 +18,17 @@ from __future__ import annotations
 
 import logging
 from collections import defaultdict
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from domain.entities.social_post import SocialPost
 from domain.services.sentiment_analyzer_service import ISentimentAnalyzer
 from domain.value_objects.sentiment import SentimentAnalysis
+from application.use_cases.sentiment_pipeline import (
+    DEFAULT_ANALYSIS_CONCURRENCY,
+    analyze_concurrently,
+    recompute_aggregates,
+)
+from utils.bulk_upsert import upsert_many
 
 logger = logging.getLogger(__name__)
 
@@ -62,10 +69,17 @@ def blend_scores(news: Optional[float], social: Optional[float]) -> Optional[flo
 class CollectSocialSentimentUseCase:
     """Coordinate scrape → analyse → persist → blended aggregate for X/FinTwit."""
 
-    def __init__(self, scraper, sentiment_analyzer: ISentimentAnalyzer, db_manager):
+    def __init__(
+        self,
+        scraper,
+        sentiment_analyzer: ISentimentAnalyzer,
+        db_manager,
+        analysis_concurrency: int = DEFAULT_ANALYSIS_CONCURRENCY,
+    ):
         self._scraper = scraper
         self._analyzer = sentiment_analyzer
         self._db = db_manager
+        self._concurrency = analysis_concurrency
 
     async def execute(
         self,
@@ -80,29 +94,27 @@ class CollectSocialSentimentUseCase:
         )
         posts: List[SocialPost] = scrape_result.get("posts", [])
 
-        analyzed = 0
-        saved = 0
+        analyzed: List[Tuple[SocialPost, SentimentAnalysis]] = []
         buckets: Dict[tuple, List[float]] = defaultdict(list)
 
-        for post in posts:
-            sentiment = await self._analyze(post)
+        sentiments = await analyze_concurrently(posts, self._analyze, self._concurrency)
+        for post, sentiment in zip(posts, sentiments):
             if sentiment is None:
                 continue
-            analyzed += 1
-            if self._persist(post, sentiment):
-                saved += 1
+            analyzed.append((post, sentiment))
 
             day = (post.posted_at or post.scraped_at).date()
             buckets[(post.ticker, day)].append(
                 sentiment.to_score() * sentiment.confidence.value
             )
 
+        saved = self._persist(analyzed)
         aggregated = self._aggregate(buckets)
 
         return {
             "success": True,
             "scraped": scrape_result.get("total", len(posts)),
-            "analyzed": analyzed,
+            "analyzed": len(analyzed),
             "saved": saved,
             "aggregated_tickers": aggregated,
             "by_ticker": scrape_result.get("by_ticker", {}),
@@ -116,48 +128,28 @@ class CollectSocialSentimentUseCase:
             logger.error(f"Sentiment analysis failed for {post.post_id}: {e}")
             return None
 
-    def _persist(self, post: SocialPost, sentiment: SentimentAnalysis) -> bool:
-        if self._db is None:
-            return False
-        post_pk = self._db.upsert_social_post(post.to_db_row())
-        if not post_pk:
-            return False
-        return self._db.upsert_social_post_sentiment(
-            post_pk,
-            {
-                "overall_sentiment": sentiment.overall_sentiment.value,
-                "sentiment_score": sentiment.to_score(),
-                "confidence": sentiment.confidence.value,
-                "analyzer": "social-media-scraper",
-            },
+    def _persist(self, analyzed: List[Tuple[SocialPost, SentimentAnalysis]]) -> int:
+        """Save the posts then their sentiments, one batch each. Returns the saved count."""
+        if self._db is None or not analyzed:
+            return 0
+        post_pks = upsert_many(
+            self._db, "upsert_social_post", [post.to_db_row() for post, _ in analyzed]
         )
+        rows = [
+            (
+                post_pk,
+                {
+                    "overall_sentiment": sentiment.overall_sentiment.value,
+                    "sentiment_score": sentiment.to_score(),
+                    "confidence": sentiment.confidence.value,
+                    "analyzer": "social-media-scraper",
+                },
+            )
+            for post_pk, (_, sentiment) in zip(post_pks, analyzed)
+            if post_pk
+        ]
+        return sum(1 for ok in upsert_many(self._db, "upsert_social_post_sentiment", rows) if ok)
 
     def _aggregate(self, buckets: Dict[tuple, List[float]]) -> int:
         """Recompute social_score per ticker/day and blend with existing news_score."""
-        if self._db is None:
-            return 0
-        count = 0
-        for (ticker, day), scores in buckets.items():
-            if not scores:
-                continue
-            social_score = round(sum(scores) / len(scores), 4)
-
-            existing = self._db.get_aggregated_ticker_sentiment(ticker, day) or {}
-            combined = blend_sources({
-                "news": existing.get("news_score"),
-                "social": social_score,
-                "youtube": existing.get("youtube_score"),
-            })
-
-            ok = self._db.upsert_aggregated_ticker_sentiment(
-                {
-                    "ticker": ticker,
-                    "period_date": day,
-                    "social_score": social_score,
-                    "social_count": len(scores),
-                    "combined_score": combined,
-                }
-            )
-            if ok:
-                count += 1
-        return count
+        return recompute_aggregates(self._db, "social", buckets)
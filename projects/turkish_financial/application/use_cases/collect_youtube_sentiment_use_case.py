@@ -5,7 +5,8 @@ Orchestrates the YouTube finance channel sentiment pipeline:
   1. Scrape video transcripts from channel URLs (YouTubeScraper)
   2. Detect all BIST tickers mentioned in each transcript (detect_instruments)
   3. For each (video, ticker) pair: extract the relevant text window, analyse sentiment
-  4. Persist video + per-(video, ticker) sentiment rows
+     (pairs are analysed concurrently through the engine in sentiment_pipeline.py)
+  4. Persist videos + per-(video, ticker) sentiment rows in batches
   5. Update the youtube_* columns of the daily aggregated_ticker_sentiment rollup
      and recompute combined_score by blending news + social + youtube.
 
@@ -18,15 +19,21 @@ from __future__ import annotations
 import logging
 from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from domain.entities.youtube_video import YouTubeVideo
 from domain.services.sentiment_analyzer_service import ISentimentAnalyzer
 from domain.value_objects.sentiment import SentimentAnalysis
+from application.use_cases.sentiment_pipeline import (
+    DEFAULT_ANALYSIS_CONCURRENCY,
+    analyze_concurrently,
+    recompute_aggregates,
+)
 from infrastructure.contracts.instrument_identity_map import (
     detect_instruments,
-    resolve_name_patterns,
+    resolve_name_patterns_many,
 )
+from utils.bulk_upsert import upsert_many
 
 logger = logging.getLogger(__name__)
 
@@ -34,10 +41,17 @@ logger = logging.getLogger(__name__)
 class CollectYouTubeSentimentUseCase:
     """Coordinate scrape → detect → analyse → persist → aggregate for YouTube channels."""
 
-    def __init__(self, scraper, sentiment_analyzer: ISentimentAnalyzer, db_manager):
+    def __init__(
+        self,
+        scraper,
+        sentiment_analyzer: ISentimentAnalyzer,
+        db_manager,
+        analysis_concurrency: int = DEFAULT_ANALYSIS_CONCURRENCY,
+    ):
         self._scraper = scraper
         self._analyzer = sentiment_analyzer
         self._db = db_manager
+        self._concurrency = analysis_concurrency
 
     async def execute(
         self,
@@ -70,34 +84,50 @@ class CollectYouTubeSentimentUseCase:
         videos = list(videos_by_id.values())
 
         analyzed = 0
-        saved = 0
         # (ticker, date) → list of weighted scores
         buckets: Dict[tuple, List[float]] = defaultdict(list)
 
+        tagged: List[Tuple[YouTubeVideo, List[str]]] = []
         for video in videos:
             tickers = self._detect_tickers(video)
             if not tickers:
                 logger.debug(f"No BIST tickers found in {video.video_id}: skipping")
                 continue
+            tagged.append((video, tickers))
+
+        video_db_ids = self._persist_videos([video for video, _ in tagged])
+        sentiment_rows: List[Tuple[int, str, SentimentAnalysis]] = []
 
-            video_db_id = self._persist_video(video)
+        pairs: List[Tuple[YouTubeVideo, str, Optional[int]]] = []
+        for (video, tickers), video_db_id in zip(tagged, video_db_ids):
             if video_db_id is None and self._db is not None:
                 logger.warning(f"Could not persist video {video.video_id}")
+            pairs.extend((video, ticker, video_db_id) for ticker in tickers)
+
+        # One bist_companies read for every ticker in the run, not one per pair.
+        patterns = resolve_name_patterns_many(
+            list({ticker for _, ticker, _ in pairs}), "bist", db_manager=self._db
+        )
+        sentiments = await analyze_concurrently(
+            pairs,
+            lambda pair: self._analyze_for_ticker(pair[0], pair[1], patterns.get(pair[1], [])),
+            self._concurrency,
+        )
+
+        for (video, ticker, video_db_id), sentiment in zip(pairs, sentiments):
+            if sentiment is None:
+                continue
+            analyzed += 1
 
-            for ticker in tickers:
-                sentiment = await self._analyze_for_ticker(video, ticker)
-                if sentiment is None:
-                    continue
-                analyzed += 1
-
-                if self._persist_sentiment(video_db_id, ticker, sentiment):
-                    saved += 1
+            if video_db_id is not None:
+                sentiment_rows.append((video_db_id, ticker, sentiment))
 
-                day = (video.published_at or video.scraped_at).date()
-                buckets[(ticker, day)].append(
-                    sentiment.to_score() * sentiment.confidence.value
-                )
+            day = (video.published_at or video.scraped_at).date()
+            buckets[(ticker, day)].append(
+                sentiment.to_score() * sentiment.confidence.value
+            )
 
+        saved = self._persist_sentiments(sentiment_rows)
         aggregated = self._aggregate(buckets)
 
         return {
@@ -154,16 +184,15 @@ class CollectYouTubeSentimentUseCase:
     def _detect_tickers(self, video: YouTubeVideo) -> List[str]:
         try:
             full_text = video.text_for_analysis()
-            return detect_instruments(full_text)
+            return detect_instruments(full_text, db_manager=self._db)
         except Exception as e:
             logger.error(f"Instrument detection failed for {video.video_id}: {e}")
             return []
 
     async def _analyze_for_ticker(
-        self, video: YouTubeVideo, ticker: str
+        self, video: YouTubeVideo, ticker: str, patterns: List[str]
     ) -> Optional[SentimentAnalysis]:
         try:
-            patterns = resolve_name_patterns(ticker, "bist", self._db)
             text = video.tickers_text_window(patterns)
             return await self._analyzer.analyze(text)
         except Exception as e:  # noqa: BLE001 — one bad (video, ticker) must not abort
@@ -172,69 +201,43 @@ class CollectYouTubeSentimentUseCase:
             )
             return None
 
-    def _persist_video(self, video: YouTubeVideo) -> Optional[int]:
-        if self._db is None:
-            return None
+    def _persist_videos(self, videos: List[YouTubeVideo]) -> List[Optional[int]]:
+        """Upsert all videos in one batch. Returns their row ids in input order."""
+        if self._db is None or not videos:
+            return [None] * len(videos)
         try:
-            return self._db.upsert_youtube_video(video.to_db_row())
+            return upsert_many(self._db, "upsert_youtube_video", [video.to_db_row() for video in videos])
         except Exception as e:
-            logger.error(f"upsert_youtube_video failed for {video.video_id}: {e}")
-            return None
+            logger.error(f"upsert_youtube_video failed for {len(videos)} videos: {e}")
+            return [None] * len(videos)
 
-    def _persist_sentiment(
-        self,
-        video_db_id: Optional[int],
-        ticker: str,
-        sentiment: SentimentAnalysis,
-    ) -> bool:
-        if self._db is None or video_db_id is None:
-            return False
+    def _persist_sentiments(self, rows: List[Tuple[int, str, SentimentAnalysis]]) -> int:
+        """Upsert all (video, ticker) sentiments in one batch. Returns the saved count."""
+        if self._db is None or not rows:
+            return 0
         try:
-            return self._db.upsert_youtube_video_sentiment(
-                video_db_id,
-                ticker,
-                {
-                    "overall_sentiment": sentiment.overall_sentiment.value,
-                    "sentiment_score": sentiment.to_score(),
-                    "confidence": sentiment.confidence.value,
-                    "analyzer": "youtube-scraper",
-                },
+            results = upsert_many(
+                self._db,
+                "upsert_youtube_video_sentiment",
+                [
+                    (
+                        video_db_id,
+                        ticker,
+                        {
+                            "overall_sentiment": sentiment.overall_sentiment.value,
+                            "sentiment_score": sentiment.to_score(),
+                            "confidence": sentiment.confidence.value,
+                            "analyzer": "youtube-scraper",
+                        },
+                    )
+                    for video_db_id, ticker, sentiment in rows
+                ],
             )
         except Exception as e:
-            logger.error(
-                f"upsert_youtube_video_sentiment failed for video {video_db_id}/{ticker}: {e}"
-            )
-            return False
+            logger.error(f"upsert_youtube_video_sentiment failed for {len(rows)} rows: {e}")
+            return 0
+        return sum(1 for ok in results if ok)
 
     def _aggregate(self, buckets: Dict[tuple, List[float]]) -> int:
         """Recompute youtube_score per ticker/day and blend with existing news+social."""
-        if self._db is None:
-            return 0
-
-        from application.use_cases.collect_social_sentiment_use_case import blend_sources
-
-        count = 0
-        for (ticker, day), scores in buckets.items():
-            if not scores:
-                continue
-            youtube_score = round(sum(scores) / len(scores), 4)
-
-            existing = self._db.get_aggregated_ticker_sentiment(ticker, day) or {}
-            combined = blend_sources({
-                "news": existing.get("news_score"),
-                "social": existing.get("social_score"),
-                "youtube": youtube_score,
-            })
-
-            ok = self._db.upsert_aggregated_ticker_sentiment(
-                {
-                    "ticker": ticker,
-                    "period_date": day,
-                    "youtube_score": youtube_score,
-                    "youtube_count": len(scores),
-                    "combined_score": combined,
-                }
-            )
-            if ok:
-                count += 1
-        return count
+        return recompute_aggregates(self._db, "youtube", buckets)
@@ -0,0 +1,104 @@
+"""
+Shared engine for the news / social / YouTube collect use cases.
+
+Each collect use case scrapes its own source, then runs the same three steps:
+  1. analyse every item with bounded concurrency (``analyze_concurrently``), so a
+     run takes roughly ``items / concurrency × analyzer latency`` instead of the sum
+  2. persist the analysed items in batches (``utils.bulk_upsert.upsert_many``)
+  3. recompute the daily per-ticker rollup for that source in one set-based pass
+     (``recompute_aggregates``): one read of the existing rows, one batched upsert
+
+The per-source use cases only decide *what* to analyse and how to shape rows.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+from utils.bulk_upsert import upsert_many
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# In-flight analyzer calls per run. Network LLMs are latency-bound, so a handful of
+# overlapping requests gives most of the speed-up without tripping rate limits.
+DEFAULT_ANALYSIS_CONCURRENCY = 4
+
+_SOURCES = ("news", "social", "youtube")
+
+
+async def analyze_concurrently(
+    items: Sequence[T],
+    analyze: Callable[[T], Awaitable[Optional[R]]],
+    concurrency: int = DEFAULT_ANALYSIS_CONCURRENCY,
+) -> List[Optional[R]]:
+    """
+    Await ``analyze(item)`` for every item, at most ``concurrency`` at a time.
+
+    Results are returned in input order. ``analyze`` is expected to swallow its own
+    per-item failures (returning None); an exception that escapes still only costs
+    that item, so one bad input never aborts the run.
+    """
+    if not items:
+        return []
+    gate = asyncio.Semaphore(max(1, concurrency))
+
+    async def _one(item: T) -> Optional[R]:
+        async with gate:
+            try:
+                return await analyze(item)
+            except Exception as e:  # noqa: BLE001 - isolate the failing item
+                logger.error(f"Sentiment analysis failed: {e}")
+                return None
+
+    return list(await asyncio.gather(*(_one(item) for item in items)))
+
+
+def recompute_aggregates(db_manager, source: str, buckets: Dict[tuple, List[float]]) -> int:
+    """
+    Write ``<source>_score`` / ``<source>_count`` for every (ticker, day) bucket and
+    re-blend ``combined_score`` with the other sources already stored for that day.
+
+    Existing rows are read with one ``get_aggregated_ticker_sentiment_many`` call when
+    the manager provides it (falling back to the per-row getter), and all rows are
+    written with one batched upsert. Returns the number of rows written.
+    """
+    if db_manager is None:
+        return 0
+    from application.use_cases.collect_social_sentiment_use_case import blend_sources
+
+    scored = {
+        key: (round(sum(scores) / len(scores), 4), len(scores))
+        for key, scores in buckets.items()
+        if scores
+    }
+    existing = _existing_aggregates(db_manager, scored.keys())
+
+    rows = []
+    for (ticker, day), (score, count) in scored.items():
+        current = existing.get((ticker, day)) or {}
+        combined = blend_sources({
+            name: score if name == source else current.get(f"{name}_score")
+            for name in _SOURCES
+        })
+        rows.append({
+            "ticker": ticker,
+            "period_date": day,
+            f"{source}_score": score,
+            f"{source}_count": count,
+            "combined_score": combined,
+        })
+    return sum(1 for ok in upsert_many(db_manager, "upsert_aggregated_ticker_sentiment", rows) if ok)
+
+
+def _existing_aggregates(db_manager, keys: Iterable[Tuple[str, Any]]) -> Dict[tuple, Dict[str, Any]]:
+    keys = list(keys)
+    if not keys:
+        return {}
+    batched = getattr(db_manager, "get_aggregated_ticker_sentiment_many", None)
+    if batched is not None:
+        return batched(keys)
+    return {key: db_manager.get_aggregated_ticker_sentiment(*key) for key in keys}
@@ -19,6 +19,8 @@ class DatabaseConfig(BaseModel):
     password: str = Field(default_factory=lambda: os.getenv("APP_DB_PASSWORD", "back2future"))
     db_schema: str = Field(default_factory=lambda: os.getenv("DB_SCHEMA", "turkish_financial"))
     pool_size: int = Field(default=20)
+    # Seconds a caller waits for a free pooled connection before PoolExhaustedError.
+    pool_timeout: float = Field(default_factory=lambda: float(os.getenv("DB_POOL_TIMEOUT", "5")))
     
     def get_connection_string(self) -> str:
         """Get database connection string"""
@@ -49,6 +51,10 @@ class FirecrawlConfig(BaseModel):
         default=5,
         description="Max concurrent scrapes per batch job (NuQ server-enforced)"
     )
+    max_concurrent_requests: int = Field(
+        default=8,
+        description="Max blocking Firecrawl SDK calls in flight across all scrapers"
+    )
 
 
 class ScraperConfig(BaseModel):
@@ -135,6 +141,7 @@ class Config:
             formats=os.getenv("FIRECRAWL_FORMATS", "markdown,html").split(","),
             max_retries=int(os.getenv("MAX_RETRIES", "3")),
             retry_backoff=int(os.getenv("RETRY_BACKOFF_FACTOR", "2")),
+            max_concurrent_requests=int(os.getenv("FIRECRAWL_MAX_CONCURRENT_REQUESTS", "8")),
         )
         
         self.scraper = ScraperConfig(
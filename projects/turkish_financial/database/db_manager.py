@@ -3,18 +3,76 @@ Database Manager for Turkish Financial Data Scraper
 """
 import logging
 import json
-import os
+import threading
 import time
+from collections import defaultdict
 from datetime import datetime
 import psycopg2
 import psycopg2.errors
 from psycopg2 import pool, sql
 from psycopg2.extras import RealDictCursor, Json
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
 from config import config
 
 logger = logging.getLogger(__name__)
 
+# Rows per multi-row INSERT; keeps statements well under Postgres' 65535 bind limit.
+BULK_UPSERT_CHUNK_SIZE = 500
+
+_DISCLOSURE_COLUMNS = (
+    "disclosure_id", "stock_code", "company_name", "disclosure_type",
+    "disclosure_date", "timestamp", "has_attachment", "detail_url",
+    "pdf_url", "content", "data", "subject", "subject_code", "is_late",
+)
+_NEWS_COLUMNS = ("news_id", "news_category", "title", "content",
+                 "publish_date", "source_url", "data")
+_NEWS_ARTICLE_COLUMNS = ("article_id", "source", "ticker", "headline",
+                         "body", "url", "published_at")
+_NEWS_SENTIMENT_COLUMNS = ("overall_sentiment", "sentiment_score", "confidence",
+                           "key_drivers", "tone_descriptors", "analyzer")
+_AGGREGATE_COLUMNS = ("ticker", "period_date", "news_score", "news_count",
+                      "social_score", "social_count", "youtube_score", "youtube_count",
+                      "combined_score")
+_SOCIAL_POST_COLUMNS = ("post_id", "platform", "ticker", "text",
+                        "author", "posted_at", "likes", "retweets")
+_SENTIMENT_COLUMNS = ("overall_sentiment", "sentiment_score", "confidence", "analyzer")
+_YOUTUBE_VIDEO_COLUMNS = ("video_id", "channel", "title", "url", "transcript",
+                          "transcript_method", "transcript_status", "transcript_attempted_at",
+                          "published_at", "duration", "lang")
+
+
+# Per (day, company, sentiment) sums behind kap_sentiment_daily; {filter} narrows the days.
+_ROLLUP_INSERT = (
+    "INSERT INTO {schema}.kap_sentiment_daily (day, company_name, overall_sentiment, analyses, "
+    "sentiment_score_sum, sentiment_score_n, confidence_sum, confidence_n, latest_at)"
+)
+_ROLLUP_SELECT = '''
+    SELECT DATE(COALESCE(s.created_at, s.analyzed_at)) AS day,
+           COALESCE(d.company_name, '') AS company_name,
+           COALESCE(s.overall_sentiment, '') AS overall_sentiment,
+           COUNT(*) AS analyses,
+           COALESCE(SUM(s.sentiment_score), 0) AS sentiment_score_sum,
+           COUNT(s.sentiment_score) AS sentiment_score_n,
+           COALESCE(SUM(s.confidence), 0) AS confidence_sum,
+           COUNT(s.confidence) AS confidence_n,
+           MAX(COALESCE(s.created_at, s.analyzed_at)) AS latest_at
+    FROM {schema}.kap_disclosure_sentiment s
+    LEFT JOIN {schema}.kap_disclosures d ON d.id = s.disclosure_id
+    WHERE COALESCE(s.created_at, s.analyzed_at) IS NOT NULL {filter}
+    GROUP BY 1, 2, 3
+'''
+
+
+def _present(data: Dict[str, Any], cols) -> Dict[str, Any]:
+    """Keep the non-None values of ``cols`` so an upsert never nulls stored columns."""
+    return {c: data.get(c) for c in cols if data.get(c) is not None}
+
+
+def _wrap_json(row: Dict[str, Any], col: str = "data") -> Dict[str, Any]:
+    if isinstance(row.get(col), (dict, list)):
+        row[col] = Json(row[col])
+    return row
+
 
 class DatabaseManager:
     """Database connection and operations manager"""
@@ -23,11 +81,14 @@ class DatabaseManager:
         """Initialize database connection pool"""
         try:
             self.schema = config.database.db_schema
-            self.pool = pool.SimpleConnectionPool(
+            # The manager is a process-wide singleton shared by FastAPI threadpool
+            # workers, schedulers and background tasks, so use the thread-safe pool.
+            self.pool = pool.ThreadedConnectionPool(
                 minconn=1,
                 maxconn=config.database.pool_size,
                 **config.database.get_connection_params()
             )
+            self._init_pool_metrics(config.database.pool_size)
             logger.info(f"Database connection pool created with schema: {self.schema}")
             self._create_schema()
             self._create_tables()
@@ -376,6 +437,12 @@ class DatabaseManager:
                 ON {}.kap_fundamentals(effective_at)
             ''').format(sql.Identifier(self.schema)))
 
+            # Point and batch reads filter on UPPER(stock_code) and take the newest row.
+            cursor.execute(sql.SQL('''
+                CREATE INDEX IF NOT EXISTS idx_fundamentals_code_latest
+                ON {}.kap_fundamentals (UPPER(stock_code), effective_at DESC NULLS LAST)
+            ''').format(sql.Identifier(self.schema)))
+
             # --- kap_disclosures extra columns (idempotent ALTERs) ----------
             # subject / subject_code / is_late were missing from the original schema;
             # add them now so scrape_and_save_disclosures() can populate them properly.
@@ -393,6 +460,111 @@ class DatabaseManager:
                 WHERE disclosure_id IS NOT NULL
             ''').format(sql.Identifier(self.schema)))
 
+            # Keyset pagination for /reports/kap listings (see api/routers/reports.py):
+            # newest first on (disclosure_date, scraped_at, id) with NULLs sorting last.
+            cursor.execute(sql.SQL('''
+                CREATE INDEX IF NOT EXISTS idx_kap_disclosures_keyset
+                ON {}.kap_disclosures (
+                    (COALESCE(disclosure_date, '-infinity'::date)) DESC,
+                    (COALESCE(scraped_at, '-infinity'::timestamp)) DESC,
+                    id DESC
+                )
+            ''').format(sql.Identifier(self.schema)))
+
+            # Trigram index for company_name ILIKE '%x%' searches. pg_trgm may need
+            # privileges the app role lacks, so failure only loses the index.
+            cursor.execute("SAVEPOINT kap_disclosures_trgm")
+            try:
+                cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+                cursor.execute(sql.SQL('''
+                    CREATE INDEX IF NOT EXISTS idx_kap_disclosures_company_trgm
+                    ON {}.kap_disclosures USING gin (company_name gin_trgm_ops)
+                ''').format(sql.Identifier(self.schema)))
+                cursor.execute("RELEASE SAVEPOINT kap_disclosures_trgm")
+            except Exception as e:
+                cursor.execute("ROLLBACK TO SAVEPOINT kap_disclosures_trgm")
+                logger.warning(f"pg_trgm unavailable, company-name search stays unindexed: {e}")
+
+            # --- Daily KAP sentiment rollup ---------------------------------
+            # /sentiment/overview, /sentiment/trends and the external overview read
+            # these per (day, company, sentiment) sums instead of re-aggregating
+            # kap_disclosure_sentiment JOIN kap_disclosures per request. Sentiment is
+            # written from several modules, so triggers record touched days in
+            # kap_sentiment_daily_dirty and refresh_sentiment_rollups() recomputes them.
+            cursor.execute(sql.SQL('''
+                CREATE TABLE IF NOT EXISTS {}.kap_sentiment_daily (
+                    day DATE NOT NULL,
+                    company_name VARCHAR(255) NOT NULL DEFAULT '',
+                    overall_sentiment VARCHAR(20) NOT NULL DEFAULT '',
+                    analyses INTEGER NOT NULL,
+                    sentiment_score_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+                    sentiment_score_n INTEGER NOT NULL DEFAULT 0,
+                    confidence_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+                    confidence_n INTEGER NOT NULL DEFAULT 0,
+                    latest_at TIMESTAMP,
+                    refreshed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (day, company_name, overall_sentiment)
+                )
+            ''').format(sql.Identifier(self.schema)))
+            cursor.execute(sql.SQL('''
+                CREATE TABLE IF NOT EXISTS {}.kap_sentiment_daily_dirty (
+                    day DATE PRIMARY KEY
+                )
+            ''').format(sql.Identifier(self.schema)))
+            cursor.execute(sql.SQL('''
+                CREATE INDEX IF NOT EXISTS idx_kap_disclosure_sentiment_day
+                ON {}.kap_disclosure_sentiment ((DATE(COALESCE(created_at, analyzed_at))))
+            ''').format(sql.Identifier(self.schema)))
+            cursor.execute(sql.SQL('''
+                CREATE OR REPLACE FUNCTION {schema}.mark_kap_sentiment_day_dirty()
+                RETURNS trigger AS $$
+                BEGIN
+                    IF TG_OP IN ('UPDATE', 'DELETE')
+                       AND COALESCE(OLD.created_at, OLD.analyzed_at) IS NOT NULL THEN
+                        INSERT INTO {schema}.kap_sentiment_daily_dirty (day)
+                        VALUES (DATE(COALESCE(OLD.created_at, OLD.analyzed_at)))
+                        ON CONFLICT DO NOTHING;
+                    END IF;
+                    IF TG_OP IN ('INSERT', 'UPDATE')
+                       AND COALESCE(NEW.created_at, NEW.analyzed_at) IS NOT NULL THEN
+                        INSERT INTO {schema}.kap_sentiment_daily_dirty (day)
+                        VALUES (DATE(COALESCE(NEW.created_at, NEW.analyzed_at)))
+                        ON CONFLICT DO NOTHING;
+                    END IF;
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql
+            ''').format(schema=sql.Identifier(self.schema)))
+            cursor.execute(sql.SQL('''
+                DROP TRIGGER IF EXISTS trg_kap_sentiment_day_dirty ON {schema}.kap_disclosure_sentiment;
+                CREATE TRIGGER trg_kap_sentiment_day_dirty
+                AFTER INSERT OR UPDATE OR DELETE ON {schema}.kap_disclosure_sentiment
+                FOR EACH ROW EXECUTE FUNCTION {schema}.mark_kap_sentiment_day_dirty()
+            ''').format(schema=sql.Identifier(self.schema)))
+            # A renamed company moves its rows to another rollup key.
+            cursor.execute(sql.SQL('''
+                CREATE OR REPLACE FUNCTION {schema}.mark_kap_company_days_dirty()
+                RETURNS trigger AS $$
+                BEGIN
+                    INSERT INTO {schema}.kap_sentiment_daily_dirty (day)
+                    SELECT DISTINCT DATE(COALESCE(s.created_at, s.analyzed_at))
+                    FROM {schema}.kap_disclosure_sentiment s
+                    WHERE s.disclosure_id = NEW.id
+                      AND COALESCE(s.created_at, s.analyzed_at) IS NOT NULL
+                    ON CONFLICT DO NOTHING;
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql
+            ''').format(schema=sql.Identifier(self.schema)))
+            cursor.execute(sql.SQL('''
+                DROP TRIGGER IF EXISTS trg_kap_company_days_dirty ON {schema}.kap_disclosures;
+                CREATE TRIGGER trg_kap_company_days_dirty
+                AFTER UPDATE OF company_name ON {schema}.kap_disclosures
+                FOR EACH ROW
+                WHEN (OLD.company_name IS DISTINCT FROM NEW.company_name)
+                EXECUTE FUNCTION {schema}.mark_kap_company_days_dirty()
+            ''').format(schema=sql.Identifier(self.schema)))
+
             # --- KAP platform-level news (SPK/MKK/BIS announcements) -------
             # These are not company disclosures but regulatory/platform news that
             # affects whole sectors or the market. Separate table to keep company
@@ -662,43 +834,219 @@ class DatabaseManager:
         """Raised when connection pool is exhausted"""
         pass
 
+    def _init_pool_metrics(self, size: int) -> None:
+        """Set up the checkout gate and counters reported by :meth:`pool_stats`.
+
+        psycopg2 pools raise as soon as every connection is checked out; the
+        semaphore makes callers queue for a free connection (up to
+        ``config.database.pool_timeout`` seconds) instead of failing immediately.
+        """
+        self._pool_size = size
+        self._pool_slots = threading.BoundedSemaphore(size)
+        self._pool_lock = threading.Lock()
+        self._checked_out: set = set()
+        self._pool_counters: Dict[str, float] = {
+            "acquired": 0, "waited": 0, "timeouts": 0, "discarded": 0,
+            "peak_in_use": 0, "wait_ms_total": 0.0,
+        }
+
     def get_connection(self):
         """Get a connection from the pool and set search_path
 
-        Implements a short retry strategy when the pool is temporarily exhausted.
+        Waits for a free connection when the pool is busy.
         Raises:
-            PoolExhaustedError: if connections cannot be acquired after retries
+            PoolExhaustedError: if no connection frees up within the pool timeout
         """
-        retries = int(os.getenv("DB_CONN_RETRIES", "3"))
-        wait_ms = int(os.getenv("DB_CONN_WAIT_MS", "100"))
+        slots = getattr(self, "_pool_slots", None)
+        waited_ms = 0.0
+        if slots is not None and not slots.acquire(blocking=False):
+            started = time.perf_counter()
+            timeout = float(getattr(config.database, "pool_timeout", 5.0))
+            if not slots.acquire(timeout=timeout):
+                with self._pool_lock:
+                    self._pool_counters["timeouts"] += 1
+                logger.error(f"Connection pool exhausted after waiting {timeout:.1f}s")
+                raise DatabaseManager.PoolExhaustedError("connection pool exhausted")
+            waited_ms = (time.perf_counter() - started) * 1000
+
+        conn = None
+        try:
+            conn = self.pool.getconn()
+            # Set search_path for this connection to use our schema
+            cursor = conn.cursor()
+            cursor.execute(sql.SQL("SET search_path TO {}, public").format(
+                sql.Identifier(self.schema)
+            ))
+            cursor.close()
+        except pool.PoolError as e:
+            if slots is not None:
+                slots.release()
+            logger.error(f"Connection pool exhausted: {e}")
+            raise DatabaseManager.PoolExhaustedError("connection pool exhausted")
+        except Exception as e:
+            if conn is not None:
+                # Usually a connection the server already dropped: close it rather
+                # than leak it, so the pool can open a fresh one.
+                try:
+                    self.pool.putconn(conn, close=True)
+                except Exception as put_error:
+                    logger.error(f"Error discarding connection: {put_error}")
+                if slots is not None:
+                    with self._pool_lock:
+                        self._pool_counters["discarded"] += 1
+            if slots is not None:
+                slots.release()
+            logger.error(f"Error getting connection: {e}")
+            raise
 
-        for attempt in range(1, retries + 1):
-            try:
-                conn = self.pool.getconn()
-                # Set search_path for this connection to use our schema
-                cursor = conn.cursor()
-                cursor.execute(sql.SQL("SET search_path TO {}, public").format(
-                    sql.Identifier(self.schema)
-                ))
-                cursor.close()
-                return conn
-            except pool.PoolError as e:
-                logger.warning(f"Connection pool exhausted (attempt {attempt}/{retries}): {e}")
-                if attempt == retries:
-                    logger.error("Connection pool exhausted after retries")
-                    raise DatabaseManager.PoolExhaustedError("connection pool exhausted")
-                time.sleep(wait_ms / 1000.0)
-            except Exception as e:
-                logger.error(f"Error getting connection: {e}")
-                raise
+        if slots is not None:
+            with self._pool_lock:
+                self._checked_out.add(id(conn))
+                counters = self._pool_counters
+                counters["acquired"] += 1
+                counters["peak_in_use"] = max(counters["peak_in_use"], len(self._checked_out))
+                if waited_ms:
+                    counters["waited"] += 1
+                    counters["wait_ms_total"] += waited_ms
+        return conn
     
     def return_connection(self, conn):
-        """Return a connection to the pool"""
+        """Return a connection to the pool (closed connections are discarded)"""
+        closed = bool(getattr(conn, "closed", False))
         try:
-            self.pool.putconn(conn)
+            self.pool.putconn(conn, close=closed)
         except Exception as e:
             logger.error(f"Error returning connection: {e}")
+        finally:
+            slots = getattr(self, "_pool_slots", None)
+            if slots is not None:
+                with self._pool_lock:
+                    checked_out = id(conn) in self._checked_out
+                    self._checked_out.discard(id(conn))
+                    if closed:
+                        self._pool_counters["discarded"] += 1
+                if checked_out:
+                    slots.release()
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Snapshot of pool usage: size, in-use/available counts, waits and timeouts."""
+        if getattr(self, "_pool_slots", None) is None:
+            return {}
+        with self._pool_lock:
+            counters = dict(self._pool_counters)
+            in_use = len(self._checked_out)
+        waited = counters["waited"]
+        return {
+            "size": self._pool_size,
+            "in_use": in_use,
+            "available": self._pool_size - in_use,
+            "peak_in_use": int(counters["peak_in_use"]),
+            "acquired": int(counters["acquired"]),
+            "waited": int(waited),
+            "avg_wait_ms": round(counters["wait_ms_total"] / waited, 2) if waited else 0.0,
+            "timeouts": int(counters["timeouts"]),
+            "discarded": int(counters["discarded"]),
+        }
+
+    def health_check(self) -> Dict[str, Any]:
+        """Round-trip ``SELECT 1`` and report its latency with :meth:`pool_stats`.
+
+        Raises whatever :meth:`get_connection` or the query raises, so callers can
+        map pool exhaustion and connection errors to their own status strings.
+        """
+        started = time.perf_counter()
+        conn = self.get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            cursor.close()
+        finally:
+            self.return_connection(conn)
+        return {
+            "status": "connected",
+            "latency_ms": round((time.perf_counter() - started) * 1000, 2),
+            "pool": self.pool_stats(),
+        }
     
+    # ------------------------------------------------------------------
+    # Sentiment rollups
+    # ------------------------------------------------------------------
+
+    def refresh_sentiment_rollups(self, full: bool = False, wait: bool = False) -> Dict[str, Any]:
+        """
+        Bring kap_sentiment_daily up to date and return its freshness stamp.
+
+        Incremental runs recompute only the days the triggers marked dirty, so a
+        no-op refresh is one empty DELETE. ``full=True`` rebuilds every day from
+        history (the backfill path). Only one refresher runs at a time: with
+        ``wait=True`` the call blocks until the advisory lock is free, otherwise a
+        caller that finds it taken does nothing, reports the last completed refresh
+        and sets ``lock_busy``.
+
+        Returns ``{"refreshed_at", "days_refreshed", "pending_days", "lock_busy"}``.
+        """
+        schema = sql.Identifier(self.schema)
+        conn = self.get_connection()
+        try:
+            cursor = conn.cursor()
+            if wait:
+                cursor.execute("SELECT pg_advisory_xact_lock(hashtext('kap_sentiment_daily'))")
+                locked = True
+            else:
+                cursor.execute("SELECT pg_try_advisory_xact_lock(hashtext('kap_sentiment_daily'))")
+                locked = cursor.fetchone()[0]
+            days_refreshed = 0
+            if locked and full:
+                cursor.execute(sql.SQL("DELETE FROM {}.kap_sentiment_daily_dirty").format(schema))
+                cursor.execute(sql.SQL("TRUNCATE {}.kap_sentiment_daily").format(schema))
+                cursor.execute(
+                    sql.SQL(_ROLLUP_INSERT + _ROLLUP_SELECT).format(schema=schema, filter=sql.SQL(""))
+                )
+                cursor.execute(sql.SQL("SELECT COUNT(DISTINCT day) FROM {}.kap_sentiment_daily").format(schema))
+                days_refreshed = cursor.fetchone()[0]
+            elif locked:
+                cursor.execute(sql.SQL("DELETE FROM {}.kap_sentiment_daily_dirty RETURNING day").format(schema))
+                days = [row[0] for row in cursor.fetchall()]
+                if days:
+                    cursor.execute(
+                        sql.SQL("DELETE FROM {}.kap_sentiment_daily WHERE day = ANY(%s)").format(schema),
+                        (days,),
+                    )
+                    cursor.execute(
+                        sql.SQL(_ROLLUP_INSERT + _ROLLUP_SELECT).format(
+                            schema=schema,
+                            filter=sql.SQL("AND DATE(COALESCE(s.created_at, s.analyzed_at)) = ANY(%s)"),
+                        ),
+                        (days,),
+                    )
+                    days_refreshed = len(days)
+
+            # Holding the lock means the rollup is current as of this transaction;
+            # otherwise report when the concurrent refresher last wrote.
+            stamp = "CURRENT_TIMESTAMP" if locked else "(SELECT MAX(refreshed_at) FROM {schema}.kap_sentiment_daily)"
+            cursor.execute(
+                sql.SQL(
+                    "SELECT " + stamp + ", (SELECT COUNT(*) FROM {schema}.kap_sentiment_daily_dirty)"
+                ).format(schema=schema)
+            )
+            refreshed_at, pending_days = cursor.fetchone()
+            conn.commit()
+            if days_refreshed:
+                logger.info(f"Sentiment rollup refreshed for {days_refreshed} day(s) (full={full})")
+            return {
+                "refreshed_at": refreshed_at,
+                "days_refreshed": int(days_refreshed),
+                "pending_days": int(pending_days or 0),
+                "lock_busy": not locked,
+            }
+        except Exception as e:
+            logger.error(f"refresh_sentiment_rollups failed: {e}")
+            conn.rollback()
+            raise
+        finally:
+            self.return_connection(conn)
+
     def insert_data(
         self,
         table_name: str,
@@ -776,21 +1124,23 @@ class DatabaseManager:
             
             # Get columns from first item
             columns = list(data_list[0].keys())
-            
-            # Build INSERT query
-            query = sql.SQL(
-                "INSERT INTO {}.{} ({}) VALUES ({}) "
-                "ON CONFLICT DO NOTHING"
-            ).format(
-                sql.Identifier(self.schema),
-                sql.Identifier(table_name),
-                sql.SQL(', ').join(map(sql.Identifier, columns)),
+            row_template = sql.SQL("({})").format(
                 sql.SQL(', ').join(sql.Placeholder() * len(columns))
             )
             
-            # Execute for each row
-            for data in data_list:
-                values = [data.get(col) for col in columns]
+            # One multi-row INSERT per chunk instead of one round trip per row
+            for start in range(0, len(data_list), BULK_UPSERT_CHUNK_SIZE):
+                chunk = data_list[start:start + BULK_UPSERT_CHUNK_SIZE]
+                query = sql.SQL(
+                    "INSERT INTO {}.{} ({}) VALUES {} "
+                    "ON CONFLICT DO NOTHING"
+                ).format(
+                    sql.Identifier(self.schema),
+                    sql.Identifier(table_name),
+                    sql.SQL(', ').join(map(sql.Identifier, columns)),
+                    sql.SQL(', ').join([row_template] * len(chunk))
+                )
+                values = [data.get(col) for data in chunk for col in columns]
                 cursor.execute(query, values)
             
             conn.commit()
@@ -879,12 +1229,7 @@ class DatabaseManager:
         conn = self.get_connection()
         try:
             cursor = conn.cursor()
-            cols = [
-                "disclosure_id", "stock_code", "company_name", "disclosure_type",
-                "disclosure_date", "timestamp", "has_attachment", "detail_url",
-                "pdf_url", "content", "data", "subject", "subject_code", "is_late",
-            ]
-            row = {c: data.get(c) for c in cols}
+            row = {c: data.get(c) for c in _DISCLOSURE_COLUMNS}
             row["data"] = Json(row["data"]) if isinstance(row["data"], (dict, list)) else row["data"]
 
             non_null = {k: v for k, v in row.items() if v is not None}
@@ -1028,9 +1373,7 @@ class DatabaseManager:
         conn = self.get_connection()
         try:
             cursor = conn.cursor()
-            cols = ["news_id", "news_category", "title", "content",
-                    "publish_date", "source_url", "data"]
-            row = {c: data.get(c) for c in cols if data.get(c) is not None}
+            row = _present(data, _NEWS_COLUMNS)
             if not row.get("news_id") or not row.get("title"):
                 return None
 
@@ -1072,9 +1415,7 @@ class DatabaseManager:
         conn = self.get_connection()
         try:
             cursor = conn.cursor()
-            cols = ["article_id", "source", "ticker", "headline",
-                    "body", "url", "published_at"]
-            row = {c: data.get(c) for c in cols if data.get(c) is not None}
+            row = _present(data, _NEWS_ARTICLE_COLUMNS)
             if not row.get("article_id") or not row.get("headline"):
                 return None
 
@@ -1113,11 +1454,7 @@ class DatabaseManager:
         conn = self.get_connection()
         try:
             cursor = conn.cursor()
-            row: Dict[str, Any] = {"article_id": article_id}
-            for col in ("overall_sentiment", "sentiment_score", "confidence",
-                        "key_drivers", "tone_descriptors", "analyzer"):
-                if data.get(col) is not None:
-                    row[col] = data[col]
+            row: Dict[str, Any] = {"article_id": article_id, **_present(data, _NEWS_SENTIMENT_COLUMNS)}
 
             set_clause = sql.SQL(", ").join(
                 sql.SQL("{} = EXCLUDED.{}").format(sql.Identifier(k), sql.Identifier(k))
@@ -1152,10 +1489,7 @@ class DatabaseManager:
         conn = self.get_connection()
         try:
             cursor = conn.cursor()
-            cols = ["ticker", "period_date", "news_score", "news_count",
-                    "social_score", "social_count", "youtube_score", "youtube_count",
-                    "combined_score"]
-            row = {c: data.get(c) for c in cols if data.get(c) is not None}
+            row = _present(data, _AGGREGATE_COLUMNS)
             if not row.get("ticker") or not row.get("period_date"):
                 return False
             row["computed_at"] = datetime.now()
@@ -1192,9 +1526,7 @@ class DatabaseManager:
         conn = self.get_connection()
         try:
             cursor = conn.cursor()
-            cols = ["post_id", "platform", "ticker", "text",
-                    "author", "posted_at", "likes", "retweets"]
-            row = {c: data.get(c) for c in cols if data.get(c) is not None}
+            row = _present(data, _SOCIAL_POST_COLUMNS)
             if not row.get("post_id") or not row.get("text"):
                 return None
 
@@ -1228,10 +1560,7 @@ class DatabaseManager:
         conn = self.get_connection()
         try:
             cursor = conn.cursor()
-            row: Dict[str, Any] = {"post_id": post_id}
-            for col in ("overall_sentiment", "sentiment_score", "confidence", "analyzer"):
-                if data.get(col) is not None:
-                    row[col] = data[col]
+            row: Dict[str, Any] = {"post_id": post_id, **_present(data, _SENTIMENT_COLUMNS)}
 
             set_clause = sql.SQL(", ").join(
                 sql.SQL("{} = EXCLUDED.{}").format(sql.Identifier(k), sql.Identifier(k))
@@ -1267,6 +1596,26 @@ class DatabaseManager:
         )
         return rows[0] if rows else None
 
+    def get_aggregated_ticker_sentiment_many(
+        self, keys: List[Tuple[str, Any]]
+    ) -> Dict[Tuple[str, Any], Optional[Dict[str, Any]]]:
+        """
+        Batched :meth:`get_aggregated_ticker_sentiment` over ``(ticker, period_date)``
+        pairs, in one query. Returns a dict keyed by the input pairs (None if missing).
+        """
+        if not keys:
+            return {}
+        rows = self.query(
+            "SELECT a.ticker, a.period_date, a.news_score, a.news_count, a.social_score, "
+            "a.social_count, a.youtube_score, a.youtube_count, a.combined_score "
+            "FROM aggregated_ticker_sentiment a "
+            "JOIN unnest(%s::text[], %s::date[]) AS k(ticker, period_date) "
+            "ON a.ticker = k.ticker AND a.period_date = k.period_date",
+            ([t.strip().upper() for t, _ in keys], [d for _, d in keys]),
+        )
+        found = {(row["ticker"], row["period_date"]): row for row in rows}
+        return {(t, d): found.get((t.strip().upper(), d)) for t, d in keys}
+
     def get_source_refresh_cache(
         self, ticker: str, max_age_seconds: int
     ) -> Dict[str, Dict[str, Any]]:
@@ -1493,10 +1842,7 @@ class DatabaseManager:
         conn = self.get_connection()
         try:
             cursor = conn.cursor()
-            cols = ["video_id", "channel", "title", "url", "transcript",
-                    "transcript_method", "transcript_status", "transcript_attempted_at",
-                    "published_at", "duration", "lang"]
-            row = {c: data.get(c) for c in cols if data.get(c) is not None}
+            row = _present(data, _YOUTUBE_VIDEO_COLUMNS)
             if not row.get("video_id"):
                 return None
 
@@ -1532,10 +1878,11 @@ class DatabaseManager:
         conn = self.get_connection()
         try:
             cursor = conn.cursor()
-            row: Dict[str, Any] = {"video_id": video_db_id, "ticker": ticker.strip().upper()}
-            for col in ("overall_sentiment", "sentiment_score", "confidence", "analyzer"):
-                if data.get(col) is not None:
-                    row[col] = data[col]
+            row: Dict[str, Any] = {
+                "video_id": video_db_id,
+                "ticker": ticker.strip().upper(),
+                **_present(data, _SENTIMENT_COLUMNS),
+            }
 
             set_clause = sql.SQL(", ").join(
                 sql.SQL("{} = EXCLUDED.{}").format(sql.Identifier(k), sql.Identifier(k))
@@ -1561,3 +1908,256 @@ class DatabaseManager:
             return False
         finally:
             self.return_connection(conn)
+
+    # ------------------------------------------------------------------
+    # Set-based bulk upserts
+    # ------------------------------------------------------------------
+
+    def _bulk_upsert(
+        self,
+        cursor,
+        table: str,
+        rows: List[Dict[str, Any]],
+        conflict: Tuple[str, ...],
+        returning: bool = False,
+        touch: Optional[str] = None,
+    ) -> Dict[tuple, int]:
+        """
+        Write ``rows`` with multi-row ``INSERT ... ON CONFLICT`` statements on ``cursor``.
+
+        Postgres refuses to update the same row twice in one statement, so rows sharing
+        a conflict key are merged first (later non-null values win, exactly like
+        repeated single-row upserts). Rows are then grouped by column set so partial
+        rows never null out stored values, and each group is sent in chunks of
+        ``BULK_UPSERT_CHUNK_SIZE``. ``touch`` names a timestamp column bumped on update.
+
+        Returns ``{conflict key (as str tuple): id}`` when ``returning`` is set.
+        """
+        merged: Dict[tuple, Dict[str, Any]] = {}
+        for row in rows:
+            key = tuple(row[c] for c in conflict)
+            merged[key] = {**merged[key], **row} if key in merged else row
+
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = defaultdict(list)
+        for row in merged.values():
+            groups[tuple(sorted(row))].append(row)
+
+        ids: Dict[tuple, int] = {}
+        for cols, group in groups.items():
+            updates = [
+                sql.SQL("{} = EXCLUDED.{}").format(sql.Identifier(c), sql.Identifier(c))
+                for c in cols if c not in conflict
+            ]
+            if touch:
+                updates.append(sql.SQL("{} = CURRENT_TIMESTAMP").format(sql.Identifier(touch)))
+            action = (
+                sql.SQL("DO UPDATE SET {}").format(sql.SQL(", ").join(updates))
+                if updates else sql.SQL("DO NOTHING")
+            )
+            returning_clause = (
+                sql.SQL(" RETURNING id, {}").format(
+                    sql.SQL(", ").join(sql.Identifier(c) for c in conflict)
+                )
+                if returning else sql.SQL("")
+            )
+            row_template = sql.SQL("({})").format(
+                sql.SQL(", ").join(sql.Placeholder() * len(cols))
+            )
+            for start in range(0, len(group), BULK_UPSERT_CHUNK_SIZE):
+                chunk = group[start:start + BULK_UPSERT_CHUNK_SIZE]
+                q = sql.SQL(
+                    "INSERT INTO {schema}.{table} ({cols}) VALUES {rows} "
+                    "ON CONFLICT ({conflict}) {action}{returning}"
+                ).format(
+                    schema=sql.Identifier(self.schema),
+                    table=sql.Identifier(table),
+                    cols=sql.SQL(", ").join(sql.Identifier(c) for c in cols),
+                    rows=sql.SQL(", ").join([row_template] * len(chunk)),
+                    conflict=sql.SQL(", ").join(sql.Identifier(c) for c in conflict),
+                    action=action,
+                    returning=returning_clause,
+                )
+                cursor.execute(q, [row[c] for row in chunk for c in cols])
+                if returning:
+                    for record in cursor.fetchall():
+                        ids[tuple(str(v) for v in record[1:])] = record[0]
+        return ids
+
+    def _upsert_many(
+        self,
+        name: str,
+        table: str,
+        rows: List[Dict[str, Any]],
+        conflict: Tuple[str, ...],
+        returning: bool = False,
+        touch: Optional[str] = None,
+    ) -> Tuple[Dict[tuple, int], Set[tuple]]:
+        """
+        Run :meth:`_bulk_upsert` in one transaction.
+
+        One bad row (an over-long value, an unparseable date) aborts the whole
+        statement, so a failed batch is rolled back and retried one row per
+        transaction: only the offending rows are lost, as with the single-row
+        helpers. Returns the RETURNING ids and the conflict keys (as str tuples) of
+        the rows that could not be written.
+        """
+        if not rows:
+            return {}, set()
+        conn = self.get_connection()
+        try:
+            try:
+                ids = self._bulk_upsert(
+                    conn.cursor(), table, rows, conflict, returning=returning, touch=touch
+                )
+                conn.commit()
+                return ids, set()
+            except Exception as e:
+                logger.warning(f"{name} failed for {len(rows)} rows, retrying row by row: {e}")
+                conn.rollback()
+
+            ids, failed = {}, set()
+            for row in rows:
+                key = tuple(str(row[c]) for c in conflict)
+                try:
+                    ids.update(self._bulk_upsert(
+                        conn.cursor(), table, [row], conflict, returning=returning, touch=touch
+                    ))
+                    conn.commit()
+                    failed.discard(key)
+                except Exception as e:
+                    logger.error(f"{name} failed for {key}: {e}")
+                    conn.rollback()
+                    failed.add(key)
+            return ids, failed
+        finally:
+            self.return_connection(conn)
+
+    @staticmethod
+    def _flags_in_input_order(
+        rows: List[Dict[str, Any]],
+        valid: List[bool],
+        conflict: Tuple[str, ...],
+        failed: Set[tuple],
+    ) -> List[bool]:
+        return [
+            ok and tuple(str(row[c]) for c in conflict) not in failed
+            for row, ok in zip(rows, valid)
+        ]
+
+    @staticmethod
+    def _ids_in_input_order(
+        rows: List[Dict[str, Any]],
+        valid: List[bool],
+        key: str,
+        ids: Dict[tuple, int],
+    ) -> List[Optional[int]]:
+        return [ids.get((str(row[key]),)) if ok else None for row, ok in zip(rows, valid)]
+
+    def upsert_disclosure_many(self, items: List[Dict[str, Any]]) -> List[bool]:
+        """Batched :meth:`upsert_disclosure`: one transaction, flags in input order."""
+        rows = [_wrap_json(_present(d, _DISCLOSURE_COLUMNS)) for d in items]
+        valid = [bool(r.get("disclosure_id")) for r in rows]
+        _, failed = self._upsert_many(
+            "upsert_disclosure_many", "kap_disclosures",
+            [r for r, v in zip(rows, valid) if v], ("disclosure_id",),
+        )
+        return self._flags_in_input_order(rows, valid, ("disclosure_id",), failed)
+
+    def upsert_news_many(self, items: List[Dict[str, Any]]) -> List[Optional[int]]:
+        """Batched :meth:`upsert_news`. Returns row ids in input order (None if skipped)."""
+        rows = [_wrap_json(_present(d, _NEWS_COLUMNS)) for d in items]
+        valid = [bool(r.get("news_id") and r.get("title")) for r in rows]
+        ids, _ = self._upsert_many(
+            "upsert_news_many", "kap_news",
+            [r for r, v in zip(rows, valid) if v], ("news_id",), returning=True,
+        )
+        return self._ids_in_input_order(rows, valid, "news_id", ids)
+
+    def upsert_news_article_many(self, items: List[Dict[str, Any]]) -> List[Optional[int]]:
+        """Batched :meth:`upsert_news_article`. Returns row ids in input order (None if skipped)."""
+        rows = [_present(d, _NEWS_ARTICLE_COLUMNS) for d in items]
+        valid = [bool(r.get("article_id") and r.get("headline")) for r in rows]
+        ids, _ = self._upsert_many(
+            "upsert_news_article_many", "news_articles",
+            [r for r, v in zip(rows, valid) if v], ("article_id",),
+            returning=True, touch="scraped_at",
+        )
+        return self._ids_in_input_order(rows, valid, "article_id", ids)
+
+    def upsert_news_article_sentiment_many(
+        self, items: List[Tuple[int, Dict[str, Any]]]
+    ) -> List[bool]:
+        """Batched :meth:`upsert_news_article_sentiment` over ``(article_id, data)`` pairs."""
+        rows = [
+            {"article_id": article_id, **_present(data, _NEWS_SENTIMENT_COLUMNS)}
+            for article_id, data in items
+        ]
+        _, failed = self._upsert_many(
+            "upsert_news_article_sentiment_many", "news_article_sentiment", rows, ("article_id",),
+        )
+        return self._flags_in_input_order(rows, [True] * len(rows), ("article_id",), failed)
+
+    def upsert_aggregated_ticker_sentiment_many(self, items: List[Dict[str, Any]]) -> List[bool]:
+        """Batched :meth:`upsert_aggregated_ticker_sentiment`: flags in input order."""
+        computed_at = datetime.now()
+        rows = [_present(d, _AGGREGATE_COLUMNS) for d in items]
+        valid = [bool(r.get("ticker") and r.get("period_date")) for r in rows]
+        _, failed = self._upsert_many(
+            "upsert_aggregated_ticker_sentiment_many", "aggregated_ticker_sentiment",
+            [{**r, "computed_at": computed_at} for r, v in zip(rows, valid) if v],
+            ("ticker", "period_date"),
+        )
+        return self._flags_in_input_order(rows, valid, ("ticker", "period_date"), failed)
+
+    def upsert_social_post_many(self, items: List[Dict[str, Any]]) -> List[Optional[int]]:
+        """Batched :meth:`upsert_social_post`. Returns row ids in input order (None if skipped)."""
+        rows = [_present(d, _SOCIAL_POST_COLUMNS) for d in items]
+        valid = [bool(r.get("post_id") and r.get("text")) for r in rows]
+        ids, _ = self._upsert_many(
+            "upsert_social_post_many", "social_media_posts",
+            [r for r, v in zip(rows, valid) if v], ("post_id",),
+            returning=True, touch="scraped_at",
+        )
+        return self._ids_in_input_order(rows, valid, "post_id", ids)
+
+    def upsert_social_post_sentiment_many(
+        self, items: List[Tuple[int, Dict[str, Any]]]
+    ) -> List[bool]:
+        """Batched :meth:`upsert_social_post_sentiment` over ``(post_id, data)`` pairs."""
+        rows = [
+            {"post_id": post_id, **_present(data, _SENTIMENT_COLUMNS)}
+            for post_id, data in items
+        ]
+        _, failed = self._upsert_many(
+            "upsert_social_post_sentiment_many", "social_media_sentiment", rows, ("post_id",),
+        )
+        return self._flags_in_input_order(rows, [True] * len(rows), ("post_id",), failed)
+
+    def upsert_youtube_video_many(self, items: List[Dict[str, Any]]) -> List[Optional[int]]:
+        """Batched :meth:`upsert_youtube_video`. Returns row ids in input order (None if skipped)."""
+        rows = [_present(d, _YOUTUBE_VIDEO_COLUMNS) for d in items]
+        valid = [bool(r.get("video_id")) for r in rows]
+        ids, _ = self._upsert_many(
+            "upsert_youtube_video_many", "youtube_videos",
+            [r for r, v in zip(rows, valid) if v], ("video_id",),
+            returning=True, touch="scraped_at",
+        )
+        return self._ids_in_input_order(rows, valid, "video_id", ids)
+
+    def upsert_youtube_video_sentiment_many(
+        self, items: List[Tuple[int, str, Dict[str, Any]]]
+    ) -> List[bool]:
+        """Batched :meth:`upsert_youtube_video_sentiment` over ``(video_db_id, ticker, data)``."""
+        rows = [
+            {
+                "video_id": video_db_id,
+                "ticker": ticker.strip().upper(),
+                **_present(data, _SENTIMENT_COLUMNS),
+            }
+            for video_db_id, ticker, data in items
+        ]
+        _, failed = self._upsert_many(
+            "upsert_youtube_video_sentiment_many", "youtube_video_sentiment",
+            rows, ("video_id", "ticker"),
+        )
+        return self._flags_in_input_order(rows, [True] * len(rows), ("video_id", "ticker"), failed)
@@ -145,41 +145,21 @@ STATIC_MEMBER_OID_MAP: dict[str, str] = {
 }
 
 
-def detect_instruments(text: str) -> List[str]:
+def detect_instruments(text: str, db_manager=None) -> List[str]:
     """
     Detect all BIST tickers mentioned in `text`.
 
-    Two-pass scan:
-      1. Uppercase \bTICKER\b regex match (handles captions that preserve the code).
-      2. Company-name substring match (lowercased), using STATIC_BIST_MAP patterns.
-         Primary for YouTube auto-captions which are mostly lowercase.
+    One pass of the compiled matcher (see instrument_matcher.py) covering:
+      1. Uppercase \bTICKER\b tokens (handles captions that preserve the code).
+      2. Company names / aliases after Turkish case folding — primary for YouTube
+         auto-captions, which are mostly lowercase and often unaccented.
 
-    Returns de-duplicated list in detection order.
+    With `db_manager`, active `bist_companies` names are matched too. Returns a
+    de-duplicated list: ticker tokens first, then names, each in order of appearance.
     """
-    import re
+    from infrastructure.contracts.instrument_matcher import get_instrument_matcher
 
-    found: list[str] = []
-    seen: set[str] = set()
-
-    def _add(ticker: str) -> None:
-        if ticker not in seen:
-            seen.add(ticker)
-            found.append(ticker)
-
-    # Pass 1: explicit uppercase ticker tokens in the original text
-    for ticker in STATIC_BIST_MAP:
-        if re.search(rf"\b{re.escape(ticker)}\b", text):
-            _add(ticker)
-
-    # Pass 2: company-name substrings (case-insensitive)
-    lower = text.lower()
-    for ticker, patterns in STATIC_BIST_MAP.items():
-        for pattern in patterns:
-            if pattern.lower() in lower:
-                _add(ticker)
-                break
-
-    return found
+    return get_instrument_matcher(db_manager).detect(text)
 
 
 def _normalize_instrument(instrument: str) -> str:
@@ -246,7 +226,7 @@ def resolve_name_patterns(
         return []
 
     code = _normalize_instrument(instrument)
-    patterns: List[str] = []
+    names: List[str] = []
 
     # 1. bist_companies table (code → name), if the DB is reachable.
     if db_manager is not None:
@@ -255,13 +235,47 @@ def resolve_name_patterns(
                 "SELECT name FROM bist_companies WHERE UPPER(code) = %s",
                 (code,),
             )
-            for row in rows:
-                name = (row.get("name") or "").strip()
-                if name:
-                    patterns.append(name)
+            names = [row.get("name") for row in rows]
         except Exception as e:  # pragma: no cover - defensive, DB optional
             logger.debug(f"bist_companies lookup failed for {code}: {e}")
 
+    return _merge_name_patterns(code, names)
+
+
+def resolve_name_patterns_many(
+    instruments: List[str],
+    market: str,
+    db_manager=None,
+) -> dict[str, List[str]]:
+    """
+    Batch form of :func:`resolve_name_patterns`, keyed by normalised instrument code.
+
+    Reads `bist_companies` once for the whole list (``UPPER(code) = ANY(%s)``) instead
+    of once per instrument. Unsupported markets resolve to an empty dict.
+    """
+    if not supports_market(market):
+        return {}
+
+    codes = list(dict.fromkeys(c for c in map(_normalize_instrument, instruments) if c))
+    names: dict[str, List[str]] = {code: [] for code in codes}
+    if db_manager is not None and codes:
+        try:
+            rows = db_manager.query(
+                "SELECT UPPER(code) AS code, name FROM bist_companies WHERE UPPER(code) = ANY(%s)",
+                (codes,),
+            )
+            for row in rows:
+                names.setdefault(row.get("code"), []).append(row.get("name"))
+        except Exception as e:  # pragma: no cover - defensive, DB optional
+            logger.debug(f"bist_companies batch lookup failed: {e}")
+
+    return {code: _merge_name_patterns(code, names.get(code, [])) for code in codes}
+
+
+def _merge_name_patterns(code: str, db_names: List[Optional[str]]) -> List[str]:
+    """Combine `bist_companies` names with the fallbacks below, de-duplicated."""
+    patterns = [name.strip() for name in db_names if (name or "").strip()]
+
     # 2. static fallback map.
     static = STATIC_BIST_MAP.get(code)
     if static:
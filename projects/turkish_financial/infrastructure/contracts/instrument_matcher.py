@@ -0,0 +1,238 @@
+"""
+Compiled BIST instrument matcher — one pass over the text for every ticker and name.
+
+Tagging used to loop over every ticker in STATIC_BIST_MAP, running a fresh
+``re.search(rf"\\b{ticker}\\b")`` per ticker and then a substring check per company
+name: O(tickers × text) per article or transcript. This module compiles the catalogue
+once into two trie-shaped regexes (a prefix trie rendered as nested alternations, so
+the regex engine walks it like an Aho-Corasick goto function):
+
+  * ticker codes, matched as whole words on the original text;
+  * company names / aliases, matched on Turkish-folded text (``fold_turkish``), so
+    "TÜRK HAVA YOLLARI", "Türk Hava Yolları" and "turk hava yollari" are the same.
+
+Names must start at a word boundary (no "bim" inside "ibim") but may carry Turkish
+suffixes ("akbank'ın", "akbankın"). Overlapping names are all reported.
+
+Codes only match case-insensitively (``ignore_case_tickers``) when they come from the
+curated STATIC_BIST_MAP: the full ``bist_companies`` list holds codes that are also
+ordinary words ("Altın" → ALTIN, "Konya" → KONYA), so DB codes must be upper case.
+
+Compiled matchers are cached process-wide, one per catalogue source (static only, or
+merged with the DB). When a ``db_manager`` is passed, active ``bist_companies`` rows
+are merged into the catalogue and a cheap fingerprint of the table is re-checked at
+most every ``_FINGERPRINT_TTL_SECONDS``; a changed table rebuilds that matcher on the
+next call.
+"""
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# "İ".lower() is two code points ("i" + combining dot); replace it first so folding
+# keeps every character at its original offset and match positions stay valid.
+# Chained str.replace is much faster than str.translate on transcript-sized text.
+_TR_ASCII = tuple(zip("ıçğöşüâîû", "icgosuaiu"))
+
+_FINGERPRINT_TTL_SECONDS = 60.0
+_FINGERPRINT_SQL = (
+    "SELECT COUNT(*) AS n, md5(string_agg(UPPER(code) || ':' || COALESCE(name, ''), ',' "
+    "ORDER BY code)) AS digest FROM bist_companies WHERE is_active"
+)
+_COMPANIES_SQL = "SELECT UPPER(code) AS code, name FROM bist_companies WHERE is_active"
+
+
+def fold_turkish(text: str) -> str:
+    """Lower-case with Turkish rules and drop diacritics, preserving length."""
+    folded = text.replace("İ", "i").lower()
+    for src, dst in _TR_ASCII:
+        if src in folded:
+            folded = folded.replace(src, dst)
+    return folded
+
+
+def _trie_regex(words: Sequence[str]) -> str:
+    """Render ``words`` as a prefix-trie regex that prefers the longest match."""
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def emit(node: Dict[str, Any]) -> str:
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return "(?:" + body + ")?" if "" in node else body
+
+    return emit(trie)
+
+
+@dataclass(frozen=True)
+class InstrumentMatch:
+    """One instrument reference in a text: ``text[start:end]`` names ``ticker``."""
+
+    ticker: str
+    start: int
+    end: int
+    via: str  # "ticker" (the code itself) or "name" (company name / alias)
+
+
+class InstrumentMatcher:
+    """
+    Precompiled ticker + company-name matcher over a ``{code: [names]}`` catalogue.
+
+    ``ignore_case_codes`` limits which codes ``ignore_case_tickers`` may match in
+    lower or title case; by default every code may.
+    """
+
+    def __init__(
+        self,
+        catalogue: Mapping[str, Sequence[str]],
+        ignore_case_codes: Optional[Iterable[str]] = None,
+    ):
+        self.codes = frozenset(code.upper() for code in catalogue)
+        self.ignore_case_codes = (
+            self.codes if ignore_case_codes is None
+            else frozenset(code.upper() for code in ignore_case_codes) & self.codes
+        )
+        self._names: Dict[str, List[str]] = {}
+        for code, names in catalogue.items():
+            for name in names:
+                folded = fold_turkish((name or "").strip())
+                if folded and code.upper() not in self._names.get(folded, []):
+                    self._names.setdefault(folded, []).append(code.upper())
+
+        # The regex reports the longest name at each position; names that are
+        # prefixes of it ("koza" in "koza altın") match there as well.
+        lengths = sorted({len(name) for name in self._names})
+        self._codes_at: Dict[str, List[str]] = {}
+        for name in self._names:
+            codes: List[str] = []
+            for size in lengths:
+                if size > len(name):
+                    break
+                codes.extend(c for c in self._names.get(name[:size], []) if c not in codes)
+            self._codes_at[name] = codes
+
+        tickers = _trie_regex(sorted(self.codes))
+        self._ticker_re = re.compile(rf"\b{tickers}\b") if tickers else None
+        ci_tickers = _trie_regex(sorted(self.ignore_case_codes))
+        self._ticker_re_ci = re.compile(rf"\b{ci_tickers}\b", re.IGNORECASE) if ci_tickers else None
+        names = _trie_regex(sorted(self._names))
+        # Zero-width lookahead so overlapping names ("türkiye iş bankası" and
+        # "iş bankası") are each reported, like the substring scan they replace.
+        self._name_re = re.compile(rf"(?<!\w)(?=({names}))") if names else None
+
+    def find_all(self, text: str, ignore_case_tickers: bool = False) -> List[InstrumentMatch]:
+        """Every ticker and name reference in ``text``, ordered by position."""
+        if not text:
+            return []
+        matches: List[InstrumentMatch] = []
+        if self._ticker_re is not None:
+            for m in self._ticker_re.finditer(text):
+                matches.append(InstrumentMatch(m.group(0), m.start(), m.end(), "ticker"))
+        if ignore_case_tickers and self._ticker_re_ci is not None:
+            exact = {m.start for m in matches}
+            for m in self._ticker_re_ci.finditer(text):
+                if m.start() not in exact:
+                    matches.append(InstrumentMatch(m.group(0).upper(), m.start(), m.end(), "ticker"))
+        if self._name_re is not None:
+            for m in self._name_re.finditer(fold_turkish(text)):
+                name = m.group(1)
+                for code in self._codes_at[name]:
+                    matches.append(InstrumentMatch(code, m.start(), m.start() + len(name), "name"))
+        matches.sort(key=lambda match: (match.start, match.via != "ticker"))
+        return matches
+
+    def detect(self, text: str, ignore_case_tickers: bool = False) -> List[str]:
+        """
+        Distinct tickers mentioned in ``text``: explicit codes first, then names,
+        each in order of first appearance.
+        """
+        matches = self.find_all(text, ignore_case_tickers)
+        ordered = [m.ticker for m in matches if m.via == "ticker"]
+        ordered += [m.ticker for m in matches if m.via == "name"]
+        return list(dict.fromkeys(ordered))
+
+
+_lock = threading.Lock()
+# Catalogue source ("static" / "db") → (matcher, table fingerprint, last check).
+_cached: Dict[str, Tuple[InstrumentMatcher, Optional[Tuple[Any, ...]], float]] = {}
+
+
+def get_instrument_matcher(db_manager=None) -> InstrumentMatcher:
+    """
+    Return the process-wide matcher for the catalogue source, building or
+    rebuilding it when needed.
+
+    Without ``db_manager`` the static catalogue is used. With one, ``bist_companies``
+    names are merged in and the table fingerprint is re-checked at most once per
+    ``_FINGERPRINT_TTL_SECONDS``; DB errors keep the current matcher.
+    """
+    source = "static" if db_manager is None else "db"
+    now = time.monotonic()
+    entry = _cached.get(source)
+    if entry is not None and (db_manager is None or now - entry[2] < _FINGERPRINT_TTL_SECONDS):
+        return entry[0]
+
+    with _lock:
+        entry = _cached.get(source)
+        if entry is not None and (db_manager is None or now - entry[2] < _FINGERPRINT_TTL_SECONDS):
+            return entry[0]
+        fingerprint = _fingerprint(db_manager)
+        if entry is None or (fingerprint is not None and fingerprint != entry[1]):
+            matcher = _build(db_manager if fingerprint else None)
+            logger.info("Instrument matcher built for %d tickers (%s)", len(matcher.codes), source)
+        else:
+            matcher, fingerprint = entry[0], entry[1]
+        _cached[source] = (matcher, fingerprint, now)
+        return matcher
+
+
+def invalidate_instrument_matcher() -> None:
+    """Drop the cached matchers; the next call rebuilds them (e.g. after a catalogue sync)."""
+    with _lock:
+        _cached.clear()
+
+
+def _fingerprint(db_manager) -> Optional[Tuple[Any, ...]]:
+    if db_manager is None:
+        return None
+    try:
+        rows = db_manager.query(_FINGERPRINT_SQL)
+    except Exception as e:  # noqa: BLE001 - DB optional, static catalogue still works
+        logger.debug(f"bist_companies fingerprint failed: {e}")
+        return None
+    if not rows or not rows[0].get("n"):
+        return None
+    return (rows[0].get("n"), rows[0].get("digest"))
+
+
+def _build(db_manager) -> InstrumentMatcher:
+    from infrastructure.contracts.instrument_identity_map import STATIC_BIST_MAP
+
+    return InstrumentMatcher(_catalogue(db_manager), ignore_case_codes=STATIC_BIST_MAP)
+
+
+def _catalogue(db_manager) -> Dict[str, List[str]]:
+    from infrastructure.contracts.instrument_identity_map import STATIC_BIST_MAP
+
+    catalogue = {code: list(names) for code, names in STATIC_BIST_MAP.items()}
+    if db_manager is not None:
+        try:
+            for row in db_manager.query(_COMPANIES_SQL):
+                code = (row.get("code") or "").strip().upper()
+                if code:
+                    catalogue.setdefault(code, []).append(row.get("name") or "")
+        except Exception as e:  # noqa: BLE001 - fall back to the static names
+            logger.debug(f"bist_companies load failed: {e}")
+    return catalogue
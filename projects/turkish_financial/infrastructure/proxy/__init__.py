@@ -6,6 +6,7 @@ from .providers import (
     FirecrawlProxyProvider,
     get_proxy_provider,
 )
+from .transport import PooledTransport, close_transports, get_transport
 
 __all__ = [
     "ProxyProvider",
@@ -13,4 +14,7 @@ __all__ = [
     "ScraperAPIProvider",
     "FirecrawlProxyProvider",
     "get_proxy_provider",
+    "PooledTransport",
+    "get_transport",
+    "close_transports",
 ]
@@ -0,0 +1,117 @@
+"""
+Process-wide pooled HTTP transports, one per proxy provider.
+
+Direct-HTTP call sites (the Firecrawl ``bypassProxy`` raw scrape, the ScraperAPI
+fallbacks in ``kap_scraper``) used to open a fresh ``requests`` connection per call,
+paying a TCP + TLS handshake to kap.org.tr or the Firecrawl API every time. They now
+share a ``requests.Session`` per provider whose connection pool keeps sockets (and
+their TLS sessions) alive between calls.
+
+``requests`` is kept on purpose: the ScraperAPI fallbacks exist for the cases where
+aiohttp's proxy auth fails, so they must keep the same client stack. Async callers
+use :meth:`PooledTransport.arequest`, which runs the blocking call in a thread.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+from .providers import ProxyProvider
+
+logger = logging.getLogger(__name__)
+
+
+class PooledTransport:
+    """Lazily created, thread-safe pooled ``requests`` session bound to a provider."""
+
+    def __init__(
+        self,
+        provider: ProxyProvider,
+        *,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+    ) -> None:
+        self.provider = provider
+        self.pool_connections = pool_connections
+        # Upper bound of kept-alive connections per host (kap.org.tr, Firecrawl API, ...)
+        self.pool_maxsize = pool_maxsize
+        self._session: Optional[requests.Session] = None
+        self._lock = threading.Lock()
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=0,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        proxies = self.provider.requests_proxies()
+        if proxies:
+            session.proxies.update(proxies)
+        session.verify = self.provider.verify_tls()
+        if not session.verify:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        with self._lock:
+            if self._session is None:
+                self._session = self._create_session()
+            return self._session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request over the pooled session (blocking)."""
+        return self.session.request(method, url, **kwargs)
+
+    async def arequest(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request over the pooled session without blocking the event loop."""
+        return await asyncio.to_thread(self.request, method, url, **kwargs)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+_transports: Dict[str, PooledTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def _transport_key(provider: ProxyProvider) -> str:
+    return f"{provider.name}|{provider.aiohttp_proxy() or ''}"
+
+
+def get_transport(provider: ProxyProvider, **pool_options: Any) -> PooledTransport:
+    """
+    Return the shared transport for ``provider``, creating it on first use.
+
+    Providers with the same backend and proxy URL share one transport; ``pool_options``
+    only apply when the transport is created.
+    """
+    key = _transport_key(provider)
+    with _transports_lock:
+        transport = _transports.get(key)
+        if transport is None:
+            transport = PooledTransport(provider, **pool_options)
+            _transports[key] = transport
+            logger.debug("Created pooled transport for proxy provider %s", provider.name)
+        return transport
+
+
+def close_transports() -> None:
+    """Close every shared transport (e.g. on application shutdown)."""
+    with _transports_lock:
+        transports = list(_transports.values())
+        _transports.clear()
+    for transport in transports:
+        transport.close()
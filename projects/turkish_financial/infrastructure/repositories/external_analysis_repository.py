@@ -21,7 +21,10 @@ from domain.entities.external_analysis import (
     RiskLevel,
     derive_score,
 )
-from infrastructure.contracts.instrument_identity_map import resolve_name_patterns
+from infrastructure.contracts.instrument_identity_map import (
+    resolve_name_patterns,
+    resolve_name_patterns_many,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -142,6 +145,62 @@ class ExternalAnalysisRepository:
 
         return self._envelope(instrument, market, rows[0])
 
+    # ── batch point query (§6.2) ─────────────────────────────────────────────
+    def get_points(
+        self, instruments: List[str], market: str, as_of: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Latest sentiment at/<= as_of for every instrument, in one query.
+
+        Same matching as :meth:`get_point` (stock_code or any company_name pattern),
+        but the (instrument, pattern) pairs are passed as arrays and joined against
+        the disclosures, with ``DISTINCT ON`` picking each instrument's newest row.
+        Returns one envelope per input instrument, in input order.
+        """
+        patterns = resolve_name_patterns_many(instruments, market, db_manager=self._db)
+        idxs: List[int] = []
+        codes: List[str] = []
+        likes: List[str] = []
+        for idx, instrument in enumerate(instruments):
+            code = instrument.strip().upper()
+            for pat in patterns.get(code, []):
+                idxs.append(idx)
+                codes.append(code)
+                likes.append(f"%{pat}%")
+
+        rows_by_idx: Dict[int, Dict[str, Any]] = {}
+        if idxs:
+            params: List[Any] = [idxs, codes, likes]
+            as_of_clause = ""
+            if as_of:
+                as_of_clause = "WHERE COALESCE(s.created_at, s.analyzed_at, d.disclosure_date) <= %s"
+                params.append(as_of)
+            query = f"""
+                WITH wanted (batch_idx, stock_code, pattern) AS (
+                    SELECT * FROM unnest(%s::int[], %s::text[], %s::text[])
+                )
+                SELECT DISTINCT ON (w.batch_idx) w.batch_idx,
+                       s.overall_sentiment, s.sentiment_score, s.confidence,
+                       s.impact_horizon, s.key_drivers, s.risk_flags, s.key_sentiments,
+                       s.risk_level, s.tone_descriptors, s.sample_size, s.analyzer,
+                       COALESCE(s.created_at, s.analyzed_at, d.disclosure_date) AS effective_at
+                FROM wanted w
+                JOIN kap_disclosures d
+                  ON d.stock_code = w.stock_code OR d.company_name ILIKE w.pattern
+                JOIN kap_disclosure_sentiment s ON s.disclosure_id = d.id
+                {as_of_clause}
+                ORDER BY w.batch_idx, effective_at DESC NULLS LAST
+            """
+            for row in self._db.query(query, tuple(params)):
+                rows_by_idx[row.get("batch_idx")] = row
+
+        return [
+            self._envelope(instrument, market, rows_by_idx[idx])
+            if idx in rows_by_idx
+            else self._unavailable(instrument, market)
+            for idx, instrument in enumerate(instruments)
+        ]
+
     # ── history (§6.3) ────────────────────────────────────────────────────────
     def get_history(
         self,
@@ -213,27 +272,32 @@ class ExternalAnalysisRepository:
     def get_overview(
         self, market: str, date_from: Optional[str] = None, date_to: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Distribution + daily trend across all instruments in the window."""
-        where = ["1=1"]
+        """
+        Distribution + daily trend across all instruments in the window.
+
+        Read from the ``kap_sentiment_daily`` rollup (refreshed first), so the cost
+        scales with the number of days rather than the number of analyses.
+        """
+        refresh = self._refresh_rollups()
+        where = ["company_name <> ''"]
         params: List[Any] = []
         if date_from:
-            where.append("DATE(COALESCE(s.created_at, s.analyzed_at)) >= %s")
+            where.append("day >= %s")
             params.append(date_from)
         if date_to:
-            where.append("DATE(COALESCE(s.created_at, s.analyzed_at)) <= %s")
+            where.append("day <= %s")
             params.append(date_to)
         where_clause = " AND ".join(where)
 
         summary_rows = self._db.query(
             f"""
-            SELECT COUNT(*) AS total_analyses,
-                   COUNT(DISTINCT d.company_name) AS unique_instruments,
-                   AVG(s.confidence) AS average_confidence,
-                   COUNT(*) FILTER (WHERE s.overall_sentiment = 'positive') AS positive,
-                   COUNT(*) FILTER (WHERE s.overall_sentiment = 'neutral')  AS neutral,
-                   COUNT(*) FILTER (WHERE s.overall_sentiment = 'negative') AS negative
-            FROM kap_disclosure_sentiment s
-            JOIN kap_disclosures d ON s.disclosure_id = d.id
+            SELECT COALESCE(SUM(analyses), 0) AS total_analyses,
+                   COUNT(DISTINCT company_name) AS unique_instruments,
+                   SUM(confidence_sum) / NULLIF(SUM(confidence_n), 0) AS average_confidence,
+                   SUM(analyses) FILTER (WHERE overall_sentiment = 'positive') AS positive,
+                   SUM(analyses) FILTER (WHERE overall_sentiment = 'neutral')  AS neutral,
+                   SUM(analyses) FILTER (WHERE overall_sentiment = 'negative') AS negative
+            FROM kap_sentiment_daily
             WHERE {where_clause}
             """,
             tuple(params),
@@ -247,19 +311,18 @@ class ExternalAnalysisRepository:
         def _frac(n: int) -> float:
             return round(n / total, 4) if total else 0.0
 
+        # Signed score per row is ±confidence (0 for neutral); summed per sentiment
+        # in the rollup, so the daily average is exact.
         trend_rows = self._db.query(
             f"""
-            SELECT DATE(COALESCE(s.created_at, s.analyzed_at)) AS day,
-                   AVG(
-                       CASE s.overall_sentiment
-                           WHEN 'positive' THEN  s.confidence
-                           WHEN 'negative' THEN -s.confidence
-                           ELSE 0 END
-                   ) AS avg_score,
-                   COUNT(*) AS count,
-                   COUNT(DISTINCT d.company_name) AS unique_instruments
-            FROM kap_disclosure_sentiment s
-            JOIN kap_disclosures d ON s.disclosure_id = d.id
+            SELECT day,
+                   (COALESCE(SUM(confidence_sum) FILTER (WHERE overall_sentiment = 'positive'), 0)
+                    - COALESCE(SUM(confidence_sum) FILTER (WHERE overall_sentiment = 'negative'), 0))
+                   / NULLIF(SUM(CASE WHEN overall_sentiment IN ('positive', 'negative')
+                                     THEN confidence_n ELSE analyses END), 0) AS avg_score,
+                   SUM(analyses) AS count,
+                   COUNT(DISTINCT company_name) AS unique_instruments
+            FROM kap_sentiment_daily
             WHERE {where_clause}
             GROUP BY day
             ORDER BY day
@@ -290,8 +353,23 @@ class ExternalAnalysisRepository:
                 },
             },
             "daily_trend": daily_trend,
+            "rollup": {
+                "refreshed_at": _to_iso_utc(refresh.get("refreshed_at")),
+                "pending_days": refresh.get("pending_days"),
+            },
         }
 
+    def _refresh_rollups(self) -> Dict[str, Any]:
+        """Fold pending sentiment writes into the daily rollup; stale reads beat errors."""
+        refresh = getattr(self._db, "refresh_sentiment_rollups", None)
+        if refresh is None:
+            return {}
+        try:
+            return refresh() or {}
+        except Exception as e:
+            logger.warning(f"Sentiment rollup refresh failed, serving last rollup: {e}")
+            return {}
+
     # ── shaping helpers ───────────────────────────────────────────────────────
     def _payload(self, row: Dict[str, Any]) -> Dict[str, Any]:
         """Normalise a joined row into a SentimentPayload dict (§2)."""
@@ -81,6 +81,41 @@ class FundamentalRepository:
             return self._unavailable(instrument, market)
         return self._envelope(instrument, market, rows[0])
 
+    def get_points(
+        self, instruments: List[str], market: str, as_of: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Latest fundamentals at/<= as_of for every instrument, in one query.
+
+        ``DISTINCT ON (UPPER(stock_code))`` over ``UPPER(stock_code) = ANY(%s)`` keeps
+        a 500-ticker batch at one round trip. Envelopes come back in input order.
+        """
+        codes = [self._resolve(instrument, market) for instrument in instruments]
+        wanted = list(dict.fromkeys(code for code in codes if code))
+
+        rows_by_code: Dict[str, Dict[str, Any]] = {}
+        if wanted:
+            where = ["UPPER(stock_code) = ANY(%s)"]
+            params: List[Any] = [wanted]
+            if as_of:
+                where.append("effective_at <= %s")
+                params.append(as_of)
+            query = f"""
+                SELECT DISTINCT ON (UPPER(stock_code)) {_SELECT_COLUMNS}
+                FROM kap_fundamentals
+                WHERE {' AND '.join(where)}
+                ORDER BY UPPER(stock_code), effective_at DESC NULLS LAST
+            """
+            for row in self._db.query(query, tuple(params)):
+                rows_by_code[(row.get("stock_code") or "").upper()] = row
+
+        return [
+            self._envelope(instrument, market, rows_by_code[code])
+            if code in rows_by_code
+            else self._unavailable(instrument, market)
+            for instrument, code in zip(instruments, codes)
+        ]
+
     def get_history(
         self,
         instrument: str,
@@ -2,6 +2,7 @@
 Sentiment Analyzer Implementation
 Concrete implementation using LLM providers
 """
+import asyncio
 import logging
 import json
 import re
@@ -51,8 +52,10 @@ class SentimentAnalyzerService(ISentimentAnalyzer):
         try:
             prompt = custom_prompt or self._get_default_prompt()
             
-            # Get LLM response
-            response = self._llm_provider.analyze(content, prompt)
+            # Get LLM response. Providers are blocking clients, so run them in a
+            # worker thread: concurrent analyses then overlap instead of serialising
+            # on the event loop.
+            response = await asyncio.to_thread(self._llm_provider.analyze, content, prompt)
             
             if not response:
                 logger.error("Empty response from LLM")
@@ -2,8 +2,11 @@
 Base scraper class using Firecrawl
 """
 import asyncio
+import functools
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List, Callable, Union
 from abc import ABC, abstractmethod
 from firecrawl import FirecrawlApp
@@ -11,6 +14,25 @@ from config import config
 
 logger = logging.getLogger(__name__)
 
+# The Firecrawl SDK client is synchronous (scrape, crawl/batch polling, extract).
+# Its calls run on this shared pool so they never block the event loop; the pool
+# size is the process-wide cap on concurrent SDK calls.
+_sdk_executor: Optional[ThreadPoolExecutor] = None
+_sdk_executor_lock = threading.Lock()
+
+
+def _get_sdk_executor() -> ThreadPoolExecutor:
+    """Return the shared executor, sized by config.firecrawl.max_concurrent_requests."""
+    global _sdk_executor
+    with _sdk_executor_lock:
+        if _sdk_executor is None:
+            workers = getattr(config.firecrawl, "max_concurrent_requests", 8)
+            _sdk_executor = ThreadPoolExecutor(
+                max_workers=max(1, int(workers)),
+                thread_name_prefix="firecrawl-sdk",
+            )
+        return _sdk_executor
+
 
 class BaseScraper(ABC):
     """Base scraper class with Firecrawl integration"""
@@ -34,6 +56,13 @@ class BaseScraper(ABC):
         
         logger.info(f"Initialized {self.__class__.__name__}")
 
+    async def _run_sdk(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking Firecrawl SDK call on the shared executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_sdk_executor(), functools.partial(func, *args, **kwargs)
+        )
+
     def _normalize_document(self, result: Any) -> Dict[str, Any]:
         """Normalize Firecrawl document-like responses across SDK versions."""
         if isinstance(result, dict):
@@ -187,15 +216,18 @@ class BaseScraper(ABC):
         # If bypassProxy is set, post the raw JSON payload directly to the Firecrawl API
         # because the SDK's typed scrape() doesn't expose this custom field.
         if params.get("bypassProxy") or params.get("bypass_proxy"):
-            import requests as _req
             from firecrawl.v2.types import Document
             from firecrawl.v2.utils.normalize import normalize_document_input
+            from infrastructure.proxy import DirectProvider, get_transport
 
             api_url = (config.firecrawl.base_url or "http://localhost:3002").rstrip("/")
             api_key = config.firecrawl.api_key or ""
             payload = self._build_raw_scrape_payload(url, params)
 
-            resp = _req.post(
+            # The Firecrawl API is always reached directly; the pooled session keeps
+            # the connection (and TLS session) alive across scrapes.
+            resp = get_transport(DirectProvider()).request(
+                "POST",
                 f"{api_url}/v2/scrape",
                 json=payload,
                 headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
@@ -281,7 +313,7 @@ class BaseScraper(ABC):
 
         try:
             logger.info(f"Scraping URL: {url}")
-            result = self._call_scrape(url, params)
+            result = await self._run_sdk(self._call_scrape, url, params)
             data = self._normalize_document(result)
 
             logger.info(f"Successfully scraped: {url}")
@@ -390,7 +422,8 @@ class BaseScraper(ABC):
             )
 
             t0 = time.perf_counter()
-            result = self.firecrawl.crawl(
+            result = await self._run_sdk(
+                self.firecrawl.crawl,
                 start_url,
                 limit=limit,
                 include_paths=include_patterns,
@@ -460,7 +493,8 @@ class BaseScraper(ABC):
             except Exception:
                 timeout_s = 60
 
-            result = self.firecrawl.extract(
+            result = await self._run_sdk(
+                self.firecrawl.extract,
                 urls=[url],
                 schema=schema,
                 prompt=prompt,
@@ -663,7 +697,8 @@ class BaseScraper(ABC):
             logger.info(f"Mapping URL: {url} (search={search!r}, limit={limit})")
             map_call = getattr(self.firecrawl, "map", None)
             if callable(map_call):
-                result = map_call(
+                result = await self._run_sdk(
+                    map_call,
                     url,
                     limit=limit,
                     search=search,
@@ -678,7 +713,7 @@ class BaseScraper(ABC):
                 }
                 if search:
                     params["search"] = search
-                result = self.firecrawl.map_url(url, params=params)
+                result = await self._run_sdk(self.firecrawl.map_url, url, params=params)
 
             links = self._normalize_links(result)
             logger.info(f"Map found {len(links)} links for {url}")
@@ -699,6 +734,35 @@ class BaseScraper(ABC):
                 "scraper": self.__class__.__name__,
             }
 
+    def _run_batch_scrape(
+        self,
+        urls: List[str],
+        scrape_options: Dict[str, Any],
+        kwargs: Dict[str, Any],
+        poll_interval: int,
+    ) -> tuple:
+        """Start a batch job and block until it finishes; returns (result, pages)."""
+        batch_scrape = getattr(self.firecrawl, "batch_scrape", None)
+        if callable(batch_scrape):
+            result = batch_scrape(urls, **self._build_v2_scrape_kwargs(scrape_options), **kwargs)
+            pages = result.data if hasattr(result, "data") else []
+        else:
+            kwargs["scrape_options"] = scrape_options
+            async_batch_scrape = getattr(self.firecrawl, "async_batch_scrape_urls", None)
+            if callable(async_batch_scrape):
+                result = async_batch_scrape(urls, **kwargs)
+                status = result.wait_for_completion(poll_interval=poll_interval)
+                pages = status.data if hasattr(status, "data") else []
+                result = status
+            else:
+                legacy_batch_scrape = getattr(self.firecrawl, "batch_scrape_urls", None)
+                if not callable(legacy_batch_scrape):
+                    raise AttributeError("Firecrawl client does not expose batch_scrape() or batch_scrape_urls()")
+                result = legacy_batch_scrape(urls, **kwargs)
+                pages = result.data if hasattr(result, "data") else []
+
+        return result, pages
+
     # ------------------------------------------------------------------
     # NEW: batch_scrape() – scrape many URLs in one job
     # ------------------------------------------------------------------
@@ -755,25 +819,7 @@ class BaseScraper(ABC):
             try:
                 logger.info(f"Batch scraping {len(urls)} URLs (concurrency={max_concurrency})")
                 t0 = time.perf_counter()
-                batch_scrape = getattr(self.firecrawl, "batch_scrape", None)
-                if callable(batch_scrape):
-                    result = batch_scrape(urls, **self._build_v2_scrape_kwargs(scrape_options), **kwargs)
-                    pages = result.data if hasattr(result, "data") else []
-                else:
-                    kwargs["scrape_options"] = scrape_options
-                    async_batch_scrape = getattr(self.firecrawl, "async_batch_scrape_urls", None)
-                    if callable(async_batch_scrape):
-                        result = async_batch_scrape(urls, **kwargs)
-                        status = result.wait_for_completion(poll_interval=poll_interval)
-                        pages = status.data if hasattr(status, "data") else []
-                        result = status
-                    else:
-                        legacy_batch_scrape = getattr(self.firecrawl, "batch_scrape_urls", None)
-                        if not callable(legacy_batch_scrape):
-                            raise AttributeError("Firecrawl client does not expose batch_scrape() or batch_scrape_urls()")
-                        result = legacy_batch_scrape(urls, **kwargs)
-                        pages = result.data if hasattr(result, "data") else []
-
+                result, pages = await self._run_sdk(self._run_batch_scrape, urls, scrape_options, kwargs, poll_interval)
                 duration_s = round(time.perf_counter() - t0, 2)
 
                 # Extract API-level timing fields added in upstream #3771
@@ -863,7 +909,8 @@ class BaseScraper(ABC):
             if not callable(search_call):
                 raise AttributeError("Firecrawl client does not expose search()")
 
-            result = search_call(
+            result = await self._run_sdk(
+                search_call,
                 query,
                 limit=params["limit"],
                 tbs=params.get("tbs"),
@@ -949,7 +996,7 @@ class BaseScraper(ABC):
 
         try:
             logger.info(f"Scraping with {len(actions)} actions: {url}")
-            result = self._call_scrape(url, scrape_params)
+            result = await self._run_sdk(self._call_scrape, url, scrape_params)
             data = self._normalize_document(result)
 
             logger.info(f"Action-based scrape completed: {url}")
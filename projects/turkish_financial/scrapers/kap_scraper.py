@@ -25,13 +25,13 @@ from pathlib import Path
 from bs4 import BeautifulSoup
 import re
 from scrapers.base_scraper import BaseScraper
+from utils.bulk_upsert import upsert_many
 from utils.text_extractor import TextExtractorFactory
 from utils.pdf_downloader import PDFDownloader
 from utils.llm_analyzer import LLMAnalyzer, LocalLLMProvider, OpenAIProvider, GeminiProvider
 import csv
 import os
 import json as _json_lib
-import requests as _requests
 from config import config as _app_config
 
 logger = logging.getLogger(__name__)
@@ -39,9 +39,11 @@ logger = logging.getLogger(__name__)
 # Egress is sourced from a pluggable ProxyProvider (infrastructure/proxy) so the
 # backend can change (ScraperAPI today, Firecrawl/residential later) without editing
 # call sites. The module-level shapes below are what requests/aiohttp consume directly.
-from infrastructure.proxy import get_proxy_provider
+from infrastructure.proxy import get_proxy_provider, get_transport
 
 _PROXY_PROVIDER = get_proxy_provider(_app_config)
+# Shared keep-alive session for the requests-based ScraperAPI fallbacks below.
+_PROXY_TRANSPORT = get_transport(_PROXY_PROVIDER)
 _PROXY_DICT: Optional[Dict[str, str]] = _PROXY_PROVIDER.requests_proxies()
 _AIOHTTP_PROXY: Optional[str] = _PROXY_PROVIDER.aiohttp_proxy()
 # Native ScraperAPI endpoint helpers still key off the raw API key when present.
@@ -49,69 +51,59 @@ _SCRAPERAPI_KEY: Optional[str] = _app_config.proxy.proxy_password if _app_config
 
 
 async def _scraperapi_post(url: str, body: Dict[str, Any]) -> Optional[Any]:
-    """POST to a URL via ScraperAPI native endpoint using requests (sync → thread)."""
+    """POST to a URL via ScraperAPI over the provider's pooled session."""
     if not _SCRAPERAPI_KEY:
         return None
-    import urllib3
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
-    def _do_post() -> Optional[Any]:
-        try:
-            headers = {
-                "Content-Type": "application/json",
-                "Accept": "application/json, text/plain, */*",
-                "Referer": "https://www.kap.org.tr/",
-            }
-            r = _requests.post(
-                url,
-                json=body,
-                headers=headers,
-                proxies=_PROXY_DICT,
-                verify=False,
-                timeout=45,
-            )
-            if r.status_code == 200:
-                return r.json() if r.text.strip().startswith("[") or r.text.strip().startswith("{") else None
-            logger.warning(f"ScraperAPI POST {url} → HTTP {r.status_code}")
-            return None
-        except Exception as e:
-            logger.debug(f"ScraperAPI POST failed {url}: {e}")
-            return None
-
-    return await asyncio.to_thread(_do_post)
+    try:
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json, text/plain, */*",
+            "Referer": "https://www.kap.org.tr/",
+        }
+        r = await _PROXY_TRANSPORT.arequest(
+            "POST",
+            url,
+            json=body,
+            headers=headers,
+            proxies=_PROXY_DICT,
+            verify=False,
+            timeout=45,
+        )
+        if r.status_code == 200:
+            return r.json() if r.text.strip().startswith("[") or r.text.strip().startswith("{") else None
+        logger.warning(f"ScraperAPI POST {url} → HTTP {r.status_code}")
+        return None
+    except Exception as e:
+        logger.debug(f"ScraperAPI POST failed {url}: {e}")
+        return None
 
 
 async def _scraperapi_get(url: str) -> Optional[Any]:
-    """GET a JSON URL via ScraperAPI proxy using requests (sync → thread)."""
+    """GET a JSON URL via ScraperAPI over the provider's pooled session."""
     if not _SCRAPERAPI_KEY:
         return None
-    import urllib3
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
-    def _do_get() -> Optional[Any]:
-        try:
-            headers = {
-                "Accept": "application/json, text/plain, */*",
-                "Referer": "https://www.kap.org.tr/",
-            }
-            r = _requests.get(
-                url,
-                headers=headers,
-                proxies=_PROXY_DICT,
-                verify=False,
-                timeout=30,
-            )
-            if r.status_code == 200:
-                text = r.text.strip()
-                if text.startswith("[") or text.startswith("{"):
-                    return r.json()
-            logger.warning(f"ScraperAPI GET {url} → HTTP {r.status_code}")
-            return None
-        except Exception as e:
-            logger.debug(f"ScraperAPI GET failed {url}: {e}")
-            return None
-
-    return await asyncio.to_thread(_do_get)
+    try:
+        headers = {
+            "Accept": "application/json, text/plain, */*",
+            "Referer": "https://www.kap.org.tr/",
+        }
+        r = await _PROXY_TRANSPORT.arequest(
+            "GET",
+            url,
+            headers=headers,
+            proxies=_PROXY_DICT,
+            verify=False,
+            timeout=30,
+        )
+        if r.status_code == 200:
+            text = r.text.strip()
+            if text.startswith("[") or text.startswith("{"):
+                return r.json()
+        logger.warning(f"ScraperAPI GET {url} → HTTP {r.status_code}")
+        return None
+    except Exception as e:
+        logger.debug(f"ScraperAPI GET failed {url}: {e}")
+        return None
 
 # --- Module-level schema constants ---
 # Keeping these as module-level singletons ensures Firecrawl's deterministic JSON
@@ -2342,15 +2334,15 @@ class KAPScraper(BaseScraper):
                 },
             }
 
-            if self.db_manager is not None:
-                try:
-                    self.db_manager.upsert_disclosure(disc_row)
-                    saved += 1
-                except Exception as e:
-                    logger.error(f"Failed to save disclosure {disclosure_index}: {e}")
-
             disclosures.append(disc_row)
 
+        if self.db_manager is not None and disclosures:
+            # One multi-row upsert for the whole window instead of a commit per row.
+            try:
+                saved = sum(1 for ok in upsert_many(self.db_manager, "upsert_disclosure", disclosures) if ok)
+            except Exception as e:
+                logger.error(f"Failed to save {len(disclosures)} disclosures: {e}")
+
         return {
             "success": True,
             "total": len(data),
@@ -2500,17 +2492,19 @@ class KAPScraper(BaseScraper):
                          if k not in ("title", "content", "category", "publish_date", "source_url")},
             }
 
-            if self.db_manager is not None:
-                try:
-                    row_id = self.db_manager.upsert_news(news_row)
-                    if row_id is not None:
-                        saved += 1
-                        news_row["db_id"] = row_id
-                except Exception as e:
-                    logger.error(f"Failed to save news '{title[:40]}': {e}")
-
             processed.append(news_row)
 
+        if self.db_manager is not None and processed:
+            try:
+                row_ids = upsert_many(self.db_manager, "upsert_news", processed)
+            except Exception as e:
+                logger.error(f"Failed to save {len(processed)} news items: {e}")
+                row_ids = []
+            for news_row, row_id in zip(processed, row_ids):
+                if row_id is not None:
+                    saved += 1
+                    news_row["db_id"] = row_id
+
         return {
             "success": True,
             "total": len(raw_items),
@@ -11,17 +11,31 @@ Investing.com TR comment sections load via JavaScript, so they are rendered with
 `scrape_with_actions` (Playwright: wait → scroll → scrape), mirroring the KAP SPA
 pattern in `kap_scraper.py`.
 
+`scrape_all` fetches every selected source and comment page concurrently, at most
+`NEWS_PER_HOST_CONCURRENCY` requests per host. RSS feeds are read with an async
+conditional GET (ETag / Last-Modified, plus a body digest for feeds that send
+neither), so a feed that has not changed since the previous run is skipped without
+parsing. The new validators only count once the caller has persisted the batch
+(`commit_feed_state`). Per-source article counts and fetch times are returned for
+monitoring.
+
 The scraper is intentionally I/O-only: it returns `NewsArticle` objects. Sentiment
 analysis and persistence are orchestrated by CollectNewsSentimentUseCase.
 """
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
 import logging
 import os
 import re
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 
+import aiohttp
 from bs4 import BeautifulSoup
 
 from scrapers.base_scraper import BaseScraper
@@ -44,7 +58,7 @@ from domain.entities.news_article import (
     SOURCE_DOVIZCOM,
     SOURCE_INVESTING_TR,
 )
-from infrastructure.contracts.instrument_identity_map import STATIC_BIST_MAP
+from infrastructure.contracts.instrument_matcher import get_instrument_matcher
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +88,30 @@ NEWS_ARTICLE_PROMPT = (
     "a short summary/body, the article URL, and the publish date if shown."
 )
 
+# Concurrent requests allowed against one portal host during scrape_all.
+DEFAULT_PER_HOST_CONCURRENCY = 2
+_FEED_TIMEOUT_SECONDS = 20
+_FEED_USER_AGENT = "Mozilla/5.0 (compatible; turkish-financial-news/1.0)"
+
+# Conditional-GET state per (feed URL, tickers, days_back): validators and body
+# digest from the last fetch whose articles were persisted. It is keyed by the
+# filter as well as the URL because fetch_rss filters entries after parsing: an
+# unchanged feed only means "nothing new" for the same filter, and a per-ticker
+# refresh must not be skipped because the scheduler already read the feed. Process
+# memory is enough: the news scheduler runs inside the API process.
+_FEED_STATE: Dict[Any, Dict[str, Any]] = {}
+
+
+def _feed_state_key(feed_url: str, tickers: Optional[List[str]], days_back: int) -> Tuple[Any, ...]:
+    return (feed_url, tuple(sorted(tickers)) if tickers else None, days_back)
+
+
+def _per_host_concurrency() -> int:
+    try:
+        return max(1, int(os.getenv("NEWS_PER_HOST_CONCURRENCY", DEFAULT_PER_HOST_CONCURRENCY)))
+    except ValueError:
+        return DEFAULT_PER_HOST_CONCURRENCY
+
 
 class NewsPortalScraper(BaseScraper):
     """Scrape Turkish financial news portals into NewsArticle objects."""
@@ -180,24 +218,16 @@ class NewsPortalScraper(BaseScraper):
         """
         Tag a BIST ticker from article text.
 
-        Matches an explicit ticker token (e.g. "THYAO") first, then falls back to the
-        company-name substrings in STATIC_BIST_MAP (e.g. "türk hava yolları" → THYAO).
-        Returns the first match or None for macro/sector headlines.
+        Matches an explicit ticker token (e.g. "THYAO") first, then falls back to
+        company names and aliases (e.g. "türk hava yolları" → THYAO), using the shared
+        compiled matcher. Returns the first match or None for macro/sector headlines.
         """
         if not text:
             return None
-        upper = text.upper()
-        for ticker in STATIC_BIST_MAP:
-            # word-boundary match so "SISE" doesn't fire inside "SISECAM" text noise
-            if re.search(rf"\b{re.escape(ticker)}\b", upper):
-                return ticker
-
-        lowered = text.lower()
-        for ticker, patterns in STATIC_BIST_MAP.items():
-            for pat in patterns:
-                if pat in lowered:
-                    return ticker
-        return None
+        # Tickers are matched case-insensitively here: portal headlines often
+        # title-case or lower-case codes ("Thyao").
+        detected = get_instrument_matcher(self.db_manager).detect(text, ignore_case_tickers=True)
+        return detected[0] if detected else None
 
     @staticmethod
     def _parse_date(value: Any) -> Optional[datetime]:
@@ -240,12 +270,26 @@ class NewsPortalScraper(BaseScraper):
         tickers: Optional[List[str]] = None,
         days_back: int = 7,
     ) -> List[NewsArticle]:
-        """Read an RSS feed with feedparser and map entries to NewsArticle objects."""
+        """
+        Read an RSS feed and map its entries to NewsArticle objects.
+
+        The feed is fetched asynchronously with a conditional GET; an unchanged feed
+        returns no articles (they were collected on the previous run). Parsing runs
+        in a worker thread so it never blocks the event loop.
+        """
         import feedparser  # local import: optional dep, keeps module import light
 
         articles: List[NewsArticle] = []
         try:
-            parsed = feedparser.parse(feed_url)
+            payload = await self._fetch_feed(feed_url, _feed_state_key(feed_url, tickers, days_back))
+        except Exception as e:
+            logger.error(f"RSS fetch failed for {feed_url}: {e}")
+            return articles
+        if payload is None:
+            logger.info(f"RSS {source}: unchanged since last run ({feed_url})")
+            return articles
+        try:
+            parsed = await asyncio.to_thread(feedparser.parse, payload)
         except Exception as e:
             logger.error(f"feedparser failed for {feed_url}: {e}")
             return articles
@@ -285,6 +329,63 @@ class NewsPortalScraper(BaseScraper):
         logger.info(f"RSS {source}: {len(articles)} articles from {feed_url}")
         return articles
 
+    @property
+    def _pending_feeds(self) -> Dict[Any, Dict[str, Any]]:
+        """Feed state fetched by this scraper, not yet recorded by commit_feed_state()."""
+        return self.__dict__.setdefault("_pending_feed_state", {})
+
+    def commit_feed_state(self) -> None:
+        """
+        Record the validators fetched since the last commit.
+
+        Call once the scraped articles are persisted: until then the next run still
+        sees the feeds as changed, so a failure downstream does not lose articles.
+        """
+        for key, state in self._pending_feeds.items():
+            _FEED_STATE[key] = {**state, "unchanged": False}
+        self._pending_feeds.clear()
+
+    def _feed_unchanged(self, state_key: Any) -> bool:
+        return bool((self._pending_feeds.get(state_key) or {}).get("unchanged"))
+
+    async def _fetch_feed(self, feed_url: str, state_key: Any = None) -> Optional[bytes]:
+        """
+        GET ``feed_url`` with If-None-Match / If-Modified-Since from the last
+        committed fetch under ``state_key`` (default: the URL).
+
+        Returns the body, or None when the server answers 304 or the body digest is
+        the same as last time. The new validators are kept pending until
+        ``commit_feed_state``. HTTP errors raise.
+        """
+        key = state_key if state_key is not None else feed_url
+        state = _FEED_STATE.get(key) or {}
+        headers = {"User-Agent": _FEED_USER_AGENT}
+        if state.get("etag"):
+            headers["If-None-Match"] = state["etag"]
+        if state.get("last_modified"):
+            headers["If-Modified-Since"] = state["last_modified"]
+
+        timeout = aiohttp.ClientTimeout(total=_FEED_TIMEOUT_SECONDS)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with session.get(feed_url, headers=headers) as response:
+                if response.status == 304:
+                    self._pending_feeds[key] = {**state, "unchanged": True}
+                    return None
+                response.raise_for_status()
+                body = await response.read()
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+
+        digest = hashlib.sha1(body).hexdigest()
+        unchanged = digest == state.get("digest")
+        self._pending_feeds[key] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "digest": digest,
+            "unchanged": unchanged,
+        }
+        return None if unchanged else body
+
     # ── HTML source (Firecrawl extract_with_schema, scrape_url fallback) ──────
     async def fetch_html(
         self,
@@ -451,6 +552,10 @@ class NewsPortalScraper(BaseScraper):
         """
         Collect articles from all (or selected) sources.
 
+        Every source and Investing.com TR comment page is fetched concurrently, with
+        at most ``NEWS_PER_HOST_CONCURRENCY`` (default 2) in flight per host. A failing
+        source only costs its own articles.
+
         Args:
             tickers: restrict to these BIST tickers (also drives which Investing.com TR
                      pages are rendered). None → keep everything, tag where possible.
@@ -459,50 +564,89 @@ class NewsPortalScraper(BaseScraper):
             include_investing_comments: also render Investing.com TR comment pages.
 
         Returns:
-            {"success", "total", "by_source", "articles": List[NewsArticle]}
+            {"success", "total", "by_source", "by_source_timing",
+             "articles": List[NewsArticle]}
+            ``by_source`` maps source → article count; ``by_source_timing`` maps
+            source → {"articles", "elapsed_ms", "status"} where status is "ok",
+            "not_modified" (RSS feed unchanged), "partial" or "error". For
+            Investing.com TR, elapsed_ms is the slowest comment page.
+
+        Call ``commit_feed_state()`` after the articles are persisted so the next
+        run can skip unchanged feeds.
         """
         norm_tickers = [t.strip().upper() for t in tickers] if tickers else None
         source_configs = {**self.SOURCES, **self._extra_rss_sources()}
         selected = sources or list(source_configs.keys())
-        all_articles: List[NewsArticle] = []
-        by_source: Dict[str, int] = {}
 
+        # (label, url, fetch) per unit of work; labels repeat for comment pages.
+        jobs: List[Tuple[str, str, Callable[[], Awaitable[List[NewsArticle]]]]] = []
+        rss_keys: Dict[str, Any] = {}
         for source in selected:
             cfg = source_configs.get(source)
             if not cfg:
                 continue
-            try:
-                if cfg["method"] == "rss":
-                    found = await self.fetch_rss(
-                        cfg["feed_url"], source, norm_tickers, days_back
-                    )
-                else:
-                    found = await self.fetch_html(
-                        cfg["listing_url"], source, norm_tickers, days_back
-                    )
-            except Exception as e:
-                logger.error(f"Source {source} failed: {e}", exc_info=True)
-                found = []
-            by_source[source] = len(found)
-            all_articles.extend(found)
-
+            if cfg["method"] == "rss":
+                url = cfg["feed_url"]
+                rss_keys[url] = _feed_state_key(url, norm_tickers, days_back)
+                fetch = functools.partial(self.fetch_rss, url, source, norm_tickers, days_back)
+            else:
+                url = cfg["listing_url"]
+                fetch = functools.partial(self.fetch_html, url, source, norm_tickers, days_back)
+            jobs.append((source, url, fetch))
         if include_investing_comments:
-            inv_tickers = norm_tickers or list(self.INVESTING_EQUITY_URLS.keys())
-            inv_count = 0
-            for ticker in inv_tickers:
+            for ticker in norm_tickers or list(self.INVESTING_EQUITY_URLS.keys()):
+                url = self.INVESTING_EQUITY_URLS.get(ticker, "")
+                fetch = functools.partial(self.fetch_investing_comments, ticker)
+                jobs.append((SOURCE_INVESTING_TR, url, fetch))
+
+        # Semaphores are created per run: they bind to the running event loop.
+        limit = _per_host_concurrency()
+        host_gates: Dict[str, asyncio.Semaphore] = {}
+
+        async def _run(label: str, url: str, fetch) -> Tuple[List[NewsArticle], str, float]:
+            host = urlsplit(url).netloc.lower()
+            gate = host_gates.setdefault(host, asyncio.Semaphore(limit))
+            async with gate:
+                started = time.perf_counter()
                 try:
-                    found = await self.fetch_investing_comments(ticker)
+                    found, status = list(await fetch() or []), "ok"
                 except Exception as e:
-                    logger.error(f"Investing comments {ticker} failed: {e}")
-                    found = []
-                inv_count += len(found)
-                all_articles.extend(found)
-            by_source[SOURCE_INVESTING_TR] = inv_count
+                    logger.error(f"Source {label} failed ({url}): {e}", exc_info=True)
+                    found, status = [], "error"
+                elapsed_ms = (time.perf_counter() - started) * 1000
+            if status == "ok" and url in rss_keys and self._feed_unchanged(rss_keys[url]):
+                status = "not_modified"
+            return found, status, elapsed_ms
+
+        results = await asyncio.gather(*(_run(*job) for job in jobs))
 
+        all_articles: List[NewsArticle] = []
+        by_source: Dict[str, int] = {}
+        timing: Dict[str, Dict[str, Any]] = {}
+        statuses: Dict[str, List[str]] = {}
+        for (label, _url, _fetch), (found, status, elapsed_ms) in zip(jobs, results):
+            all_articles.extend(found)
+            by_source[label] = by_source.get(label, 0) + len(found)
+            entry = timing.setdefault(label, {"articles": 0, "elapsed_ms": 0.0})
+            entry["articles"] += len(found)
+            entry["elapsed_ms"] = round(max(entry["elapsed_ms"], elapsed_ms), 1)
+            statuses.setdefault(label, []).append(status)
+        for label, seen in statuses.items():
+            if len(set(seen)) == 1:
+                timing[label]["status"] = seen[0]
+            else:
+                timing[label]["status"] = "partial" if "error" in seen else "ok"
+
+        slowest = sorted(timing.items(), key=lambda item: item[1]["elapsed_ms"], reverse=True)[:3]
+        logger.info(
+            f"News scrape: {len(all_articles)} articles from {len(timing)} sources; slowest "
+            + ", ".join(f"{label} {entry['elapsed_ms']:.0f} ms" for label, entry in slowest)
+        )
         return {
             "success": True,
             "total": len(all_articles),
             "by_source": by_source,
+            "by_source_timing": timing,
             "articles": all_articles,
         }
 
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Rebuild the daily KAP sentiment rollup (``kap_sentiment_daily``) from history.
+
+Normal traffic keeps the rollup current incrementally: triggers mark touched days
+dirty and the sentiment endpoints fold them in on read. Run this after a bulk
+import that bypassed the triggers, or once after deploying the rollup table::
+
+    docker compose exec turkish-financial-api python scripts/backfill_sentiment_rollups.py
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parents[1]
+if str(PROJECT_DIR) not in sys.path:
+    sys.path.insert(0, str(PROJECT_DIR))
+
+from database.db_manager import DatabaseManager
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Rebuild KAP sentiment rollups")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="only recompute days marked dirty instead of rebuilding everything",
+    )
+    parser.add_argument(
+        "--no-wait",
+        action="store_true",
+        help="give up instead of waiting when another refresh holds the rollup lock",
+    )
+    args = parser.parse_args()
+
+    db = DatabaseManager()
+    result = db.refresh_sentiment_rollups(full=not args.incremental, wait=not args.no_wait)
+    print(json.dumps(result, default=str))
+    if result.get("lock_busy"):
+        print("Another rollup refresh holds the lock; nothing was rebuilt.", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -58,8 +58,10 @@ class FakeDB:
     PoolExhaustedError = DatabaseManager.PoolExhaustedError
 
     def __init__(self, point_rows=None, history_rows=None, summary=None, trend=None,
-                 raise_on_query=False):
+                 raise_on_query=False, batch_rows=None):
         self.point_rows = point_rows or []
+        self.batch_rows = batch_rows or []
+        self.batch_params = None
         self.history_rows = history_rows or []
         self.summary = summary
         self.trend = trend or []
@@ -72,6 +74,9 @@ class FakeDB:
             return []  # force static-map resolution
         if "total_analyses" in sql:
             return [self.summary] if self.summary is not None else []
+        if "DISTINCT ON (w.batch_idx)" in sql:
+            self.batch_params = params
+            return self.batch_rows
         if "GROUP BY day" in sql:
             return self.trend
         if "ORDER BY effective_at" in sql and "LIMIT 1" in sql:
@@ -303,7 +308,7 @@ class TestPoint:
 class TestBatch:
     def test_partial_items(self):
         # THYAO resolves and has a row; ZZZZ resolves to self but no rows -> unavailable
-        client = make_client(FakeDB(point_rows=[_row()]))
+        client = make_client(FakeDB(batch_rows=[_row(batch_idx=0)]))
         r = client.post(
             "/api/external/v1/sentiment/batch",
             json={"market": "bist", "instruments": ["THYAO", "ZZZZ"]},
@@ -312,9 +317,26 @@ class TestBatch:
         body = r.json()
         assert body["contract_version"] == "1.0"
         assert len(body["items"]) == 2
-        # Both share the same fake point rows, so both are 'ok' here; assert envelope echo
         assert body["items"][0]["instrument"] == "THYAO"
+        assert body["items"][0]["status"] == "ok"
         assert body["items"][1]["instrument"] == "ZZZZ"
+        assert body["items"][1]["status"] == "unavailable"
+
+    def test_batch_is_one_set_based_query(self):
+        db = FakeDB(batch_rows=[_row(batch_idx=1)])
+        calls = []
+        original = db.query
+        db.query = lambda sql, params=None: calls.append(sql) or original(sql, params)
+        body = make_client(db).post(
+            "/api/external/v1/sentiment/batch",
+            json={"market": "bist", "instruments": ["ZZZZ", "THYAO", "AKBNK"]},
+        ).json()
+        assert [it["status"] for it in body["items"]] == ["unavailable", "ok", "unavailable"]
+        # one bist_companies lookup + one points query, regardless of instrument count
+        assert len(calls) == 2
+        idxs, codes, patterns = db.batch_params
+        assert set(idxs) == {0, 1, 2}
+        assert "%turk hava yollari%" in [p for i, p in zip(idxs, patterns) if i == 1]
 
     def test_empty_instruments_rejected(self):
         client = make_client(FakeDB())
@@ -393,6 +415,25 @@ class TestOverview:
         assert len(body["daily_trend"]) == 2
         assert body["daily_trend"][0]["date"] == "2026-06-13"
 
+    def test_overview_refreshes_rollup_and_reports_freshness(self):
+        db = FakeDB(summary={"total_analyses": 0}, trend=[])
+        db.refresh_sentiment_rollups = lambda: {
+            "refreshed_at": datetime(2026, 6, 14, 9, 30), "days_refreshed": 1, "pending_days": 0,
+        }
+        body = make_client(db).get("/api/external/v1/sentiment/overview?market=bist").json()
+        assert body["rollup"] == {"refreshed_at": "2026-06-14T09:30:00Z", "pending_days": 0}
+
+    def test_failed_rollup_refresh_still_serves_overview(self):
+        db = FakeDB(summary={"total_analyses": 5, "positive": 5}, trend=[])
+
+        def boom():
+            raise RuntimeError("lock timeout")
+
+        db.refresh_sentiment_rollups = boom
+        body = make_client(db).get("/api/external/v1/sentiment/overview?market=bist").json()
+        assert body["summary"]["total_analyses"] == 5
+        assert body["rollup"]["refreshed_at"] is None
+
     def test_empty_overview(self):
         client = make_client(FakeDB(summary={"total_analyses": 0}, trend=[]))
         body = client.get("/api/external/v1/sentiment/overview?market=bist").json()
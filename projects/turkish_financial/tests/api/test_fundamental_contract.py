@@ -30,10 +30,14 @@ class FakeDB:
         self.point_rows = point_rows or []
         self.history_rows = history_rows or []
         self.raise_on_query = raise_on_query
+        self.batch_queries = 0
 
     def query(self, sql, params=None):
         if self.raise_on_query:
             raise RuntimeError("boom")
+        if "DISTINCT ON" in sql:
+            self.batch_queries += 1
+            return self.point_rows
         if "kap_fundamentals" in sql:
             return self.point_rows if "LIMIT 1" in sql else self.history_rows
         return []
@@ -174,7 +178,7 @@ class TestHistory:
 # ════════════════════════════════════════════════════════════════════════════
 class TestBatch:
     def test_items_echoed(self):
-        client = make_client(FakeDB(point_rows=[_row()]))
+        client = make_client(FakeDB(point_rows=[_row(), _row(stock_code="AKBNK")]))
         r = client.post(
             "/api/external/v1/fundamental/batch",
             json={"market": "bist", "instruments": ["THYAO", "AKBNK"]},
@@ -187,6 +191,34 @@ class TestBatch:
         assert body["items"][1]["instrument"] == "AKBNK"
         assert all(it["kind"] == "fundamental" for it in body["items"])
 
+    def test_missing_tickers_fetched_concurrently_with_bound(self, monkeypatch):
+        import asyncio
+
+        db = FakeDB(point_rows=[_row()])
+        running = {"now": 0, "peak": 0}
+        fetched = []
+
+        async def fake_fetch(instrument, db_manager, repo, market, as_of=None, oid_refresh=None):
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+            await asyncio.sleep(0.01)
+            running["now"] -= 1
+            fetched.append(instrument)
+            return repo._unavailable(instrument, market)
+
+        monkeypatch.setattr(external_analysis, "_on_demand_fundamental_fetch", fake_fetch)
+        monkeypatch.setenv("FUNDAMENTAL_ON_DEMAND_CONCURRENCY", "2")
+        instruments = ["THYAO", "AKBNK", "GARAN", "ASELS", "AKBNK"]
+        body = make_client(db).post(
+            "/api/external/v1/fundamental/batch",
+            json={"market": "bist", "instruments": instruments},
+        ).json()
+
+        assert db.batch_queries == 1
+        assert [it["status"] for it in body["items"]] == ["ok"] + ["unavailable"] * 4
+        assert sorted(fetched) == ["AKBNK", "ASELS", "GARAN"]  # duplicate fetched once
+        assert running["peak"] == 2
+
     def test_empty_instruments_rejected(self):
         client = make_client(FakeDB())
         r = client.post(
@@ -0,0 +1,140 @@
+"""
+Tests for keyset pagination on the KAP report listing endpoints.
+
+The reports router is mounted on a minimal app with a fake database that records
+the SQL it receives and answers from canned rows, so no Postgres is needed.
+"""
+from datetime import date, datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.dependencies import get_db_manager
+from api.routers import reports
+
+
+class FakeCursor:
+    def __init__(self, db):
+        self._db = db
+        self._result = []
+
+    def execute(self, query, params=None):
+        self._db.executed.append((query, params))
+        if "pg_class" in query:
+            self._result = [(self._db.estimate,)]
+        elif "COUNT(*)" in query:
+            self._db.counts += 1
+            self._result = [(len(self._db.rows),)]
+        elif "FROM kap_disclosures" in query:
+            self._result = list(self._db.rows)
+        else:
+            self._result = []
+
+    def fetchone(self):
+        return self._result[0] if self._result else None
+
+    def fetchall(self):
+        return self._result
+
+
+class FakeConn:
+    def __init__(self, db):
+        self._db = db
+
+    def cursor(self, *a, **k):
+        return FakeCursor(self._db)
+
+
+class FakeDB:
+    def __init__(self, rows, estimate=-1):
+        self.rows = rows
+        self.estimate = estimate
+        self.executed = []
+        self.counts = 0
+
+    def get_connection(self):
+        return FakeConn(self)
+
+    def return_connection(self, conn):
+        return None
+
+
+def _report_row(row_id, day):
+    scraped = datetime(2026, 6, day, 12, 0)
+    return (row_id, "THY A.O.", "ODA", date(2026, 6, day), "içerik", None, scraped,
+            f"2026-06-{day:02d}", scraped.isoformat(sep=" "))
+
+
+def make_client(db: FakeDB) -> TestClient:
+    app = FastAPI()
+    app.include_router(reports.router)
+    app.dependency_overrides[get_db_manager] = lambda: db
+    return TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def _clear_count_cache():
+    reports._count_cache.clear()
+    yield
+    reports._count_cache.clear()
+
+
+def test_cursor_round_trips_and_rejects_garbage():
+    token = reports._encode_cursor("2026-06-10", "2026-06-10 12:00:00", 42)
+    assert reports._decode_cursor(token) == ("2026-06-10", "2026-06-10 12:00:00", 42)
+    with pytest.raises(reports.HTTPException):
+        reports._decode_cursor("not-a-cursor")
+
+
+def test_first_page_returns_next_cursor_from_look_ahead_row():
+    db = FakeDB([_report_row(3, 12), _report_row(2, 11), _report_row(1, 10)])
+    response = make_client(db).get("/api/v1/reports/kap?limit=2")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [r["id"] for r in body["reports"]] == [3, 2]
+    assert reports._decode_cursor(body["next_cursor"]) == ("2026-06-11", "2026-06-11 12:00:00", 2)
+    page_query, page_params = db.executed[-1]
+    assert "OFFSET" not in page_query
+    assert page_params[-1] == 3  # limit + 1 look-ahead
+
+
+def test_cursor_page_uses_keyset_predicate_instead_of_offset():
+    db = FakeDB([_report_row(1, 10)])
+    token = reports._encode_cursor("2026-06-11", "2026-06-11 12:00:00", 2)
+    response = make_client(db).get(f"/api/v1/reports/kap?limit=2&offset=50&cursor={token}")
+
+    assert response.status_code == 200
+    assert response.json()["next_cursor"] is None
+    page_query, page_params = db.executed[-1]
+    assert "< (%s::date, %s::timestamp, %s)" in page_query
+    assert "OFFSET" not in page_query
+    assert page_params == ["2026-06-11", "2026-06-11 12:00:00", 2, 3]
+
+
+def test_unfiltered_total_uses_planner_estimate():
+    db = FakeDB([_report_row(1, 10)], estimate=125000)
+    body = make_client(db).get("/api/v1/reports/kap").json()
+    assert body["total"] == 125000
+    assert body["total_is_estimate"] is True
+    assert db.counts == 0
+
+
+def test_filtered_total_is_counted_once_and_cached():
+    db = FakeDB([_report_row(1, 10)])
+    client = make_client(db)
+    for _ in range(3):
+        body = client.get("/api/v1/reports/kap?company_code=THY").json()
+    assert body["total"] == 1
+    assert body["total_is_estimate"] is False
+    assert db.counts == 1
+
+
+def test_pdf_urls_paginates_with_cursor():
+    row = (7, "123", "THY A.O.", "ODA", date(2026, 6, 10), "https://kap.org.tr/x", True,
+           "2026-06-10", "2026-06-10 12:00:00")
+    db = FakeDB([row, row])
+    body = make_client(db).get("/api/v1/reports/kap/pdf-urls?limit=1").json()
+    assert body["total"] == 1
+    assert reports._decode_cursor(body["next_cursor"])[2] == 7
@@ -52,6 +52,15 @@ class FakeScraper:
                 "articles": self._articles}
 
 
+class CommittingScraper(FakeScraper):
+    def __init__(self, articles):
+        super().__init__(articles)
+        self.commits = 0
+
+    def commit_feed_state(self):
+        self.commits += 1
+
+
 class FakeAnalyzer:
     def __init__(self, mapping):
         # mapping: headline substring -> SentimentAnalysis
@@ -164,3 +173,147 @@ class TestExecute:
         assert result["analyzed"] == 0
         assert result["saved"] == 0
         assert db.aggregates == []
+
+
+class BatchFakeDB(FakeDB):
+    """DB double exposing the set-based *_many helpers."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def upsert_news_article_many(self, rows):
+        self.batches.append(("articles", len(rows)))
+        return [self.upsert_news_article(row) for row in rows]
+
+    def upsert_news_article_sentiment_many(self, items):
+        self.batches.append(("sentiments", len(items)))
+        return [self.upsert_news_article_sentiment(*item) for item in items]
+
+    def upsert_aggregated_ticker_sentiment_many(self, rows):
+        self.batches.append(("aggregates", len(rows)))
+        return [self.upsert_aggregated_ticker_sentiment(row) for row in rows]
+
+
+class TestBatchedPersistence:
+    def test_uses_one_batch_per_table(self):
+        articles = [
+            NewsArticle(source="bloomberght", headline=f"THYAO haber {i}", url=str(i),
+                        ticker="THYAO", published_at=datetime(2026, 6, 10))
+            for i in range(3)
+        ]
+        analyzer = FakeAnalyzer({"THYAO": _sentiment(SentimentType.POSITIVE, 0.8)})
+        db = BatchFakeDB()
+        uc = CollectNewsSentimentUseCase(FakeScraper(articles), analyzer, db)
+
+        result = run(uc.execute())
+
+        assert result["saved"] == 3
+        assert db.batches == [("articles", 3), ("sentiments", 3), ("aggregates", 1)]
+        assert [pk for pk, _ in db.sentiments] == [1, 2, 3]
+
+
+class SlowAnalyzer(FakeAnalyzer):
+    """Analyzer that yields to the loop and records how many calls overlap."""
+
+    def __init__(self, mapping):
+        super().__init__(mapping)
+        self.in_flight = 0
+        self.peak = 0
+
+    async def analyze(self, content, custom_prompt=None):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return await super().analyze(content, custom_prompt)
+
+
+class TestPipelinedAnalysis:
+    def _articles(self, n):
+        return [
+            NewsArticle(source="bloomberght", headline=f"THYAO haber {i}", url=str(i),
+                        ticker="THYAO", published_at=datetime(2026, 6, 10))
+            for i in range(n)
+        ]
+
+    def test_analysis_concurrency_is_bounded(self):
+        analyzer = SlowAnalyzer({"THYAO": _sentiment(SentimentType.POSITIVE, 0.8)})
+        uc = CollectNewsSentimentUseCase(
+            FakeScraper(self._articles(7)), analyzer, FakeDB(), analysis_concurrency=3,
+        )
+
+        result = run(uc.execute())
+
+        assert result["analyzed"] == 7
+        assert analyzer.peak == 3
+
+    def test_results_keep_article_order(self):
+        articles = self._articles(4)
+        analyzer = SlowAnalyzer({"THYAO": _sentiment(SentimentType.POSITIVE, 0.8)})
+        db = FakeDB()
+        run(CollectNewsSentimentUseCase(FakeScraper(articles), analyzer, db).execute())
+        assert [row["url"] for row in db.articles] == ["0", "1", "2", "3"]
+
+    def test_aggregate_reads_existing_rows_in_one_call(self):
+        class ManyReadDB(BatchFakeDB):
+            reads = []
+
+            def get_aggregated_ticker_sentiment_many(self, keys):
+                self.reads.append(list(keys))
+                return {key: {"social_score": 0.2} for key in keys}
+
+            def get_aggregated_ticker_sentiment(self, ticker, period_date):
+                raise AssertionError("per-row read used")
+
+        articles = self._articles(2) + [
+            NewsArticle(source="bloomberght", headline="AKBNK haber", url="x",
+                        ticker="AKBNK", published_at=datetime(2026, 6, 11)),
+        ]
+        analyzer = FakeAnalyzer({
+            "THYAO": _sentiment(SentimentType.POSITIVE, 0.5),
+            "AKBNK": _sentiment(SentimentType.NEGATIVE, 0.5),
+        })
+        db = ManyReadDB()
+        result = run(CollectNewsSentimentUseCase(FakeScraper(articles), analyzer, db).execute())
+
+        assert result["aggregated_tickers"] == 2
+        assert len(db.reads) == 1 and len(db.reads[0]) == 2
+        thyao = next(row for row in db.aggregates if row["ticker"] == "THYAO")
+        # news = 0.5·0.5 = 0.25 blended with the stored social 0.2: 0.6·0.25 + 0.4·0.2
+        assert thyao["combined_score"] == pytest.approx(0.23, abs=1e-4)
+
+
+class TestFeedStateCommit:
+    def _articles(self):
+        return [
+            NewsArticle(source="bloomberght", headline=f"THYAO haber {i}", url=str(i),
+                        ticker="THYAO", published_at=datetime(2026, 6, 10))
+            for i in range(2)
+        ]
+
+    def test_commits_after_every_article_is_saved(self):
+        scraper = CommittingScraper(self._articles())
+        analyzer = FakeAnalyzer({"THYAO": _sentiment(SentimentType.POSITIVE, 0.8)})
+        run(CollectNewsSentimentUseCase(scraper, analyzer, FakeDB()).execute())
+        assert scraper.commits == 1
+
+    def test_no_commit_when_articles_are_not_saved(self):
+        scraper = CommittingScraper(self._articles())
+        analyzer = FakeAnalyzer({"haber 0": _sentiment(SentimentType.POSITIVE, 0.8)})
+        result = run(CollectNewsSentimentUseCase(scraper, analyzer, FakeDB()).execute())
+        assert result["saved"] == 1
+        assert scraper.commits == 0
+
+    def test_no_commit_when_persistence_raises(self):
+        class BrokenDB(FakeDB):
+            def upsert_news_article(self, data):
+                raise RuntimeError("db down")
+
+        scraper = CommittingScraper(self._articles())
+        analyzer = FakeAnalyzer({"THYAO": _sentiment(SentimentType.POSITIVE, 0.8)})
+        try:
+            run(CollectNewsSentimentUseCase(scraper, analyzer, BrokenDB()).execute())
+        except RuntimeError:
+            pass
+        assert scraper.commits == 0
@@ -14,6 +14,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from scrapers import news_portal_scraper
 from scrapers.news_portal_scraper import NewsPortalScraper
 from domain.entities.news_article import SOURCE_BLOOMBERG_HT, SOURCE_BIGPARA, SOURCE_INVESTING_TR, SOURCE_EKONOMIM
 
@@ -93,10 +94,57 @@ class TestDateHelpers:
 def _install_feedparser_stub(entries):
     mod = types.ModuleType("feedparser")
     parsed = types.SimpleNamespace(entries=entries)
-    mod.parse = lambda url: parsed
+    mod.parse = lambda payload: parsed
     sys.modules["feedparser"] = mod
 
 
+def _rss_scraper() -> NewsPortalScraper:
+    s = _make_scraper()
+    s._fetch_feed = AsyncMock(return_value=b"<rss/>")
+    return s
+
+
+class FakeResponse:
+    def __init__(self, status, body=b"", headers=None):
+        self.status = status
+        self._body = body
+        self.headers = headers or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise RuntimeError(f"HTTP {self.status}")
+
+    async def read(self):
+        return self._body
+
+
+class FakeSession:
+    """Stands in for aiohttp.ClientSession; replays scripted responses in order."""
+
+    def __init__(self, responses, sent):
+        self._responses = responses
+        self._sent = sent
+
+    def __call__(self, *a, **k):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def get(self, url, headers=None):
+        self._sent.append(dict(headers or {}))
+        return self._responses.pop(0)
+
+
 class TestFetchRss:
     def test_maps_entries_to_articles(self):
         _install_feedparser_stub([
@@ -113,7 +161,7 @@ class TestFetchRss:
                 "published": "2026-06-11T09:30:00",
             },
         ])
-        s = _make_scraper()
+        s = _rss_scraper()
         articles = run(s.fetch_rss("http://feed", SOURCE_BLOOMBERG_HT, None, days_back=3650))
         assert len(articles) == 2
         thy = next(a for a in articles if "Hava" in a.headline)
@@ -124,7 +172,7 @@ class TestFetchRss:
 
     def test_skips_entries_without_title(self):
         _install_feedparser_stub([{"summary": "no title", "link": "x"}])
-        s = _make_scraper()
+        s = _rss_scraper()
         articles = run(s.fetch_rss("http://feed", SOURCE_BLOOMBERG_HT, None))
         assert articles == []
 
@@ -133,11 +181,83 @@ class TestFetchRss:
             {"title": "THYAO haberi", "summary": "", "link": "a", "published": "2026-06-10"},
             {"title": "AKBNK haberi", "summary": "", "link": "b", "published": "2026-06-10"},
         ])
-        s = _make_scraper()
+        s = _rss_scraper()
         articles = run(s.fetch_rss("http://feed", SOURCE_BLOOMBERG_HT, ["THYAO"], days_back=3650))
         assert len(articles) == 1
         assert articles[0].ticker == "THYAO"
 
+    def test_unchanged_feed_is_skipped_without_parsing(self):
+        mod = types.ModuleType("feedparser")
+        mod.parse = lambda payload: pytest.fail("unchanged feed must not be parsed")
+        sys.modules["feedparser"] = mod
+        s = _make_scraper()
+        s._fetch_feed = AsyncMock(return_value=None)
+        assert run(s.fetch_rss("http://feed", SOURCE_BLOOMBERG_HT, None)) == []
+
+
+class TestConditionalFeedFetch:
+    URL = "https://feeds.example/rss"
+
+    @pytest.fixture(autouse=True)
+    def _clean_state(self, monkeypatch):
+        monkeypatch.setattr(news_portal_scraper, "_FEED_STATE", {})
+
+    def _session(self, monkeypatch, responses):
+        sent = []
+        monkeypatch.setattr(news_portal_scraper.aiohttp, "ClientSession", FakeSession(responses, sent))
+        return sent
+
+    def test_sends_validators_and_skips_on_304(self, monkeypatch):
+        sent = self._session(monkeypatch, [
+            FakeResponse(200, b"<rss>v1</rss>", {"ETag": '"abc"', "Last-Modified": "Wed, 10 Jun 2026 09:00:00 GMT"}),
+            FakeResponse(304),
+        ])
+        s = _make_scraper()
+        assert run(s._fetch_feed(self.URL)) == b"<rss>v1</rss>"
+        s.commit_feed_state()
+        assert run(s._fetch_feed(self.URL)) is None
+        assert "If-None-Match" not in sent[0]
+        assert sent[1]["If-None-Match"] == '"abc"'
+        assert sent[1]["If-Modified-Since"] == "Wed, 10 Jun 2026 09:00:00 GMT"
+        assert s._feed_unchanged(self.URL)
+
+    def test_identical_body_without_validators_is_unchanged(self, monkeypatch):
+        self._session(monkeypatch, [
+            FakeResponse(200, b"<rss>same</rss>"),
+            FakeResponse(200, b"<rss>same</rss>"),
+            FakeResponse(200, b"<rss>new</rss>"),
+        ])
+        s = _make_scraper()
+        assert run(s._fetch_feed(self.URL)) == b"<rss>same</rss>"
+        s.commit_feed_state()
+        assert run(s._fetch_feed(self.URL)) is None
+        assert run(s._fetch_feed(self.URL)) == b"<rss>new</rss>"
+
+    def test_validators_wait_for_commit(self, monkeypatch):
+        sent = self._session(monkeypatch, [
+            FakeResponse(200, b"<rss>v1</rss>", {"ETag": '"abc"'}),
+            FakeResponse(200, b"<rss>v1</rss>", {"ETag": '"abc"'}),
+        ])
+        s = _make_scraper()
+        assert run(s._fetch_feed(self.URL)) == b"<rss>v1</rss>"
+        # Nothing persisted yet, so the next run must download the feed again.
+        assert run(s._fetch_feed(self.URL)) == b"<rss>v1</rss>"
+        assert "If-None-Match" not in sent[1]
+        assert news_portal_scraper._FEED_STATE == {}
+
+    def test_state_is_per_ticker_filter(self, monkeypatch):
+        sent = self._session(monkeypatch, [
+            FakeResponse(200, b"<rss>v1</rss>", {"ETag": '"abc"'}),
+            FakeResponse(200, b"<rss>v1</rss>", {"ETag": '"abc"'}),
+        ])
+        _install_feedparser_stub([])
+        s = _make_scraper()
+        run(s.fetch_rss(self.URL, SOURCE_BLOOMBERG_HT, None, days_back=7))
+        s.commit_feed_state()
+        # A per-ticker refresh of the same feed is not answered by the scheduler's state.
+        run(s.fetch_rss(self.URL, SOURCE_BLOOMBERG_HT, ["THYAO"], days_back=7))
+        assert "If-None-Match" not in sent[1]
+
 
 # ── HTML path (Firecrawl extract_with_schema) ────────────────────────────────────
 class TestFetchHtml:
@@ -241,3 +361,44 @@ class TestScrapeAll:
         # No exception bubbles up; run still succeeds with zero articles
         assert result["success"] is True
         assert result["total"] == 0
+        assert {entry["status"] for entry in result["by_source_timing"].values()} == {"error"}
+
+    def test_sources_fetched_concurrently_with_per_host_limit(self, monkeypatch):
+        monkeypatch.setenv("NEWS_PER_HOST_CONCURRENCY", "2")
+        s = _make_scraper()
+        in_flight = {}
+        peak = {}
+
+        async def slow(url):
+            host = url.split("/")[2]
+            in_flight[host] = in_flight.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), in_flight[host])
+            await asyncio.sleep(0.05)
+            in_flight[host] -= 1
+            return []
+
+        async def fake_rss(feed_url, source, tickers, days_back):
+            return await slow(feed_url)
+
+        async def fake_html(listing_url, source, tickers, days_back):
+            return await slow(listing_url)
+
+        async def fake_inv(ticker, max_comments=30):
+            return await slow(s.INVESTING_EQUITY_URLS[ticker])
+
+        s.fetch_rss = fake_rss
+        s.fetch_html = fake_html
+        s.fetch_investing_comments = fake_inv
+
+        started = datetime.utcnow()
+        result = run(s.scrape_all(include_investing_comments=True))
+        elapsed = (datetime.utcnow() - started).total_seconds()
+
+        # 15 portals + 7 comment pages on one host: sequential would take >1 s.
+        assert elapsed < 0.5
+        assert peak["tr.investing.com"] == 2
+        assert max(peak.values()) == 2
+        timing = result["by_source_timing"]
+        assert set(timing) == set(result["by_source"])
+        assert timing[SOURCE_INVESTING_TR]["status"] == "ok"
+        assert timing[SOURCE_BLOOMBERG_HT]["elapsed_ms"] >= 40
@@ -13,6 +13,7 @@ import importlib.util
 import os
 import sys
 import types
+from datetime import date, datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -37,7 +38,7 @@ def _stub_psycopg2():
     p2.errors.DuplicateSchema = Exception
     p2.pool = types.ModuleType("psycopg2.pool")
     p2.pool.SimpleConnectionPool = MagicMock()
-    p2.pool.PoolError = Exception
+    p2.pool.PoolError = type("PoolError", (Exception,), {})
     p2.sql = types.ModuleType("psycopg2.sql")
     p2.sql.SQL = MagicMock(return_value=MagicMock())
     p2.sql.Identifier = MagicMock(return_value=MagicMock())
@@ -259,3 +260,290 @@ class TestUpsertNews:
         result = db.upsert_news({"news_id": "x", "title": "T"})
         assert result is None
         assert conn.rolled_back is True
+
+
+# ---------------------------------------------------------------------------
+# set-based bulk upserts
+# ---------------------------------------------------------------------------
+
+class BatchCursor(FakeCursor):
+    """Cursor whose fetchall() replays one RETURNING result per execute()."""
+
+    def __init__(self, results=None):
+        super().__init__()
+        self._results = list(results or [])
+
+    def fetchall(self):
+        return self._results.pop(0) if self._results else []
+
+
+def _make_batch_db(results=None):
+    db, conn = _make_db()
+    conn._cursor = BatchCursor(results)
+    return db, conn
+
+
+class TestUpsertManyVariants:
+    def test_news_articles_ids_follow_input_order(self):
+        # RETURNING order is not guaranteed, so ids are mapped back by key.
+        db, conn = _make_batch_db([[(11, "a2"), (10, "a1")]])
+        result = db.upsert_news_article_many([
+            {"article_id": "a1", "headline": "Bir"},
+            {"article_id": "bad"},  # no headline → skipped
+            {"article_id": "a2", "headline": "İki"},
+        ])
+        assert result == [10, None, 11]
+        assert len(conn._cursor.executed) == 1
+        assert conn._cursor.executed[0][1] == ["a1", "Bir", "a2", "İki"]
+        assert conn.committed is True
+
+    def test_duplicate_keys_are_merged_into_one_row(self):
+        db, conn = _make_batch_db([[(5, "p1")]])
+        result = db.upsert_social_post_many([
+            {"post_id": "p1", "text": "eski", "likes": 3},
+            {"post_id": "p1", "text": "yeni"},
+        ])
+        assert result == [5, 5]
+        # later non-null values win, earlier-only columns are kept
+        assert sorted(conn._cursor.executed[0][1], key=str) == sorted([3, "p1", "yeni"], key=str)
+
+    def test_chunks_share_one_transaction(self):
+        db, conn = _make_batch_db()
+        with patch.object(_dm_mod, "BULK_UPSERT_CHUNK_SIZE", 2):
+            result = db.upsert_disclosure_many(
+                [{"disclosure_id": str(i), "stock_code": "THYAO"} for i in range(5)]
+            )
+        assert result == [True] * 5
+        assert len(conn._cursor.executed) == 3
+        assert conn.committed is True
+
+    def test_failure_rolls_back_and_reports_every_row(self):
+        db, conn = _make_batch_db()
+        conn.cursor = lambda **kw: (_ for _ in ()).throw(RuntimeError("boom"))
+        result = db.upsert_news_many([{"news_id": "n1", "title": "T"}])
+        assert result == [None]
+        assert conn.rolled_back is True
+
+    def test_bad_row_only_loses_itself(self):
+        too_long = "x" * 300
+
+        class RejectingCursor(BatchCursor):
+            def execute(self, q, params=None):
+                super().execute(q, params)
+                if too_long in (params or []):
+                    raise RuntimeError("value too long for type character varying(255)")
+
+        db, conn = _make_db()
+        conn._cursor = RejectingCursor()
+        result = db.upsert_disclosure_many([
+            {"disclosure_id": "1", "company_name": "Türk Hava Yolları"},
+            {"disclosure_id": "2", "company_name": too_long},
+            {"disclosure_id": "3", "company_name": "Aselsan"},
+        ])
+        assert result == [True, False, True]
+        # the batch statement, then one retry per row
+        assert len(conn._cursor.executed) == 4
+
+    def test_row_retry_keeps_returned_ids(self):
+        class RejectingCursor(BatchCursor):
+            def execute(self, q, params=None):
+                super().execute(q, params)
+                if "bad date" in (params or []):
+                    raise RuntimeError("invalid input syntax for type timestamp")
+
+        db, conn = _make_db()
+        conn._cursor = RejectingCursor([[(10, "a1")], [(12, "a3")]])
+        result = db.upsert_news_article_many([
+            {"article_id": "a1", "headline": "Bir", "published_at": "2026-06-10"},
+            {"article_id": "a2", "headline": "İki", "published_at": "bad date"},
+            {"article_id": "a3", "headline": "Üç", "published_at": "2026-06-11"},
+        ])
+        assert result == [10, None, 12]
+
+    def test_empty_batch_skips_database(self):
+        db, conn = _make_batch_db()
+        assert db.upsert_youtube_video_sentiment_many([]) == []
+        assert conn._cursor.executed == []
+
+
+class TestBulkInsert:
+    def test_single_statement_for_all_rows(self):
+        db, conn = _make_batch_db()
+        assert db.bulk_insert("pdf_tables", [{"a": 1, "b": 2}, {"a": 3, "b": 4}]) is True
+        assert conn._cursor.executed == [(conn._cursor.executed[0][0], [1, 2, 3, 4])]
+        assert conn.committed is True
+
+
+# ---------------------------------------------------------------------------
+# pool gate, metrics and health check
+# ---------------------------------------------------------------------------
+
+class FakePool:
+    def __init__(self):
+        self.returned = []
+
+    def getconn(self):
+        return FakeConn()
+
+    def putconn(self, conn, close=False):
+        self.returned.append((conn, close))
+
+
+def _make_pooled_db(size=1):
+    db = DatabaseManager.__new__(DatabaseManager)
+    db.schema = "fin"
+    db.pool = FakePool()
+    db._init_pool_metrics(size)
+    return db
+
+
+class TestPoolGate:
+    def test_checkout_and_return_are_counted(self):
+        db = _make_pooled_db(size=2)
+        conn = db.get_connection()
+        assert db.pool_stats()["in_use"] == 1
+        db.return_connection(conn)
+        stats = db.pool_stats()
+        assert stats["in_use"] == 0
+        assert stats["acquired"] == 1
+        assert stats["peak_in_use"] == 1
+
+    def test_exhausted_pool_times_out(self):
+        db = _make_pooled_db(size=1)
+        db.get_connection()
+        with patch.object(_dm_mod.config.database, "pool_timeout", 0.05):
+            with pytest.raises(DatabaseManager.PoolExhaustedError):
+                db.get_connection()
+        assert db.pool_stats()["timeouts"] == 1
+
+    def test_waiting_caller_gets_released_connection(self):
+        import threading
+
+        db = _make_pooled_db(size=1)
+        held = db.get_connection()
+        threading.Timer(0.05, db.return_connection, args=(held,)).start()
+        with patch.object(_dm_mod.config.database, "pool_timeout", 2.0):
+            conn = db.get_connection()
+        assert conn is not held
+        stats = db.pool_stats()
+        assert stats["waited"] == 1
+        assert stats["avg_wait_ms"] > 0
+
+    def test_closed_connection_is_discarded(self):
+        db = _make_pooled_db()
+        conn = db.get_connection()
+        conn.closed = 1
+        db.return_connection(conn)
+        assert db.pool.returned == [(conn, True)]
+        assert db.pool_stats()["discarded"] == 1
+        # the slot is free again
+        db.return_connection(db.get_connection())
+
+    def test_failed_checkout_discards_the_connection(self):
+        class DroppedConn(FakeConn):
+            def __init__(self):
+                super().__init__()
+                self._cursor.execute = self._fail
+
+            @staticmethod
+            def _fail(q, params=None):
+                raise RuntimeError("server closed the connection unexpectedly")
+
+        db = _make_pooled_db()
+        dropped = DroppedConn()
+        db.pool.getconn = lambda: dropped
+        with pytest.raises(RuntimeError):
+            db.get_connection()
+        assert db.pool.returned == [(dropped, True)]
+        stats = db.pool_stats()
+        assert stats["discarded"] == 1
+        assert stats["in_use"] == 0
+
+    def test_health_check_reports_latency_and_pool(self):
+        db = _make_pooled_db()
+        result = db.health_check()
+        assert result["status"] == "connected"
+        assert result["latency_ms"] >= 0
+        assert result["pool"]["in_use"] == 0
+
+
+# ---------------------------------------------------------------------------
+# sentiment rollup refresh
+# ---------------------------------------------------------------------------
+
+class ScriptedCursor(FakeCursor):
+    """Cursor that answers fetchone()/fetchall() from queued results."""
+
+    def __init__(self, fetchone=(), fetchall=()):
+        super().__init__()
+        self._ones = list(fetchone)
+        self._alls = list(fetchall)
+
+    def fetchone(self):
+        return self._ones.pop(0)
+
+    def fetchall(self):
+        return self._alls.pop(0)
+
+
+def _make_rollup_db(fetchone, fetchall=()):
+    db, conn = _make_db()
+    conn._cursor = ScriptedCursor(fetchone, fetchall)
+    return db, conn
+
+
+class TestRefreshSentimentRollups:
+    def test_incremental_recomputes_only_dirty_days(self):
+        days = [date(2026, 6, 13), date(2026, 6, 14)]
+        stamp = datetime(2026, 6, 14, 9, 30)
+        db, conn = _make_rollup_db(fetchone=[(True,), (stamp, 0)], fetchall=[[(d,) for d in days]])
+        result = db.refresh_sentiment_rollups()
+        assert result == {"refreshed_at": stamp, "days_refreshed": 2, "pending_days": 0, "lock_busy": False}
+        params = [p for _, p in conn._cursor.executed]
+        # the dirty-day delete returns the days; the rollup delete and re-insert
+        # are scoped to them
+        assert params.count((days,)) == 2
+        assert conn.committed
+
+    def test_clean_rollup_skips_recompute(self):
+        db, conn = _make_rollup_db(fetchone=[(True,), (datetime(2026, 6, 14), 0)], fetchall=[[]])
+        result = db.refresh_sentiment_rollups()
+        assert result["days_refreshed"] == 0
+        # lock, dirty-day delete, stamp
+        assert len(conn._cursor.executed) == 3
+
+    def test_busy_lock_reports_stamp_without_writing(self):
+        db, conn = _make_rollup_db(fetchone=[(False,), (None, 4)])
+        result = db.refresh_sentiment_rollups(full=True)
+        assert result == {"refreshed_at": None, "days_refreshed": 0, "pending_days": 4, "lock_busy": True}
+        assert len(conn._cursor.executed) == 2
+
+    def test_wait_blocks_on_the_lock_instead_of_skipping(self):
+        db, conn = _make_rollup_db(fetchone=[(120,), (datetime(2026, 6, 14), 0)])
+        result = db.refresh_sentiment_rollups(full=True, wait=True)
+        assert "pg_advisory_xact_lock" in conn._cursor.executed[0][0]
+        assert result["days_refreshed"] == 120
+        assert result["lock_busy"] is False
+
+    def test_full_rebuild_counts_days(self):
+        db, conn = _make_rollup_db(fetchone=[(True,), (120,), (datetime(2026, 6, 14), 0)])
+        result = db.refresh_sentiment_rollups(full=True)
+        assert result["days_refreshed"] == 120
+        assert conn.committed
+
+
+class TestAggregateReadMany:
+    def test_one_query_keyed_by_input_pairs(self):
+        db, _ = _make_db()
+        calls = []
+        day = date(2026, 6, 10)
+
+        def fake_query(q, params=None):
+            calls.append(params)
+            return [{"ticker": "THYAO", "period_date": day, "news_score": 0.4}]
+
+        db.query = fake_query
+        result = db.get_aggregated_ticker_sentiment_many([("thyao", day), ("AKBNK", day)])
+        assert calls == [(["THYAO", "AKBNK"], [day, day])]
+        assert result[("thyao", day)]["news_score"] == 0.4
+        assert result[("AKBNK", day)] is None
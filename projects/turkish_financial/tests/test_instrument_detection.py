@@ -11,6 +11,11 @@ from infrastructure.contracts.instrument_identity_map import (
     STATIC_BIST_MAP,
     detect_instruments,
 )
+from infrastructure.contracts.instrument_matcher import (
+    InstrumentMatcher,
+    get_instrument_matcher,
+    invalidate_instrument_matcher,
+)
 
 
 def test_static_bist_catalogue_and_detection_map_cover_the_versioned_universe():
@@ -79,3 +84,91 @@ class TestDetectInstruments:
     def test_returns_list_not_set(self):
         result = detect_instruments("akbank büyüyor")
         assert isinstance(result, list)
+
+
+class CatalogueDB:
+    """db_manager double serving ``bist_companies`` rows and their fingerprint."""
+
+    def __init__(self, companies):
+        self.companies = companies
+
+    def query(self, sql, params=None):
+        if "md5" in sql:
+            return [{"n": len(self.companies), "digest": repr(self.companies)}]
+        return self.companies
+
+
+class TestInstrumentMatcher:
+    """The compiled matcher behind detect_instruments and news ticker tagging."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        invalidate_instrument_matcher()
+        yield
+        invalidate_instrument_matcher()
+
+    def test_reports_positions_in_original_text(self):
+        text = "Bugün THYAO ve Türk Hava Yolları konuşuldu."
+        matches = InstrumentMatcher(STATIC_BIST_MAP).find_all(text)
+        spans = [(m.ticker, text[m.start:m.end], m.via) for m in matches]
+        assert spans == [("THYAO", "THYAO", "ticker"), ("THYAO", "Türk Hava Yolları", "name")]
+
+    def test_turkish_upper_case_and_ascii_spellings_fold_together(self):
+        matcher = InstrumentMatcher({"ISCTR": ["türkiye iş bankası"], "TUPRS": ["tüpraş"]})
+        text = "TÜRKİYE İŞ BANKASI ve TUPRAS"
+        matches = matcher.find_all(text)
+        assert [m.ticker for m in matches] == ["ISCTR", "TUPRS"]
+        assert text[matches[0].start:matches[0].end] == "TÜRKİYE İŞ BANKASI"
+
+    def test_name_needs_word_start_but_allows_suffix(self):
+        matcher = InstrumentMatcher({"BIMAS": ["BİM"]})
+        assert matcher.detect("ibim market") == []
+        assert matcher.detect("bim'in cirosu ve bimin karı") == ["BIMAS"]
+
+    def test_overlapping_names_are_all_reported(self):
+        matcher = InstrumentMatcher({"KOZAL": ["koza altın"], "KOZAA": ["koza"]})
+        assert set(matcher.detect("koza altın madencilik")) == {"KOZAL", "KOZAA"}
+
+    def test_ticker_case_sensitivity_is_opt_in(self):
+        matcher = InstrumentMatcher({"THYAO": []})
+        assert matcher.detect("thyao yükseldi") == []
+        assert matcher.detect("thyao yükseldi", ignore_case_tickers=True) == ["THYAO"]
+
+    def test_ignore_case_is_limited_to_curated_codes(self):
+        matcher = InstrumentMatcher({"THYAO": [], "ALTIN": []}, ignore_case_codes=["THYAO"])
+        text = "Altın fiyatları düşerken thyao yükseldi, ALTIN sertifikası da"
+        assert matcher.detect(text, ignore_case_tickers=True) == ["THYAO", "ALTIN"]
+        assert [m.start for m in matcher.find_all(text, True) if m.ticker == "ALTIN"] == [text.index("ALTIN")]
+
+    def test_db_codes_need_upper_case(self):
+        db = CatalogueDB([
+            {"code": "ALTIN", "name": "Darphane Altın Sertifikası"},
+            {"code": "KONYA", "name": "Konya Çimento"},
+            {"code": "MAVI", "name": "Mavi Giyim"},
+        ])
+        matcher = get_instrument_matcher(db)
+        text = "Altın Konya'da mavi renkli vitrinlerde, Thyao da yükseldi"
+        assert matcher.detect(text, ignore_case_tickers=True) == ["THYAO"]
+        assert matcher.detect("KONYA çimento kapasitesini artırdı", ignore_case_tickers=True) == ["KONYA"]
+
+    def test_static_and_db_matchers_are_cached_separately(self):
+        static = get_instrument_matcher()
+        db_matcher = get_instrument_matcher(CatalogueDB([{"code": "YENI", "name": "Yeni Şirket"}]))
+        assert db_matcher is not static
+        assert db_matcher.detect("yeni sirket halka arz") == ["YENI"]
+        assert static.detect("yeni sirket halka arz") == []
+        assert get_instrument_matcher() is static
+
+    def test_rebuilt_when_bist_companies_changes(self, monkeypatch):
+        from infrastructure.contracts import instrument_matcher
+
+        monkeypatch.setattr(instrument_matcher, "_FINGERPRINT_TTL_SECONDS", 0.0)
+        db = CatalogueDB([{"code": "YENI", "name": "Yeni Şirket"}])
+        first = get_instrument_matcher(db)
+        assert first.detect("yeni sirket halka arz") == ["YENI"]
+        assert get_instrument_matcher(db) is first  # unchanged table → cached
+
+        db.companies.append({"code": "DAHA", "name": "Daha Yeni Holding"})
+        rebuilt = get_instrument_matcher(db)
+        assert rebuilt is not first
+        assert "DAHA" in rebuilt.detect("daha yeni holding bilanço")
@@ -0,0 +1,91 @@
+"""Unit tests for the shared pooled HTTP transports (infrastructure/proxy/transport.py)."""
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from infrastructure.proxy import (  # noqa: E402
+    DirectProvider,
+    ScraperAPIProvider,
+    close_transports,
+    get_transport,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    client_ports = set()
+
+    def _reply(self):
+        type(self).client_ports.add(self.client_address[1])
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._reply()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._reply()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    _Handler.client_ports = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        close_transports()
+
+
+def test_transport_is_shared_per_provider():
+    try:
+        assert get_transport(DirectProvider()) is get_transport(DirectProvider())
+        scraperapi = ScraperAPIProvider(host="proxy.example", port=8001, api_key="KEY")
+        assert get_transport(scraperapi) is not get_transport(DirectProvider())
+    finally:
+        close_transports()
+
+
+def test_session_uses_provider_proxies_and_tls_hint():
+    provider = ScraperAPIProvider(host="proxy.example", port=8001, api_key="KEY")
+    transport = get_transport(provider, pool_maxsize=4)
+    try:
+        session = transport.session
+        assert session.proxies == provider.requests_proxies()
+        assert session.verify is False
+        assert session.get_adapter("https://www.kap.org.tr")._pool_maxsize == 4
+    finally:
+        close_transports()
+
+
+def test_sequential_requests_reuse_connection(local_server):
+    transport = get_transport(DirectProvider())
+    for _ in range(3):
+        assert transport.request("POST", f"{local_server}/v2/scrape", json={"url": "x"}).ok
+    assert len(_Handler.client_ports) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_requests_share_pool(local_server):
+    transport = get_transport(DirectProvider())
+    for _ in range(3):
+        response = await transport.arequest("GET", f"{local_server}/tr/api/disclosures")
+        assert response.json() == {"ok": True}
+    assert len(_Handler.client_ports) == 1
@@ -1,5 +1,5 @@
 """
-Clear utils stubs injected at module-level by test_upstream_features.py.
+Clear the stubs injected at module-level by test_upstream_features.py.
 This runs at conftest load time (before test files in this package are
 collected), so the real modules are importable again.
 """
@@ -11,6 +11,10 @@ _STUBBED = [
     "utils.pdf_downloader",
     "utils.llm_analyzer",
     "utils.logger",
+    # the sentiment service and its domain imports, for the provider → parser tests
+    "domain.value_objects.sentiment",
+    "domain.services.sentiment_analyzer_service",
+    "infrastructure.services.sentiment_analyzer_impl",
 ]
 
 for _name in _STUBBED:
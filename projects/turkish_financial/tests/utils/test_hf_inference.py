@@ -0,0 +1,151 @@
+"""
+Tests for the shared HuggingFace inference layer (utils/hf_inference.py).
+
+No transformers/torch needed: the pipeline loader is monkeypatched with a fake
+classifier that records the batches it receives.
+"""
+import json
+import threading
+import time
+
+import pytest
+
+from utils import hf_inference
+from utils.hf_inference import InferenceQueue, chunk_text, score_chunks
+
+
+class FakeClassifier:
+    """Labels a text positive when it contains "kar", negative when it contains "zarar"."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.batches = []
+
+    def __call__(self, texts, batch_size=None, truncation=None):
+        self.batches.append(list(texts))
+        time.sleep(self.delay)
+        out = []
+        for text in texts:
+            if "zarar" in text:
+                out.append({"label": "LABEL_0", "score": 0.9})
+            elif "kar" in text:
+                out.append({"label": "LABEL_1", "score": 0.8})
+            else:
+                out.append({"label": "LABEL_2", "score": 0.6})
+        return out
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(hf_inference, "_classifiers", {})
+    monkeypatch.setattr(hf_inference, "_queues", {})
+    monkeypatch.setattr(hf_inference, "_model_locks", {})
+    loads = []
+
+    def fake_load(model_name):
+        loads.append(model_name)
+        if model_name == "missing/model":
+            raise OSError("not found")
+        return FakeClassifier()
+
+    monkeypatch.setattr(hf_inference, "_load_pipeline", fake_load)
+    return loads
+
+
+class TestRegistry:
+    def test_model_loaded_once_per_process(self, registry):
+        first = hf_inference.get_hf_classifier("m")
+        assert hf_inference.get_hf_classifier("m") is first
+        assert hf_inference.get_inference_queue("m") is hf_inference.get_inference_queue("m")
+        assert registry == ["m"]
+
+    def test_failed_load_is_remembered(self, registry):
+        assert hf_inference.get_hf_classifier("missing/model") is None
+        assert hf_inference.get_inference_queue("missing/model") is None
+        assert registry == ["missing/model"]
+
+    def test_providers_share_the_model(self, registry):
+        from utils.llm_analyzer import HuggingFaceLocalProvider
+
+        a = HuggingFaceLocalProvider(model_name="m")
+        b = HuggingFaceLocalProvider(model_name="m", company_name="THY")
+        assert a.classifier is b.classifier
+        assert registry == ["m"]
+
+
+class TestInferenceQueue:
+    def test_concurrent_callers_are_batched(self):
+        classifier = FakeClassifier(delay=0.02)
+        q = InferenceQueue(classifier, max_batch_size=8, max_wait_ms=30)
+        results = [None] * 8
+
+        def call(i):
+            results[i] = q.classify([f"metin {i} kar"])
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert all(r == [{"label": "LABEL_1", "score": 0.8}] for r in results)
+        assert len(classifier.batches) < 8
+        stats = q.stats()
+        assert stats["texts"] == 8
+        assert stats["batches"] == len(classifier.batches)
+        assert stats["avg_batch_size"] > 1
+        assert stats["texts_per_second"] > 0
+
+    def test_batch_size_is_capped_and_order_kept(self):
+        classifier = FakeClassifier()
+        q = InferenceQueue(classifier, max_batch_size=3, max_wait_ms=20)
+        results = q.classify(["kar", "zarar", "nötr", "kar", "zarar"])
+        assert [r["label"] for r in results] == ["LABEL_1", "LABEL_0", "LABEL_2", "LABEL_1", "LABEL_0"]
+        assert max(len(b) for b in classifier.batches) <= 3
+
+    def test_classifier_error_reaches_caller(self):
+        def broken(texts, **kwargs):
+            raise RuntimeError("oom")
+
+        q = InferenceQueue(broken, max_batch_size=4, max_wait_ms=1)
+        with pytest.raises(RuntimeError, match="oom"):
+            q.classify(["x"])
+        assert q.stats()["errors"] == 1
+
+
+class TestChunking:
+    def test_short_text_is_one_chunk(self):
+        assert chunk_text("Kısa metin.", max_chars=100) == ["Kısa metin."]
+
+    def test_splits_between_sentences(self):
+        text = "Birinci cümle burada. İkinci cümle burada. Üçüncü cümle burada."
+        chunks = chunk_text(text, max_chars=45)
+        assert chunks == ["Birinci cümle burada. İkinci cümle burada.", "Üçüncü cümle burada."]
+
+    def test_long_sentence_is_hard_split_and_chunks_capped(self):
+        chunks = chunk_text("a" * 1000, max_chars=100, max_chunks=4)
+        assert len(chunks) == 4
+        assert all(len(c) == 100 for c in chunks)
+
+    def test_single_chunk_score_is_model_score(self):
+        assert score_chunks(["metin"], [{"label": "LABEL_1", "score": 0.8}]) == ("positive", 0.8)
+
+    def test_chunks_vote_weighted_by_length(self):
+        label, confidence = score_chunks(
+            ["x" * 300, "y" * 100],
+            [{"label": "LABEL_0", "score": 0.9}, {"label": "LABEL_1", "score": 0.99}],
+        )
+        assert label == "negative"
+        assert confidence == pytest.approx(0.9 * 300 / 400)
+
+
+def test_provider_scores_whole_disclosure_not_first_2000_chars(registry, monkeypatch):
+    from utils.llm_analyzer import HuggingFaceLocalProvider
+
+    monkeypatch.setenv("HF_CHUNK_CHARS", "200")
+    provider = HuggingFaceLocalProvider(model_name="m")
+    # The first 2000 characters are neutral; the rest reports a loss.
+    content = "Genel kurul toplandı. " * 100 + "Şirket dönemi zarar ile kapattı. " * 150
+    result = json.loads(provider.analyze(content))
+    assert result["overall_sentiment"] == "negative"
+    assert len(hf_inference._classifiers["m"].batches[0]) > 1
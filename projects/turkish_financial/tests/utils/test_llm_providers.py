@@ -0,0 +1,166 @@
+"""
+Tests for chunked LLM provider calls: sentence-aligned chunking, concurrent chunk
+submission and the on-disk response cache. Model clients are replaced by fakes;
+the cache lives in a per-test temporary SQLite file.
+"""
+import asyncio
+import threading
+import time
+import types
+
+import pytest
+
+from infrastructure.services.sentiment_analyzer_impl import SentimentAnalyzerService
+from utils import llm_cache
+from utils.llm_analyzer import GeminiProvider, LocalLLMProvider
+from utils.text_chunker import approx_tokens, chunk_sentences
+
+
+@pytest.fixture(autouse=True)
+def response_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("LLM_RESPONSE_CACHE_PATH", str(tmp_path / "responses.sqlite"))
+    monkeypatch.setattr(llm_cache, "_cache", None)
+    monkeypatch.setattr(llm_cache, "_cache_failed", False)
+    yield
+    llm_cache._cache = None
+
+
+class FakeCompletions:
+    def __init__(self, delay=0.03, fail_on=None):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.calls = []
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def create(self, model, messages, temperature):
+        chunk = messages[-1]["content"]
+        with self._lock:
+            self.calls.append(chunk)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        if self.fail_on and self.fail_on in chunk:
+            raise RuntimeError("model overloaded")
+        message = types.SimpleNamespace(content=f"yanıt:{chunk[:12]}")
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+
+def _local_provider(completions, chunk_size=120):
+    provider = LocalLLMProvider(base_url="http://localhost:1/v1", chunk_size=chunk_size)
+    provider.client = types.SimpleNamespace(chat=types.SimpleNamespace(completions=completions))
+    return provider
+
+
+def _report(sentences=12):
+    return " ".join(f"Bölüm {i} için şirket net kârı arttı." for i in range(sentences))
+
+
+class TestChunkSentences:
+    def test_short_text_is_single_chunk(self):
+        assert chunk_sentences("Kısa bir bildirim.", max_tokens=100) == ["Kısa bir bildirim."]
+
+    def test_chunks_end_on_sentence_boundaries(self):
+        text = _report(10)
+        chunks = chunk_sentences(text, max_tokens=40)
+        assert len(chunks) > 1
+        assert all(chunk.endswith(".") for chunk in chunks)
+        assert all(approx_tokens(chunk) <= 40 for chunk in chunks)
+        assert " ".join(chunks) == text
+
+    def test_custom_token_counter(self):
+        words = lambda text: len(text.split())
+        chunks = chunk_sentences("bir iki üç. dört beş altı. yedi sekiz dokuz.", 6, count_tokens=words)
+        assert chunks == ["bir iki üç. dört beş altı.", "yedi sekiz dokuz."]
+
+    def test_oversized_sentence_is_hard_split(self):
+        chunks = chunk_sentences("x" * 100, max_tokens=10)
+        assert all(len(chunk) <= 30 for chunk in chunks)
+        assert "".join(chunks) == "x" * 100
+
+
+class TestLocalProviderChunks:
+    def test_chunks_are_sent_concurrently_in_order(self, monkeypatch):
+        monkeypatch.setenv("LLM_CHUNK_CONCURRENCY", "3")
+        completions = FakeCompletions()
+        provider = _local_provider(completions)
+        chunks = provider._chunk_content(_report())
+
+        result = provider.analyze(_report(), prompt="p")
+
+        assert len(completions.calls) == len(chunks) > 3
+        assert completions.peak == 3
+        assert result.split("\n\n") == [f"yanıt:{chunk[:12]}" for chunk in chunks]
+
+    def test_rerun_is_served_from_cache(self):
+        completions = FakeCompletions(delay=0)
+        provider = _local_provider(completions)
+        first = provider.analyze(_report(), prompt="p")
+        sent = len(completions.calls)
+
+        again = _local_provider(completions).analyze(_report(), prompt="p")
+        assert again == first
+        assert len(completions.calls) == sent
+        # A different prompt is a different cache entry.
+        provider.analyze(_report(), prompt="başka")
+        assert len(completions.calls) == 2 * sent
+
+    def test_failed_chunk_fails_the_call_but_keeps_finished_chunks(self):
+        text = _report()
+        failing = FakeCompletions(delay=0, fail_on="Bölüm 11")
+        assert _local_provider(failing).analyze(text, prompt="p") == ""
+
+        retry = FakeCompletions(delay=0)
+        assert _local_provider(retry).analyze(text, prompt="p") != ""
+        assert len(retry.calls) == 1 and "Bölüm 11" in retry.calls[0]
+
+
+def _gemini_post(posted, reply):
+    """requests.post stand-in where only gemini-2.0-flash answers, with reply(text)."""
+    def fake_post(url, json, headers, params, timeout):
+        posted.append(url)
+        if "gemini-2.0-flash:" not in url:
+            return types.SimpleNamespace(status_code=404, text="not found")
+        text = json["contents"][0]["parts"][0]["text"]
+        body = {"candidates": [{"content": {"parts": [{"text": reply(text)}]}}]}
+        return types.SimpleNamespace(status_code=200, json=lambda: body)
+
+    return fake_post
+
+
+class TestGeminiProvider:
+    def test_working_model_is_remembered_across_calls(self, monkeypatch):
+        import requests
+
+        posted = []
+        monkeypatch.setattr(requests, "post", _gemini_post(posted, lambda text: text[-8:]))
+        provider = GeminiProvider(api_key="k")
+
+        provider.analyze(_report(), prompt="p")
+        provider.analyze(_report(3), prompt="p")
+
+        # The first call walks past 1.5-flash once; the second goes straight to 2.0.
+        assert len(posted) == 3
+
+    def test_long_report_is_one_call_and_parses_as_json(self, monkeypatch):
+        import requests
+
+        answer = (
+            '{"overall_sentiment": "positive", "confidence": 0.8, "impact_horizon": "short_term", '
+            '"key_drivers": ["kâr"], "risk_flags": [], "tone_descriptors": ["iyimser"], '
+            '"target_audience": null, "analysis_text": "Kâr arttı."}'
+        )
+        posted = []
+        monkeypatch.setattr(requests, "post", _gemini_post(posted, lambda text: answer))
+        provider = GeminiProvider(api_key="k")
+        report = _report(1500)
+        assert len(report) > provider.chunk_size
+
+        analysis = asyncio.run(SentimentAnalyzerService(provider).analyze(report))
+
+        assert len(posted) == 2  # one 404 from 1.5-flash, then a single 2.0-flash call
+        assert analysis is not None
+        assert analysis.overall_sentiment.value == "positive"
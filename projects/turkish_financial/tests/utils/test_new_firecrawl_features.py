@@ -446,6 +446,57 @@ def test_assess_pdf_completeness(
     assert assessment["reason"] == reason
 
 
+# ---------------------------------------------------------------------------
+# Blocking SDK calls run off the event loop
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_concurrent_scrapes_overlap_without_blocking_loop():
+    """Sync SDK scrapes run on the shared executor, so they overlap."""
+    import asyncio
+    import time
+
+    def slow_scrape(url, **kwargs):
+        time.sleep(0.2)
+        return {"markdown": url}
+
+    fc = MagicMock()
+    fc.scrape.side_effect = slow_scrape
+    scraper = _make_scraper(fc)
+
+    ticks = 0
+
+    async def heartbeat():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    beat = asyncio.create_task(heartbeat())
+    t0 = time.perf_counter()
+    results = await asyncio.gather(*(scraper.scrape_url(f"https://example.com/{i}") for i in range(4)))
+    elapsed = time.perf_counter() - t0
+    beat.cancel()
+
+    assert all(r["success"] for r in results)
+    assert elapsed < 0.6
+    assert ticks >= 5
+
+
+def test_sdk_executor_is_bounded_by_config(monkeypatch):
+    """The shared executor is sized from config.firecrawl.max_concurrent_requests."""
+    import scrapers.base_scraper as base_scraper
+
+    monkeypatch.setattr(base_scraper, "_sdk_executor", None)
+    monkeypatch.setattr(base_scraper.config.firecrawl, "max_concurrent_requests", 3, raising=False)
+    executor = base_scraper._get_sdk_executor()
+    try:
+        assert executor._max_workers == 3
+        assert base_scraper._get_sdk_executor() is executor
+    finally:
+        executor.shutdown(wait=False)
+
+
 # ---------------------------------------------------------------------------
 # KAPScraper new methods (mocked)
 # ---------------------------------------------------------------------------
@@ -0,0 +1,24 @@
+"""
+Batched persistence through DatabaseManager's ``upsert_*_many`` helpers.
+
+Callers hand over the whole batch; managers that only implement the single-row
+helpers (older deployments, test doubles) are driven row by row instead.
+"""
+from typing import Any, List, Sequence
+
+
+def upsert_many(db_manager, method: str, items: Sequence[Any]) -> List[Any]:
+    """
+    Persist ``items`` with ``db_manager.<method>_many`` and return its per-item results.
+
+    Falls back to ``db_manager.<method>`` per item; tuple items are passed as positional
+    arguments (e.g. ``(article_pk, sentiment_row)``), anything else as the only argument.
+    Results are always in input order.
+    """
+    if not items:
+        return []
+    batched = getattr(db_manager, f"{method}_many", None)
+    if batched is not None:
+        return list(batched(list(items)))
+    single = getattr(db_manager, method)
+    return [single(*item) if isinstance(item, tuple) else single(item) for item in items]
@@ -0,0 +1,259 @@
+"""
+Process-wide HuggingFace sentiment inference: one model load, batched CPU passes.
+
+``HuggingFaceLocalProvider`` used to build a fresh ``transformers.pipeline`` per
+instance, and the sentiment routers build a new ``ProductionKAPScraper`` (and so a
+new provider) per request. Each request therefore reloaded the BERT weights and then
+classified one truncated text at a time. This module provides:
+
+  * ``get_hf_classifier(model_name)`` — registry that loads each model once per
+    process (failures are remembered too, so a missing model is not retried per call);
+  * ``InferenceQueue`` — a micro-batching queue in front of a classifier. Concurrent
+    callers' texts are collected for up to ``max_wait_ms`` (or until ``max_batch_size``)
+    and run as one padded batch, which is several times cheaper per text on CPU than
+    single-text calls. ``stats()`` reports batches, batch sizes and throughput;
+  * ``chunk_text`` / ``score_chunks`` — split long disclosures into sentence-aligned
+    chunks and combine the per-chunk labels, instead of classifying the first 2000
+    characters only.
+
+Tuning: ``HF_BATCH_SIZE`` (default 16), ``HF_BATCH_WAIT_MS`` (default 10),
+``HF_CHUNK_CHARS`` (default 1500) and ``HF_MAX_CHUNKS`` (default 16).
+"""
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from utils.text_chunker import chunk_sentences
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 16
+DEFAULT_BATCH_WAIT_MS = 10.0
+DEFAULT_CHUNK_CHARS = 1500
+DEFAULT_MAX_CHUNKS = 16
+
+LABEL_MAP = {
+    'POSITIVE': 'positive',
+    'NEGATIVE': 'negative',
+    'NEUTRAL': 'neutral',
+    'LABEL_0': 'negative',
+    'LABEL_1': 'positive',
+    'LABEL_2': 'neutral',
+}
+
+def _env_number(name: str, default, cast=int):
+    try:
+        return max(cast(1), cast(os.getenv(name, default)))
+    except ValueError:
+        return default
+
+
+# ── model registry ────────────────────────────────────────────────────────────
+_registry_lock = threading.Lock()
+_model_locks: Dict[str, threading.Lock] = {}
+_classifiers: Dict[str, Any] = {}
+_queues: Dict[str, "InferenceQueue"] = {}
+
+
+def _load_pipeline(model_name: str):
+    from transformers import pipeline
+
+    return pipeline("sentiment-analysis", model=model_name, tokenizer=model_name)
+
+
+def get_hf_classifier(model_name: str):
+    """
+    Return the shared pipeline for ``model_name``, loading it on first use.
+
+    Returns None when the model cannot be loaded; the failure is cached for the life
+    of the process so every later request falls back immediately.
+    """
+    if model_name in _classifiers:
+        return _classifiers[model_name]
+    with _registry_lock:
+        model_lock = _model_locks.setdefault(model_name, threading.Lock())
+    # Per-model lock: concurrent first requests wait for one load instead of each
+    # loading the weights, and loading one model does not block another.
+    with model_lock:
+        if model_name not in _classifiers:
+            started = time.perf_counter()
+            try:
+                _classifiers[model_name] = _load_pipeline(model_name)
+                logger.info(
+                    f"Loaded HuggingFace model {model_name} in {time.perf_counter() - started:.1f}s"
+                )
+            except Exception as e:
+                logger.error(f"Failed to initialize HuggingFace pipeline: {e}")
+                _classifiers[model_name] = None
+    return _classifiers[model_name]
+
+
+def get_inference_queue(model_name: str) -> Optional["InferenceQueue"]:
+    """Shared batching queue for ``model_name``; None when the model is unavailable."""
+    if model_name in _queues:
+        return _queues[model_name]
+    classifier = get_hf_classifier(model_name)
+    if classifier is None:
+        return None
+    with _registry_lock:
+        if model_name not in _queues:
+            _queues[model_name] = InferenceQueue(
+                classifier,
+                max_batch_size=_env_number("HF_BATCH_SIZE", DEFAULT_BATCH_SIZE),
+                max_wait_ms=_env_number("HF_BATCH_WAIT_MS", DEFAULT_BATCH_WAIT_MS, float),
+                name=model_name,
+            )
+        return _queues[model_name]
+
+
+def inference_stats() -> Dict[str, Dict[str, Any]]:
+    """Throughput metrics for every started queue, keyed by model name."""
+    return {name: q.stats() for name, q in list(_queues.items())}
+
+
+# ── micro-batching queue ──────────────────────────────────────────────────────
+class InferenceQueue:
+    """
+    Collects texts from concurrent callers and classifies them in padded batches.
+
+    A single daemon worker drains the queue: it blocks for the first text, then keeps
+    taking texts until ``max_batch_size`` is reached or ``max_wait_ms`` has passed,
+    and runs the classifier once for the whole batch. ``classify`` blocks the calling
+    thread until its own texts are scored.
+    """
+
+    def __init__(
+        self,
+        classifier: Callable[..., List[Dict[str, Any]]],
+        max_batch_size: int = DEFAULT_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_BATCH_WAIT_MS,
+        name: str = "",
+    ):
+        self._classifier = classifier
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+        self.name = name
+        self._pending: "queue.Queue[Tuple[str, Future]]" = queue.Queue()
+        self._stats_lock = threading.Lock()
+        self._batches = 0
+        self._texts = 0
+        self._errors = 0
+        self._largest_batch = 0
+        self._busy_seconds = 0.0
+        self._started_at = time.monotonic()
+        self._worker = threading.Thread(
+            target=self._run, name=f"hf-inference-{name or 'model'}", daemon=True
+        )
+        self._worker.start()
+
+    def classify(self, texts: Sequence[str], timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Score ``texts``; returns one ``{"label", "score"}`` dict per text, in order."""
+        futures: List[Future] = []
+        for text in texts:
+            future: Future = Future()
+            self._pending.put((text, future))
+            futures.append(future)
+        return [future.result(timeout=timeout) for future in futures]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            batches, texts, busy = self._batches, self._texts, self._busy_seconds
+            return {
+                "batches": batches,
+                "texts": texts,
+                "errors": self._errors,
+                "avg_batch_size": round(texts / batches, 2) if batches else 0.0,
+                "largest_batch": self._largest_batch,
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": self.max_wait * 1000.0,
+                "busy_seconds": round(busy, 3),
+                "texts_per_second": round(texts / busy, 2) if busy else 0.0,
+                "queue_depth": self._pending.qsize(),
+                "uptime_seconds": round(time.monotonic() - self._started_at, 1),
+            }
+
+    def _next_batch(self) -> List[Tuple[str, Future]]:
+        batch = [self._pending.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._pending.get(timeout=remaining) if remaining > 0 else self._pending.get_nowait()
+            except queue.Empty:
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            texts = [text for text, _ in batch]
+            started = time.perf_counter()
+            try:
+                # The pipeline pads each batch to its longest member itself.
+                results = self._classifier(texts, batch_size=len(texts), truncation=True)
+                if len(results) != len(texts):
+                    raise RuntimeError(f"classifier returned {len(results)} results for {len(texts)} texts")
+            except Exception as e:  # noqa: BLE001 - surface to the waiting callers
+                with self._stats_lock:
+                    self._errors += len(batch)
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            elapsed = time.perf_counter() - started
+            with self._stats_lock:
+                self._batches += 1
+                self._texts += len(texts)
+                self._largest_batch = max(self._largest_batch, len(texts))
+                self._busy_seconds += elapsed
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+
+
+# ── chunk-level scoring ──────────────────────────────────────────────────────
+def chunk_text(
+    text: str,
+    max_chars: Optional[int] = None,
+    max_chunks: Optional[int] = None,
+) -> List[str]:
+    """
+    Split ``text`` into chunks of at most ``max_chars``, breaking between sentences.
+
+    A single sentence longer than ``max_chars`` is hard-split. At most ``max_chunks``
+    chunks are returned, sampled evenly across the document so the end of a long
+    disclosure (where results and outlook usually sit) is still scored.
+    """
+    max_chars = max_chars or _env_number("HF_CHUNK_CHARS", DEFAULT_CHUNK_CHARS)
+    max_chunks = max_chunks or _env_number("HF_MAX_CHUNKS", DEFAULT_MAX_CHUNKS)
+    chunks = chunk_sentences(text, max_chars, count_tokens=len)
+    if len(chunks) > max_chunks:
+        step = len(chunks) / max_chunks
+        chunks = [chunks[int(i * step)] for i in range(max_chunks)]
+    return chunks
+
+
+def score_chunks(chunks: Sequence[str], results: Sequence[Dict[str, Any]]) -> Tuple[str, float]:
+    """
+    Combine per-chunk predictions into one (sentiment, confidence).
+
+    Each chunk votes for its label with weight ``score × len(chunk)``; the label with
+    the largest weight wins and its confidence is that weight over the total chunk
+    length. For a single chunk this is exactly the model's own label and score.
+    """
+    weights: Dict[str, float] = {}
+    total = 0.0
+    for chunk, result in zip(chunks, results):
+        label = LABEL_MAP.get(str(result.get('label', '')).upper(), 'neutral')
+        size = float(len(chunk)) or 1.0
+        weights[label] = weights.get(label, 0.0) + float(result.get('score', 0.0)) * size
+        total += size
+    if not weights or total <= 0:
+        return 'neutral', 0.0
+    label = max(weights, key=weights.get)
+    return label, weights[label] / total
@@ -6,7 +6,8 @@ import logging
 import json
 import re
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Any, List, Optional
 from pathlib import Path
 from openai import OpenAI
 from fpdf import FPDF
@@ -33,8 +34,22 @@ except ImportError:
         _GEMINI_LEGACY = False
         genai = None
 
+from utils.hf_inference import chunk_text, get_hf_classifier, get_inference_queue, score_chunks
+from utils.llm_cache import ResponseCache, get_response_cache
+from utils.text_chunker import CHARS_PER_TOKEN, chunk_sentences
+
 logger = logging.getLogger(__name__)
 
+# In-flight model calls per analyze() for chunked providers.
+DEFAULT_CHUNK_CONCURRENCY = 4
+
+
+def _chunk_concurrency() -> int:
+    try:
+        return max(1, int(os.getenv("LLM_CHUNK_CONCURRENCY", DEFAULT_CHUNK_CONCURRENCY)))
+    except ValueError:
+        return DEFAULT_CHUNK_CONCURRENCY
+
 
 class LLMProvider(ABC):
     """Abstract base class for LLM providers"""
@@ -53,6 +68,50 @@ class LLMProvider(ABC):
         """
         pass
 
+    def _analyze_chunks(
+        self,
+        chunks: List[str],
+        prompt: str,
+        call: Callable[[str], str],
+        model_id: str,
+    ) -> List[str]:
+        """
+        Run ``call(chunk)`` for every chunk not already in the response cache.
+
+        Uncached chunks are submitted concurrently (``LLM_CHUNK_CONCURRENCY``, default
+        4) and each successful response is cached as soon as it arrives, so a failed
+        run still saves the chunks that completed. Responses are returned in chunk
+        order; the first chunk error is re-raised after the others finish.
+        """
+        cache = get_response_cache()
+        temperature = getattr(self, "temperature", None)
+        keys = [
+            ResponseCache.key(type(self).__name__, model_id, temperature, prompt, chunk)
+            for chunk in chunks
+        ]
+        responses: List[Optional[str]] = [cache.get(key) if cache else None for key in keys]
+        missing = [i for i, response in enumerate(responses) if response is None]
+        if len(missing) < len(chunks):
+            logger.info(f"{len(chunks) - len(missing)}/{len(chunks)} chunks served from response cache")
+
+        error: Optional[Exception] = None
+        workers = min(_chunk_concurrency(), len(missing))
+        if missing:
+            with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="llm-chunk") as pool:
+                futures = {pool.submit(call, chunks[i]): i for i in missing}
+                for future in as_completed(futures):
+                    i = futures[future]
+                    try:
+                        responses[i] = future.result() or ""
+                    except Exception as e:  # noqa: BLE001 - re-raised once all chunks settle
+                        error = error or e
+                        continue
+                    if cache and responses[i]:
+                        cache.put(keys[i], responses[i])
+        if error is not None:
+            raise error
+        return [response or "" for response in responses]
+
 
 class LocalLLMProvider(LLMProvider):
     """Local LLM provider (LM Studio, Ollama, etc.)"""
@@ -95,50 +154,44 @@ class LocalLLMProvider(LLMProvider):
                     "Cevaplarını Türkçe olarak hazırla ve finansal fırsatları detaylandır."
                 )
             
-            # Split content into chunks if needed
+            # Split content into chunks if needed; cached chunks are not re-sent
             chunks = self._chunk_content(content)
-            responses = []
-            
-            for i, chunk in enumerate(chunks):
-                logger.info(f"Analyzing chunk {i + 1}/{len(chunks)}")
-                
-                messages = [
-                    {"role": "system", "content": prompt},
-                    {"role": "user", "content": chunk}
-                ]
-                
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    temperature=self.temperature
-                )
-                
-                responses.append(response.choices[0].message.content)
+            if len(chunks) > 1:
+                logger.info(f"Analyzing {len(chunks)} chunks")
+            responses = self._analyze_chunks(
+                chunks, prompt, lambda chunk: self._complete(prompt, chunk), self.model
+            )
             
             return "\n\n".join(responses)
             
         except Exception as e:
             logger.error(f"Error analyzing content with LLM: {e}")
             return ""
+
+    def _complete(self, prompt: str, chunk: str) -> str:
+        """One chat completion for one chunk (the OpenAI client is thread-safe)."""
+        messages = [
+            {"role": "system", "content": prompt},
+            {"role": "user", "content": chunk}
+        ]
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=self.temperature
+        )
+        return response.choices[0].message.content
     
     def _chunk_content(self, content: str) -> List[str]:
         """
-        Split content into chunks to fit model context
+        Split content into sentence-aligned chunks that fit the model context
         
         Args:
             content: Text to split
             
         Returns:
-            List of content chunks
+            List of content chunks (``chunk_size`` characters ≈ the token budget)
         """
-        if len(content) <= self.chunk_size:
-            return [content]
-        
-        chunks = []
-        for i in range(0, len(content), self.chunk_size):
-            chunks.append(content[i:i + self.chunk_size])
-        
-        return chunks
+        return chunk_sentences(content, max(1, self.chunk_size // CHARS_PER_TOKEN))
 
 
 class OpenAIProvider(LLMProvider):
@@ -216,8 +269,6 @@ class GeminiProvider(LLMProvider):
     def analyze(self, content: str, prompt: Optional[str] = None) -> str:
         """Analyze content using Google Gemini API (REST API v1 for compatibility)"""
         try:
-            import requests
-            
             # Use default Turkish financial analysis prompt if none provided
             if not prompt:
                 prompt = (
@@ -228,130 +279,114 @@ class GeminiProvider(LLMProvider):
                     "net tavsiyelerde bulun. Tavsiyelerinin dayandığı nedenleri açıkça belirt. "
                     "Cevaplarını Türkçe olarak hazırla ve finansal fırsatları detaylandır."
                 )
-            
-            # Combine prompt and content
-            full_prompt = f"{prompt}\n\n{content}"
-            
-            # Use REST API v1 (more reliable than SDK)
-            # Try different model names if the default fails
-            model_to_try = self.model_name
-            models_to_try = [
-                self.model_name,
-                "gemini-1.5-flash",
-                "gemini-1.5-pro", 
-                "gemini-pro",
-                "models/gemini-1.5-flash",
-                "models/gemini-1.5-pro"
-            ]
-            
-            last_error = None
-            for model_to_try in models_to_try:
-                url = f"{self.base_url}/models/{model_to_try}:generateContent"
-            
-            payload = {
-                "contents": [{
-                    "parts": [{
-                        "text": full_prompt
-                    }]
-                }],
-                "generationConfig": {
-                    "temperature": self.temperature
-                }
-            }
-            
-            headers = {"Content-Type": "application/json"}
-            params = {"key": self.api_key}
-            
-            # Try different model names - COST OPTIMIZED ORDER (cheapest first)
-            models_to_try = [
-                "models/gemini-1.5-flash",  # COST OPTIMIZED: 75-80% cheaper than 2.5
-                "models/gemini-2.0-flash",  # Fallback option 
-                "models/gemini-2.5-flash",  # Expensive - only if others fail
-                "models/gemini-2.0-flash-lite",  # Lightweight backup
-                self.model_name  # User-specified
-            ]
-            
-            last_error = None
-            for model_to_try in models_to_try:
-                url = f"{self.base_url}/{model_to_try}:generateContent"
-                
-                logger.info(f"Trying Gemini REST API v1 with model: {model_to_try}")
-                
-                try:
-                    response = requests.post(url, json=payload, headers=headers, params=params, timeout=60)
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        if 'candidates' in data and data['candidates']:
-                            text = data['candidates'][0]['content']['parts'][0]['text']
-                            logger.info(f"✅ Successfully got {len(text)} chars from Gemini using model: {model_to_try}")
-                            return text
-                        else:
-                            logger.warning(f"No candidates in Gemini response for {model_to_try}")
-                            continue
-                    else:
-                        error_text = response.text[:300]
-                        last_error = f"{response.status_code}: {error_text}"
-                        logger.debug(f"Model {model_to_try} failed: {last_error}")
-                        continue
-                except Exception as e:
-                    last_error = str(e)
-                    logger.debug(f"Exception with {model_to_try}: {e}")
-                    continue
-            
-            # If all models failed, log the last error
-            logger.error(f"All Gemini models failed. Last error: {last_error}")
-            return ""
-            
-            # If all models failed, log the last error
-            logger.error(f"All Gemini models failed. Last error: {last_error}")
-            return ""
-            
+
+            # Gemini's context window holds a whole report, so the content goes out in
+            # one call: callers parse a single JSON answer, and per-chunk answers
+            # joined together would not parse. A cached answer is not sent again.
+            responses = self._analyze_chunks(
+                [content], prompt, lambda chunk: self._generate(f"{prompt}\n\n{chunk}"), self.model_name
+            )
+            return responses[0]
+
         except ImportError:
             logger.error("requests library required for Gemini REST API")
             return ""
         except Exception as e:
             logger.error(f"Error analyzing content with Gemini API: {e}", exc_info=True)
             return ""
+
+    def _generate(self, full_prompt: str) -> str:
+        """
+        One generateContent call, trying models in cost order.
+
+        The first model that answers is remembered and tried first afterwards, so
+        later requests skip the models that already failed. Raises when
+        every model fails.
+        """
+        import requests
+
+        payload = {
+            "contents": [{
+                "parts": [{
+                    "text": full_prompt
+                }]
+            }],
+            "generationConfig": {
+                "temperature": self.temperature
+            }
+        }
+
+        headers = {"Content-Type": "application/json"}
+        params = {"key": self.api_key}
+
+        # Try different model names - COST OPTIMIZED ORDER (cheapest first)
+        models_to_try = [
+            "models/gemini-1.5-flash",  # COST OPTIMIZED: 75-80% cheaper than 2.5
+            "models/gemini-2.0-flash",  # Fallback option 
+            "models/gemini-2.5-flash",  # Expensive - only if others fail
+            "models/gemini-2.0-flash-lite",  # Lightweight backup
+            self.model_name  # User-specified
+        ]
+        working = getattr(self, "_working_model", None)
+        if working:
+            models_to_try = [working] + [m for m in models_to_try if m != working]
+
+        last_error = None
+        for model_to_try in models_to_try:
+            url = f"{self.base_url}/{model_to_try}:generateContent"
+
+            logger.info(f"Trying Gemini REST API v1 with model: {model_to_try}")
+
+            try:
+                response = requests.post(url, json=payload, headers=headers, params=params, timeout=60)
+
+                if response.status_code == 200:
+                    data = response.json()
+                    if 'candidates' in data and data['candidates']:
+                        text = data['candidates'][0]['content']['parts'][0]['text']
+                        logger.info(f"✅ Successfully got {len(text)} chars from Gemini using model: {model_to_try}")
+                        self._working_model = model_to_try
+                        return text
+                    else:
+                        logger.warning(f"No candidates in Gemini response for {model_to_try}")
+                        continue
+                else:
+                    error_text = response.text[:300]
+                    last_error = f"{response.status_code}: {error_text}"
+                    logger.debug(f"Model {model_to_try} failed: {last_error}")
+                    continue
+            except Exception as e:
+                last_error = str(e)
+                logger.debug(f"Exception with {model_to_try}: {e}")
+                continue
+
+        raise RuntimeError(f"All Gemini models failed: {last_error}")
     
     def _chunk_content(self, content: str) -> List[str]:
         """
-        Split content into chunks to fit model context
+        Split content into sentence-aligned chunks that fit model context
         
         Args:
             content: Text to split
             
         Returns:
-            List of content chunks
+            List of content chunks (``chunk_size`` characters ≈ the token budget)
         """
-        if len(content) <= self.chunk_size:
-            return [content]
-        
-        chunks = []
-        for i in range(0, len(content), self.chunk_size):
-            chunks.append(content[i:i + self.chunk_size])
-        
-        return chunks
+        return chunk_sentences(content, max(1, self.chunk_size // CHARS_PER_TOKEN))
 
 
 class HuggingFaceLocalProvider(LLMProvider):
     """HuggingFace local sentiment analysis provider"""
 
     def __init__(self, model_name: str = "savasy/bert-base-turkish-sentiment-cased", disclosure_type: str = 'Diğer', company_name: str = ""):
-        try:
-            from transformers import pipeline
-            self.classifier = pipeline(
-                "sentiment-analysis",
-                model=model_name,
-                tokenizer=model_name
-            )
-        except (ImportError, Exception) as e:
-            logger.error(f"Failed to initialize HuggingFace pipeline: {e}")
-            self.classifier = None
+        # The model is loaded once per process and shared through a batching queue,
+        # so constructing a provider per request is cheap.
+        self.model_name = model_name
+        self.classifier = get_hf_classifier(model_name)
+        self._queue = get_inference_queue(model_name) if self.classifier else None
         self.disclosure_type = disclosure_type
         self.company_name = company_name
 
-
     def analyze(self, content: str, prompt: Optional[str] = None) -> str:
         """
         Analyze sentiment using a local HuggingFace model.
@@ -363,7 +398,7 @@ class HuggingFaceLocalProvider(LLMProvider):
         Returns:
             A JSON string with the sentiment analysis result.
         """
-        if not self.classifier:
+        if not self.classifier or self._queue is None:
             return ""
 
         try:
@@ -374,18 +409,13 @@ class HuggingFaceLocalProvider(LLMProvider):
             content_processed = tr_lower(content)
 
             # --- Strategy 1: Transformer Model ---
+            # Long disclosures are scored chunk by chunk (batched with any other
+            # in-flight requests) rather than truncated to the first 2000 chars.
             model_sentiment = None
             model_confidence = 0.0
-            result = self.classifier(content[:2000])[0]
-            mapping = {
-                'POSITIVE': 'positive',
-                'NEGATIVE': 'negative',
-                'LABEL_0': 'negative',
-                'LABEL_1': 'positive',
-                'LABEL_2': 'neutral'
-            }
-            model_sentiment = mapping.get(result['label'], 'neutral')
-            model_confidence = float(result['score'])
+            chunks = chunk_text(content)
+            if chunks:
+                model_sentiment, model_confidence = score_chunks(chunks, self._queue.classify(chunks))
 
             # --- Strategy 2: Enhanced Financial Lexicon (simplified for provider) ---
             keywords = {
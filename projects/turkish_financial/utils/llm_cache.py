@@ -0,0 +1,112 @@
+"""
+On-disk cache of LLM responses keyed by a hash of provider, model, prompt and text.
+
+KAP disclosures are re-analysed on every re-run (backfills, re-scrapes, a changed
+provider default), and long annual reports cost many chunk calls each time. Providers
+look every chunk up here first and only call the model for chunks they have not seen,
+so a re-run costs only the chunks whose text actually changed.
+
+The cache is a single SQLite file (``LLM_RESPONSE_CACHE_PATH``, default
+``data/llm_cache/responses.sqlite``); entries expire after
+``LLM_RESPONSE_CACHE_TTL_DAYS`` (default 30). Set ``LLM_RESPONSE_CACHE=0`` to disable.
+Cache errors are logged and treated as misses — the cache never fails an analysis.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = "data/llm_cache/responses.sqlite"
+DEFAULT_TTL_DAYS = 30.0
+
+
+class ResponseCache:
+    """Thread-safe SQLite key/value store for model responses."""
+
+    def __init__(self, path: str, ttl_days: float = DEFAULT_TTL_DAYS):
+        self.path = path
+        self.ttl_seconds = max(0.0, float(ttl_days)) * 86400
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_responses ("
+            " key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """Stable content hash of ``parts`` (provider, model, settings, prompt, text)."""
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(str(part).encode("utf-8"))
+            digest.update(b"\x1f")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT response, created_at FROM llm_responses WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"LLM response cache read failed: {e}")
+            row = None
+        if row is None or (self.ttl_seconds and time.time() - row[1] > self.ttl_seconds):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0]
+
+    def put(self, key: str, response: str) -> None:
+        if not response:
+            return
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_responses (key, response, created_at) VALUES (?, ?, ?)",
+                    (key, response, time.time()),
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"LLM response cache write failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {"path": self.path, "hits": self.hits, "misses": self.misses}
+
+
+_cache_lock = threading.Lock()
+_cache: Optional[ResponseCache] = None
+_cache_failed = False
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Process-wide response cache, or None when disabled or the file cannot be opened."""
+    global _cache, _cache_failed
+    if _cache is not None or _cache_failed:
+        return _cache
+    if os.getenv("LLM_RESPONSE_CACHE", "1").strip().lower() in ("0", "false", "no", "off"):
+        return None
+    with _cache_lock:
+        if _cache is None and not _cache_failed:
+            path = os.getenv("LLM_RESPONSE_CACHE_PATH", DEFAULT_CACHE_PATH)
+            try:
+                ttl_days = float(os.getenv("LLM_RESPONSE_CACHE_TTL_DAYS", DEFAULT_TTL_DAYS))
+                _cache = ResponseCache(path, ttl_days)
+            except (OSError, ValueError, sqlite3.Error) as e:
+                logger.warning(f"LLM response cache disabled ({path}): {e}")
+                _cache_failed = True
+    return _cache
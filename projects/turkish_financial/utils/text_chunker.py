@@ -0,0 +1,72 @@
+"""
+Sentence-aligned chunking for model inputs.
+
+Providers used to cut long KAP texts into fixed character slices, which splits
+sentences (and often numbers) across two requests and shifts every boundary when a
+single character changes upstream. ``chunk_sentences`` packs whole sentences into
+chunks under a token budget, so a chunk boundary only moves where the text changed
+and per-chunk response caching stays effective across re-runs.
+
+Token counts are estimated (``approx_tokens``) unless the caller passes a real
+tokenizer's counter; Turkish averages roughly three characters per LLM token.
+"""
+from __future__ import annotations
+
+import math
+import re
+from typing import Callable, List, Optional
+
+CHARS_PER_TOKEN = 3
+
+_SENTENCE_END = re.compile(r'(?<=[.!?;:])\s+|\n+')
+
+
+def approx_tokens(text: str) -> int:
+    """Conservative token estimate for Turkish text."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def chunk_sentences(
+    text: str,
+    max_tokens: int,
+    count_tokens: Optional[Callable[[str], int]] = None,
+) -> List[str]:
+    """
+    Split ``text`` into chunks of at most ``max_tokens``, breaking between sentences.
+
+    A sentence that alone exceeds the budget is hard-split at the character length
+    the budget allows. Empty input gives no chunks.
+    """
+    count = count_tokens or approx_tokens
+    max_tokens = max(1, int(max_tokens))
+    text = (text or "").strip()
+    if not text:
+        return []
+    if count(text) <= max_tokens:
+        return [text]
+
+    # Character width used when a single sentence has to be cut.
+    hard_width = max(1, max_tokens * CHARS_PER_TOKEN if count is approx_tokens
+                     else int(len(text) * max_tokens / count(text)))
+
+    chunks: List[str] = []
+    current = ""
+    for sentence in _SENTENCE_END.split(text):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        while count(sentence) > max_tokens and len(sentence) > hard_width:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(sentence[:hard_width])
+            sentence = sentence[hard_width:]
+        candidate = f"{current} {sentence}" if current else sentence
+        if current and count(candidate) > max_tokens:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = candidate
+    if current:
+        chunks.append(current)
+    return chunks